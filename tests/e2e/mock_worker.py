@@ -19,7 +19,7 @@ class MockWorker:
         self.fail_tasks: set[str] = fail_tasks or set()
         self.invocations: list[dict] = []
 
-    def invoke_claude_code(self, task: dict, timeout: int = 300) -> ClaudeInvocationResult:
+    def invoke_claude_code(self, task: dict, timeout: int = 300, artifact: object = None) -> ClaudeInvocationResult:
         """Execute a mock Claude Code invocation with deterministic file operations.
 
         Creates and modifies files listed in the task manifest, then returns
@@ -29,6 +29,7 @@ class MockWorker:
             task: Task dictionary containing at minimum "id" and optionally
                   "files" with "create" and "modify" lists of file paths.
             timeout: Invocation timeout in seconds (unused in mock).
+            artifact: Task artifact capture (unused in mock; output is not streamed).
 
         Returns:
             ClaudeInvocationResult with deterministic success/failure outcome.
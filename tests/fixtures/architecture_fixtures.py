@@ -0,0 +1,112 @@
+"""Layered synthetic projects for architecture checker tests.
+
+``write_layered_project`` writes a ``.zerg/config.yaml`` with layers, import
+rules, naming conventions and exceptions, plus a tree of modules whose
+imports and names violate them at random. ``mutate_project`` applies one
+random edit (changed imports, renamed definitions, syntax errors, new and
+deleted files) and returns the paths it touched, like a merge diff.
+"""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+ARCHITECTURE_CONFIG = """\
+architecture:
+  enabled: true
+  layers:
+    - name: core
+      paths: ["src/core/**"]
+      allowed_imports: [stdlib, core]
+    - name: services
+      paths: ["src/services/**"]
+      allowed_imports: [stdlib, core, services]
+    - name: web
+      paths: ["src/web/**"]
+      allowed_imports: [stdlib, core, services, web]
+  import_rules:
+    - directory: "src/core/"
+      deny: [requests, flask]
+    - directory: "src/web/"
+      allow: [src.services, src.core, flask]
+  naming_conventions:
+    - directory: "src/"
+      files: snake_case
+      classes: PascalCase
+      functions: snake_case
+  exceptions:
+    - file: "src/web/legacy_*.py"
+      reason: "Legacy views"
+    - import: "src.web.routes"
+      in_file: "src/services/hooks_*.py"
+      reason: "Callback registration"
+"""
+
+LAYERS = ("core", "services", "web")
+
+_EXTERNAL = ("os", "json", "requests", "flask", "yaml", "src.web.routes")
+
+
+def _module(layer: str, index: int) -> str:
+    return f"src.{layer}.mod_{index:05d}"
+
+
+def _source(rng: random.Random, files: int, syntax_error: bool = False) -> str:
+    lines = []
+    for _ in range(rng.randrange(1, 6)):
+        if rng.random() < 0.3:
+            lines.append(f"import {rng.choice(_EXTERNAL)}")
+        else:
+            target = _module(rng.choice(LAYERS), rng.randrange(files))
+            lines.append(f"from {target} import thing" if rng.random() < 0.5 else f"import {target}")
+    lines.append("")
+    lines.append(f"class {rng.choice(['Widget', 'bad_widget', 'Helper'])}{rng.randrange(100)}:")
+    lines.append(f"    def {rng.choice(['run', 'doWork', '__init__'])}(self):")
+    lines.append("        import json")
+    lines.append("        return json")
+    lines.append("")
+    lines.append(f"def {rng.choice(['load_all', 'LoadAll', 'save'])}():")
+    lines.append("    return None")
+    if syntax_error:
+        lines.append("def broken(:")
+    return "\n".join(lines) + "\n"
+
+
+def _path(root: Path, rng: random.Random, index: int) -> Path:
+    layer = LAYERS[index % len(LAYERS)]
+    prefix = rng.choice(["mod", "mod", "mod", "legacy", "hooks", "BadName"])
+    return root / "src" / layer / f"{prefix}_{index:05d}.py"
+
+
+def write_layered_project(root: Path, files: int, seed: int = 0) -> list[Path]:
+    """Write the config and *files* modules under *root* and return the module paths."""
+    rng = random.Random(seed)
+    (root / ".zerg").mkdir(parents=True, exist_ok=True)
+    (root / ".zerg" / "config.yaml").write_text(ARCHITECTURE_CONFIG)
+    for layer in LAYERS:
+        (root / "src" / layer).mkdir(parents=True, exist_ok=True)
+    paths = []
+    for index in range(files):
+        path = _path(root, rng, index)
+        path.write_text(_source(rng, files, syntax_error=rng.random() < 0.01))
+        paths.append(path)
+    return paths
+
+
+def mutate_project(root: Path, rng: random.Random, files: int) -> list[str]:
+    """Apply one random edit under *root* and return the changed paths relative to it."""
+    existing = sorted(p for p in (root / "src").rglob("*.py"))
+    action = rng.random()
+    if action < 0.6 and existing:
+        path = rng.choice(existing)
+        path.write_text(_source(rng, files, syntax_error=rng.random() < 0.1))
+    elif action < 0.8:
+        path = _path(root, rng, files + rng.randrange(10 * files))
+        path.write_text(_source(rng, files))
+    elif existing:
+        path = rng.choice(existing)
+        path.unlink()
+    else:
+        return []
+    return [str(path.relative_to(root))]
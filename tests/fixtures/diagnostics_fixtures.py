@@ -0,0 +1,83 @@
+"""Error-log corpora for the diagnostics knowledge base.
+
+``ERROR_LINES`` covers every ``KNOWN_PATTERNS`` category (including
+case-variant and non-ASCII text); ``log_dump`` pads them with ordinary log
+noise to build large dumps. ``reference_match`` is the straightforward
+every-regex-against-the-text matcher that ``PatternMatcher`` must agree with.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+
+from zerg.diagnostics.knowledge_base import KNOWN_PATTERNS, KnownPattern
+
+ERROR_LINES: list[str] = [
+    "ImportError: cannot import name 'foo' from partially initialized module 'bar' "
+    "(most likely due to a circular import)",
+    "ModuleNotFoundError: No module named 'requests' -- try pip install requests",
+    "TypeError: run() takes 2 positional arguments but 3 were given",
+    "TypeError: __init__() got an unexpected keyword argument 'timeout'",
+    "ValueError: invalid literal for int() with base 10: 'abc'",
+    "ValueError: too many values to unpack (expected 2)",
+    "KeyError: 'worker_id' while reading config dict",
+    "AttributeError: 'NoneType' object has no attribute 'status'",
+    "AttributeError: module 'os.path' has no attribute 'joinpath'",
+    "RecursionError: maximum recursion depth exceeded in comparison",
+    "MemoryError: Cannot allocate memory (std::bad_alloc)",
+    "FileNotFoundError: [Errno 2] No such file or directory: '.zerg/state/feat.json'",
+    "PermissionError: [Errno 13] Permission denied: '/var/run/docker.sock'",
+    "SyntaxError: invalid syntax / unexpected EOF / IndentationError: expected an indented block",
+    "AssertionError: assert result == 3 failed",
+    "OSError: [Errno 28] No space left on device (ENOSPC), disk is full",
+    "ConnectionRefusedError: [Errno 111] requests.exceptions.ConnectionError",
+    "asyncio.TimeoutError / socket.timeout / requests.exceptions.Timeout",
+    "Worker 3 exceeded time limit; worker 3 timed out; task_timeout_seconds exceeded",
+    "worker-2 died unexpectedly: Process exited with code 137 (SIGKILL)",
+    "JSONDecodeError: Expecting value; state file corrupt: invalid state json",
+    "No state file found for feature",
+    "Task TASK-004 exceeded its timeout: execution time limit reached",
+    "Verification command returned non-zero; quality gate failed",
+    "CONFLICT (content): Merge conflict in zerg/a.py; Automatic merge failed; both modified:   zerg/a.py",
+    "OSError: [Errno 98] Address already in use (EADDRINUSE): bind failed for address 0.0.0.0:8000",
+    "fatal: 'main' is already checked out at '.zerg/worktrees/feat/worker-1' -- not a git repository",
+    "Cannot connect to the Docker daemon; Error response from daemon: docker permission denied",
+    "Invalid configuration: yaml parse error in config",
+    "level sync failed: workers did not complete level 2; dependency level 3 blocked; Cannot proceed to level 3",
+    "ERROR: ResolutionImpossible: dependency conflict, Could not find a version that satisfies the requirement",
+    "DeprecationWarning: this will be removed in 2.0; version mismatch; requires python version 3.12",
+    "environment variable ZERG_HOME not set; ANTHROPIC_API_KEY missing; KeyError: 'SECRET'",
+    "UnicodeDecodeError: 'utf-8' codec can't decode byte 0xff; UnicodeEncodeError: codec can't encode",
+    "importerror: CANNOT IMPORT NAME 'x'",  # case-insensitive symptoms
+    "İmportError: cannot ımport name, WorKer 2 tiſed out",  # non-ASCII case folding
+]
+
+NOISE_LINES: list[str] = [
+    "2026-01-01T12:00:00Z INFO  zerg.orchestrator: level 1 started with 5 workers",
+    "2026-01-01T12:00:01Z DEBUG zerg.worker: claimed TASK-001, running verification",
+    "2026-01-01T12:00:02Z INFO  zerg.merge: merging worker branches into staging",
+    '    File "/app/zerg/worker.py", line 120, in run',
+    "2026-01-01T12:00:03Z INFO  uvicorn: 127.0.0.1 - GET /health 200 OK",
+]
+
+
+def log_dump(lines: int, errors: int, seed: int = 0) -> str:
+    """A log of *lines* lines with *errors* error lines scattered through noise."""
+    rng = random.Random(seed)
+    out = [rng.choice(NOISE_LINES) for _ in range(lines - errors)]
+    for _ in range(errors):
+        out.insert(rng.randrange(len(out) + 1), rng.choice(ERROR_LINES))
+    return "\n".join(out)
+
+
+def reference_match(error_text: str) -> list[tuple[KnownPattern, float]]:
+    """Score every known pattern by running all of its symptom regexes."""
+    results: list[tuple[KnownPattern, float]] = []
+    for pattern in KNOWN_PATTERNS:
+        compiled = [re.compile(s, re.IGNORECASE) for s in pattern.symptoms]
+        matched = sum(1 for rx in compiled if rx.search(error_text))
+        if matched > 0:
+            results.append((pattern, matched / len(compiled)))
+    results.sort(key=lambda item: item[1], reverse=True)
+    return results
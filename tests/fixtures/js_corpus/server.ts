@@ -0,0 +1,53 @@
+import { Router, Request as Req, type Response } from 'express';
+import type { Config } from "./config";
+import React from 'react';
+import * as path from 'path';
+
+/** Options accepted by the server. */
+export interface ServerOptions extends BaseOptions, Logging {
+  port: number;
+}
+
+export type Handler<T> = (req: Req, res: Response) => T;
+type Id = string | number;
+
+/**
+ * HTTP server wrapper.
+ * @public
+ */
+export abstract class Server extends BaseServer implements Closeable, Startable {
+  constructor(private readonly options: ServerOptions) {
+    super();
+  }
+}
+
+export default class App {}
+
+/**
+ * Starts the server.
+ */
+export async function start(config: Config, retries = 3) {
+  return new Server(config);
+}
+
+function helper(
+  a: number,
+  b: number,
+) {
+  return a + b;
+}
+
+export const handler = (req, res) => {
+  res.send('ok');
+};
+
+export const typed: Handler<void> = async (req: Req): Promise<void> => {};
+const local = async () => 1;
+let counter = (n) => n + 1;
+
+export const DEFAULT_PORT: number = 3000;
+export let mutable = {};
+export var legacy = [];
+export const handler = 5;
+export const Config = {};
+export function start() {}
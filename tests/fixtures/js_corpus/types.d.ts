@@ -0,0 +1,10 @@
+export interface A {}
+interface B extends A {}
+export type Pair<K, V> = [K, V];
+export type Mapper<T extends { id: string }> = (t: T) => T;
+type Alias = B;
+export const enumLike: Record<string, number> = {};
+import {
+  one,
+  two as deux,
+} from './numbers';
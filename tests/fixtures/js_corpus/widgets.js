@@ -0,0 +1,27 @@
+import { useState, useEffect } from 'react';
+import lodash from "lodash";
+
+// Simple helper
+function add(a, b) { return a + b; }
+
+/** Widget base. */
+class Widget {
+  render() {}
+}
+
+class Button extends Widget {}
+
+export default function main() {}
+
+export const onClick = (event) => {
+  return event;
+};
+export const onClick = (other) => other;
+var oldStyle = function () {};
+export const VERSION = "1.0";
+export const add = 1;
+async function load(url) {
+  return fetch(url);
+}
+export function
+  spaced(x) { return x; }
@@ -0,0 +1,72 @@
+"""JS/TS sources for repo map extractor tests.
+
+``JS_CORPUS`` holds hand-written modules with the symbols the regex
+extractor produced for them in ``symbols.json`` (one list per file, in
+output order). ``js_bundle`` builds a large webpack-style bundle for
+benchmarks: many small modules with JSDoc, line comments, block comments
+and template literals around top-level declarations.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+from typing import Any
+
+JS_CORPUS = Path(__file__).parent / "js_corpus"
+
+
+def corpus_symbols() -> dict[str, list[dict[str, Any]]]:
+    """Return the expected symbols per corpus file name."""
+    return json.loads((JS_CORPUS / "symbols.json").read_text())
+
+
+_MODULE = """\
+/***/ "./src/{name}.js":
+/*!*************************!*\\
+  !*** ./src/{name}.js ***!
+  \\*************************/
+import {{ helper_{dep}, shared_{dep} }} from './mod_{dep}';
+import util_{index} from "util";
+
+/**
+ * Build the {name} view.
+ */
+export function render_{index}(props, state) {{
+  const html = `
+    <div class="{name}">${{props.title}}</div>
+  `;
+  // TODO: cache the result
+  return html + helper_{dep}(state);
+}}
+
+export const handle_{index} = (event, ctx) => {{
+  return render_{index}(event, ctx);
+}};
+
+/** Model for {name}. */
+export class Model_{index} extends Base {{
+  constructor(opts) {{
+    super(opts);
+    this.label = '{name}: ' + "value";
+  }}
+}}
+
+export const CONFIG_{index} = {{ retries: {index}, path: "/api/{name}" }};
+"""
+
+
+def js_bundle(size: int, seed: int = 0) -> tuple[str, int]:
+    """Return a bundle of at least *size* characters and the number of symbols it declares."""
+    rng = random.Random(seed)
+    parts = []
+    total = 0
+    index = 0
+    while total < size:
+        part = _MODULE.format(name=f"mod_{index}", index=index, dep=rng.randrange(index + 1))
+        parts.append(part)
+        total += len(part)
+        index += 1
+    # Per module: two imported names, the default import, function, arrow, class, variable
+    return "".join(parts), index * 7
@@ -0,0 +1,132 @@
+"""Small OSV ecosystem exports for offline CVE scanner tests.
+
+``write_osv_export`` writes a zip laid out like
+``https://osv-vulnerabilities.storage.googleapis.com/<ecosystem>/all.zip``:
+one ``<ID>.json`` OSV record per advisory.
+"""
+
+from __future__ import annotations
+
+import json
+import zipfile
+from pathlib import Path
+from typing import Any
+
+
+def _range(*events: dict[str, str], kind: str = "ECOSYSTEM") -> dict[str, Any]:
+    return {"type": kind, "events": list(events)}
+
+
+OSV_RECORDS: dict[str, list[dict[str, Any]]] = {
+    "PyPI": [
+        {
+            "id": "PYSEC-2023-74",
+            "summary": "Unintended leak of Proxy-Authorization header in requests",
+            "aliases": ["CVE-2023-32681", "GHSA-j8r2-6x86-q33q"],
+            "severity": [{"type": "CVSS_V3", "score": "6.1"}],
+            "affected": [
+                {
+                    "package": {"ecosystem": "PyPI", "name": "requests"},
+                    "ranges": [_range({"introduced": "2.3.0"}, {"fixed": "2.31.0"})],
+                }
+            ],
+        },
+        {
+            "id": "GHSA-qw25-v68c-qjf3",
+            "summary": "Django denial of service in multipart parser",
+            "aliases": ["CVE-2023-24580"],
+            "affected": [
+                {
+                    "package": {"ecosystem": "PyPI", "name": "Django"},
+                    "ranges": [
+                        _range({"introduced": "3.2"}, {"fixed": "3.2.18"}, {"introduced": "4.0"}, {"fixed": "4.0.10"})
+                    ],
+                }
+            ],
+        },
+        {
+            "id": "PYSEC-2021-108",
+            "summary": "ReDoS in urllib3 URL authority parsing",
+            "aliases": ["CVE-2021-33503"],
+            "severity": [{"type": "CVSS_V3", "score": "7.5"}],
+            "affected": [
+                {
+                    "package": {"ecosystem": "PyPI", "name": "urllib3"},
+                    "ranges": [_range({"introduced": "1.25.4"}, {"last_affected": "1.26.4"})],
+                }
+            ],
+        },
+        {
+            "id": "PYSEC-2020-96",
+            "summary": "Arbitrary code execution in PyYAML full_load",
+            "aliases": ["CVE-2020-1747"],
+            "severity": [{"type": "CVSS_V3", "score": "9.8"}],
+            "affected": [
+                {
+                    "package": {"ecosystem": "PyPI", "name": "PyYAML"},
+                    "versions": ["5.1", "5.1.1", "5.2", "5.3"],
+                }
+            ],
+        },
+        {
+            "id": "PYSEC-2019-999",
+            "summary": "Withdrawn advisory",
+            "withdrawn": "2019-06-01T00:00:00Z",
+            "affected": [
+                {
+                    "package": {"ecosystem": "PyPI", "name": "flask"},
+                    "ranges": [_range({"introduced": "0"})],
+                }
+            ],
+        },
+    ],
+    "npm": [
+        {
+            "id": "GHSA-35jh-r3h4-6jhm",
+            "summary": "Command injection in lodash",
+            "aliases": ["CVE-2021-23337"],
+            "affected": [
+                {
+                    "package": {"ecosystem": "npm", "name": "lodash"},
+                    "ranges": [_range({"introduced": "0"}, {"fixed": "4.17.21"}, kind="SEMVER")],
+                }
+            ],
+        },
+    ],
+    "Go": [
+        {
+            "id": "GO-2022-1059",
+            "summary": "Denial of service via crafted Accept-Language header in golang.org/x/text/language",
+            "aliases": ["CVE-2022-32149"],
+            "affected": [
+                {
+                    "package": {"ecosystem": "Go", "name": "golang.org/x/text"},
+                    "ranges": [_range({"introduced": "0"}, {"fixed": "0.3.8"}, kind="SEMVER")],
+                }
+            ],
+        },
+    ],
+    "crates.io": [
+        {
+            "id": "RUSTSEC-2021-0078",
+            "summary": "Lenient hyper header parsing of Content-Length",
+            "aliases": ["CVE-2021-32715"],
+            "affected": [
+                {
+                    "package": {"ecosystem": "crates.io", "name": "hyper"},
+                    "ranges": [_range({"introduced": "0.0.0-0"}, {"fixed": "0.14.10"}, kind="SEMVER")],
+                }
+            ],
+        },
+    ],
+}
+
+
+def write_osv_export(directory: Path, ecosystem: str, records: list[dict[str, Any]] | None = None) -> Path:
+    """Write ``<directory>/<ecosystem>/all.zip`` and return its path."""
+    target = directory / ecosystem / "all.zip"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(target, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for record in OSV_RECORDS[ecosystem] if records is None else records:
+            archive.writestr(f"{record['id']}.json", json.dumps(record))
+    return target
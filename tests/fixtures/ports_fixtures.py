@@ -0,0 +1,25 @@
+"""Helpers for exercising the port allocator from several processes.
+
+``allocate_in_process`` runs in a spawned worker: it waits for a shared start
+time so every process allocates at once, then allocates ports one at a time
+and returns them with the mean latency per allocation.
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+
+def allocate_in_process(args: tuple[str, int, int, int, float]) -> tuple[list[int], float]:
+    """Allocate *count* ports after *start_at*; return them and seconds per allocation."""
+    from zerg.ports import PortAllocator
+
+    reservation_file, range_start, range_end, count, start_at = args
+    allocator = PortAllocator(range_start=range_start, range_end=range_end, reservation_file=Path(reservation_file))
+    while time.time() < start_at:
+        time.sleep(0.001)
+    start = time.perf_counter()
+    ports = [allocator.allocate_one() for _ in range(count)]
+    elapsed = time.perf_counter() - start
+    return ports, elapsed / count
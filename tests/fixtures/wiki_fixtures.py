@@ -0,0 +1,135 @@
+"""Synthetic wiki sites and reference cross-referencing for doc_engine tests.
+
+``synthetic_site`` builds pages shaped like the wiki generator's output
+(headings, bold definitions, code blocks, ``[[links]]``). The
+``reference_*`` functions are the straightforward implementations of
+``CrossRefBuilder.inject_links`` / ``see_also`` (a regex per term, every
+page compared with every other) that the indexed versions must agree with.
+``synthetic_project`` writes a ``zerg/`` source tree for ``zerg wiki`` runs.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+from collections import Counter
+from pathlib import Path
+
+from zerg.doc_engine.crossref import (
+    _HEADING_PATTERN,
+    _WIKI_LINK_PATTERN,
+    GlossaryEntry,
+    _extract_keywords,
+    _is_inside_heading,
+    _mask_code_blocks,
+)
+
+_VOCABULARY = (
+    "worker orchestrator level merge gate task graph state heartbeat launcher container worktree "
+    "retry backpressure circuit breaker metrics token cache context plugin diagnostics hypothesis "
+    "renderer sidebar glossary publisher detector extractor dependency mermaid config schema"
+).split()
+
+
+def synthetic_site(pages: int, seed: int = 0) -> dict[str, str]:
+    """Return ``{page_name: markdown}`` for a site of *pages* module pages."""
+    rng = random.Random(seed)
+    names = [f"module_{i:04d}" for i in range(pages)]
+    site: dict[str, str] = {}
+    for i, name in enumerate(names):
+        words = rng.sample(_VOCABULARY, 6)
+        lines = [f"# {name}", "", f"## {words[0].title()} {i}", ""]
+        lines.append(f"**Term{i}**: defines the {words[1]} handling for {words[2]} {i}.")
+        for _ in range(8):
+            sentence = " ".join(rng.choice(_VOCABULARY) for _ in range(12))
+            if rng.random() < 0.3:
+                sentence += f" See Term{rng.randrange(pages)} and {words[0].title()} {rng.randrange(pages)}."
+            lines.append(sentence.capitalize())
+        lines += ["", "```python", f"def {words[3]}_{i}(): return Term{i}", "```", ""]
+        lines.append(f"### {words[4].title()}")
+        for _ in range(2):
+            lines.append(f"Related: [[{rng.choice(names)}]] uses `{words[5]}`.")
+        site[name] = "\n".join(lines) + "\n"
+    return site
+
+
+def reference_inject_links(content: str, glossary: list[GlossaryEntry], current_page: str) -> str:
+    """inject_links with one regex per glossary term."""
+    terms = sorted([e for e in glossary if e.page != current_page], key=lambda e: len(e.term), reverse=True)
+    masked = _mask_code_blocks(content)
+    linked_terms: set[str] = set()
+    for entry in terms:
+        term_lower = entry.term.lower()
+        if term_lower in linked_terms:
+            continue
+        needles = [re.escape(entry.term)] + [re.escape(a) for a in entry.aliases]
+        pattern = re.compile(r"\b(" + "|".join(needles) + r")\b", re.IGNORECASE)
+        for match in pattern.finditer(masked):
+            if _is_inside_heading(content, match.start()):
+                continue
+            link = f"[[{entry.term}|{content[match.start() : match.end()]}]]"
+            content = content[: match.start()] + link + content[match.end() :]
+            masked = masked[: match.start()] + " " * len(link) + masked[match.end() :]
+            linked_terms.add(term_lower)
+            break
+    return content
+
+
+def reference_see_also(page_name: str, all_pages: dict[str, str], max_related: int = 5) -> list[str]:
+    """see_also comparing the page against every other page."""
+    if page_name not in all_pages:
+        return []
+    source_content = all_pages[page_name]
+    source_keywords = Counter(_extract_keywords(source_content))
+    scores: dict[str, float] = {}
+    for other_name, other_content in all_pages.items():
+        if other_name == page_name:
+            continue
+        score = 0.0
+        other_keywords = Counter(_extract_keywords(other_content))
+        for kw in set(source_keywords) & set(other_keywords):
+            score += min(source_keywords[kw], other_keywords[kw])
+        for link_match in _WIKI_LINK_PATTERN.finditer(source_content):
+            if link_match.group(1).strip().lower() == other_name.lower():
+                score += 10.0
+        for link_match in _WIKI_LINK_PATTERN.finditer(other_content):
+            if link_match.group(1).strip().lower() == page_name.lower():
+                score += 10.0
+        source_headings = {m.group(2).strip().lower() for m in _HEADING_PATTERN.finditer(source_content)}
+        other_headings = {m.group(2).strip().lower() for m in _HEADING_PATTERN.finditer(other_content)}
+        score += len(source_headings & other_headings) * 5.0
+        if score > 0:
+            scores[other_name] = score
+    return sorted(scores, key=lambda n: scores[n], reverse=True)[:max_related]
+
+
+def synthetic_project(root: Path, modules: int, seed: int = 0) -> list[Path]:
+    """Write *modules* Python modules under ``root/zerg`` (in subpackages of 100) and return their paths."""
+    rng = random.Random(seed)
+    paths = []
+    for i in range(modules):
+        package = root / "zerg" / f"pkg_{i // 100:02d}"
+        package.mkdir(parents=True, exist_ok=True)
+        words = rng.sample(_VOCABULARY, 4)
+        imports = sorted({f"zerg.pkg_{rng.randrange(i // 100 + 1):02d}.mod_{rng.randrange(i + 1):04d}"})
+        source = [f'"""{words[0].title()} {words[1]} for the {words[2]} {i}."""', "", "import os"]
+        source += [f"from {name} import helper" for name in imports]
+        source += [
+            "",
+            "",
+            f"class {words[3].title()}{i}:",
+            f'    """Track **{words[3]}** state for {words[0]} {i}."""',
+            "",
+            "    def run(self, value: int) -> int:",
+            "        return value + 1",
+            "",
+            "",
+            "def helper(path: str, retries: int = 3) -> bool:",
+            f'    """Check the {words[1]} at *path*."""',
+            "    return os.path.exists(path)",
+            "",
+        ]
+        path = package / f"mod_{i:04d}.py"
+        path.write_text("\n".join(source))
+        paths.append(path)
+    return paths
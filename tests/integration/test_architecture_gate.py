@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
+import subprocess
 from pathlib import Path
 from textwrap import dedent
+from unittest.mock import patch
 
 import pytest
 
+from zerg.architecture import ArchitectureChecker
 from zerg.architecture_gate import ArchitectureGate, check_files
+from zerg.config import ZergConfig
 from zerg.constants import GateResult
-from zerg.plugins import GateContext
+from zerg.merge import MergeCoordinator
+from zerg.plugins import GateContext, PluginRegistry
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, capture_output=True, check=True)
 
 
 class TestArchitectureGate:
@@ -170,6 +179,27 @@ class TestArchitectureGate:
         assert result.result == GateResult.PASS
         assert "warning" in result.stdout.lower()
 
+    def test_gate_checks_changed_files_against_stored_facts(self, gate: ArchitectureGate, temp_project: Path) -> None:
+        """A merge diff narrows the run; violations in untouched files are still reported."""
+        config_path = temp_project / ".zerg" / "config.yaml"
+        config_path.write_text(
+            'architecture:\n  enabled: true\n  import_rules:\n    - directory: "src/"\n      deny: ["flask"]\n'
+        )
+        (temp_project / "src" / "old.py").write_text("import flask\n")
+        (temp_project / "src" / "clean.py").write_text("import json\n")
+
+        first = gate.run(GateContext(feature="test", level=1, cwd=temp_project, config=None))
+        assert first.result == GateResult.FAIL
+        assert (temp_project / ".zerg" / "state" / "architecture-facts.json").exists()
+
+        (temp_project / "src" / "clean.py").write_text("import flask.json\n")
+        ctx = GateContext(feature="test", level=2, cwd=temp_project, config=None, changed_files=["src/clean.py"])
+        second = ArchitectureGate().run(ctx)
+
+        assert second.result == GateResult.FAIL
+        assert "src/old.py" in second.stderr
+        assert "src/clean.py" in second.stderr
+
     def test_gate_reports_duration(self, gate: ArchitectureGate, temp_project: Path) -> None:
         """Gate reports execution duration."""
         config_path = temp_project / ".zerg" / "config.yaml"
@@ -369,3 +399,38 @@ class TestExceptionIntegration:
         assert result.result == GateResult.FAIL
         assert "module.py" in result.stderr
         assert "__init__.py" not in result.stderr
+
+
+class TestArchitectureGateInMergeFlow:
+    """ArchitectureGate registered as a plugin gate of the level merge."""
+
+    def test_post_merge_gate_receives_merged_files(self, tmp_repo: Path) -> None:
+        """The merge diff reaches the gate; the pre-merge run checks nothing new."""
+        (tmp_repo / ".zerg").mkdir()
+        (tmp_repo / ".zerg" / "config.yaml").write_text(
+            'architecture:\n  enabled: true\n  import_rules:\n    - directory: "src/"\n      deny: ["flask"]\n'
+        )
+        (tmp_repo / "src").mkdir()
+        (tmp_repo / "src" / "clean.py").write_text("import json\n")
+        _git(tmp_repo, "add", "src")
+        _git(tmp_repo, "commit", "-q", "-m", "Add src")
+        _git(tmp_repo, "checkout", "-q", "-b", "zerg/feat/worker-0")
+        (tmp_repo / "src" / "new.py").write_text("import os\n")
+        _git(tmp_repo, "add", "src")
+        _git(tmp_repo, "commit", "-q", "-m", "Add new module")
+        _git(tmp_repo, "checkout", "-q", "main")
+
+        registry = PluginRegistry()
+        registry.register_gate(ArchitectureGate())
+        config = ZergConfig()
+        config.quality_gates = []
+        merger = MergeCoordinator("feat", config, tmp_repo, plugin_registry=registry)
+
+        with patch.object(
+            ArchitectureChecker, "check_changed", autospec=True, side_effect=ArchitectureChecker.check_changed
+        ) as check_changed:
+            result = merger.full_merge_flow(level=1, worker_branches=["zerg/feat/worker-0"])
+
+        assert result.success, result.error
+        assert [c.args[3] for c in check_changed.call_args_list] == [[], ["src/new.py"]]
+        assert [r.gate_name for r in result.gate_results] == ["architecture", "architecture"]
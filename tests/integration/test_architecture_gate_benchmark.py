@@ -0,0 +1,64 @@
+"""Benchmark: architecture gate on a 10,000-file project after a small merge.
+
+Writes a layered synthetic project with layer, import-rule and naming
+violations, then times a full ``check_directory`` scan, the first
+``check_changed`` run (which fills the fact store) and a run after a merge
+that touched three files. Times are printed; the incremental result is
+checked against a fresh full scan. Run with ``-s`` to see the numbers::
+
+    pytest tests/integration/test_architecture_gate_benchmark.py -s -m slow
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from pathlib import Path
+
+import pytest
+
+from tests.fixtures.architecture_fixtures import mutate_project, write_layered_project
+from zerg.architecture import ArchitectureChecker, ArchitectureFactStore, Violation, load_architecture_config
+
+FILES = 10_000
+CHANGED = 3
+
+
+def _key(violations: list[Violation]) -> list[tuple[str, int, str, str]]:
+    return sorted((v.file, v.line or 0, v.rule_type, v.message) for v in violations)
+
+
+@pytest.mark.slow
+@pytest.mark.timeout(600)
+def test_gate_after_small_merge_on_10000_files(tmp_path: Path) -> None:
+    write_layered_project(tmp_path, FILES)
+    checker = ArchitectureChecker(load_architecture_config(tmp_path / ".zerg" / "config.yaml"))
+    store_path = tmp_path / ".zerg" / "state" / "architecture-facts.json"
+
+    start = time.perf_counter()
+    full = checker.check_directory(tmp_path)
+    full_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    store = ArchitectureFactStore(store_path)
+    checker.check_changed(tmp_path, store)
+    store.save()
+    first_s = time.perf_counter() - start
+
+    rng = random.Random(7)
+    changed: list[str] = []
+    for _ in range(CHANGED):
+        changed.extend(mutate_project(tmp_path, rng, FILES))
+
+    start = time.perf_counter()
+    store = ArchitectureFactStore(store_path)
+    incremental = checker.check_changed(tmp_path, store, changed)
+    store.save()
+    incremental_s = time.perf_counter() - start
+
+    print(f"\nArchitecture gate, {FILES} files, {len(full)} violations")
+    print(f"  full scan            {full_s:6.2f}s")
+    print(f"  first run (no facts) {first_s:6.2f}s")
+    print(f"  {CHANGED}-file merge         {incremental_s:6.2f}s")
+
+    assert _key(incremental) == _key(checker.check_directory(tmp_path))
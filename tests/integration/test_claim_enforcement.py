@@ -224,6 +224,7 @@ class TestWorkerProtocolIntegration:
         monkeypatch.setenv("ZERG_FEATURE", "test-feature")
         monkeypatch.setenv("ZERG_WORKTREE", str(tmp_path))
         monkeypatch.setenv("ZERG_STATE_DIR", str(tmp_path))
+        monkeypatch.setenv("ZERG_LOG_DIR", str(tmp_path / "logs"))
         monkeypatch.setenv("ZERG_TASK_GRAPH", str(task_graph_path))
 
         # Create WorkerProtocol
@@ -284,6 +285,7 @@ def _setup_protocol_for_level_tests(
     monkeypatch.setenv("ZERG_FEATURE", "test-feature")  # type: ignore[union-attr]
     monkeypatch.setenv("ZERG_WORKTREE", str(tmp_path))  # type: ignore[union-attr]
     monkeypatch.setenv("ZERG_STATE_DIR", str(tmp_path))  # type: ignore[union-attr]
+    monkeypatch.setenv("ZERG_LOG_DIR", str(tmp_path / "logs"))  # type: ignore[union-attr]
     monkeypatch.setenv("ZERG_TASK_GRAPH", str(task_graph_path))  # type: ignore[union-attr]
 
     return WorkerProtocol()
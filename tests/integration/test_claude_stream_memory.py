@@ -0,0 +1,115 @@
+"""Benchmark: peak memory of a Claude CLI invocation with very large output.
+
+A stub CLI emits hundreds of MB of ``stream-json`` lines.  Each invocation
+runs in a fresh interpreter so ``ru_maxrss`` reflects only that call; the
+streaming handler's peak RSS must stay flat as output grows, while the old
+``subprocess.run(capture_output=True)`` approach grows with it.  Run with
+``-s`` to see the numbers::
+
+    pytest tests/integration/test_claude_stream_memory.py -s -m slow
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+MB = 1024 * 1024
+
+_STUB_CLI = """\
+import json, os, sys, time
+event = {"type": "assistant", "message": {"content": [{"type": "text", "text": "x" * 900}]}}
+line = (json.dumps(event) + "\\n").encode()
+total = int(os.environ["STUB_BYTES"])
+out = sys.stdout.buffer
+written = 0
+while written < total:
+    out.write(line * 64)
+    written += len(line) * 64
+out.flush()
+if os.environ.get("STUB_HANG"):
+    time.sleep(60)
+"""
+
+_STREAMING_CHILD = """\
+import json, resource, sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import zerg.protocol_handler as ph
+from zerg.log_writer import TaskArtifactCapture
+
+cli, workdir, timeout = sys.argv[1], Path(sys.argv[2]), int(sys.argv[3])
+ph.CLAUDE_CLI_COMMAND = cli
+handler = ph.ProtocolHandler(
+    worker_id=1, feature="bench", branch="b", worktree_path=workdir, state=MagicMock(), git=MagicMock(),
+    verifier=MagicMock(), context_tracker=MagicMock(), config=MagicMock(),
+)
+artifact = TaskArtifactCapture(workdir / "logs", "TASK-1")
+result = handler.invoke_claude_code({"id": "TASK-1", "title": "bench"}, timeout=timeout, artifact=artifact)
+print(json.dumps({
+    "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "exit_code": result.exit_code,
+    "tail_bytes": len(result.stdout),
+    "events": (result.progress or {}).get("events", 0),
+    "artifact_bytes": artifact.claude_output_path.stat().st_size,
+}))
+"""
+
+_CAPTURE_CHILD = """\
+import json, resource, subprocess, sys
+result = subprocess.run([sys.argv[1]], capture_output=True, text=True)
+print(json.dumps({"rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}))
+"""
+
+
+@pytest.fixture
+def stub_cli(tmp_path: Path) -> Path:
+    script = tmp_path / "stub-claude"
+    script.write_text(f"#!{sys.executable}\n{_STUB_CLI}")
+    script.chmod(0o755)
+    return script
+
+
+def _child(code: str, *args: str, env_extra: dict[str, str]) -> dict:
+    env = {**os.environ, **env_extra}
+    out = subprocess.run([sys.executable, "-c", code, *args], capture_output=True, text=True, env=env, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.slow
+def test_streaming_peak_rss_stays_flat(stub_cli: Path, tmp_path: Path) -> None:
+    small = _child(_STREAMING_CHILD, str(stub_cli), str(tmp_path), "300", env_extra={"STUB_BYTES": str(16 * MB)})
+    large = _child(_STREAMING_CHILD, str(stub_cli), str(tmp_path), "300", env_extra={"STUB_BYTES": str(320 * MB)})
+    capture = _child(_CAPTURE_CHILD, str(stub_cli), env_extra={"STUB_BYTES": str(320 * MB)})
+
+    print("\nPeak RSS of one Claude CLI invocation")
+    print(f"  streaming,  16 MB output  {small['rss_mb']:7.1f} MB")
+    print(f"  streaming, 320 MB output  {large['rss_mb']:7.1f} MB  ({large['events']} stream-json events parsed)")
+    print(f"  capture_output, 320 MB    {capture['rss_mb']:7.1f} MB")
+
+    assert small["exit_code"] == large["exit_code"] == 0
+    assert large["artifact_bytes"] >= 320 * MB
+    assert large["tail_bytes"] <= 64 * 1024
+    assert large["rss_mb"] - small["rss_mb"] < 32
+    assert capture["rss_mb"] > large["rss_mb"] + 256
+
+
+@pytest.mark.slow
+def test_partial_output_survives_timeout(stub_cli: Path, tmp_path: Path) -> None:
+    result = _child(
+        _STREAMING_CHILD,
+        str(stub_cli),
+        str(tmp_path),
+        "10",
+        env_extra={"STUB_BYTES": str(64 * MB), "STUB_HANG": "1"},
+    )
+
+    assert result["exit_code"] == -1
+    assert result["artifact_bytes"] >= 64 * MB
+    assert result["events"] > 0
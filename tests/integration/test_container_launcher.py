@@ -256,7 +256,7 @@ class TestContainerLauncher:
         # Mock docker inspect
         mock_run.return_value = MagicMock(
             returncode=0,
-            stdout="true,0\n",  # running=true, exit_code=0
+            stdout="abc123 true 0 \n",  # id, running, exit code, health
         )
 
         status = launcher.monitor(0)
@@ -275,7 +275,7 @@ class TestContainerLauncher:
         # Mock docker inspect - container exited
         mock_run.return_value = MagicMock(
             returncode=0,
-            stdout="false,0\n",  # running=false, exit_code=0
+            stdout="abc123 false 0 \n",  # id, running, exit code, health
         )
 
         status = launcher.monitor(0)
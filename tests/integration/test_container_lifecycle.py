@@ -249,7 +249,7 @@ class TestContainerMonitor:
     @patch("subprocess.run")
     def test_monitor_running(self, mock_run) -> None:
         """Test monitoring running container."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="true,0\n")
+        mock_run.return_value = MagicMock(returncode=0, stdout="container123 true 0 \n")
 
         launcher = ContainerLauncher()
         launcher._workers[0] = WorkerHandle(worker_id=0, status=WorkerStatus.INITIALIZING)
@@ -262,7 +262,7 @@ class TestContainerMonitor:
     @patch("subprocess.run")
     def test_monitor_stopped(self, mock_run) -> None:
         """Test monitoring stopped container."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="false,0\n")
+        mock_run.return_value = MagicMock(returncode=0, stdout="container123 false 0 \n")
 
         launcher = ContainerLauncher()
         launcher._workers[0] = WorkerHandle(worker_id=0, status=WorkerStatus.RUNNING)
@@ -275,7 +275,7 @@ class TestContainerMonitor:
     @patch("subprocess.run")
     def test_monitor_crashed(self, mock_run) -> None:
         """Test monitoring crashed container."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="false,1\n")
+        mock_run.return_value = MagicMock(returncode=0, stdout="container123 false 1 \n")
 
         launcher = ContainerLauncher()
         launcher._workers[0] = WorkerHandle(worker_id=0, status=WorkerStatus.RUNNING)
@@ -288,7 +288,7 @@ class TestContainerMonitor:
     @patch("subprocess.run")
     def test_monitor_checkpointing(self, mock_run) -> None:
         """Test monitoring checkpointing container."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="false,2\n")
+        mock_run.return_value = MagicMock(returncode=0, stdout="container123 false 2 \n")
 
         launcher = ContainerLauncher()
         launcher._workers[0] = WorkerHandle(worker_id=0, status=WorkerStatus.RUNNING)
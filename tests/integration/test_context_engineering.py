@@ -93,8 +93,10 @@ class TestPluginRegistration:
 class TestRegistryBuildTaskContext:
     """Registry.build_task_context dispatches correctly to registered plugin."""
 
-    def test_registry_build_task_context(self) -> None:
+    def test_registry_build_task_context(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """Registry dispatches build_task_context to registered plugin and returns result."""
+        # The plugin keeps its rule index and token cache under the project's state dir
+        monkeypatch.chdir(tmp_path)
         registry = PluginRegistry()
         plugin = ContextEngineeringPlugin(ContextEngineeringConfig(security_rule_filtering=False))
         registry.register_context_plugin(plugin)
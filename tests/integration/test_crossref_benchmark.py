@@ -0,0 +1,62 @@
+"""Benchmark: wiki cross-referencing on a 2,000-page synthetic site.
+
+Times the cross-reference stage of wiki generation: building the glossary,
+injecting glossary links into every page and computing every page's
+see-also list. The previous implementations (a fresh regex per glossary term
+per page; every page re-parsed against every other page) are quadratic, so
+they are timed on a sample of pages and reported per page next to the
+indexed versions. Sampled results are asserted equal; run with ``-s`` to see
+the numbers::
+
+    pytest tests/integration/test_crossref_benchmark.py -s -m slow
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from tests.fixtures.wiki_fixtures import reference_inject_links, reference_see_also, synthetic_site
+from zerg.doc_engine.crossref import CrossRefBuilder
+
+PAGES = 2_000
+SAMPLE = 10
+
+
+@pytest.mark.slow
+@pytest.mark.timeout(600)
+def test_crossref_on_2000_page_site() -> None:
+    site = synthetic_site(PAGES)
+    crossref = CrossRefBuilder()
+
+    start = time.perf_counter()
+    glossary = crossref.build_glossary(site)
+    glossary_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    linked = {name: crossref.inject_links(content, glossary, name) for name, content in site.items()}
+    links_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    related = {name: crossref.see_also(name, site) for name in site}
+    see_also_s = time.perf_counter() - start
+
+    sample = list(site)[:: PAGES // SAMPLE]
+    start = time.perf_counter()
+    for name in sample:
+        assert reference_inject_links(site[name], glossary, name) == linked[name]
+    ref_links_s = (time.perf_counter() - start) / len(sample)
+
+    start = time.perf_counter()
+    for name in sample:
+        assert reference_see_also(name, site) == related[name]
+    ref_see_also_s = (time.perf_counter() - start) / len(sample)
+
+    print(f"\nCross-referencing {PAGES} pages, {len(glossary)} glossary terms")
+    print(f"  build_glossary             {glossary_s:8.2f}s")
+    print(f"  {'':26} {'per page':>10} {'all pages':>10}")
+    print(f"  inject_links  per-term re  {ref_links_s * 1000:8.1f}ms {ref_links_s * PAGES:9.0f}s (est.)")
+    print(f"  inject_links  indexed      {links_s / PAGES * 1000:8.2f}ms {links_s:9.2f}s")
+    print(f"  see_also      pairwise     {ref_see_also_s * 1000:8.1f}ms {ref_see_also_s * PAGES:9.0f}s (est.)")
+    print(f"  see_also      indexed      {see_also_s / PAGES * 1000:8.2f}ms {see_also_s:9.2f}s")
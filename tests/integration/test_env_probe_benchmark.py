@@ -0,0 +1,64 @@
+"""Benchmark: checking 50 imports and the installed packages for ``zerg debug --env``.
+
+Times the previous approach (one ``python -c "import X"`` per module, plus
+``pip list --format=json``) against ``PythonEnvDiagnostics`` with an empty
+probe cache and again with a warm one. Times are printed; every run must
+agree on which modules import and which packages are installed. Run with
+``-s`` to see the numbers::
+
+    pytest tests/integration/test_env_probe_benchmark.py -s -m slow
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from zerg.diagnostics.env_diagnostics import PythonEnvDiagnostics
+
+MODULES = [
+    *("json", "csv", "sqlite3", "decimal", "fractions", "statistics", "asyncio", "email", "http.client"),
+    *("urllib.request", "xml.etree.ElementTree", "logging", "argparse", "pathlib", "tempfile", "shutil"),
+    *("zipfile", "tarfile", "gzip", "bz2", "lzma", "hashlib", "hmac", "secrets", "uuid", "datetime"),
+    *("calendar", "heapq", "bisect", "collections", "itertools", "functools", "typing", "dataclasses"),
+    *("enum", "contextlib", "textwrap", "difflib", "pprint", "inspect", "yaml", "pydantic", "click"),
+    *("rich", "jinja2", "pytest", "zerg", "zerg.ports", "no_such_module_a", "no_such_module_b"),
+]
+
+
+@pytest.mark.slow
+def test_probe_50_modules(tmp_path: Path) -> None:
+    assert len(MODULES) == 50
+    (tmp_path / "state").mkdir()
+    cache_path = tmp_path / "state" / "env-probe-cache.json"
+    reference = PythonEnvDiagnostics(cache_path=cache_path)
+
+    start = time.perf_counter()
+    imported = [m for m in MODULES if reference._run_cmd([sys.executable, "-c", f"import {m}"])[1]]
+    stdout, ok = reference._run_cmd([sys.executable, "-m", "pip", "list", "--format=json"])
+    before_s = time.perf_counter() - start
+    # pip can exceed the subprocess timeout on a loaded machine; compare packages only when it finished
+    pip_names = {pkg["name"].lower() for pkg in json.loads(stdout)} if ok else None
+
+    timings = []
+    for _run in ("cold", "warm"):
+        diagnostics = PythonEnvDiagnostics(cache_path=cache_path)
+        start = time.perf_counter()
+        imports = diagnostics.check_imports(MODULES)
+        packages = diagnostics.check_packages()
+        timings.append(time.perf_counter() - start)
+        assert imports["success"] == imported
+        if pip_names is not None:
+            assert {pkg["name"].lower() for pkg in packages["installed"]} == pip_names
+
+    if pip_names is None:
+        print(f"\nEnvironment probe, {len(MODULES)} modules (pip list failed, no reference timing)")
+    else:
+        print(f"\nEnvironment probe, {len(MODULES)} modules, {len(pip_names)} packages")
+        print(f"  interpreter per module + pip list  {before_s:6.2f}s")
+    print(f"  one child, empty cache             {timings[0]:6.2f}s")
+    print(f"  warm cache                         {timings[1]:6.2f}s")
@@ -0,0 +1,112 @@
+"""Benchmark: EventEmitter reads on a 1M-event file and watcher delivery latency.
+
+``get_events(since=...)`` near the end of a 1,000,000-event file is timed
+against decoding the whole file (the previous behaviour). Watcher delivery
+latency (emit to callback, across threads via the file) is compared for the
+inotify and polling backends. Only result equality and delivery are asserted;
+run with ``-s`` to see the numbers::
+
+    pytest tests/integration/test_event_emitter_benchmark.py -s -m slow
+"""
+
+from __future__ import annotations
+
+import json
+import statistics
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from zerg.event_emitter import EventEmitter
+
+EVENTS = 1_000_000
+TAIL = 100
+DELIVERIES = 200
+
+
+def _full_scan(event_file: Path, since: datetime) -> list[dict[str, Any]]:
+    """get_events(since) before the index: decode every line and timestamp."""
+    events = []
+    with open(event_file) as f:
+        for line in f:
+            event = json.loads(line)
+            if datetime.fromisoformat(event["timestamp"]) > since:
+                events.append(event)
+    return events
+
+
+@pytest.mark.slow
+@pytest.mark.timeout(600)
+def test_get_events_since_on_1m_event_file(tmp_path: Path) -> None:
+    emitter = EventEmitter("bench", state_dir=tmp_path)
+    start = time.perf_counter()
+    for i in range(EVENTS):
+        emitter.emit("task_complete", {"task_id": f"TASK-{i:07d}", "worker_id": i % 16})
+    emit_s = time.perf_counter() - start
+    emitter.close()
+
+    with open(emitter.event_file, "rb") as f:
+        f.seek(-64 * 1024, 2)
+        cut_line = f.read().splitlines()[-(TAIL + 1)]
+    since = datetime.fromisoformat(json.loads(cut_line)["timestamp"])
+
+    start = time.perf_counter()
+    expected = _full_scan(emitter.event_file, since)
+    full_s = time.perf_counter() - start
+
+    reader = EventEmitter("bench", state_dir=tmp_path)
+    start = time.perf_counter()
+    cold = reader.get_events(since=since)
+    cold_s = time.perf_counter() - start
+    start = time.perf_counter()
+    warm = reader.get_events(since=since)
+    warm_s = time.perf_counter() - start
+
+    size_mb = emitter.event_file.stat().st_size / 1e6
+    print(f"\nget_events(since) on {EVENTS} events ({size_mb:.0f} MB), {TAIL} newer events")
+    print(f"  emit (per event)            {emit_s / EVENTS * 1e6:8.2f} us")
+    print(f"  full decode                 {full_s * 1000:8.1f} ms")
+    print(f"  indexed seek, cold reader   {cold_s * 1000:8.2f} ms")
+    print(f"  indexed seek, warm reader   {warm_s * 1000:8.2f} ms")
+
+    assert 0 < len(expected) <= TAIL  # events sharing the cut timestamp are excluded
+    assert cold == expected
+    assert warm == expected
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("use_inotify", [True, False], ids=["inotify", "polling"])
+def test_watcher_delivery_latency(tmp_path: Path, use_inotify: bool) -> None:
+    if use_inotify and not sys.platform.startswith("linux"):
+        pytest.skip("inotify is Linux-only")
+    writer = EventEmitter("bench", state_dir=tmp_path)
+    watcher = EventEmitter("bench", state_dir=tmp_path)
+    sent: dict[int, float] = {}
+    latencies: list[float] = []
+    done = threading.Event()
+
+    def on_event(event_type: str, data: dict[str, Any]) -> None:
+        latencies.append(time.perf_counter() - sent[data["n"]])
+        if len(latencies) == DELIVERIES:
+            done.set()
+
+    watcher.start_watching(on_event, use_inotify=use_inotify)
+    try:
+        for n in range(DELIVERIES):
+            sent[n] = time.perf_counter()
+            writer.emit("tick", {"n": n})
+            time.sleep(0.005)
+        assert done.wait(10.0)
+    finally:
+        watcher.stop_watching()
+        writer.close()
+
+    ms = sorted(latency * 1000 for latency in latencies)
+    backend = "inotify" if use_inotify else "polling"
+    print(f"\nWatcher delivery latency, {backend}, {DELIVERIES} events 5 ms apart")
+    print(f"  median {statistics.median(ms):7.2f} ms   p99 {ms[int(len(ms) * 0.99) - 1]:7.2f} ms")
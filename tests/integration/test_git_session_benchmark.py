@@ -0,0 +1,135 @@
+"""Benchmark: batched git queries vs one git process per item.
+
+Builds a repository with 500 snapshot tags and a feature branch of 500
+commits, each touching its own file, then compares the previous per-item
+loops (``rev-list`` per tag, ``git diff`` per file, ``git show --numstat``
+per commit) with the batched paths (one ``for-each-ref``, one ``git diff``,
+one ``git log --numstat``). Spawned processes and wall time are reported;
+only spawn counts and result equality are asserted. Run with ``-s`` to see
+the numbers::
+
+    pytest tests/integration/test_git_session_benchmark.py -s -m slow
+"""
+
+from __future__ import annotations
+
+import subprocess
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from zerg.git.base import GitRunner
+from zerg.git.config import GitRescueConfig
+from zerg.git.history_engine import HistoryAnalyzer, _get_lines_changed
+from zerg.git.prereview import ContextPreparer
+from zerg.git.rescue import SnapshotManager
+
+ITEMS = 500
+
+
+def _fast_import(repo: Path) -> None:
+    """Create ``feature`` (ITEMS commits, one new file each) and ITEMS snapshot tags."""
+    lines = ["reset refs/heads/feature", "from refs/heads/main", ""]
+    for i in range(ITEMS):
+        data = f"VALUE = {i}\n" * 5
+        message = f"feat: add module {i}"
+        lines += [
+            "commit refs/heads/feature",
+            f"mark :{i + 1}",
+            f"committer Bench <bench@example.com> {1_700_000_000 + i} +0000",
+            f"data {len(message)}",
+            message,
+            f"M 100644 inline src/mod{i}.py",
+            f"data {len(data)}",
+            data,
+            "",
+        ]
+    for i in range(ITEMS):
+        lines += [f"reset refs/tags/zerg-snapshot-20240101-{i:06d}", f"from :{i + 1}", ""]
+    subprocess.run(
+        ["git", "-C", str(repo), "fast-import", "--quiet"],
+        input="\n".join(lines).encode(),
+        check=True,
+    )
+    subprocess.run(["git", "-C", str(repo), "checkout", "-q", "feature"], check=True)
+
+
+class _SpawnCounter:
+    """Counts processes started through subprocess.Popen."""
+
+    def __init__(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        self.count = 0
+        original = subprocess.Popen
+        counter = self
+
+        class CountingPopen(original):  # type: ignore[misc, valid-type]
+            def __init__(self, *args: Any, **kwargs: Any) -> None:
+                counter.count += 1
+                super().__init__(*args, **kwargs)
+
+        monkeypatch.setattr(subprocess, "Popen", CountingPopen)
+
+    def measure(self, fn: Callable[[], Any]) -> tuple[Any, int, float]:
+        """Return (result, processes spawned, seconds) for ``fn()``."""
+        before = self.count
+        start = time.perf_counter()
+        result = fn()
+        return result, self.count - before, time.perf_counter() - start
+
+
+def _legacy_snapshot_commits(runner: GitRunner) -> list[str]:
+    tags = runner._run("tag", "--list", "zerg-snapshot-*").stdout.split()
+    return [runner._run("rev-list", "-1", tag).stdout.strip() for tag in sorted(tags)]
+
+
+def _legacy_hunks(preparer: ContextPreparer) -> list[str]:
+    return [preparer.get_file_hunks(path, "main", 10_000) for path in preparer.get_changed_files("main")]
+
+
+def _legacy_history(runner: GitRunner) -> list[tuple[str, int]]:
+    shas = runner._run("log", "--format=%H", "main..HEAD").stdout.split()
+    return sorted((sha, _get_lines_changed(runner, sha)) for sha in shas)
+
+
+@pytest.mark.slow
+def test_batched_git_queries(tmp_repo: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _fast_import(tmp_repo)
+    runner = GitRunner(tmp_repo)
+    preparer = ContextPreparer(runner)
+    counter = _SpawnCounter(monkeypatch)
+
+    def batched_snapshots() -> list[str]:
+        return [s.commit for s in SnapshotManager(runner, GitRescueConfig()).list_snapshots()]
+
+    def batched_hunks() -> list[str]:
+        ctx = preparer.prepare_context("main", budget_chars=20_000_000)
+        return [f["hunks"] for f in ctx["files"]]
+
+    def batched_history() -> list[tuple[str, int]]:
+        return sorted((c.sha, c.lines_changed) for c in HistoryAnalyzer(runner).get_commits("main"))
+
+    cases = [
+        ("snapshot tags", _legacy_snapshot_commits, batched_snapshots, runner),
+        ("per-file hunks", _legacy_hunks, batched_hunks, preparer),
+        ("commit numstat", _legacy_history, batched_history, runner),
+    ]
+    print(f"\nGit queries over {ITEMS} items (processes spawned, wall time)")
+    for name, legacy_fn, batched_fn, arg in cases:
+        legacy, legacy_spawns, legacy_s = counter.measure(lambda fn=legacy_fn, a=arg: fn(a))
+        batched, batched_spawns, batched_s = counter.measure(batched_fn)
+        print(
+            f"  {name:15s} legacy {legacy_spawns:4d} / {legacy_s:6.2f}s"
+            f"   batched {batched_spawns:4d} / {batched_s:6.2f}s"
+        )
+
+        assert batched == legacy and len(batched) == ITEMS
+        assert legacy_spawns > ITEMS and batched_spawns <= 2
+
+    # Object lookups through the persistent cat-file session spawn at most one process
+    tags = [f"refs/tags/zerg-snapshot-20240101-{i:06d}" for i in range(ITEMS)]
+    infos, spawns, seconds = counter.measure(lambda: [runner.object_info(tag) for tag in tags])
+    print(f"  {'cat-file check':15s} session {spawns:4d} / {seconds:6.2f}s")
+    assert all(info is not None for info in infos) and spawns <= 1
@@ -0,0 +1,63 @@
+"""Benchmark: StructuredLogWriter throughput in synchronous and asynchronous modes.
+
+Several threads emit entries concurrently, as worker components do on the
+orchestrator. Synchronous mode serialises, writes and flushes on every
+``emit``; asynchronous mode only enqueues, so the caller-side rate is the
+number that matters for the hot path. Only correctness is asserted; the
+rates are too load-sensitive to gate on. Run with ``-s`` to see the numbers::
+
+    pytest tests/integration/test_log_writer_benchmark.py -s -m slow
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from zerg.json_utils import HAS_ORJSON
+from zerg.log_writer import StructuredLogWriter
+
+THREADS = 4
+ENTRIES_PER_THREAD = 20_000
+
+
+def _run(log_dir: Path, async_writes: bool) -> tuple[float, float]:
+    """Return (caller-side entries/s, end-to-end entries/s including close)."""
+    writer = StructuredLogWriter(log_dir, worker_id=0, feature="bench", async_writes=async_writes)
+    data = {"files": ["src/a.py", "src/b.py"], "attempt": 1}
+
+    def emit_many(thread_id: int) -> None:
+        for i in range(ENTRIES_PER_THREAD):
+            writer.emit("info", f"thread {thread_id} entry {i}", task_id="T1.1", event="task_progress", data=data)
+
+    threads = [threading.Thread(target=emit_many, args=(t,)) for t in range(THREADS)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    emitted = time.perf_counter() - start
+    writer.close()
+    total = time.perf_counter() - start
+
+    count = THREADS * ENTRIES_PER_THREAD
+    return count / emitted, count / total
+
+
+@pytest.mark.slow
+def test_async_writer_throughput(tmp_path: Path) -> None:
+    sync_emit, sync_total = _run(tmp_path / "sync", async_writes=False)
+    async_emit, async_total = _run(tmp_path / "async", async_writes=True)
+
+    print(f"\nStructuredLogWriter, {THREADS} threads x {ENTRIES_PER_THREAD} entries (orjson={HAS_ORJSON})")
+    print(f"  sync   emit {sync_emit:10.0f}/s   end-to-end {sync_total:10.0f}/s")
+    print(f"  async  emit {async_emit:10.0f}/s   end-to-end {async_total:10.0f}/s")
+
+    for mode in ("sync", "async"):
+        lines = (tmp_path / mode / "workers" / "worker-0.jsonl").read_text().splitlines()
+        assert len(lines) == THREADS * ENTRIES_PER_THREAD
+        json.loads(lines[-1])
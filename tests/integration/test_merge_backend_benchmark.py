@@ -0,0 +1,100 @@
+"""Benchmark: checkout-free merge-tree backend vs checkout-based git merge.
+
+Builds a synthetic repository with a dozen worker branches and merges them
+into a staging branch with each backend, comparing wall time and how many
+working-tree files (plus the index) each backend writes. Run with ``-s`` to
+see the numbers::
+
+    pytest tests/integration/test_merge_backend_benchmark.py -s -m slow
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from zerg.config import ZergConfig
+from zerg.git_ops import GitOps
+from zerg.merge import MergeCoordinator
+
+WORKERS = 12
+BASE_FILES = 200
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True, text=True).stdout
+
+
+def _snapshot(repo: Path) -> dict[str, tuple[int, int]]:
+    """Return ``{path: (mtime_ns, inode)}`` for the working tree and index."""
+    snap: dict[str, tuple[int, int]] = {}
+    for dirpath, dirnames, filenames in os.walk(repo):
+        dirnames[:] = [d for d in dirnames if d != ".git"]
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            st = os.stat(path)
+            snap[path] = (st.st_mtime_ns, st.st_ino)
+    index = repo / ".git" / "index"
+    st = index.stat()
+    snap[str(index)] = (st.st_mtime_ns, st.st_ino)
+    return snap
+
+
+def _writes(before: dict[str, tuple[int, int]], after: dict[str, tuple[int, int]]) -> int:
+    changed = sum(1 for path, sig in after.items() if before.get(path) != sig)
+    return changed + sum(1 for path in before if path not in after)
+
+
+@pytest.fixture
+def synthetic_repo(tmp_repo: Path) -> Path:
+    for i in range(BASE_FILES):
+        pkg = tmp_repo / f"pkg{i % 10}"
+        pkg.mkdir(exist_ok=True)
+        (pkg / f"mod{i}.py").write_text(f"VALUE = {i}\n" * 20)
+    _git(tmp_repo, "add", "-A")
+    _git(tmp_repo, "commit", "-q", "-m", "base")
+    for w in range(WORKERS):
+        branch = f"zerg/bench/worker-{w}"
+        _git(tmp_repo, "checkout", "-q", "-b", branch, "main")
+        for j in range(5):
+            (tmp_repo / f"pkg{w % 10}" / f"worker{w}_{j}.py").write_text(f"W = {w}\n")
+        _git(tmp_repo, "add", "-A")
+        _git(tmp_repo, "commit", "-q", "-m", f"worker {w}")
+    _git(tmp_repo, "checkout", "-q", "main")
+    return tmp_repo
+
+
+@pytest.mark.slow
+def test_merge_tree_backend_benchmark(synthetic_repo: Path) -> None:
+    ops = GitOps(synthetic_repo)
+    if not ops.supports_merge_tree():
+        pytest.skip("git merge-tree --write-tree unavailable")
+    branches = [f"zerg/bench/worker-{w}" for w in range(WORKERS)]
+    coordinator = MergeCoordinator("bench", config=ZergConfig(), repo_path=synthetic_repo)
+
+    results: dict[str, tuple[float, int, str]] = {}
+    for backend in ("checkout", "merge-tree"):
+        staging = f"zerg/bench/staging-{backend}"
+        ops.create_branch(staging, "main")
+        before = _snapshot(synthetic_repo)
+        start = time.perf_counter()
+        if backend == "checkout":
+            coordinator._execute_checkout_merge(branches, staging)
+        else:
+            coordinator._execute_merge_tree(branches, staging)
+        elapsed = time.perf_counter() - start
+        writes = _writes(before, _snapshot(synthetic_repo))
+        results[backend] = (elapsed, writes, _git(synthetic_repo, "rev-parse", f"{staging}^{{tree}}").strip())
+        _git(synthetic_repo, "checkout", "-q", "main")
+
+    print(f"\nMerging {WORKERS} worker branches over {BASE_FILES} base files")
+    for backend, (elapsed, writes, _tree) in results.items():
+        print(f"  {backend:<10} {elapsed * 1000:8.1f} ms  {writes:4d} working-tree/index writes")
+
+    assert results["merge-tree"][2] == results["checkout"][2], "backends produced different trees"
+    assert results["merge-tree"][1] == 0
+    assert results["checkout"][1] >= WORKERS
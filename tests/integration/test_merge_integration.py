@@ -340,6 +340,7 @@ class TestRealMergeCoordinatorIntegration:
             git.checkout.return_value = None
             git.abort_merge.return_value = None
             git.delete_branch.return_value = None
+            git.supports_merge_tree.return_value = False
             git_mock.return_value = git
             yield git
 
@@ -132,12 +132,11 @@ class TestStatusCommandMetrics:
 
         # Patch StateManager in the status command module so the CLI reads
         # from the same tmp_path state directory the test populated above.
-        # NOTE: ``import zerg.commands.status`` resolves to the Click command
-        # object (due to re-export in __init__.py), so we grab the real module
-        # from sys.modules.
-        import sys
+        # The CLI loads subcommands lazily, so import the module explicitly
+        # rather than relying on an earlier test having loaded it.
+        import importlib
 
-        status_mod = sys.modules["zerg.commands.status"]
+        status_mod = importlib.import_module("zerg.commands.status")
 
         _OrigStateManager = StateManager
 
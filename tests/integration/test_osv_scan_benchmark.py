@@ -0,0 +1,83 @@
+"""Benchmark: offline CVE scan of a 2,000-dependency lockfile.
+
+Builds a synthetic PyPI OSV export (advisories with ranges and explicit
+version lists), imports it into the local database and scans a pinned
+``requirements.txt`` (the lockfile pip-compile produces) with 2,000
+dependencies while any network access fails the test. Import and scan
+times are printed; the findings are checked against the expected set. Run
+with ``-s`` to see the numbers::
+
+    pytest tests/integration/test_osv_scan_benchmark.py -s -m slow
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from tests.fixtures.osv_fixtures import write_osv_export
+from zerg.security.cve import scan_dependencies
+from zerg.security.osv_db import VulnerabilityDatabase
+
+DEPENDENCIES = 2_000
+ADVISORIES_PER_PACKAGE = 3
+
+
+def _advisories() -> list[dict[str, Any]]:
+    records = []
+    for i in range(DEPENDENCIES * 2):  # half the advisories are for packages not in the lockfile
+        for n in range(ADVISORIES_PER_PACKAGE):
+            affected: dict[str, Any] = {"package": {"ecosystem": "PyPI", "name": f"pkg_{i:04d}"}}
+            if n == 0:
+                affected["versions"] = [f"1.{m}.0" for m in range(0, 10, 3)]
+            else:
+                events = [{"introduced": f"{n}.0"}, {"fixed": f"{n}.5"}]
+                affected["ranges"] = [{"type": "ECOSYSTEM", "events": events}]
+            vuln_id, cve = f"PYSEC-BENCH-{i:04d}-{n}", f"CVE-2099-{i:04d}{n}"
+            records.append({"id": vuln_id, "aliases": [cve], "affected": [affected]})
+    return records
+
+
+def _expected(version: str, i: int) -> set[str]:
+    expected = set()
+    major, minor = (int(p) for p in version.split(".")[:2])
+    if version in {f"1.{m}.0" for m in range(0, 10, 3)}:
+        expected.add(f"CVE-2099-{i:04d}0")
+    for n in range(1, ADVISORIES_PER_PACKAGE):
+        if major == n and minor < 5:
+            expected.add(f"CVE-2099-{i:04d}{n}")
+    return expected
+
+
+@pytest.mark.slow
+def test_offline_scan_of_2000_dependency_lockfile(tmp_path: Path) -> None:
+    project = tmp_path / "project"
+    project.mkdir()
+    versions = {i: f"{1 + i % 3}.{i % 10}.0" for i in range(DEPENDENCIES)}
+    # Lockfile spelling differs from the advisories (pkg-0001 vs pkg_0001); PEP 503 names match
+    lines = [f"pkg-{i:04d}=={version}" for i, version in versions.items()]
+    (project / "requirements.txt").write_text("\n".join(lines) + "\n")
+    (project / "requirements.lock").write_text("")
+
+    export = write_osv_export(tmp_path / "exports", "PyPI", records=_advisories())
+    db_path = tmp_path / "osv.sqlite3"
+    start = time.perf_counter()
+    with VulnerabilityDatabase(db_path) as db:
+        imported = db.import_export(export, "PyPI")
+    import_s = time.perf_counter() - start
+
+    with patch("zerg.security.cve.urllib.request.urlopen", side_effect=AssertionError("network used")):
+        start = time.perf_counter()
+        findings = scan_dependencies(project, db_path=db_path)
+        scan_s = time.perf_counter() - start
+
+    print(f"\nOffline CVE scan, {DEPENDENCIES} dependencies, {imported} advisories")
+    print(f"  import export  {import_s:6.2f}s")
+    print(f"  scan           {scan_s:6.2f}s   ({len(findings)} findings)")
+
+    expected = set().union(*(_expected(version, i) for i, version in versions.items()))
+    assert {f.pattern_name for f in findings} == expected
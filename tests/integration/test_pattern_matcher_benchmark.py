@@ -0,0 +1,58 @@
+"""Benchmark: PatternMatcher.match on large log dumps.
+
+Times the literal-prefiltered matcher against running every symptom regex
+over the text (the previous implementation) on dumps of increasing size,
+with a handful of error lines scattered through ordinary log noise. Only
+result equality is asserted; run with ``-s`` to see the numbers::
+
+    pytest tests/integration/test_pattern_matcher_benchmark.py -s -m slow
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from tests.fixtures.diagnostics_fixtures import log_dump
+from zerg.diagnostics.knowledge_base import KNOWN_PATTERNS, PatternMatcher
+
+SIZES = (1_000, 10_000, 100_000)
+ERRORS = 5
+
+
+def _every_regex_matcher() -> Callable[[str], list[tuple[Any, float]]]:
+    compiled = {p.name: [re.compile(s, re.IGNORECASE) for s in p.symptoms] for p in KNOWN_PATTERNS}
+
+    def match(text: str) -> list[tuple[Any, float]]:
+        results = []
+        for pattern in KNOWN_PATTERNS:
+            matched = sum(1 for rx in compiled[pattern.name] if rx.search(text))
+            if matched:
+                results.append((pattern, matched / len(compiled[pattern.name])))
+        results.sort(key=lambda item: item[1], reverse=True)
+        return results
+
+    return match
+
+
+def _timed(fn: Callable[[str], Any], text: str) -> tuple[float, Any]:
+    start = time.perf_counter()
+    result = fn(text)
+    return time.perf_counter() - start, result
+
+
+@pytest.mark.slow
+def test_match_scaling_on_log_dumps() -> None:
+    before, after = _every_regex_matcher(), PatternMatcher().match
+    print(f"\nPatternMatcher.match, {len(KNOWN_PATTERNS)} patterns, {ERRORS} error lines per dump")
+    print(f"  {'lines':>8} {'MB':>6} {'every regex':>12} {'prefiltered':>12}")
+    for lines in SIZES:
+        text = log_dump(lines, ERRORS, seed=lines)
+        before_s, expected = _timed(before, text)
+        after_s, actual = _timed(after, text)
+        print(f"  {lines:>8} {len(text) / 1e6:>6.1f} {before_s * 1000:>10.1f}ms {after_s * 1000:>10.1f}ms")
+        assert [(p.name, s) for p, s in actual] == [(p.name, s) for p, s in expected]
@@ -0,0 +1,28 @@
+"""Integration tests for host-wide port allocation across processes."""
+
+from __future__ import annotations
+
+import multiprocessing
+import time
+from pathlib import Path
+
+from tests.fixtures.ports_fixtures import allocate_in_process
+from zerg.ports import ReservationFile
+
+PROCESSES = 6
+PORTS_EACH = 25
+
+
+def test_concurrent_processes_never_share_a_port(tmp_path: Path) -> None:
+    reservation_file = tmp_path / "ports.json"
+    start_at = time.time() + 1.0
+    args = [(str(reservation_file), 52000, 53999, PORTS_EACH, start_at)] * PROCESSES
+
+    with multiprocessing.get_context("spawn").Pool(PROCESSES) as pool:
+        results = pool.map(allocate_in_process, args)
+
+    ports = [port for allocated, _latency in results for port in allocated]
+    assert len(ports) == PROCESSES * PORTS_EACH
+    assert len(set(ports)) == len(ports)
+    # The workers have exited, so their reservations are reclaimable
+    assert ReservationFile(reservation_file).claim(52000, 53999, 1) != []
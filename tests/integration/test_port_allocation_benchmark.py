@@ -0,0 +1,43 @@
+"""Benchmark: 16 processes allocating worker ports at the same time.
+
+Every process starts allocating at the same instant, one port per call, as
+orchestrators launching workers on one host do. The mean latency per
+allocation is printed; the test checks that no port was handed out twice.
+Run with ``-s`` to see the numbers::
+
+    pytest tests/integration/test_port_allocation_benchmark.py -s -m slow
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import time
+from pathlib import Path
+
+import pytest
+
+from tests.fixtures.ports_fixtures import allocate_in_process
+from zerg.constants import DEFAULT_PORT_RANGE_END, DEFAULT_PORT_RANGE_START
+
+PROCESSES = 16
+PORTS_EACH = 50
+
+
+@pytest.mark.slow
+def test_concurrent_allocation_latency(tmp_path: Path) -> None:
+    start_at = time.time() + 3.0
+    args = [
+        (str(tmp_path / "ports.json"), DEFAULT_PORT_RANGE_START, DEFAULT_PORT_RANGE_END, PORTS_EACH, start_at)
+    ] * PROCESSES
+
+    with multiprocessing.get_context("spawn").Pool(PROCESSES) as pool:
+        results = pool.map(allocate_in_process, args)
+
+    ports = [port for allocated, _latency in results for port in allocated]
+    latencies = sorted(latency for _ports, latency in results)
+    print(f"\nPort allocation, {PROCESSES} processes x {PORTS_EACH} ports")
+    print(f"  mean per allocation  {1000 * sum(latencies) / len(latencies):7.2f}ms")
+    print(f"  slowest process      {1000 * latencies[-1]:7.2f}ms")
+    print(f"  duplicates           {len(ports) - len(set(ports))}")
+
+    assert len(set(ports)) == len(ports) == PROCESSES * PORTS_EACH
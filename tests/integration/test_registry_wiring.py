@@ -17,6 +17,8 @@ import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from zerg.constants import WorkerStatus
 from zerg.orchestrator import Orchestrator
 from zerg.types import WorkerState
@@ -27,6 +29,12 @@ from zerg.worker_registry import WorkerRegistry
 # =============================================================================
 
 
+@pytest.fixture(autouse=True)
+def _isolated_repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Run in a scratch directory so the orchestrator log lands outside the repo."""
+    monkeypatch.chdir(tmp_path)
+
+
 def _patch_orchestrator_deps():
     """Context manager that patches all Orchestrator external dependencies.
 
@@ -0,0 +1,37 @@
+"""Benchmark: JS/TS symbol extraction from a 5 MB bundle.
+
+Builds a webpack-style bundle of small modules (imports, JSDoc, template
+literals, functions, arrow functions, classes and exported constants) and
+times ``extract_js_symbols`` on it. The time is printed; the symbol count is
+checked against what the bundle declares. Run with ``-s`` to see the
+numbers::
+
+    pytest tests/integration/test_repo_map_js_benchmark.py -s -m slow
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from tests.fixtures.js_fixtures import js_bundle
+from zerg.repo_map_js import extract_js_symbols
+
+BUNDLE_SIZE = 5_000_000
+
+
+@pytest.mark.slow
+def test_extract_symbols_from_5mb_bundle() -> None:
+    source, declared = js_bundle(BUNDLE_SIZE)
+
+    start = time.perf_counter()
+    symbols = extract_js_symbols(source)
+    elapsed = time.perf_counter() - start
+
+    lines = source.count("\n")
+    print(f"\nJS symbol extraction, {len(source) / 1e6:.1f} MB, {lines} lines")
+    print(f"  extract  {elapsed:6.2f}s   ({len(symbols)} symbols)")
+
+    assert len(symbols) == declared
+    assert {s.kind for s in symbols} == {"function", "class", "import", "variable"}
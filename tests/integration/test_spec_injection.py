@@ -108,6 +108,8 @@ class TestSpecInjection:
             "ZERG_WORKTREE": str(temp_workspace),
             "ZERG_BRANCH": "zerg/test-feature/worker-1",
             "ZERG_SPEC_DIR": str(feature_specs),
+            "ZERG_STATE_DIR": str(temp_workspace / ".zerg" / "state"),
+            "ZERG_LOG_DIR": str(temp_workspace / ".zerg" / "logs"),
         }
 
         with patch.dict(os.environ, env, clear=False):
@@ -131,6 +133,8 @@ class TestSpecInjection:
             "ZERG_WORKTREE": str(temp_workspace),
             "ZERG_BRANCH": "zerg/test-feature/worker-1",
             "ZERG_SPEC_DIR": str(feature_specs),
+            "ZERG_STATE_DIR": str(temp_workspace / ".zerg" / "state"),
+            "ZERG_LOG_DIR": str(temp_workspace / ".zerg" / "logs"),
         }
 
         with patch.dict(os.environ, env, clear=False):
@@ -184,6 +188,8 @@ class TestSpecInjection:
             "ZERG_FEATURE": "no-specs-feature",
             "ZERG_WORKTREE": str(workspace),
             "ZERG_BRANCH": "zerg/no-specs/worker-1",
+            "ZERG_STATE_DIR": str(zerg / "state"),
+            "ZERG_LOG_DIR": str(zerg / "logs"),
         }
 
         with patch.dict(os.environ, env, clear=False):
@@ -213,6 +219,8 @@ class TestSpecInjection:
             "ZERG_WORKTREE": str(temp_workspace),
             "ZERG_BRANCH": "zerg/test-feature/worker-1",
             "ZERG_SPEC_DIR": str(feature_specs),
+            "ZERG_STATE_DIR": str(temp_workspace / ".zerg" / "state"),
+            "ZERG_LOG_DIR": str(temp_workspace / ".zerg" / "logs"),
         }
 
         with patch.dict(os.environ, env, clear=False):
@@ -0,0 +1,106 @@
+"""Benchmark: level-barrier latency with and without speculative merging.
+
+Simulates a level whose workers finish at staggered times.  Without
+speculation every branch is merged and the post-merge gates run only once
+the orchestrator notices the level is complete.  With speculation each
+branch is merged (and gated) as its task completes, so the barrier merges
+nothing new and reuses the gate result for the final tree.  Run with
+``-s`` to see the numbers::
+
+    pytest tests/integration/test_speculative_merge_benchmark.py -s -m slow
+"""
+
+from __future__ import annotations
+
+import subprocess
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from zerg.config import QualityGate, ZergConfig
+from zerg.git_ops import GitOps
+from zerg.merge import MergeCoordinator
+from zerg.speculative_merge import SpeculativeMerger
+
+WORKERS = 8
+STAGGER = 0.15  # seconds between worker completions
+POLL_LAG = 0.5  # orchestrator notices level completion this long after the last task
+GATE = QualityGate(name="test", command="sleep 0.3", required=True)
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True, text=True).stdout.strip()
+
+
+def _make_branches(repo: Path, run: str) -> list[str]:
+    branches = []
+    for w in range(WORKERS):
+        branch = f"zerg/{run}/worker-{w}"
+        _git(repo, "checkout", "-q", "-b", branch, "main")
+        for j in range(5):
+            (repo / f"{run}_w{w}_{j}.py").write_text(f"W = {w}\n")
+        _git(repo, "add", "-A")
+        _git(repo, "commit", "-q", "-m", f"worker {w}")
+        _git(repo, "checkout", "-q", "main")
+        branches.append(branch)
+    return branches
+
+
+def _run_level(repo: Path, speculate: bool) -> tuple[float, str, int]:
+    """Return (barrier seconds, merged tree, post-merge gate runs at the barrier)."""
+    run = "spec" if speculate else "plain"
+    _git(repo, "checkout", "-q", "main")
+    _git(repo, "reset", "-q", "--hard", "base")
+    branches = _make_branches(repo, run)
+    config = ZergConfig()
+    config.quality_gates = [GATE]
+    coordinator = MergeCoordinator(run, config=config, repo_path=repo)
+    spec = SpeculativeMerger(run, coordinator.git, gates=[GATE], config=config) if speculate else None
+
+    for branch in branches:
+        time.sleep(STAGGER)
+        if spec is not None:
+            spec.submit(branch)
+    time.sleep(POLL_LAG)
+
+    barrier_runs = 0
+    real_post = coordinator.run_post_merge_gates
+
+    def counting_post(**kwargs: Any) -> Any:
+        nonlocal barrier_runs
+        barrier_runs += 1
+        return real_post(**kwargs)
+
+    start = time.perf_counter()
+    with (
+        patch.object(coordinator, "run_pre_merge_gates", return_value=(True, [])),
+        patch.object(coordinator, "run_post_merge_gates", side_effect=counting_post),
+    ):
+        result = coordinator.full_merge_flow(1, branches, "main", speculative=spec)
+    elapsed = time.perf_counter() - start
+    if spec is not None:
+        spec.close()
+    assert result.success, result.error
+    return elapsed, _git(repo, "ls-tree", "-r", "--name-only", "main"), barrier_runs
+
+
+@pytest.mark.slow
+def test_speculative_merge_barrier_latency(tmp_repo: Path) -> None:
+    if not GitOps(tmp_repo).supports_merge_tree():
+        pytest.skip("git merge-tree --write-tree unavailable")
+    _git(tmp_repo, "tag", "base")
+
+    plain, plain_files, plain_runs = _run_level(tmp_repo, speculate=False)
+    spec, spec_files, spec_runs = _run_level(tmp_repo, speculate=True)
+
+    print(f"\nLevel barrier with {WORKERS} workers, gate '{GATE.command}'")
+    print(f"  barrier merge   {plain * 1000:8.1f} ms  ({plain_runs} post-merge gate run)")
+    print(f"  speculative     {spec * 1000:8.1f} ms  ({spec_runs} post-merge gate runs)")
+
+    assert plain_files.replace("plain_", "") == spec_files.replace("spec_", "")
+    assert plain_runs == 1
+    assert spec_runs == 0
+    assert spec < plain
@@ -0,0 +1,81 @@
+"""Benchmark: counting 10,000 distinct prompts with the persistent token cache.
+
+Compares rewriting the whole ``token-cache.json`` snapshot on every cache miss
+(the previous behaviour) with appending misses to ``token-cache.log``, both
+one ``count()`` at a time and through ``count_many()``. Rewriting is quadratic
+in the number of misses (about four minutes for all 10,000), so it is timed on
+the first 2,000 prompts only. Only result equality and the persisted entries
+are asserted; run with ``-s`` to see the numbers::
+
+    pytest tests/integration/test_token_counter_benchmark.py -s -m slow
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from zerg.config import TokenMetricsConfig
+from zerg.token_counter import TokenCounter, TokenResult
+
+PROMPTS = 10_000
+BASELINE_PROMPTS = 2_000
+
+
+class _RewriteOnMiss(TokenCounter):
+    """Persists the full snapshot after every miss, as before the cache log."""
+
+    def _cache_store(self, text_hash: str, result: TokenResult) -> None:
+        with self._cache_lock:
+            self._cache[text_hash] = {"count": result.count, "mode": result.mode, "timestamp": time.time()}
+            self._evict()
+            self._cache_dirty = True
+        self._persist_cache()
+
+
+def _counter(cls: type[TokenCounter], state_dir: Path) -> TokenCounter:
+    return cls(config=TokenMetricsConfig(api_counting=False, cache_enabled=True), state_dir=state_dir)
+
+
+def _timed(fn: Callable[[], Any]) -> tuple[float, Any]:
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+@pytest.mark.slow
+def test_count_10000_distinct_prompts(tmp_path: Path) -> None:
+    prompts = [f"Task {i}: implement the handler for endpoint /api/v1/items/{i} " * 4 for i in range(PROMPTS)]
+    timings: dict[str, float] = {}
+    results: dict[str, list[TokenResult]] = {}
+
+    for name, cls, batch, count in (
+        ("rewrite per miss", _RewriteOnMiss, False, BASELINE_PROMPTS),
+        ("append log", TokenCounter, False, PROMPTS),
+        ("append log, count_many", TokenCounter, True, PROMPTS),
+    ):
+        state_dir = tmp_path / name.replace(" ", "_").replace(",", "")
+        counter = _counter(cls, state_dir)
+        batch_prompts = prompts[:count]
+        if batch:
+            elapsed, counted = _timed(lambda c=counter, b=batch_prompts: c.count_many(b))
+        else:
+            elapsed, counted = _timed(lambda c=counter, b=batch_prompts: [c.count(p) for p in b])
+        counter.close()
+        timings[f"{name} ({count})"], results[name] = elapsed, counted
+
+        reloaded = _counter(TokenCounter, state_dir)
+        assert len(reloaded._cache) == count
+
+    print("\nCounting distinct prompts (cache misses, heuristic mode)")
+    for name, elapsed in timings.items():
+        print(f"  {name:<31} {elapsed:7.2f}s")
+
+    baseline = results.pop("rewrite per miss")
+    for counted in results.values():
+        assert len(counted) == PROMPTS
+        assert counted[:BASELINE_PROMPTS] == baseline
@@ -25,7 +25,7 @@ class TestTokenMetricsPipeline:
             api_counting=False,
             cache_enabled=False,
         )
-        counter = TokenCounter(config=config)
+        counter = TokenCounter(config=config, state_dir=tmp_path)
 
         # Step 2: Count some sample text
         sample_text = "def hello_world():\n    print('Hello, ZERG!')\n" * 10
@@ -0,0 +1,58 @@
+"""Benchmark: ``zerg wiki`` after a one-file change on a 2,000-module project.
+
+Runs a full build, edits one module and times the incremental rebuild
+against a second full build, then checks that the incrementally updated
+wiki is byte-for-byte identical to a clean build. Run with ``-s`` to see
+the numbers::
+
+    pytest tests/integration/test_wiki_incremental_benchmark.py -s -m slow
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from tests.fixtures.wiki_fixtures import synthetic_project
+from zerg.commands.wiki import wiki
+
+MODULES = 2_000
+
+
+def _build(*args: str) -> tuple[float, str]:
+    start = time.perf_counter()
+    result = CliRunner().invoke(wiki, list(args), catch_exceptions=False)
+    elapsed = time.perf_counter() - start
+    assert result.exit_code == 0, result.output
+    return elapsed, result.output
+
+
+def _tree(directory: Path) -> dict[str, bytes]:
+    return {p.name: p.read_bytes() for p in directory.glob("*.md")}
+
+
+@pytest.mark.slow
+@pytest.mark.timeout(600)
+def test_one_file_change_on_2000_module_project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    sources = synthetic_project(tmp_path, MODULES)
+
+    first_s, _ = _build("-o", "wiki", "--full")
+    full_s, _ = _build("-o", "wiki", "--full")
+
+    changed = sources[MODULES // 2]
+    changed.write_text(changed.read_text() + "\n\ndef added() -> None:\n    pass\n")
+    incremental_s, output = _build("-o", "wiki")
+    assert "(1 rendered," in output
+
+    _build("-o", "clean", "--full")
+    assert _tree(tmp_path / "wiki") == _tree(tmp_path / "clean")
+
+    print(f"\nzerg wiki on {MODULES} modules ({os.cpu_count()} CPUs)")
+    print(f"  first build (writes every page)  {first_s:6.2f}s")
+    print(f"  full rebuild                      {full_s:6.2f}s")
+    print(f"  one-file change, incremental      {incremental_s:6.2f}s")
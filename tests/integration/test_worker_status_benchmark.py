@@ -0,0 +1,73 @@
+"""Benchmark: reading 50 workers' heartbeats and progress.
+
+Compares the per-worker JSON files (glob the state directory, then open and
+parse one file per worker) with the shared worker status table (one mapping
+of ``worker-status.bin``). Workers write with the default JSON export, so the
+table readers also see the files and must skip them. Only result equality is
+asserted; run with ``-s`` to see the numbers::
+
+    pytest tests/integration/test_worker_status_benchmark.py -s -m slow
+"""
+
+from __future__ import annotations
+
+import shutil
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from zerg.heartbeat import HeartbeatMonitor, HeartbeatWriter
+from zerg.progress_reporter import ProgressReporter
+
+WORKERS = 50
+READS = 200
+
+
+def _per_read_ms(fn: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    for _ in range(READS):
+        fn()
+    return (time.perf_counter() - start) / READS * 1000
+
+
+@pytest.mark.slow
+def test_status_read_cost_at_50_workers(tmp_path: Path) -> None:
+    table_dir = tmp_path / "table"
+    legacy_dir = tmp_path / "legacy"
+    legacy_dir.mkdir()
+    step_states = ["completed"] * 3 + ["in_progress"] + ["pending"] * 4
+    for wid in range(WORKERS):
+        HeartbeatWriter(wid, state_dir=table_dir).write(
+            task_id=f"TASK-{wid:03d}", step="implementing", current_step=4, total_steps=8, step_states=step_states
+        )
+        reporter = ProgressReporter(wid, state_dir=table_dir)
+        reporter.update(current_task=f"TASK-{wid:03d}", current_step="implementing", tasks_total=10)
+        reporter.add_tier_result(1, "syntax", True)
+    # The legacy directory has only the exported JSON files
+    for path in table_dir.glob("*.json"):
+        shutil.copy(path, legacy_dir / path.name)
+
+    legacy_monitor = HeartbeatMonitor(state_dir=legacy_dir)
+    table_monitor = HeartbeatMonitor(state_dir=table_dir)
+    cases = [
+        ("heartbeats", legacy_monitor.read_all, table_monitor.read_all),
+        (
+            "progress",
+            lambda: ProgressReporter.read_all(state_dir=legacy_dir),
+            lambda: ProgressReporter.read_all(state_dir=table_dir),
+        ),
+    ]
+
+    print(f"\nStatus read cost, {WORKERS} workers (ms per read_all)")
+    for name, legacy_fn, table_fn in cases:
+        legacy = legacy_fn()
+        table = table_fn()
+        assert len(table) == WORKERS
+        assert {wid: r.to_dict() for wid, r in table.items()} == {wid: r.to_dict() for wid, r in legacy.items()}
+
+        legacy_ms = _per_read_ms(legacy_fn)
+        table_ms = _per_read_ms(table_fn)
+        print(f"  {name:10s} json files {legacy_ms:6.3f}   status table {table_ms:6.3f}")
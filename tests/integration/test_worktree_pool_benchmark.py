@@ -0,0 +1,78 @@
+"""Benchmark: worker worktree start latency with and without the worktree pool.
+
+Builds a repository with 20k tracked files and provisions worktrees for
+four workers across two levels and then a second run (new feature), as
+the orchestrator does on respawn. Without the pool every spawn removes and
+re-adds the worktree (a full checkout); with it, worktrees are reassigned in
+place or taken from the pool. Only correctness is asserted; run with ``-s``
+to see the numbers::
+
+    pytest tests/integration/test_worktree_pool_benchmark.py -s -m slow
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from zerg.worktree import WorktreeManager
+
+FILES = 20_000
+WORKERS = 4
+LEVELS = 2
+
+
+def _add_files(repo: Path) -> None:
+    """Commit FILES small files to main with git fast-import."""
+    lines = ["commit refs/heads/main", "committer Bench <bench@example.com> 1700000000 +0000", "data 5", "files"]
+    lines.append("from refs/heads/main^0")
+    for i in range(FILES):
+        data = f"VALUE = {i}\n"
+        lines += [f"M 100644 inline pkg{i % 100}/mod{i}.py", f"data {len(data)}", data]
+    subprocess.run(
+        ["git", "-C", str(repo), "fast-import", "--quiet", "--force"],
+        input=("\n".join(lines) + "\n").encode(),
+        check=True,
+    )
+    subprocess.run(["git", "-C", str(repo), "reset", "-q", "--hard", "main"], check=True)
+
+
+def _spawn_latencies(manager: WorktreeManager) -> list[float]:
+    """Provision worktrees as worker spawns do; return per-spawn seconds."""
+    latencies = []
+    for feature in ("run-1", "run-2"):
+        for _level in range(LEVELS):
+            for worker_id in range(WORKERS):
+                start = time.perf_counter()
+                info = manager.create(feature, worker_id)
+                latencies.append(time.perf_counter() - start)
+                assert info.branch == f"zerg/{feature}/worker-{worker_id}"
+                assert (info.path / "pkg99" / f"mod{FILES - 1}.py").exists()
+        # End of run: workers are terminated
+        for worker_id in range(WORKERS):
+            manager.release(manager.get_worktree_path(feature, worker_id))
+    return latencies
+
+
+@pytest.mark.slow
+@pytest.mark.timeout(600)  # the fresh-checkout baseline alone takes tens of seconds
+def test_worktree_pool_start_latency(tmp_repo: Path) -> None:
+    _add_files(tmp_repo)
+
+    fresh = _spawn_latencies(WorktreeManager(tmp_repo))
+    pooled_manager = WorktreeManager(tmp_repo, pool_size=WORKERS)
+    pooled = _spawn_latencies(pooled_manager)
+    pooled_manager.drain_pool()
+
+    spawns = 2 * LEVELS * WORKERS
+    print(f"\nWorker worktree start latency, {FILES} files, {spawns} spawns")
+    for name, latencies in (("fresh", fresh), ("pooled", pooled)):
+        mean_ms = statistics.mean(latencies) * 1000
+        median_ms = statistics.median(latencies) * 1000
+        print(f"  {name:7s} mean {mean_ms:7.1f} ms   median {median_ms:7.1f} ms")
+
+    assert len(fresh) == len(pooled) == spawns
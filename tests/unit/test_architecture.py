@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import random
 from pathlib import Path
 from textwrap import dedent
+from unittest.mock import patch
 
 import pytest
 
+from tests.fixtures.architecture_fixtures import mutate_project, write_layered_project
 from zerg.architecture import (
     ArchitectureChecker,
     ArchitectureConfig,
     ArchitectureException,
+    ArchitectureFactStore,
+    FileFacts,
     ImportRule,
     LayerConfig,
     NamingConvention,
@@ -546,3 +551,92 @@ class TestStdlibDetection:
 
         violations = checker.check_file(file_path, root=tmp_path)
         assert violations == []
+
+
+class TestIncrementalCheck:
+    """check_changed against a full check_directory scan."""
+
+    FILES = 80
+
+    @pytest.fixture
+    def project(self, tmp_path: Path) -> Path:
+        write_layered_project(tmp_path, self.FILES, seed=7)
+        return tmp_path
+
+    @staticmethod
+    def _checker(root: Path) -> ArchitectureChecker:
+        return ArchitectureChecker(load_architecture_config(root / ".zerg" / "config.yaml"), ASTCache())
+
+    @staticmethod
+    def _key(violations: list[Violation]) -> list[tuple]:
+        return sorted((v.file, v.line or 0, v.rule_type, v.message, v.severity) for v in violations)
+
+    def test_matches_full_scan_across_random_edits(self, project: Path) -> None:
+        store_path = project / "facts.json"
+        full = self._key(self._checker(project).check_directory(project))
+        store = ArchitectureFactStore(store_path)
+        assert self._key(self._checker(project).check_changed(project, store)) == full
+        assert {v[2] for v in full} == {"layer", "import", "naming"}
+        store.save()
+
+        rng = random.Random(11)
+        for _ in range(30):
+            changed: list[str] = []
+            for _ in range(rng.randrange(1, 4)):
+                changed += mutate_project(project, rng, self.FILES)
+            store = ArchitectureFactStore(store_path)
+            incremental = self._checker(project).check_changed(project, store, changed)
+            store.save()
+            assert self._key(incremental) == self._key(self._checker(project).check_directory(project))
+
+    def test_unchanged_files_are_not_reparsed(self, project: Path) -> None:
+        store_path = project / "facts.json"
+        store = ArchitectureFactStore(store_path)
+        self._checker(project).check_changed(project, store)
+        store.save()
+
+        changed = mutate_project(project, random.Random(3), self.FILES)
+        store = ArchitectureFactStore(store_path)
+        with patch("zerg.architecture.FileFacts.from_tree", wraps=FileFacts.from_tree) as parsed:
+            self._checker(project).check_changed(project, store, changed)
+        assert parsed.call_count <= 1
+        store.save()
+
+        with patch("zerg.architecture.FileFacts.from_tree", wraps=FileFacts.from_tree) as parsed:
+            self._checker(project).check_changed(project, ArchitectureFactStore(store_path), [])
+        assert parsed.call_count == 0
+
+    def test_config_change_rechecks_without_reparsing(self, project: Path) -> None:
+        store = ArchitectureFactStore()
+        before = self._checker(project).check_changed(project, store)
+
+        config_path = project / ".zerg" / "config.yaml"
+        config_path.write_text(
+            config_path.read_text().replace("allowed_imports: [stdlib, core]", "allowed_imports: []")
+        )
+        checker = self._checker(project)
+        with patch("zerg.architecture.FileFacts.from_tree", wraps=FileFacts.from_tree) as parsed:
+            after = checker.check_changed(project, store, [])
+        assert parsed.call_count == 0
+        assert self._key(after) == self._key(checker.check_directory(project))
+        assert len(after) > len(before)
+
+    def test_changed_files_discover_new_and_deleted_files(self, tmp_path: Path) -> None:
+        config = ArchitectureConfig(enabled=True, import_rules=[ImportRule(directory="src/", deny=["flask"])])
+        checker = ArchitectureChecker(config, ASTCache())
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "a.py").write_text("import flask\n")
+        store = ArchitectureFactStore()
+        assert [v.file for v in checker.check_changed(tmp_path, store)] == ["src/a.py"]
+
+        (tmp_path / "src" / "a.py").unlink()
+        (tmp_path / "src" / "b.py").write_text("import flask\n")
+        (tmp_path / "src" / "notes.txt").write_text("import flask\n")
+        violations = checker.check_changed(tmp_path, store, ["src/a.py", "src/b.py", "src/notes.txt"])
+        assert [v.file for v in violations] == ["src/b.py"]
+        assert set(store.files) == {"src/b.py"}
+
+    def test_corrupt_store_is_ignored(self, tmp_path: Path) -> None:
+        store_path = tmp_path / "facts.json"
+        store_path.write_text("{not json")
+        assert ArchitectureFactStore(store_path).files == {}
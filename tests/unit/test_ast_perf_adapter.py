@@ -0,0 +1,177 @@
+"""Tests for the built-in AST performance anti-pattern analyser."""
+
+from __future__ import annotations
+
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from zerg.performance.adapters import ast_perf_adapter
+from zerg.performance.adapters.ast_perf_adapter import AstPerfAdapter, analyze_file
+from zerg.performance.catalog import FactorCatalog
+from zerg.performance.types import DetectedStack, Severity
+
+
+@pytest.fixture()
+def python_stack() -> DetectedStack:
+    return DetectedStack(languages=["python"], frameworks=[])
+
+
+def _rules(tmp_path: Path, source: str) -> list[str]:
+    path = tmp_path / "mod.py"
+    path.write_text(textwrap.dedent(source), encoding="utf-8")
+    return [rule_id for rule_id, _line, _msg in analyze_file(str(path))]
+
+
+class TestRules:
+    def test_string_concat_in_loop(self, tmp_path: Path) -> None:
+        src = """
+        def build(items):
+            out = ""
+            for item in items:
+                out += item
+            return out
+        """
+        assert _rules(tmp_path, src) == ["string-concat-in-loop"]
+
+    def test_numeric_accumulation_not_flagged(self, tmp_path: Path) -> None:
+        src = """
+        def total(items):
+            n = 0
+            for item in items:
+                n += item
+            return n
+        """
+        assert _rules(tmp_path, src) == []
+
+    def test_pop_front_and_list_membership(self, tmp_path: Path) -> None:
+        src = """
+        def drain(queue, wanted):
+            seen = []
+            while queue:
+                item = queue.pop(0)
+                if item in seen:
+                    continue
+                seen.append(item)
+        """
+        assert sorted(_rules(tmp_path, src)) == ["list-membership-in-loop", "list-pop-front"]
+
+    def test_invariant_regex_and_parse_in_loop(self, tmp_path: Path) -> None:
+        src = """
+        import json
+        import re
+
+        def scan(lines, raw):
+            for line in lines:
+                pat = re.compile(r"\\d+")
+                cfg = json.loads(raw)
+                row = json.loads(line)
+                per_line = re.compile(line)
+        """
+        assert sorted(_rules(tmp_path, src)) == ["regex-compile-in-loop", "repeated-parse-in-loop"]
+
+    def test_blocking_calls_in_async(self, tmp_path: Path) -> None:
+        src = """
+        import subprocess
+        import time
+
+        async def handler():
+            time.sleep(1)
+            subprocess.run(["ls"])
+
+            def helper():
+                time.sleep(1)  # sync helper: not flagged
+        """
+        assert _rules(tmp_path, src) == ["blocking-call-in-async", "blocking-call-in-async"]
+
+    def test_subprocess_and_await_in_loop(self, tmp_path: Path) -> None:
+        src = """
+        import subprocess
+
+        async def fetch_all(client, urls):
+            for url in urls:
+                await client.get(url)
+                await client.head(url)
+
+        def per_file(paths):
+            for p in paths:
+                subprocess.run(["wc", p])
+        """
+        assert sorted(_rules(tmp_path, src)) == ["await-in-loop", "subprocess-in-loop"]
+
+    def test_unbounded_caches(self, tmp_path: Path) -> None:
+        src = """
+        import functools
+        from functools import lru_cache
+
+        _RESULT_CACHE = {}
+        _BOUNDED_CACHE = {}
+
+        @functools.cache
+        def a(x):
+            return x
+
+        @lru_cache(maxsize=None)
+        def b(x):
+            return x
+
+        @lru_cache(maxsize=128)
+        def c(x):
+            return x
+
+        def remember(key, value):
+            _RESULT_CACHE[key] = value
+            if len(_BOUNDED_CACHE) > 100:
+                _BOUNDED_CACHE.clear()
+            _BOUNDED_CACHE[key] = value
+        """
+        assert sorted(_rules(tmp_path, src)) == [
+            "unbounded-lru-cache",
+            "unbounded-lru-cache",
+            "unbounded-module-cache",
+        ]
+
+    def test_syntax_error_skipped(self, tmp_path: Path) -> None:
+        assert _rules(tmp_path, "def broken(:\n") == []
+
+
+class TestAdapter:
+    def test_findings_map_to_catalog_factors(self, tmp_path: Path, python_stack: DetectedStack) -> None:
+        path = tmp_path / "mod.py"
+        path.write_text("def f(xs):\n    s = ''\n    for x in xs:\n        s += x\n", encoding="utf-8")
+
+        findings = AstPerfAdapter().run([str(path), str(tmp_path / "README.md")], str(tmp_path), python_stack)
+
+        catalog = {f.id: f for f in FactorCatalog.load().factors}
+        assert len(findings) == 1
+        finding = findings[0]
+        assert finding.factor_id == 67
+        assert finding.factor_name == catalog[67].factor
+        assert finding.category == catalog[67].category
+        assert finding.severity == Severity.MEDIUM
+        assert finding.file == str(path)
+        assert finding.line == 4
+
+    def test_all_rules_reference_catalog_ids(self) -> None:
+        ids = {f.id for f in FactorCatalog.load().factors}
+        assert set(AstPerfAdapter.factors_covered) <= ids
+
+    def test_parallel_matches_serial(
+        self, tmp_path: Path, python_stack: DetectedStack, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        files = []
+        for i in range(12):
+            path = tmp_path / f"m{i}.py"
+            path.write_text(f"import re\n\ndef f{i}(xs):\n    for x in xs:\n        re.compile('a')\n")
+            files.append(str(path))
+
+        serial = AstPerfAdapter(max_workers=1).run(files, str(tmp_path), python_stack)
+        monkeypatch.setattr(ast_perf_adapter, "_PARALLEL_THRESHOLD", 4)
+        parallel = AstPerfAdapter(max_workers=2).run(files, str(tmp_path), python_stack)
+
+        assert [f.to_dict() for f in parallel] == [f.to_dict() for f in serial]
+        assert len(serial) == 12
+
+    def test_not_applicable_without_python(self) -> None:
+        assert not AstPerfAdapter().is_applicable(DetectedStack(languages=["go"], frameworks=[]))
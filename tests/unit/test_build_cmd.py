@@ -20,6 +20,7 @@ from zerg.commands.build import (
     _watch_loop,
     build,
 )
+from zerg.file_watcher import FileWatcher
 
 
 class TestBuildSystem:
@@ -153,7 +154,8 @@ class TestWatchLoop:
                 raise KeyboardInterrupt
 
         mock_sleep.side_effect = sleep_side_effect
-        _watch_loop(mock_builder, BuildSystem.PYTHON, str(tmp_path))
+        watcher = FileWatcher(tmp_path, extensions={".py"}, use_inotify=False)
+        _watch_loop(mock_builder, BuildSystem.PYTHON, str(tmp_path), watcher=watcher)
         mock_builder.run.assert_called()
 
 
@@ -0,0 +1,173 @@
+"""Tests for zerg.claude_stream module."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from zerg.claude_stream import OutputTail, StreamProgress, _EventParser, run_streaming
+
+
+def _python(code: str) -> list[str]:
+    return [sys.executable, "-c", code]
+
+
+class TestOutputTail:
+    """Tests for the bounded tail buffer."""
+
+    def test_keeps_everything_under_limit(self) -> None:
+        tail = OutputTail(limit=16)
+        tail.append(b"hello ")
+        tail.append(b"world")
+        assert tail.text() == "hello world"
+        assert tail.total == 11
+        assert not tail.truncated
+
+    def test_keeps_last_bytes_over_limit(self) -> None:
+        tail = OutputTail(limit=8)
+        for i in range(100):
+            tail.append(f"{i:03d}|".encode())
+        assert tail.text() == "098|099|"
+        assert tail.total == 400
+        assert tail.truncated
+        assert tail._size < 2 * tail.limit
+
+    def test_single_large_chunk(self) -> None:
+        tail = OutputTail(limit=4)
+        tail.append(b"abcdefgh")
+        assert tail.text() == "efgh"
+
+    def test_invalid_utf8_replaced(self) -> None:
+        tail = OutputTail(limit=3)
+        tail.append("é".encode() * 2)  # cut in the middle of a multi-byte char
+        assert tail.text().endswith("é")
+
+
+class TestEventParser:
+    """Tests for stream-json line parsing."""
+
+    def test_events_split_across_chunks(self) -> None:
+        events: list[dict] = []
+        parser = _EventParser(events.append)
+        payload = b'{"type": "system"}\nplain text\n{"type": "assi' + b'stant"}\n{"type": "result"}'
+        for i in range(0, len(payload), 5):
+            parser.feed(payload[i : i + 5])
+        parser.close()
+        assert [e["type"] for e in events] == ["system", "assistant", "result"]
+
+    def test_ignores_invalid_json_and_non_objects(self) -> None:
+        events: list[dict] = []
+        parser = _EventParser(events.append)
+        parser.feed(b'{broken\n[1, 2]\n{"ok": 1}\n')
+        assert events == [{"ok": 1}]
+
+    def test_skips_oversized_lines(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("zerg.claude_stream._MAX_EVENT_LINE", 10)
+        events: list[dict] = []
+        parser = _EventParser(events.append)
+        parser.feed(b'{"big": "' + b"x" * 50)
+        parser.feed(b'"}\n{"a": 1}\n')
+        assert events == [{"a": 1}]
+
+
+class TestStreamProgress:
+    """Tests for progress derived from events."""
+
+    def test_counts_turns_and_tools(self) -> None:
+        progress = StreamProgress()
+        progress.update({"type": "system", "subtype": "init"})
+        progress.update(
+            {"type": "assistant", "message": {"content": [{"type": "text"}, {"type": "tool_use", "name": "Bash"}]}}
+        )
+        progress.update({"type": "assistant", "message": {"content": "not a list"}})
+        progress.update({"type": "result", "subtype": "success"})
+        assert progress.to_dict() == {"events": 4, "turns": 2, "tool_uses": 1, "last_tool": "Bash"}
+        assert progress.result == {"type": "result", "subtype": "success"}
+
+
+class TestRunStreaming:
+    """Tests for run_streaming."""
+
+    def test_tees_output_and_reports_events(self, tmp_path: Path) -> None:
+        seen: list[str] = []
+        out = tmp_path / "out.txt"
+        code = (
+            "import json, sys\n"
+            "print(json.dumps({'type': 'system'}))\n"
+            "print('warn', file=sys.stderr)\n"
+            "print(json.dumps({'type': 'result'}))\n"
+        )
+
+        run = run_streaming(
+            _python(code),
+            cwd=tmp_path,
+            env=dict(os.environ),
+            timeout=30,
+            output_path=out,
+            on_event=lambda event, _progress: seen.append(event["type"]),
+        )
+
+        assert run.returncode == 0
+        assert not run.timed_out
+        assert seen == ["system", "result"]
+        assert [json.loads(line)["type"] for line in run.stdout.splitlines()] == ["system", "result"]
+        assert run.stderr == "warn\n"
+        assert out.read_text() == f"=== STDOUT ===\n{run.stdout}\n=== STDERR ===\nwarn\n\n"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["out.txt"]
+
+    def test_callback_errors_do_not_stop_pump(self, tmp_path: Path) -> None:
+        def boom(_event: dict, _progress: StreamProgress) -> None:
+            raise RuntimeError("boom")
+
+        run = run_streaming(
+            _python("print('{\"a\": 1}'); print('{\"b\": 2}')"),
+            cwd=tmp_path,
+            env=dict(os.environ),
+            timeout=30,
+            on_event=boom,
+        )
+        assert run.returncode == 0
+        assert run.progress.events == 2
+
+    def test_timeout_kills_and_keeps_partial_output(self, tmp_path: Path) -> None:
+        out = tmp_path / "out.txt"
+        code = "import time\nprint('before', flush=True)\ntime.sleep(30)\nprint('after')\n"
+
+        run = run_streaming(_python(code), cwd=tmp_path, env=dict(os.environ), timeout=3, output_path=out)
+
+        assert run.timed_out
+        assert run.returncode == -1
+        assert run.stdout == "before\n"
+        assert out.read_text() == "=== STDOUT ===\nbefore\n\n"
+
+    def test_ticks_while_process_is_silent(self, tmp_path: Path) -> None:
+        ticks: list[float] = []
+
+        run = run_streaming(
+            _python("import time; time.sleep(1.0)"),
+            cwd=tmp_path,
+            env=dict(os.environ),
+            timeout=30,
+            on_tick=lambda: ticks.append(time.monotonic()),
+            tick_interval=0.1,
+        )
+
+        assert run.returncode == 0
+        assert not run.timed_out
+        assert len(ticks) >= 3
+
+    def test_missing_executable(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            run_streaming(
+                [str(tmp_path / "nope")],
+                cwd=tmp_path,
+                env=dict(os.environ),
+                timeout=5,
+                output_path=tmp_path / "out.txt",
+            )
+        assert not (tmp_path / "out.txt.stderr").exists()
@@ -1,7 +1,10 @@
 """Tests for ClaudeTasksReader — reading Claude Code Tasks from disk."""
 
 import json
+import os
+from unittest.mock import patch
 
+from zerg import claude_tasks_reader
 from zerg.claude_tasks_reader import ClaudeTasksReader
 from zerg.constants import TaskStatus
 
@@ -101,6 +104,71 @@ class TestFindFeatureTaskList:
         assert result1 == result2 == task_list
 
 
+class TestDiscoveryIndex:
+    def _make_list(self, root, name, feature, count=3):
+        task_list = root / name
+        task_list.mkdir()
+        for i in range(1, count + 1):
+            _write_task(task_list, i, f"[L{i}] Task {i}", description=f"Feature: {feature}")
+        return task_list
+
+    def test_index_persisted_and_reused(self, tmp_path):
+        tasks_dir = tmp_path / "tasks"
+        tasks_dir.mkdir()
+        matching = self._make_list(tasks_dir, "uuid-a", "my-feature")
+        self._make_list(tasks_dir, "uuid-b", "other-feature")
+        index_path = tmp_path / "index.json"
+
+        reader = ClaudeTasksReader(tasks_dir=tasks_dir, index_path=index_path)
+        assert reader.find_feature_task_list("my-feature") == matching
+        assert index_path.exists()
+
+        # A fresh reader resolves the feature from the index without parsing task files
+        fresh = ClaudeTasksReader(tasks_dir=tasks_dir, index_path=index_path)
+        with patch.object(claude_tasks_reader, "json_loads", wraps=claude_tasks_reader.json_loads) as spy:
+            assert fresh.find_feature_task_list("my-feature") == matching
+            # Only the index itself is decoded
+            assert spy.call_count == 1
+
+    def test_only_changed_dirs_rescanned(self, tmp_path):
+        tasks_dir = tmp_path / "tasks"
+        tasks_dir.mkdir()
+        self._make_list(tasks_dir, "uuid-a", "alpha")
+        changed = self._make_list(tasks_dir, "uuid-b", "beta")
+        index_path = tmp_path / "index.json"
+
+        ClaudeTasksReader(tasks_dir=tasks_dir, index_path=index_path).find_feature_task_list("alpha")
+
+        _write_task(changed, 9, "[L1] Late task", description="Feature: gamma")
+        reader = ClaudeTasksReader(tasks_dir=tasks_dir, index_path=index_path)
+        with patch.object(ClaudeTasksReader, "_summarize_dir", wraps=ClaudeTasksReader._summarize_dir) as spy:
+            assert reader.find_feature_task_list("gamma") == changed
+            assert [c.args[0] for c in spy.call_args_list] == [changed]
+
+    def test_new_dir_invalidates_feature_hit(self, tmp_path):
+        tasks_dir = tmp_path / "tasks"
+        tasks_dir.mkdir()
+        old = self._make_list(tasks_dir, "uuid-old", "my-feature")
+        index_path = tmp_path / "index.json"
+        assert ClaudeTasksReader(tasks_dir=tasks_dir, index_path=index_path).find_feature_task_list("my-feature") == old
+
+        new = self._make_list(tasks_dir, "uuid-new", "my-feature")
+        os.utime(old, ns=(1_000_000_000, 1_000_000_000))
+        reader = ClaudeTasksReader(tasks_dir=tasks_dir, index_path=index_path)
+        assert reader.find_feature_task_list("my-feature") == new
+
+    def test_corrupt_index_ignored(self, tmp_path):
+        tasks_dir = tmp_path / "tasks"
+        tasks_dir.mkdir()
+        task_list = self._make_list(tasks_dir, "uuid-a", "my-feature")
+        index_path = tmp_path / "index.json"
+        index_path.write_text("{not json", encoding="utf-8")
+
+        reader = ClaudeTasksReader(tasks_dir=tasks_dir, index_path=index_path)
+        assert reader.find_feature_task_list("my-feature") == task_list
+        assert json.loads(index_path.read_text())["features"]["my-feature"] == "uuid-a"
+
+
 class TestReadTasks:
     def test_synthesizes_state(self, tmp_path):
         task_list = tmp_path / "uuid-abc"
@@ -244,6 +312,42 @@ class TestReadTasks:
         assert state["current_level"] == 2
 
 
+class TestIncrementalReadTasks:
+    def test_unchanged_files_not_reparsed(self, tmp_path):
+        task_list = tmp_path / "uuid-abc"
+        task_list.mkdir()
+        _write_task(task_list, 1, "[L1] Task A", status="pending")
+        path_b = _write_task(task_list, 2, "[L1] Task B", status="pending")
+
+        reader = ClaudeTasksReader(tasks_dir=tmp_path)
+        reader.read_tasks(task_list)
+
+        _write_task(task_list, 2, "[L1] Task B", status="completed")
+        st = path_b.stat()
+        os.utime(path_b, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        with patch.object(claude_tasks_reader, "json_loads", wraps=claude_tasks_reader.json_loads) as spy:
+            state = reader.read_tasks(task_list)
+            assert spy.call_count == 1
+
+        assert state["tasks"]["TASK-1"]["status"] == TaskStatus.PENDING.value
+        assert state["tasks"]["TASK-2"]["status"] == TaskStatus.COMPLETE.value
+
+    def test_removed_files_dropped(self, tmp_path):
+        task_list = tmp_path / "uuid-abc"
+        task_list.mkdir()
+        _write_task(task_list, 1, "[L1] Task A")
+        path_b = _write_task(task_list, 2, "[L2] Task B")
+
+        reader = ClaudeTasksReader(tasks_dir=tmp_path)
+        assert len(reader.read_tasks(task_list)["tasks"]) == 2
+
+        path_b.unlink()
+        state = reader.read_tasks(task_list)
+        assert list(state["tasks"]) == ["TASK-1"]
+        assert "2" not in state["levels"]
+
+
 class TestMapStatus:
     def test_pending_no_blockers(self):
         assert ClaudeTasksReader._map_status("pending", []) == TaskStatus.PENDING.value
@@ -100,6 +100,16 @@ class TestCreateCleanupPlan:
         plan = create_cleanup_plan(["my-feature"], False, False, mock_config)
         assert len(plan["worktrees"]) == 2
 
+    def test_plan_includes_pooled_worktrees(self, tmp_path: Path, monkeypatch, mock_config) -> None:
+        """Test plan finds idle worktrees left in the pool."""
+        monkeypatch.chdir(tmp_path)
+        pool_dir = tmp_path / ".zerg-worktrees" / "_pool"
+        (pool_dir / "slot-0").mkdir(parents=True)
+        (pool_dir / "slot-1").mkdir()
+
+        plan = create_cleanup_plan(["my-feature"], False, False, mock_config)
+        assert [Path(p).name for p in plan["worktrees"]] == ["slot-0", "slot-1"]
+
     def test_plan_respects_keep_logs(self, tmp_path: Path, monkeypatch, mock_config) -> None:
         """Test plan respects keep_logs flag."""
         monkeypatch.chdir(tmp_path)
@@ -193,6 +203,7 @@ class TestExecuteCleanup:
         }
         execute_cleanup(plan, mock_config)
         assert mock_worktree.delete.call_count == 1
+        mock_worktree.drain_pool.assert_called_once()
 
     @patch("zerg.commands.cleanup.WorktreeManager")
     @patch("zerg.commands.cleanup.ContainerManager")
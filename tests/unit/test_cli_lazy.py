@@ -0,0 +1,131 @@
+"""Tests for lazy subcommand loading in zerg.cli and the CLI import-time budget."""
+
+from __future__ import annotations
+
+import importlib
+import subprocess
+import sys
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from zerg.cli import LAZY_COMMANDS, LazyGroup, cli
+
+# Budget for ``python -X importtime -m zerg --help``. Eager registration of
+# every command module imported ~485 modules in ~10x the time of importing
+# click alone. Absolute import times vary several-fold with machine load, so
+# the time budget is relative to ``import click`` measured alongside it.
+MAX_IMPORTED_MODULES = 150
+MAX_IMPORT_TIME_RATIO = 2.5
+
+
+def _fresh_lazy_group() -> LazyGroup:
+    """A copy of the zerg group with no subcommands loaded yet."""
+    return LazyGroup(name="zerg", params=cli.params, callback=cli.callback, help=cli.help, lazy_commands=LAZY_COMMANDS)
+
+
+def _eager_group() -> click.Group:
+    """The zerg group with every subcommand registered up front."""
+    group = click.Group(name="zerg", params=cli.params, callback=cli.callback, help=cli.help)
+    for name, (module_name, attr, _summary) in LAZY_COMMANDS.items():
+        group.add_command(getattr(importlib.import_module(module_name), attr), name=name)
+    return group
+
+
+class TestLazyCommands:
+    """Tests for the LAZY_COMMANDS table."""
+
+    @pytest.mark.parametrize("name", sorted(LAZY_COMMANDS))
+    def test_entry_resolves_to_named_command(self, name: str) -> None:
+        module_name, attr, summary = LAZY_COMMANDS[name]
+        command = getattr(importlib.import_module(module_name), attr)
+
+        assert isinstance(command, click.Command)
+        stand_in = click.Command(name, help=summary)
+        for limit in (45, 60, 200):
+            assert stand_in.get_short_help_str(limit) == command.get_short_help_str(limit)
+
+
+class TestLazyGroup:
+    """Tests for LazyGroup."""
+
+    def test_help_matches_eager_group(self) -> None:
+        runner = CliRunner()
+        lazy = runner.invoke(_fresh_lazy_group(), ["--help"], prog_name="zerg")
+        eager = runner.invoke(_eager_group(), ["--help"], prog_name="zerg")
+
+        assert lazy.exit_code == eager.exit_code == 0
+        assert lazy.output == eager.output
+
+    def test_help_does_not_load_commands(self) -> None:
+        group = _fresh_lazy_group()
+        CliRunner().invoke(group, ["--help"])
+        assert group.commands == {}
+
+    def test_get_command_loads_only_that_command(self) -> None:
+        group = _fresh_lazy_group()
+        ctx = click.Context(group)
+
+        command = group.get_command(ctx, "status")
+
+        assert command is importlib.import_module("zerg.commands.status").status
+        assert list(group.commands) == ["status"]
+        assert group.get_command(ctx, "nope") is None
+
+    def test_list_commands_includes_eager_and_lazy(self) -> None:
+        group = _fresh_lazy_group()
+        group.add_command(click.Command("zzz-extra"))
+        assert group.list_commands(click.Context(group)) == sorted([*LAZY_COMMANDS, "zzz-extra"])
+
+    def test_shell_complete_without_loading(self) -> None:
+        group = _fresh_lazy_group()
+        items = group.shell_complete(click.Context(group), "st")
+
+        assert [(item.value, item.help) for item in items] == [
+            ("status", "Show execution progress."),
+            ("stop", "Stop execution gracefully or forcefully."),
+        ]
+        assert group.commands == {}
+
+    def test_hidden_loaded_command_not_listed(self) -> None:
+        group = _fresh_lazy_group()
+        group.add_command(click.Command("secret", hidden=True))
+        result = CliRunner().invoke(group, ["--help"])
+        assert "secret" not in result.output
+
+
+class TestImportBudget:
+    """Import-time budget for ``python -m zerg --help``."""
+
+    def _measure(self, *args: str) -> tuple[list[str], float]:
+        """Return (imported modules, cumulative import time in ms) for ``python -X importtime *args``."""
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", *args],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        modules: list[str] = []
+        total_us = 0
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:") or "self [us]" in line:
+                continue
+            self_us, _cumulative, name = line[len("import time:") :].split("|")
+            total_us += int(self_us)
+            modules.append(name.strip())
+        return modules, total_us / 1000
+
+    def test_help_stays_within_budget(self) -> None:
+        # Interleave runs and keep the best of each to damp scheduling noise
+        zerg_ms: list[float] = []
+        click_ms: list[float] = []
+        for _ in range(3):
+            modules, elapsed = self._measure("-m", "zerg", "--help")
+            zerg_ms.append(elapsed)
+            click_ms.append(self._measure("-c", "import click")[1])
+        ratio = min(zerg_ms) / min(click_ms)
+
+        assert not [m for m in modules if m.startswith("zerg.commands.")]
+        assert len(modules) <= MAX_IMPORTED_MODULES, f"{len(modules)} modules imported"
+        assert ratio <= MAX_IMPORT_TIME_RATIO, f"{min(zerg_ms):.0f} ms, {ratio:.1f}x the cost of importing click"
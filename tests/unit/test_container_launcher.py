@@ -74,6 +74,12 @@ class TestBuildContainerCmd:
         assert "--name" in cmd
         assert cmd[cmd.index("--name") + 1] == "zerg-worker-0"
 
+    def test_label_and_healthcheck_in_command(self, tmp_path: Path) -> None:
+        cmd = _launcher()._build_container_cmd("zerg-worker-0", _fake_worktree(tmp_path), {})
+
+        assert cmd[cmd.index("--label") + 1] == "zerg.worker=zerg-worker-0"
+        assert cmd[cmd.index("--health-cmd") + 1] == "test -f /tmp/.zerg-alive"
+
     def test_resource_limits_in_command(self, tmp_path: Path) -> None:
         wt = _fake_worktree(tmp_path)
         launcher = _launcher(memory_limit="8g", cpu_limit=4.0)
@@ -585,7 +591,7 @@ class TestMonitor:
         launcher._workers[0] = handle
         launcher._container_ids[0] = "cid"
 
-        mock_run.return_value = MagicMock(returncode=0, stdout="true,0\n")
+        mock_run.return_value = MagicMock(returncode=0, stdout="cid true 0 \n")
         status = launcher.monitor(0)
         assert status == WorkerStatus.RUNNING
 
@@ -596,7 +602,7 @@ class TestMonitor:
         launcher._workers[0] = handle
         launcher._container_ids[0] = "cid"
 
-        mock_run.return_value = MagicMock(returncode=0, stdout="false,0\n")
+        mock_run.return_value = MagicMock(returncode=0, stdout="cid false 0 \n")
         status = launcher.monitor(0)
         assert status == WorkerStatus.STOPPED
 
@@ -608,7 +614,7 @@ class TestMonitor:
         launcher._workers[0] = handle
         launcher._container_ids[0] = "cid"
 
-        mock_run.return_value = MagicMock(returncode=0, stdout="false,2\n")
+        mock_run.return_value = MagicMock(returncode=0, stdout="cid false 2 \n")
         status = launcher.monitor(0)
         assert status == WorkerStatus.CHECKPOINTING
 
@@ -620,7 +626,7 @@ class TestMonitor:
         launcher._workers[0] = handle
         launcher._container_ids[0] = "cid"
 
-        mock_run.return_value = MagicMock(returncode=0, stdout="false,3\n")
+        mock_run.return_value = MagicMock(returncode=0, stdout="cid false 3 \n")
         status = launcher.monitor(0)
         assert status == WorkerStatus.BLOCKED
 
@@ -631,7 +637,7 @@ class TestMonitor:
         launcher._workers[0] = handle
         launcher._container_ids[0] = "cid"
 
-        mock_run.return_value = MagicMock(returncode=0, stdout="false,137\n")
+        mock_run.return_value = MagicMock(returncode=0, stdout="cid false 137 \n")
         status = launcher.monitor(0)
         assert status == WorkerStatus.CRASHED
 
@@ -663,7 +669,7 @@ class TestMonitor:
         def side_effect(*args, **kwargs):
             cmd = args[0]
             if "inspect" in cmd:
-                return MagicMock(returncode=0, stdout="true,0\n")
+                return MagicMock(returncode=0, stdout="cid true 0 \n")
             if "test" in cmd:
                 # marker file absent
                 return MagicMock(returncode=1)
@@ -673,6 +679,33 @@ class TestMonitor:
         status = launcher.monitor(0)
         assert status == WorkerStatus.STOPPED
 
+    @patch("subprocess.run")
+    def test_monitor_unhealthy_container_stopped_without_exec(self, mock_run: MagicMock) -> None:
+        """Healthcheck reports the alive marker gone -> STOPPED, no docker exec."""
+        launcher = _launcher()
+        handle = WorkerHandle(worker_id=0, container_id="cid", status=WorkerStatus.RUNNING)
+        handle.started_at = datetime.now() - timedelta(seconds=120)
+        launcher._workers[0] = handle
+        launcher._container_ids[0] = "cid"
+
+        mock_run.return_value = MagicMock(returncode=0, stdout="cid true 0 unhealthy\n")
+        assert launcher.monitor(0) == WorkerStatus.STOPPED
+        assert [c.args[0][1] for c in mock_run.call_args_list] == ["inspect"]
+
+    @patch("subprocess.run")
+    def test_monitor_batches_inspect_across_workers(self, mock_run: MagicMock) -> None:
+        launcher = _launcher()
+        for wid in range(3):
+            launcher._workers[wid] = WorkerHandle(worker_id=wid, container_id=f"cid{wid}", status=WorkerStatus.RUNNING)
+            launcher._container_ids[wid] = f"cid{wid}"
+
+        mock_run.return_value = MagicMock(returncode=1, stdout="cid0full true 0 healthy\ncid2full false 3 \n")
+        statuses = [launcher.monitor(wid) for wid in range(3)]
+
+        assert statuses == [WorkerStatus.RUNNING, WorkerStatus.STOPPED, WorkerStatus.BLOCKED]
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0][-3:] == ["cid0", "cid1", "cid2"]
+
     @patch("subprocess.run")
     def test_monitor_alive_check_marker_present(self, mock_run: MagicMock) -> None:
         """Alive check finds marker file present -> remains RUNNING."""
@@ -690,7 +723,7 @@ class TestMonitor:
         def side_effect(*args, **kwargs):
             cmd = args[0]
             if "inspect" in cmd:
-                return MagicMock(returncode=0, stdout="true,0\n")
+                return MagicMock(returncode=0, stdout="cid true 0 \n")
             if "test" in cmd:
                 return MagicMock(returncode=0)  # marker present
             return MagicMock(returncode=0)
@@ -719,7 +752,7 @@ class TestMonitor:
         launcher._workers[0] = handle
         launcher._container_ids[0] = "cid"
 
-        mock_run.return_value = MagicMock(returncode=0, stdout="true,0\n")
+        mock_run.return_value = MagicMock(returncode=0, stdout="cid true 0 \n")
         status = launcher.monitor(0)
         assert status == WorkerStatus.RUNNING
 
@@ -0,0 +1,217 @@
+"""Tests for ContainerMonitor against a fake ``docker`` executable.
+
+The fake docker on PATH records every invocation, answers ``docker inspect``
+from a JSON state file and replays ``docker events`` lines appended to an
+events file, so the number of docker calls per orchestrator tick can be
+counted as the worker count grows.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import stat
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from zerg.constants import WorkerStatus
+from zerg.launcher_types import WorkerHandle
+from zerg.launchers.container_launcher import ContainerLauncher
+from zerg.launchers.container_monitor import ContainerMonitor
+
+TICK_SECONDS = 0.3
+
+FAKE_DOCKER = """#!{python}
+import json, os, sys, time
+
+root = os.environ["FAKE_DOCKER_DIR"]
+with open(os.path.join(root, "calls.log"), "a") as log:
+    log.write(sys.argv[1] + "\\n")
+
+if sys.argv[1] == "inspect":
+    with open(os.path.join(root, "containers.json")) as f:
+        containers = json.load(f)
+    missing = False
+    for cid in sys.argv[4:]:
+        c = containers.get(cid)
+        if c is None:
+            missing = True
+            print(f"Error: No such object: {{cid}}", file=sys.stderr)
+            continue
+        print(f"{{cid}}-full {{c['running']}} {{c['exit_code']}} {{c['health']}}")
+    sys.exit(1 if missing else 0)
+
+if sys.argv[1] == "events":
+    # Like docker: without --since only events from now on are streamed
+    path = os.path.join(root, "events.jsonl")
+    since = float(sys.argv[sys.argv.index("--since") + 1]) if "--since" in sys.argv else None
+    pos = os.path.getsize(path) if since is None and os.path.exists(path) else 0
+    while True:
+        if os.path.exists(path):
+            with open(path) as f:
+                f.seek(pos)
+                data = f.read()
+                pos = f.tell()
+            for line in data.splitlines():
+                if since is None or json.loads(line)["time"] >= since:
+                    print(line, flush=True)
+        time.sleep(0.02)
+"""
+
+
+class FakeDocker:
+    """Controls the fake docker executable's state and reads its call log."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.containers: dict[str, dict[str, str]] = {}
+
+    def add(self, cid: str, running: bool = True, exit_code: int = 0, health: str = "healthy") -> None:
+        self.containers[cid] = {"running": str(running).lower(), "exit_code": str(exit_code), "health": health}
+        (self.root / "containers.json").write_text(json.dumps(self.containers))
+
+    def emit(self, cid: str, action: str, **attributes: str) -> None:
+        event = {
+            "Type": "container",
+            "Action": action,
+            "time": int(time.time()),
+            "id": f"{cid}-full",
+            "Actor": {"ID": f"{cid}-full", "Attributes": attributes},
+        }
+        with (self.root / "events.jsonl").open("a") as f:
+            f.write(json.dumps(event) + "\n")
+
+    def calls(self, subcommand: str | None = None) -> list[str]:
+        log = self.root / "calls.log"
+        calls = log.read_text().split() if log.exists() else []
+        return [c for c in calls if subcommand in (None, c)]
+
+
+@pytest.fixture
+def fake_docker(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> FakeDocker:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "docker"
+    script.write_text(FAKE_DOCKER.format(python=sys.executable))
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_DOCKER_DIR", str(tmp_path))
+    return FakeDocker(tmp_path)
+
+
+def _launcher_with_workers(fake_docker: FakeDocker, count: int, monitor_events: bool) -> ContainerLauncher:
+    launcher = ContainerLauncher(monitor_events=monitor_events)
+    # Short cooldown so each simulated tick really consults the monitor
+    launcher.MONITOR_COOLDOWN_SECONDS = TICK_SECONDS
+    for wid in range(count):
+        cid = f"c{wid:03d}"
+        fake_docker.add(cid)
+        launcher._workers[wid] = WorkerHandle(worker_id=wid, container_id=cid, status=WorkerStatus.RUNNING)
+        launcher._container_ids[wid] = cid
+    return launcher
+
+
+def _inspects_per_tick(launcher: ContainerLauncher, fake_docker: FakeDocker, ticks: int) -> list[int]:
+    counts = []
+    for _ in range(ticks):
+        before = len(fake_docker.calls("inspect"))
+        launcher.sync_state()
+        counts.append(len(fake_docker.calls("inspect")) - before)
+        time.sleep(TICK_SECONDS)
+    return counts
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+class TestPolling:
+    """Batched docker inspect when the event stream is not used."""
+
+    def test_one_inspect_per_tick_regardless_of_worker_count(self, fake_docker: FakeDocker) -> None:
+        per_tick = {}
+        for count in (2, 8, 32):
+            launcher = _launcher_with_workers(fake_docker, count, monitor_events=False)
+            per_tick[count] = _inspects_per_tick(launcher, fake_docker, ticks=3)
+
+        assert per_tick == {2: [1, 1, 1], 8: [1, 1, 1], 32: [1, 1, 1]}
+        assert set(fake_docker.calls()) == {"inspect"}
+
+    def test_exit_codes_and_missing_containers(self, fake_docker: FakeDocker) -> None:
+        launcher = _launcher_with_workers(fake_docker, 3, monitor_events=False)
+        fake_docker.add("c001", running=False, exit_code=2)
+        del fake_docker.containers["c002"]
+        fake_docker.add("c000", health="unhealthy")
+
+        assert launcher.sync_state() == {
+            0: WorkerStatus.STOPPED,
+            1: WorkerStatus.CHECKPOINTING,
+            2: WorkerStatus.STOPPED,
+        }
+
+
+class TestEvents:
+    """State updates from a single docker events subscription."""
+
+    def test_no_calls_per_tick_once_subscribed(self, fake_docker: FakeDocker) -> None:
+        per_tick = {}
+        for count in (2, 8, 32):
+            launcher = _launcher_with_workers(fake_docker, count, monitor_events=True)
+            per_tick[count] = _inspects_per_tick(launcher, fake_docker, ticks=4)
+            launcher._container_monitor().close()
+
+        # One inspect for the unseen containers on the first tick, then events only
+        assert per_tick == {2: [1, 0, 0, 0], 8: [1, 0, 0, 0], 32: [1, 0, 0, 0]}
+        assert len(fake_docker.calls("events")) == 3
+
+    def test_events_update_worker_status(self, fake_docker: FakeDocker) -> None:
+        launcher = _launcher_with_workers(fake_docker, 3, monitor_events=True)
+        try:
+            assert launcher.sync_state() == dict.fromkeys(range(3), WorkerStatus.RUNNING)
+            calls = len(fake_docker.calls("inspect"))
+
+            fake_docker.emit("c001", "die", exitCode="3", name="zerg-worker-1")
+            fake_docker.emit("c002", "health_status: unhealthy")
+
+            assert _wait_for(lambda: launcher.monitor(1) == WorkerStatus.BLOCKED)
+            assert _wait_for(lambda: launcher.monitor(2) == WorkerStatus.STOPPED)
+            assert launcher.monitor(0) == WorkerStatus.RUNNING
+            assert len(fake_docker.calls("inspect")) == calls
+            assert len(fake_docker.calls("events")) == 1
+        finally:
+            launcher._container_monitor().close()
+
+    def test_death_before_stream_connects_is_replayed(self, fake_docker: FakeDocker) -> None:
+        monitor = ContainerMonitor(label="zerg.worker")
+        # The inspect still reports the container running, but it died just
+        # before the subscription was established
+        fake_docker.add("c000")
+        fake_docker.emit("c000", "die", exitCode="4")
+        try:
+            monitor.states(["c000"])
+            assert _wait_for(lambda: not monitor.states(["c000"])["c000"].running)
+            assert monitor.states(["c000"])["c000"].exit_code == 4
+        finally:
+            monitor.close()
+
+    def test_falls_back_to_polling_when_stream_ends(self, fake_docker: FakeDocker) -> None:
+        monitor = ContainerMonitor(label="zerg.worker", refresh_interval=0)
+        fake_docker.add("c000")
+        try:
+            assert monitor.states(["c000"])["c000"].running
+            assert monitor._events_proc is not None
+            monitor._events_proc.kill()
+            assert _wait_for(lambda: monitor._events_failed)
+
+            fake_docker.add("c000", running=False, exit_code=1)
+            assert monitor.states(["c000"])["c000"].exit_code == 1
+        finally:
+            monitor.close()
@@ -22,6 +22,11 @@ class TestContextPluginName:
 class TestBuildTaskContext:
     """Tests for build_task_context method."""
 
+    @pytest.fixture(autouse=True)
+    def _project_cwd(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Keep rule indexes and token caches out of the repository."""
+        monkeypatch.chdir(tmp_path)
+
     def test_build_task_context_with_files(self, tmp_path: Path) -> None:
         """Test building context for a task that owns Python files."""
         config = ContextEngineeringConfig(
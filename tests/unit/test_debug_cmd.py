@@ -162,9 +162,21 @@ class TestDiagnosticResultExtended:
 class TestDebugCommandDeep:
     def test_run_with_feature(self) -> None:
         debugger = DebugCommand()
-        with patch.object(debugger, "_run_zerg_diagnostics", side_effect=lambda r, f, w: r):
-            with patch.object(debugger, "_plan_recovery", side_effect=lambda r: r):
-                debugger.run(error="test error", feature="my-feat")
+        health = ZergHealthReport(feature="my-feat", state_exists=True, total_tasks=3, stale_tasks=[{"id": "T1"}])
+        with patch.object(debugger, "_probe_zerg", return_value=(health, [])):
+            with patch.object(debugger, "_probe_correlation", return_value={}):
+                with patch.object(debugger, "_plan_recovery", side_effect=lambda r: r):
+                    result = debugger.run(error="test error", feature="my-feat")
+        assert result.zerg_health is health
+        assert "1 stale task(s)" in result.evidence
+
+    def test_failed_probe_is_recorded_as_evidence(self) -> None:
+        debugger = DebugCommand()
+        with patch.object(debugger, "_probe_system", side_effect=RuntimeError("git missing")):
+            with patch.object(debugger, "_probe_env", return_value={}):
+                result = debugger.run(error="test error", deep=True)
+        assert result.system_health is None
+        assert "System diagnostics error: git missing" in result.evidence
 
     def test_plan_recovery_with_design_escalation(self) -> None:
         debugger = DebugCommand()
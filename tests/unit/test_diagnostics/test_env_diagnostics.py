@@ -0,0 +1,147 @@
+"""Tests for PythonEnvDiagnostics package and import probing."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from zerg.diagnostics.env_diagnostics import PythonEnvDiagnostics
+
+
+@pytest.fixture
+def probe_modules(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A directory of modules on sys.path (and PYTHONPATH, for the child interpreter)."""
+    mods = tmp_path / "mods"
+    mods.mkdir()
+    (mods / "probe_ok.py").write_text("print('noise on stdout')\nVALUE = 1\n")
+    (mods / "probe_broken.py").write_text("raise RuntimeError('broken at import')\n")
+    (mods / "probe_crash.py").write_text("import os\nos._exit(3)\n")
+    (mods / "probe_slow.py").write_text("import time\ntime.sleep(0.6)\n")
+    (mods / "probe_hang.py").write_text("import time\ntime.sleep(60)\n")
+    (mods / "probe_pkg").mkdir()
+    (mods / "probe_pkg" / "__init__.py").write_text("")
+    (mods / "probe_pkg" / "sub.py").write_text("")
+    monkeypatch.syspath_prepend(str(mods))
+    monkeypatch.setenv("PYTHONPATH", str(mods))
+    return mods
+
+
+@pytest.fixture
+def diagnostics(tmp_path: Path) -> PythonEnvDiagnostics:
+    (tmp_path / "state").mkdir()
+    return PythonEnvDiagnostics(cache_path=tmp_path / "state" / "env-probe-cache.json")
+
+
+class TestCheckPackages:
+    def test_lists_distributions_without_pip(self, diagnostics: PythonEnvDiagnostics) -> None:
+        with patch("zerg.diagnostics.env_diagnostics.subprocess.run", side_effect=AssertionError("pip used")):
+            result = diagnostics.check_packages(["PYTEST", "py_yaml_not_installed", "Pydantic"])
+
+        names = {pkg["name"].lower() for pkg in result["installed"]}
+        assert {"pytest", "pydantic"} <= names
+        assert result["count"] == len(result["installed"])
+        assert result["missing"] == ["py_yaml_not_installed"]
+
+    def test_listing_is_cached(self, diagnostics: PythonEnvDiagnostics, tmp_path: Path) -> None:
+        first = diagnostics.check_packages()
+        fresh = PythonEnvDiagnostics(cache_path=tmp_path / "state" / "env-probe-cache.json")
+        with patch("zerg.diagnostics.env_diagnostics.importlib.metadata.distributions") as distributions:
+            assert fresh.check_packages() == first
+        distributions.assert_not_called()
+
+
+class TestCheckImports:
+    def test_one_child_for_all_modules(self, diagnostics: PythonEnvDiagnostics, probe_modules: Path) -> None:
+        modules = ["json", "probe_ok", "probe_broken", "no_such_module_xyz", "email.mime.text"]
+        with patch("zerg.diagnostics.env_diagnostics.subprocess.Popen", wraps=subprocess.Popen) as popen:
+            result = diagnostics.check_imports(modules)
+
+        assert popen.call_count == 1
+        assert result["success"] == ["json", "probe_ok", "email.mime.text"]
+        errors = {f["module"]: f["error"] for f in result["failed"]}
+        assert errors["probe_broken"] == "RuntimeError: broken at import"
+        assert errors["no_such_module_xyz"].startswith("ModuleNotFoundError")
+
+    def test_crashing_import_does_not_hide_the_rest(
+        self, diagnostics: PythonEnvDiagnostics, probe_modules: Path
+    ) -> None:
+        result = diagnostics.check_imports(["csv", "probe_crash", "probe_ok"])
+
+        assert result["success"] == ["csv", "probe_ok"]
+        assert result["failed"] == [{"module": "probe_crash", "error": "interpreter exited with code 3"}]
+
+    def test_presence_only_starts_no_child(self, diagnostics: PythonEnvDiagnostics, probe_modules: Path) -> None:
+        with patch("zerg.diagnostics.env_diagnostics.subprocess.Popen", side_effect=AssertionError("child started")):
+            result = diagnostics.check_imports(["json", "probe_broken", "missing_mod_xyz"], import_test=False)
+
+        assert result["success"] == ["json", "probe_broken"]
+        assert [f["module"] for f in result["failed"]] == ["missing_mod_xyz"]
+
+    def test_timeout_applies_per_module(
+        self, diagnostics: PythonEnvDiagnostics, probe_modules: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(PythonEnvDiagnostics, "SUBPROCESS_TIMEOUT", 1)
+        (probe_modules / "probe_slow2.py").write_text("import time\ntime.sleep(0.6)\n")
+
+        result = diagnostics.check_imports(["probe_slow", "probe_slow2", "probe_hang", "probe_ok"])
+
+        # Together the slow modules exceed the timeout; each alone does not
+        assert result["success"] == ["probe_slow", "probe_slow2", "probe_ok"]
+        assert result["failed"] == [{"module": "probe_hang", "error": "import timed out after 1s"}]
+
+    def test_submodules_are_not_imported_in_process(
+        self, diagnostics: PythonEnvDiagnostics, probe_modules: Path
+    ) -> None:
+        result = diagnostics.check_imports(["probe_pkg.sub", "probe_pkg.nope", "nope_pkg_xyz.sub"], import_test=False)
+
+        assert "probe_pkg" not in sys.modules
+        assert result["success"] == ["probe_pkg.sub"]
+        errors = {f["module"]: f["error"] for f in result["failed"]}
+        assert errors == {
+            "probe_pkg.nope": "ModuleNotFoundError: No module named 'probe_pkg.nope'",
+            "nope_pkg_xyz.sub": "ModuleNotFoundError: No module named 'nope_pkg_xyz'",
+        }
+
+    def test_failed_imports_are_not_cached(
+        self, diagnostics: PythonEnvDiagnostics, probe_modules: Path, tmp_path: Path
+    ) -> None:
+        with patch.object(PythonEnvDiagnostics, "_is_installed", return_value=True):
+            diagnostics.check_imports(["probe_ok", "probe_broken"])
+            fresh = PythonEnvDiagnostics(cache_path=tmp_path / "state" / "env-probe-cache.json")
+            with patch("zerg.diagnostics.env_diagnostics.subprocess.Popen", wraps=subprocess.Popen) as popen:
+                result = fresh.check_imports(["probe_ok", "probe_broken"])
+
+        assert result["success"] == ["probe_ok"]
+        assert popen.call_count == 1
+        assert '["probe_broken"]' in popen.call_args.args[0]
+
+    def test_installed_modules_are_cached(
+        self, diagnostics: PythonEnvDiagnostics, probe_modules: Path, tmp_path: Path
+    ) -> None:
+        modules = ["json", "decimal", "probe_ok"]
+        first = diagnostics.check_imports(modules)
+
+        fresh = PythonEnvDiagnostics(cache_path=tmp_path / "state" / "env-probe-cache.json")
+        with patch("zerg.diagnostics.env_diagnostics.subprocess.Popen", wraps=subprocess.Popen) as popen:
+            assert fresh.check_imports(modules) == first
+
+        # Only the module from outside site-packages and the stdlib is imported again
+        assert popen.call_count == 1
+        assert '["probe_ok"]' in popen.call_args.args[0]
+
+    def test_cache_is_dropped_when_site_packages_change(
+        self, diagnostics: PythonEnvDiagnostics, tmp_path: Path
+    ) -> None:
+        diagnostics.check_imports(["json"])
+
+        fresh = PythonEnvDiagnostics(cache_path=tmp_path / "state" / "env-probe-cache.json")
+        with (
+            patch.object(PythonEnvDiagnostics, "_cache_key", return_value="changed"),
+            patch("zerg.diagnostics.env_diagnostics.subprocess.Popen", wraps=subprocess.Popen) as popen,
+        ):
+            assert fresh.check_imports(["json"])["success"] == ["json"]
+        assert popen.call_count == 1
@@ -0,0 +1,67 @@
+"""Tests for zerg.diagnostics.knowledge_base."""
+
+from __future__ import annotations
+
+import pytest
+
+from tests.fixtures.diagnostics_fixtures import ERROR_LINES, NOISE_LINES, log_dump, reference_match
+from zerg.diagnostics.knowledge_base import KNOWN_PATTERNS, PatternMatcher, _split_alternatives, required_literals
+
+
+def _names(results: list) -> list[tuple[str, float]]:
+    return [(pattern.name, score) for pattern, score in results]
+
+
+class TestRequiredLiterals:
+    @pytest.mark.parametrize(
+        "regex, expected",
+        [
+            (r"ImportError:\s+cannot import name", ("importerror:", "cannot import name")),
+            (r"worker.*timed?\s*out", ("worker", "time", "out")),
+            (r"Worker \d+ exceeded time limit", ("worker ", " exceeded time limit")),
+            (r"invalid literal for int\(\)", ("invalid literal for int()",)),
+            (r"KeyError:\s+'[\w\-\.]+'", ("keyerror:",)),
+            (r"colou?r (?:red|blue)+ seen", ("colo", " seen")),
+            (r"abc{2,3}def", ("def",)),
+            (r"SIGKILL|SIGSEGV", ()),
+            (r"(?i)x", ()),
+        ],
+    )
+    def test_extraction(self, regex: str, expected: tuple[str, ...]) -> None:
+        assert required_literals(regex) == expected
+
+
+class TestPatternMatcher:
+    def test_matches_reference_on_every_error_line(self) -> None:
+        matcher = PatternMatcher()
+        for line in ERROR_LINES + NOISE_LINES + [""]:
+            assert _names(matcher.match(line)) == _names(reference_match(line)), line
+
+    def test_matches_reference_on_log_dumps(self) -> None:
+        matcher = PatternMatcher()
+        for seed in range(5):
+            text = log_dump(lines=400, errors=seed * 3, seed=seed)
+            assert _names(matcher.match(text)) == _names(reference_match(text))
+
+    def test_branch_prefilters_hold_for_matching_lines(self) -> None:
+        # A line matching a branch contains its literals and starts a match at its prefix
+        matcher = PatternMatcher()
+        for pattern in KNOWN_PATTERNS:
+            for branches in matcher._branches[pattern.name]:
+                for branch in branches:
+                    for line in ERROR_LINES:
+                        found = branch.regex.search(line)
+                        if found and line.isascii():
+                            assert all(lit in line.lower() for lit in branch.literals), (branch.regex.pattern, line)
+                            if branch.prefix:
+                                assert line[found.start() :].lower().startswith(branch.prefix)
+
+    def test_alternation_is_split_into_branches(self) -> None:
+        assert _split_alternatives(r"SIGKILL|SIGSEGV|SIGABRT") == ["SIGKILL", "SIGSEGV", "SIGABRT"]
+        assert _split_alternatives(r"a(b|c)d|e[|]f") == ["a(b|c)d", "e[|]f"]
+        assert _split_alternatives(r"(?i)a|b") == ["(?i)a|b"]
+        assert _split_alternatives(r"(a)\1|b") == [r"(a)\1|b"]
+
+    def test_non_ascii_case_folding(self) -> None:
+        names = dict(_names(PatternMatcher().match("İmportError: cannot ımport name")))
+        assert "import_error" in names
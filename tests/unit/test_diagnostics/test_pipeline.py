@@ -0,0 +1,204 @@
+"""Tests for the concurrent diagnostics pipeline."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from zerg.commands.debug import DebugCommand, DebugConfig
+from zerg.diagnostics.log_analyzer import LogAnalyzer, WorkerLogs
+from zerg.diagnostics.log_correlator import LogCorrelationEngine
+from zerg.diagnostics.pipeline import Probe, ProbeOutcome, ProbePipeline, SharedCommands
+
+DELAY = 0.3
+
+
+def _slow(value: Any, delay: float = DELAY) -> Any:
+    def run(_: Mapping[str, ProbeOutcome]) -> Any:
+        time.sleep(delay)
+        return value
+
+    return run
+
+
+class TestProbePipeline:
+    def test_wall_time_is_bounded_by_slowest_probe(self) -> None:
+        probes = [Probe(f"p{i}", _slow(i)) for i in range(4)]
+
+        start = time.monotonic()
+        outcomes = ProbePipeline(probes).run()
+        elapsed = time.monotonic() - start
+
+        assert {name: o.value for name, o in outcomes.items()} == {"p0": 0, "p1": 1, "p2": 2, "p3": 3}
+        assert elapsed < 2 * DELAY
+
+    def test_dependents_receive_outcomes(self) -> None:
+        def total(inputs: Mapping[str, ProbeOutcome]) -> Any:
+            return {name: (o.value, o.error) for name, o in inputs.items()}
+
+        def fail(_: Mapping[str, ProbeOutcome]) -> Any:
+            raise RuntimeError("boom")
+
+        probes = [Probe("a", _slow(1, 0.01)), Probe("b", fail), Probe("sum", total, deps=("a", "b"))]
+        outcomes = ProbePipeline(probes).run()
+
+        assert outcomes["b"].error == "boom"
+        assert not outcomes["b"].ok
+        assert outcomes["sum"].value == {"a": (1, None), "b": (None, "boom")}
+
+    def test_probe_deadline(self) -> None:
+        probes = [Probe("slow", _slow("late", 2.0), timeout=0.1), Probe("fast", _slow("ok", 0.01))]
+
+        start = time.monotonic()
+        outcomes = ProbePipeline(probes).run()
+
+        assert time.monotonic() - start < 1.0
+        assert outcomes["slow"].timed_out
+        assert outcomes["slow"].error.startswith("timed out after")
+        assert outcomes["fast"].value == "ok"
+
+    def test_budget_skips_probes_not_started(self) -> None:
+        probes = [Probe("slow", _slow("late", 2.0)), Probe("after", _slow("never", 0.0), deps=("slow",))]
+
+        start = time.monotonic()
+        outcomes = ProbePipeline(probes, budget=0.1).run()
+
+        assert time.monotonic() - start < 1.0
+        assert outcomes["slow"].timed_out
+        assert outcomes["after"].error == "skipped: time budget exhausted"
+
+    def test_abandoned_probe_does_not_delay_exit(self) -> None:
+        script = textwrap.dedent(
+            """
+            import time
+            from zerg.diagnostics.pipeline import Probe, ProbePipeline
+
+            outcomes = ProbePipeline([Probe("stuck", lambda _: time.sleep(3), timeout=0.2)]).run()
+            assert outcomes["stuck"].timed_out
+            """
+        )
+        start = time.monotonic()
+        subprocess.run([sys.executable, "-c", script], check=True, timeout=10)
+        assert time.monotonic() - start < 2.5
+
+    @pytest.mark.parametrize(
+        "probes",
+        [
+            [Probe("a", _slow(1)), Probe("a", _slow(2))],
+            [Probe("a", _slow(1), deps=("b",)), Probe("b", _slow(2))],
+        ],
+    )
+    def test_invalid_graph(self, probes: list[Probe]) -> None:
+        with pytest.raises(ValueError):
+            ProbePipeline(probes)
+
+
+class TestSharedCommands:
+    def test_concurrent_callers_share_one_run(self) -> None:
+        commands = SharedCommands()
+        calls = []
+
+        def fake_run(cmd: list[str], timeout: float) -> tuple[str, bool]:
+            calls.append(cmd)
+            time.sleep(0.05)
+            return "Server Version: 24", True
+
+        with patch("zerg.diagnostics.pipeline._run_cmd", side_effect=fake_run):
+            threads = [threading.Thread(target=commands.run, args=(["docker", "info"], 10)) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            assert commands.run(["docker", "info"], 10) == ("Server Version: 24", True)
+            commands.run(["docker", "ps"], 10)
+
+        assert calls == [["docker", "info"], ["docker", "ps"]]
+
+    def test_failure_reaches_every_caller(self) -> None:
+        commands = SharedCommands()
+        started = threading.Event()
+        errors: list[BaseException] = []
+
+        def fake_run(cmd: list[str], timeout: float) -> tuple[str, bool]:
+            started.set()
+            time.sleep(0.05)
+            raise ValueError("bad output")
+
+        def call() -> None:
+            try:
+                commands.run(["docker", "info"], 10)
+            except ValueError as e:
+                errors.append(e)
+
+        with patch("zerg.diagnostics.pipeline._run_cmd", side_effect=fake_run):
+            owner = threading.Thread(target=call)
+            owner.start()
+            started.wait(1)
+            waiters = [threading.Thread(target=call, daemon=True) for _ in range(3)]
+            for t in waiters:
+                t.start()
+            for t in [owner, *waiters]:
+                t.join(timeout=2)
+
+        assert not any(t.is_alive() for t in [owner, *waiters])
+        assert len(errors) == 4
+
+
+class TestWorkerLogs:
+    def test_log_files_are_read_once(self, tmp_path: Path) -> None:
+        (tmp_path / "worker-1.stderr.log").write_text("RuntimeError: boom\n")
+        (tmp_path / "worker-2.stdout.log").write_text("2026-01-01T00:00:00 ERROR RuntimeError: boom\n")
+        logs = WorkerLogs(tmp_path)
+
+        with patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as read_text:
+            LogAnalyzer(tmp_path, logs).scan_worker_logs()
+            LogCorrelationEngine(tmp_path, logs).analyze()
+
+        read = [call.args[0].name for call in read_text.call_args_list]
+        assert sorted(read) == ["worker-1.stderr.log", "worker-2.stdout.log"]
+
+
+class TestDebugCommandProbes:
+    def test_diagnostics_run_concurrently(self) -> None:
+        debugger = DebugCommand(DebugConfig())
+        slow = {
+            "_probe_zerg": None,
+            "_probe_system": None,
+            "_probe_correlation": {},
+            "_probe_env": {"python": {}},
+        }
+
+        def sleeper(value: Any) -> Any:
+            def run(*_args: Any) -> Any:
+                time.sleep(DELAY)
+                if value is None:
+                    raise RuntimeError("unavailable")
+                return value
+
+            return run
+
+        patches = [patch.object(debugger, name, side_effect=sleeper(value)) for name, value in slow.items()]
+        patches.append(patch.object(debugger, "_plan_recovery", side_effect=lambda r: r))
+        for p in patches:
+            p.start()
+        try:
+            start = time.monotonic()
+            result = debugger.run(error="ImportError: no module named foo", feature="feat", deep=True, env=True)
+            elapsed = time.monotonic() - start
+        finally:
+            for p in patches:
+                p.stop()
+
+        assert elapsed < len(slow) * DELAY
+        assert result.env_report == {"python": {}}
+        assert result.evidence[:2] == ["ZERG diagnostics error: unavailable", "System diagnostics error: unavailable"]
+        assert result.error_intel is not None
@@ -12,10 +12,17 @@ from pathlib import Path
 
 import pytest
 
+from tests.fixtures.wiki_fixtures import (
+    reference_inject_links,
+    reference_see_also,
+    synthetic_project,
+    synthetic_site,
+)
 from zerg.doc_engine.crossref import CrossRefBuilder, GlossaryEntry
 from zerg.doc_engine.dependencies import DependencyMapper, ModuleNode
 from zerg.doc_engine.detector import ComponentDetector, ComponentType
 from zerg.doc_engine.extractor import SymbolExtractor, SymbolTable
+from zerg.doc_engine.manifest import MANIFEST_NAME, WikiManifest, content_hash, render_pages
 from zerg.doc_engine.mermaid import MermaidGenerator
 from zerg.doc_engine.renderer import DocRenderer
 from zerg.doc_engine.sidebar import SidebarConfig, SidebarGenerator, SidebarSection
@@ -317,6 +324,47 @@ class TestCrossRefBuilder:
         result = crossref.inject_links(content, glossary, current_page="mypage")
         assert "[[Widget|Widget]]" in result
 
+    def test_inject_links_matches_reference(self, crossref: CrossRefBuilder) -> None:
+        glossary = [
+            GlossaryEntry(term="Worker", definition="", page="workers", aliases=["workers pool"]),
+            GlossaryEntry(term="Worker Pool", definition="", page="pool"),
+            GlossaryEntry(term="worker", definition="", page="other"),  # same term, later entry
+            GlossaryEntry(term="C++", definition="", page="lang"),
+            GlossaryEntry(term=".NET", definition="", page="lang"),
+            GlossaryEntry(term="Cache", definition="", page="mypage"),  # own page: never linked
+            GlossaryEntry(term="Kelvin", definition="", page="units"),
+            GlossaryEntry(term="Gate", definition="", page="gates", aliases=["quality gate"]),
+        ]
+        content = (
+            "## Worker Pool\n"
+            "The `Worker` in code and ```\nWorker\n``` blocks are skipped.\n"
+            "A WORKER POOL runs C++ and x.NET code; C++Foo and Cache too.\n"
+            "\u212aelvin units, worker_pool, the quality gate and one Gate.\n"
+            "Last worker"
+        )
+        result = crossref.inject_links(content, glossary, current_page="mypage")
+        assert result == reference_inject_links(content, glossary, "mypage")
+        assert "[[Worker Pool|WORKER POOL]]" in result
+
+    def test_inject_links_matches_reference_on_site(self, crossref: CrossRefBuilder) -> None:
+        site = synthetic_site(40, seed=3)
+        glossary = crossref.build_glossary(site)
+        for name, content in site.items():
+            assert crossref.inject_links(content, glossary, name) == reference_inject_links(content, glossary, name)
+
+    def test_see_also_matches_reference(self, crossref: CrossRefBuilder) -> None:
+        site = synthetic_site(60, seed=5)
+        site["Module_0001"] = "## Overlap\nLinks to [[module_0002]] and [[MODULE_0002]].\n"
+        for name in site:
+            assert crossref.see_also(name, site, max_related=7) == reference_see_also(name, site, max_related=7)
+        assert crossref.see_also("missing", site) == []
+
+    def test_see_also_sees_page_changes(self, crossref: CrossRefBuilder) -> None:
+        site = {"a": "## Shared\n", "b": "## Shared\n", "c": "nothing in common\n"}
+        assert crossref.see_also("a", site) == ["b"]
+        site["c"] = "## Shared\n[[a]]\n"
+        assert crossref.see_also("a", site) == ["c", "b"]
+
     def test_generate_glossary_page(self, crossref: CrossRefBuilder) -> None:
         glossary = [
             GlossaryEntry(term="Beta", definition="Second.", page="p1"),
@@ -362,6 +410,61 @@ class TestSidebarGenerator:
         assert "GitHub" in footer
 
 
+# ======================================================================
+# WikiManifest
+# ======================================================================
+
+
+class TestWikiManifest:
+    def test_reuse_requires_same_source_and_page(self, tmp_path: Path) -> None:
+        (tmp_path / "mod.md").write_text("# mod")
+        manifest = WikiManifest(tmp_path)
+        manifest.record("zerg/mod.py", "h1", "mod", "# mod")
+        manifest.save({"mod"})
+
+        loaded = WikiManifest.load(tmp_path)
+        assert loaded.outputs == {"mod"}
+        assert loaded.reuse("zerg/mod.py", "h1", tmp_path) == "# mod"
+        assert loaded.reuse("zerg/mod.py", "h2", tmp_path) is None
+        assert loaded.reuse("zerg/other.py", "h1", tmp_path) is None
+
+        (tmp_path / "mod.md").write_text("# edited by hand")
+        assert loaded.reuse("zerg/mod.py", "h1", tmp_path) is None
+
+    def test_renderer_version_change_discards_sources_but_keeps_outputs(self, tmp_path: Path) -> None:
+        (tmp_path / "mod.md").write_text("# mod")
+        manifest = WikiManifest(tmp_path, renderer_version="1")
+        manifest.record("zerg/mod.py", "h1", "mod", "# mod")
+        manifest.save({"mod"})
+
+        loaded = WikiManifest.load(tmp_path, renderer_version="2")
+        assert loaded.reuse("zerg/mod.py", "h1", tmp_path) is None
+        assert loaded.outputs == {"mod"}
+
+    def test_corrupt_manifest_is_ignored(self, tmp_path: Path) -> None:
+        (tmp_path / MANIFEST_NAME).write_text("{not json")
+        loaded = WikiManifest.load(tmp_path)
+        assert loaded.sources == {}
+        assert loaded.outputs == set()
+
+    def test_content_hash(self) -> None:
+        assert content_hash(b"a") == content_hash(b"a") != content_hash(b"b")
+
+    def test_parallel_render_matches_serial(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        targets = [p.relative_to(tmp_path) for p in synthetic_project(tmp_path, 6)]
+        targets.append(Path("zerg/missing.py"))
+        renderer = DocRenderer(project_root=Path("."))
+        serial = render_pages(renderer, targets, Path("."), max_workers=1)
+
+        monkeypatch.setattr("zerg.doc_engine.manifest._PARALLEL_THRESHOLD", 2)
+        parallel = render_pages(renderer, targets, Path("."), max_workers=2)
+
+        assert parallel == serial
+        assert serial[-1] is None
+        assert all(page and page.startswith("#") for page in serial[:-1])
+
+
 # ======================================================================
 # Data classes standalone
 # ======================================================================
@@ -8,6 +8,9 @@ import time
 from datetime import UTC, datetime
 from pathlib import Path
 
+import pytest
+
+from zerg import event_emitter as event_emitter_module
 from zerg.event_emitter import EventEmitter
 
 
@@ -242,3 +245,108 @@ class TestEventEmitter:
 
         # Working callback should still receive event
         assert received == ["test"]
+
+
+def _emit_spaced(emitter: EventEmitter, count: int) -> list[datetime]:
+    """Emit *count* events and return each one's timestamp."""
+    for i in range(count):
+        emitter.emit("tick", {"n": i})
+    return [datetime.fromisoformat(e["timestamp"]) for e in emitter.get_events()]
+
+
+class TestEventIndex:
+    """Tests for the sidecar offset index used by get_events(since=)."""
+
+    @pytest.fixture(autouse=True)
+    def small_index_interval(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(event_emitter_module, "INDEX_INTERVAL_BYTES", 500)
+
+    def test_since_seeks_via_index(self, tmp_path: Path) -> None:
+        emitter = EventEmitter("feat", state_dir=tmp_path)
+        stamps = _emit_spaced(emitter, 200)
+        index_lines = (tmp_path / "feat-events.idx").read_text().splitlines()
+        assert len(index_lines) > 10
+
+        for cut in (0, 57, 150, 199):
+            events = EventEmitter("feat", state_dir=tmp_path).get_events(since=stamps[cut])
+            assert [e["data"]["n"] for e in events] == list(range(cut + 1, 200))
+
+        # The reader only decodes the tail after the cut
+        reader = EventEmitter("feat", state_dir=tmp_path)
+        with open(reader.event_file, "rb") as f:
+            assert reader._seek_offset(f, event_emitter_module._timestamp_us(stamps[150])) > 0
+
+    def test_reopen_indexes_existing_file(self, tmp_path: Path) -> None:
+        writer = EventEmitter("feat", state_dir=tmp_path)
+        _emit_spaced(writer, 50)
+        writer.close()
+        (tmp_path / "feat-events.idx").unlink()  # e.g. written before the index existed
+
+        writer = EventEmitter("feat", state_dir=tmp_path)
+        writer.emit("tick", {"n": 50})
+        stamps = [datetime.fromisoformat(e["timestamp"]) for e in writer.get_events()]
+        offsets = [int(line.split()[1]) for line in (tmp_path / "feat-events.idx").read_text().splitlines()]
+        assert offsets == sorted(offsets) and len(offsets) > 3
+
+        events = writer.get_events(since=stamps[30])
+        assert [e["data"]["n"] for e in events] == list(range(31, 51))
+
+    def test_index_for_another_file_is_ignored(self, tmp_path: Path) -> None:
+        emitter = EventEmitter("feat", state_dir=tmp_path)
+        stamps = _emit_spaced(emitter, 100)
+        emitter.close()
+        emitter.event_file.write_text(emitter.event_file.read_text().splitlines(keepends=True)[-1])
+
+        assert len(EventEmitter("feat", state_dir=tmp_path).get_events(since=stamps[0])) == 1
+
+    def test_clear_removes_index(self, tmp_path: Path) -> None:
+        emitter = EventEmitter("feat", state_dir=tmp_path)
+        _emit_spaced(emitter, 50)
+        emitter.clear()
+        assert not (tmp_path / "feat-events.idx").exists()
+
+        emitter.emit("after_clear")
+        assert [e["type"] for e in emitter.get_events(since=datetime(2000, 1, 1, tzinfo=UTC))] == ["after_clear"]
+
+
+class TestWatching:
+    """Tests for cross-process event watching."""
+
+    @pytest.mark.parametrize("use_inotify", [None, False])
+    def test_watcher_receives_new_events_only(self, tmp_path: Path, use_inotify: bool | None) -> None:
+        writer = EventEmitter("feat", state_dir=tmp_path)
+        writer.emit("before_watch")
+        watcher = EventEmitter("feat", state_dir=tmp_path)
+        received: list[str] = []
+        done = threading.Event()
+
+        def callback(event_type: str, data: dict) -> None:
+            received.append(event_type)
+            if event_type == "second":
+                done.set()
+
+        watcher.start_watching(callback, use_inotify=use_inotify)
+        try:
+            writer.emit("first")
+            writer.emit("second")
+            assert done.wait(5.0)
+        finally:
+            watcher.stop_watching()
+        assert received == ["first", "second"]
+
+    def test_watcher_restarts_after_clear(self, tmp_path: Path) -> None:
+        writer = EventEmitter("feat", state_dir=tmp_path)
+        writer.emit("old", {"padding": "x" * 200})
+        watcher = EventEmitter("feat", state_dir=tmp_path)
+        received: list[str] = []
+        watcher.start_watching(lambda t, d: received.append(t))
+        try:
+            writer.clear()
+            time.sleep(0.3)
+            writer.emit("new")
+            deadline = time.monotonic() + 5.0
+            while not received and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            watcher.stop_watching()
+        assert received == ["new"]
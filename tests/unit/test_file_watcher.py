@@ -0,0 +1,89 @@
+"""Unit tests for zerg.file_watcher."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from zerg.file_watcher import FileWatcher
+
+
+def _bump(path: Path, content: str) -> None:
+    """Rewrite *path* and push its mtime forward so stat polling sees it."""
+    path.write_text(content)
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+@pytest.fixture(params=[False, True], ids=["polling", "inotify"])
+def use_inotify(request: pytest.FixtureRequest) -> bool:
+    if request.param:
+        try:
+            FileWatcher(Path("/tmp"), extensions=set(), use_inotify=True).close()
+        except OSError:
+            pytest.skip("inotify not available")
+    return bool(request.param)
+
+
+class TestFileWatcher:
+    """Behaviour shared by the inotify and polling backends."""
+
+    def _watcher(self, root: Path, use_inotify: bool) -> FileWatcher:
+        return FileWatcher(root, extensions={".py"}, debounce=0.05, poll_interval=0.05, use_inotify=use_inotify)
+
+    def test_backend(self, tmp_path: Path, use_inotify: bool) -> None:
+        with self._watcher(tmp_path, use_inotify) as watcher:
+            assert watcher.backend == ("inotify" if use_inotify else "polling")
+
+    def test_reports_modified_and_created_files(self, tmp_path: Path, use_inotify: bool) -> None:
+        existing = tmp_path / "a.py"
+        existing.write_text("a = 1\n")
+        with self._watcher(tmp_path, use_inotify) as watcher:
+            assert watcher.wait(timeout=0.05) == []
+            _bump(existing, "a = 2\n")
+            (tmp_path / "b.py").write_text("b = 1\n")
+            changed = watcher.wait(timeout=2.0)
+        assert set(changed) == {existing, tmp_path / "b.py"}
+
+    def test_reports_deleted_files(self, tmp_path: Path, use_inotify: bool) -> None:
+        doomed = tmp_path / "gone.py"
+        doomed.write_text("x = 1\n")
+        with self._watcher(tmp_path, use_inotify) as watcher:
+            doomed.unlink()
+            assert watcher.wait(timeout=2.0) == [doomed]
+
+    def test_ignores_other_extensions_and_excluded_dirs(self, tmp_path: Path, use_inotify: bool) -> None:
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / ".hidden").mkdir()
+        with self._watcher(tmp_path, use_inotify) as watcher:
+            (tmp_path / "notes.txt").write_text("hello")
+            (tmp_path / "node_modules" / "dep.py").write_text("x = 1\n")
+            (tmp_path / ".hidden" / "secret.py").write_text("x = 1\n")
+            assert watcher.wait(timeout=0.3) == []
+
+    def test_new_subdirectory_is_watched(self, tmp_path: Path, use_inotify: bool) -> None:
+        with self._watcher(tmp_path, use_inotify) as watcher:
+            sub = tmp_path / "pkg"
+            sub.mkdir()
+            (sub / "mod.py").write_text("x = 1\n")
+            assert watcher.wait(timeout=2.0) == [sub / "mod.py"]
+            _bump(sub / "mod.py", "x = 2\n")
+            assert watcher.wait(timeout=2.0) == [sub / "mod.py"]
+
+    def test_identical_rewrite_is_suppressed(self, tmp_path: Path, use_inotify: bool) -> None:
+        target = tmp_path / "same.py"
+        target.write_text("x = 1\n")
+        with self._watcher(tmp_path, use_inotify) as watcher:
+            _bump(target, "x = 2\n")
+            assert watcher.wait(timeout=2.0) == [target]
+            _bump(target, "x = 2\n")
+            assert watcher.wait(timeout=0.3) == []
+
+    def test_first_identical_rewrite_is_suppressed(self, tmp_path: Path, use_inotify: bool) -> None:
+        target = tmp_path / "same.py"
+        target.write_text("x = 1\n")
+        with self._watcher(tmp_path, use_inotify) as watcher:
+            _bump(target, "x = 1\n")
+            assert watcher.wait(timeout=0.3) == []
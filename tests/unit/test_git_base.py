@@ -70,3 +70,48 @@ class TestGitRunnerQueries:
         assert runner.has_changes() is False
         (tmp_repo / "new-file.txt").write_text("content")
         assert runner.has_changes() is True
+
+
+class TestGitRunnerObjectSession:
+    """Tests for the persistent cat-file session and for_each_ref."""
+
+    def test_object_info(self, tmp_repo: Path) -> None:
+        runner = GitRunner(tmp_repo)
+        info = runner.object_info("HEAD")
+        assert info is not None and info.sha == runner.current_commit() and info.type == "commit"
+        assert runner.object_info("HEAD:README.md").type == "blob"
+        assert runner.object_info("no-such-ref") is None
+
+    def test_object_info_sees_later_ref_updates(self, tmp_repo: Path) -> None:
+        runner = GitRunner(tmp_repo)
+        assert runner.object_info("refs/heads/later") is None
+        runner._run("branch", "later")
+        assert runner.object_info("refs/heads/later").sha == runner.current_commit()
+
+    def test_read_object(self, tmp_repo: Path) -> None:
+        runner = GitRunner(tmp_repo)
+        info, data = runner.read_object("HEAD:README.md")
+        assert data == b"# Test Repo" and info.size == len(data)
+        assert runner.read_object("HEAD:missing.txt") is None
+
+    def test_rejects_newline(self, tmp_repo: Path) -> None:
+        with pytest.raises(ValueError):
+            GitRunner(tmp_repo).object_info("HEAD\nmain")
+
+    def test_restarts_after_close_and_crash(self, tmp_repo: Path) -> None:
+        runner = GitRunner(tmp_repo)
+        sha = runner.current_commit()
+        assert runner.object_info("HEAD").sha == sha
+        runner.close()
+        assert runner.object_info("HEAD").sha == sha
+        runner._cat_file_check._proc.kill()
+        runner._cat_file_check._proc.wait()
+        assert runner.object_info("HEAD").sha == sha
+
+    def test_for_each_ref(self, tmp_repo: Path) -> None:
+        runner = GitRunner(tmp_repo)
+        runner._run("tag", "light")
+        runner._run("tag", "-a", "-m", "msg", "annotated")
+        refs = runner.for_each_ref("refs/tags/", fields=("refname:strip=2", "objecttype", "*objectname"))
+        sha = runner.current_commit()
+        assert refs == [["annotated", "tag", sha], ["light", "commit", ""]]
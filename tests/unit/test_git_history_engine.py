@@ -165,6 +165,20 @@ class TestHistoryAnalyzer:
         commits = HistoryAnalyzer(mock_runner).get_commits("main")
         assert len(commits) == 2
 
+    def test_get_commits_parses_numstat(self, mock_runner: MagicMock) -> None:
+        log_output = (
+            "abc1234|||feat: add auth|||Alice|||2025-01-15 10:00:00 +0000\n\n"
+            "10\t2\tsrc/auth.py\n"
+            "-\t-\tassets/logo.png\n"
+            "1\t1\tsrc/{old => new}/util.py\n"
+            "0\t0\tdocs/a.md => docs/b.md\n"
+        )
+        mock_runner._run.return_value = MagicMock(stdout=log_output)
+        [commit] = HistoryAnalyzer(mock_runner).get_commits("main")
+        assert commit.files == ("src/auth.py", "assets/logo.png", "src/new/util.py", "docs/b.md")
+        assert commit.lines_changed == 14
+        assert "--numstat" in mock_runner._run.call_args[0]
+
     def test_get_commits_empty_output(self, mock_runner: MagicMock) -> None:
         """Covers line 148 -- empty output returns []."""
         mock_runner._run.return_value = MagicMock(stdout="")
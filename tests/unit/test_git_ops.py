@@ -66,6 +66,15 @@ class TestGitOpsChanges:
         ops = GitOps(tmp_repo)
         assert ops.has_conflicts() is False and ops.get_conflicting_files() == []
 
+    def test_changed_files(self, tmp_repo: Path) -> None:
+        ops = GitOps(tmp_repo)
+        base = ops.get_commit()
+        (tmp_repo / "src").mkdir()
+        (tmp_repo / "src" / "new file.py").write_text("x = 1\n")
+        ops.commit("Add file", add_all=True)
+        assert ops.changed_files(base) == ["src/new file.py"]
+        assert ops.changed_files(base, base) == []
+
 
 class TestGitOpsCommit:
     def test_commit_basic(self, tmp_repo: Path) -> None:
@@ -157,3 +166,58 @@ class TestGitOpsPush:
             ops.push("origin", "main", force=True, set_upstream=True)
             call_args = mock_run.call_args[0]
             assert "--force" in call_args and "--set-upstream" in call_args
+
+
+class TestGitOpsMergeWithoutCheckout:
+    @staticmethod
+    def _worker_branch(ops: GitOps, repo: Path, name: str, filename: str, content: str) -> None:
+        ops.create_branch(name, "main")
+        ops.checkout(name)
+        (repo / filename).write_text(content)
+        ops.commit(f"Add {filename}", add_all=True)
+        ops.checkout("main")
+
+    def test_merges_in_object_database(self, tmp_repo: Path) -> None:
+        ops = GitOps(tmp_repo)
+        if not ops.supports_merge_tree():
+            pytest.skip("git merge-tree --write-tree unavailable")
+        for i in range(3):
+            self._worker_branch(ops, tmp_repo, f"worker-{i}", f"w{i}.txt", f"worker {i}")
+        ops.create_branch("staging", "main")
+
+        commits = ops.merge_without_checkout(["worker-0", "worker-1", "worker-2"], "staging")
+
+        assert len(commits) == 3
+        assert ops.get_commit("staging") == commits[-1]
+        assert ops.current_branch() == "main"
+        assert not (tmp_repo / "w0.txt").exists()
+        files = ops._run("ls-tree", "--name-only", "staging").stdout.split()
+        assert {"w0.txt", "w1.txt", "w2.txt"} <= set(files)
+        parents = ops._run("rev-list", "--parents", "-n", "1", "staging").stdout.split()
+        assert parents[1:] == [commits[1], ops.get_commit("worker-2")]
+
+    def test_conflict_leaves_ref_untouched(self, tmp_repo: Path) -> None:
+        ops = GitOps(tmp_repo)
+        if not ops.supports_merge_tree():
+            pytest.skip("git merge-tree --write-tree unavailable")
+        self._worker_branch(ops, tmp_repo, "worker-0", "README.md", "one")
+        self._worker_branch(ops, tmp_repo, "worker-1", "README.md", "two")
+        ops.create_branch("staging", "main")
+        before = ops.get_commit("staging")
+
+        with pytest.raises(MergeConflictError) as exc_info:
+            ops.merge_without_checkout(["worker-0", "worker-1"], "staging")
+
+        assert exc_info.value.conflicting_files == ["README.md"]
+        assert exc_info.value.source_branch == "worker-1"
+        assert ops.get_commit("staging") == before
+
+    def test_already_merged_branch_is_skipped(self, tmp_repo: Path) -> None:
+        ops = GitOps(tmp_repo)
+        if not ops.supports_merge_tree():
+            pytest.skip("git merge-tree --write-tree unavailable")
+        ops.create_branch("old", "main")
+        ops.create_branch("staging", "main")
+        before = ops.get_commit("staging")
+        assert ops.merge_without_checkout(["old"], "staging") == [before]
+        assert ops.get_commit("staging") == before
@@ -1,5 +1,6 @@
 """Tests for pre-review context assembly."""
 
+import subprocess
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -34,11 +35,43 @@ class TestContextPreparer:
         runner = _make_runner()
         runner._run.side_effect = [
             MagicMock(stdout="a.py\nb.js\n"),
-            MagicMock(stdout="diff a"),
-            MagicMock(stdout="diff b"),
+            MagicMock(stdout="diff --git a/a.py b/a.py\n+a\ndiff --git a/b.js b/b.js\n+b\n"),
         ]
         ctx = ContextPreparer(runner).prepare_context("main", budget_chars=4000)
-        assert ctx["total_files"] == 2 and len(ctx["files"]) == 2
+        assert ctx["total_files"] == 2
+        hunks = [f["hunks"] for f in ctx["files"]]
+        assert hunks == ["diff --git a/a.py b/a.py\n+a\n", "diff --git a/b.js b/b.js\n+b\n"]
+        assert runner._run.call_count == 2
+
+    def test_prepare_context_falls_back_per_file(self) -> None:
+        runner = _make_runner()
+        runner._run.side_effect = [
+            MagicMock(stdout="a.py\nsp ace.py\n"),
+            MagicMock(stdout='diff --git a/a.py b/a.py\n+a\ndiff --git "a/sp\\tace.py" "b/sp\\tace.py"\n'),
+            MagicMock(stdout="diff sp ace"),
+        ]
+        ctx = ContextPreparer(runner).prepare_context("main", budget_chars=4000)
+        assert [f["hunks"] for f in ctx["files"]] == ["diff --git a/a.py b/a.py\n+a\n", "diff sp ace"]
+        assert runner._run.call_args[0] == ("diff", "main..HEAD", "--", "sp ace.py")
+
+    def test_get_all_hunks_matches_per_file_diff(self, tmp_repo: Path) -> None:
+        def git(*args: str) -> None:
+            subprocess.run(["git", *args], cwd=tmp_repo, check=True, capture_output=True)
+
+        git("checkout", "-q", "-b", "feature")
+        (tmp_repo / "a b.py").write_text("x = 1\n")
+        (tmp_repo / "dir").mkdir()
+        (tmp_repo / "dir" / "b.py").write_text("y = 2\n")
+        (tmp_repo / "README.md").unlink(missing_ok=True)
+        git("add", "-A")
+        git("commit", "-q", "-m", "change")
+
+        preparer = ContextPreparer(GitRunner(tmp_repo))
+        changed = preparer.get_changed_files("main")
+        all_hunks = preparer.get_all_hunks("main")
+        assert sorted(all_hunks) == sorted(changed)
+        for path in changed:
+            assert all_hunks[path] == preparer.get_file_hunks(path, "main", budget_chars=10_000)
 
     def test_prepare_context_no_changes(self) -> None:
         ctx = ContextPreparer(_make_runner("")).prepare_context("main")
@@ -87,7 +120,10 @@ class TestPreReviewEngine:
         runner = _make_runner()
         runner.repo_path = tmp_path
         runner.current_branch.return_value = "feat/review"
-        runner._run.side_effect = [MagicMock(stdout="src/app.py\n"), MagicMock(stdout="+added\n")]
+        runner._run.side_effect = [
+            MagicMock(stdout="src/app.py\n"),
+            MagicMock(stdout="diff --git a/src/app.py b/src/app.py\n+added\n"),
+        ]
         assert PreReviewEngine(runner, GitConfig()).run("main") == 0
 
     def test_no_changes(self) -> None:
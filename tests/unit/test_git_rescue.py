@@ -105,25 +105,25 @@ class TestSnapshotManager:
             time.sleep(1.1)
         assert mgr.prune_snapshots() == 2 and len(mgr.list_snapshots()) == 2
 
-    def test_list_snapshots_giterror_on_resolve(self, tmp_repo: Path) -> None:
-        """Cover lines 214-216: GitError when resolving a snapshot tag is caught and skipped."""
+    def test_list_snapshots_giterror_on_list(self, tmp_repo: Path) -> None:
+        """GitError from for-each-ref yields no snapshots instead of raising."""
         runner = GitRunner(tmp_repo)
         mgr = SnapshotManager(runner, GitRescueConfig(max_snapshots=10))
-        # Create a real snapshot so there's a tag
         mgr.create_snapshot("test", "snapshot")
-        # Patch _run to raise GitError only on "rev-list" calls (tag resolve)
-        original_run = runner._run
-
-        def _patched_run(*args, **kwargs):
-            if args and args[0] == "rev-list":
-                raise GitError("could not resolve")
-            return original_run(*args, **kwargs)
-
-        with patch.object(runner, "_run", side_effect=_patched_run):
+        with patch.object(runner, "for_each_ref", side_effect=GitError("could not list")):
             snapshots = mgr.list_snapshots()
-        # The tag exists but resolving it fails, so it's skipped
         assert snapshots == []
 
+    def test_list_snapshots_peels_annotated_tags(self, tmp_repo: Path) -> None:
+        commit = _run_git("rev-parse", "HEAD", cwd=tmp_repo)
+        _run_git("tag", "-a", "-m", "annotated", "zerg-snapshot-20240101-000000", cwd=tmp_repo)
+        _run_git("tag", "zerg-snapshot-20240102-000000", cwd=tmp_repo)
+        snapshots = SnapshotManager(GitRunner(tmp_repo), GitRescueConfig()).list_snapshots()
+        assert [(s.timestamp, s.commit) for s in snapshots] == [
+            ("20240101-000000", commit),
+            ("20240102-000000", commit),
+        ]
+
     def test_prune_no_delete_when_under_max(self, tmp_repo: Path) -> None:
         """Cover line 245: early return 0 when snapshots <= max_snapshots."""
         mgr = SnapshotManager(GitRunner(tmp_repo), GitRescueConfig(max_snapshots=10))
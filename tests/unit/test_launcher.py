@@ -346,7 +346,11 @@ class TestContainerLauncherMonitor:
 
     @pytest.mark.parametrize(
         "stdout,expected",
-        [("true,0\n", WorkerStatus.RUNNING), ("false,0\n", WorkerStatus.STOPPED), ("false,1\n", WorkerStatus.CRASHED)],
+        [
+            ("c true 0 \n", WorkerStatus.RUNNING),
+            ("c false 0 \n", WorkerStatus.STOPPED),
+            ("c false 1 \n", WorkerStatus.CRASHED),
+        ],
     )
     @patch("subprocess.run")
     def test_monitor_states(self, mock_run, stdout, expected):
@@ -369,7 +373,7 @@ class TestContainerLauncherMonitor:
         mock_run.assert_not_called()
 
         # After cooldown - SHOULD call docker
-        mock_run.return_value = MagicMock(returncode=0, stdout="true,0\n", stderr="")
+        mock_run.return_value = MagicMock(returncode=0, stdout="c true 0 \n", stderr="")
         launcher._workers[0].health_check_at = datetime.now() - timedelta(seconds=15)
         launcher.monitor(0)
         mock_run.assert_called()
@@ -16,6 +16,7 @@ from zerg.merge import MergeCoordinator, MergeFlowResult
 from zerg.parser import TaskParser
 from zerg.plugins import PluginRegistry
 from zerg.state import StateManager
+from zerg.state_sync_service import StateSyncService
 from zerg.task_sync import TaskSyncBridge
 from zerg.types import GateRunResult, WorkerState
 
@@ -29,6 +30,7 @@ def mock_config():
     rush_config = MagicMock()
     rush_config.defer_merge_to_ship = False
     rush_config.gates_at_ship_only = False
+    rush_config.speculative_merge = False
     config.rush = rush_config
     return config
 
@@ -423,6 +425,7 @@ class TestMergeLevel:
             worker_branches=["zerg/test/worker-0"],
             target_branch="main",
             skip_gates=False,
+            speculative=None,
         )
         assert result.success is True
 
@@ -475,6 +478,7 @@ class TestMergeLevel:
             worker_branches=["zerg/test/worker-0"],
             target_branch="main",
             skip_gates=True,
+            speculative=None,
         )
 
     def test_stores_last_merge_result(self, mock_deps):
@@ -495,6 +499,81 @@ class TestMergeLevel:
         assert coord.last_merge_result is merge_result
 
 
+class TestSpeculativeMerge:
+    """Tests for speculative merging wiring."""
+
+    @pytest.fixture
+    def speculative(self, mock_deps):
+        mock_deps["config"].rush.speculative_merge = True
+        mock_deps["merger"].git = MagicMock()
+        mock_deps["config"].quality_gates = [QualityGate(name="lint", command="true")]
+        with patch("zerg.level_coordinator.SpeculativeMerger") as cls:
+            yield cls
+
+    def test_disabled_by_default(self, coordinator):
+        with patch("zerg.level_coordinator.SpeculativeMerger") as cls:
+            coordinator.start_level(1)
+        cls.assert_not_called()
+        coordinator.on_task_complete("TASK-001")  # no-op without speculation
+
+    def test_start_level_creates_merger(self, coordinator, mock_deps, speculative):
+        coordinator.start_level(1)
+
+        speculative.assert_called_once()
+        args, kwargs = speculative.call_args
+        assert args == ("test-feature", mock_deps["merger"].git, "main")
+        assert [g.name for g in kwargs["gates"]] == ["lint"]
+
+    def test_gates_at_ship_only_disables_gate_prerun(self, coordinator, mock_deps, speculative):
+        mock_deps["config"].rush.gates_at_ship_only = True
+        coordinator.start_level(1)
+
+        assert speculative.call_args.kwargs["gates"] == []
+
+    def test_deferred_merge_skips_speculation(self, coordinator, mock_deps, speculative):
+        mock_deps["config"].rush.defer_merge_to_ship = True
+        coordinator.start_level(1)
+
+        speculative.assert_not_called()
+
+    def test_task_complete_submits_worker_branch(self, coordinator, mock_deps, speculative):
+        ws = _add_worker(mock_deps, branch="zerg/test/worker-3")
+        ws.current_task = "TASK-002"
+        coordinator.start_level(1)
+
+        coordinator.on_task_complete("TASK-002")
+
+        speculative.return_value.submit.assert_called_once_with("zerg/test/worker-3")
+
+    def test_completion_synced_from_disk_submits_branch(self, coordinator, mock_deps, speculative):
+        ws = _add_worker(mock_deps, worker_id=3, branch="zerg/test/worker-3")
+        ws.current_task = "TASK-009"  # worker already claimed its next task
+        mock_deps["state"]._state = {"tasks": {"TASK-002": {"status": "complete", "worker_id": 3}}}
+        mock_deps["state"].get_task_worker.return_value = 3
+        mock_deps["levels"].get_task_status.return_value = "in_progress"
+        service = StateSyncService(
+            state=mock_deps["state"], levels=mock_deps["levels"], on_task_complete=[coordinator.on_task_complete]
+        )
+        coordinator.start_level(1)
+
+        service.sync_from_disk()
+
+        speculative.return_value.submit.assert_called_once_with("zerg/test/worker-3")
+
+    def test_merge_level_hands_over_and_closes(self, coordinator, mock_deps, speculative):
+        _add_worker(mock_deps)
+        mock_deps["merger"].full_merge_flow.return_value = MergeFlowResult(
+            success=True, level=1, source_branches=["zerg/test/worker-0"], target_branch="main"
+        )
+        coordinator.start_level(1)
+
+        coordinator.merge_level(1)
+
+        assert mock_deps["merger"].full_merge_flow.call_args.kwargs["speculative"] is speculative.return_value
+        speculative.return_value.close.assert_called_once()
+        assert coordinator._speculative is None
+
+
 class TestRebaseAllWorkers:
     """Tests for rebase_all_workers."""
 
@@ -1,7 +1,9 @@
 """Unit tests for StructuredLogWriter and TaskArtifactCapture."""
 
+import gzip
 import json
 import threading
+import time
 from pathlib import Path
 
 from zerg.constants import LogEvent, LogPhase
@@ -142,6 +144,139 @@ class TestStructuredLogWriter:
         assert entry["event"] == "custom_event"
 
 
+class TestStructuredLogWriterRotation:
+    """Tests for multi-generation compressed rotation."""
+
+    def _fill(self, writer: StructuredLogWriter, rounds: int) -> None:
+        for i in range(rounds):
+            writer.emit("info", f"round {i}")
+
+    def test_rotated_generations_are_gzipped(self, tmp_path: Path) -> None:
+        """Test each rotation produces a gzip generation, newest first."""
+        writer = StructuredLogWriter(tmp_path, worker_id=0, feature="test", max_size_mb=0, backup_count=3)
+        self._fill(writer, 3)
+        writer.close()
+
+        workers = tmp_path / "workers"
+        newest = gzip.decompress((workers / "worker-0.jsonl.1.gz").read_bytes()).decode()
+        older = gzip.decompress((workers / "worker-0.jsonl.2.gz").read_bytes()).decode()
+        assert json.loads(newest)["message"] == "round 1"
+        assert json.loads(older)["message"] == "round 0"
+        assert json.loads((workers / "worker-0.jsonl").read_text())["message"] == "round 2"
+
+    def test_keeps_at_most_backup_count_generations(self, tmp_path: Path) -> None:
+        """Test the oldest generation is dropped once backup_count is reached."""
+        writer = StructuredLogWriter(tmp_path, worker_id=0, feature="test", max_size_mb=0, backup_count=2)
+        self._fill(writer, 6)
+        writer.close()
+
+        names = sorted(p.name for p in (tmp_path / "workers").iterdir())
+        assert names == ["worker-0.jsonl", "worker-0.jsonl.1.gz", "worker-0.jsonl.2.gz"]
+        newest = gzip.decompress((tmp_path / "workers" / "worker-0.jsonl.1.gz").read_bytes()).decode()
+        assert json.loads(newest)["message"] == "round 4"
+
+    def test_zero_backups_discards_rotated_file(self, tmp_path: Path) -> None:
+        """Test backup_count=0 truncates instead of keeping history."""
+        writer = StructuredLogWriter(tmp_path, worker_id=0, feature="test", max_size_mb=0, backup_count=0)
+        self._fill(writer, 3)
+        writer.close()
+
+        assert [p.name for p in (tmp_path / "workers").iterdir()] == ["worker-0.jsonl"]
+
+
+class TestStructuredLogWriterAsync:
+    """Tests for the batched background writer."""
+
+    def _lines(self, tmp_path: Path) -> list[dict]:
+        text = (tmp_path / "workers" / "worker-0.jsonl").read_text()
+        return [json.loads(line) for line in text.splitlines()]
+
+    def test_emit_does_not_write_until_flush(self, tmp_path: Path) -> None:
+        """Test entries are buffered until the batch or time threshold."""
+        writer = StructuredLogWriter(tmp_path, worker_id=0, feature="test", async_writes=True, flush_interval=60)
+        assert writer.is_async
+        writer.emit("info", "queued")
+        time.sleep(0.05)
+        assert self._lines(tmp_path) == []
+
+        writer.flush()
+        assert [e["message"] for e in self._lines(tmp_path)] == ["queued"]
+        writer.close()
+
+    def test_batch_size_triggers_write(self, tmp_path: Path) -> None:
+        """Test a full batch is written without waiting for the interval."""
+        writer = StructuredLogWriter(
+            tmp_path, worker_id=0, feature="test", async_writes=True, batch_size=10, flush_interval=60
+        )
+        for i in range(10):
+            writer.emit("info", f"entry {i}")
+
+        deadline = time.monotonic() + 5
+        while len(self._lines(tmp_path)) < 10 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(self._lines(tmp_path)) == 10
+        writer.close()
+
+    def test_flush_interval_triggers_write(self, tmp_path: Path) -> None:
+        """Test a partial batch is written once flush_interval elapses."""
+        writer = StructuredLogWriter(tmp_path, worker_id=0, feature="test", async_writes=True, flush_interval=0.05)
+        writer.emit("info", "lonely entry")
+
+        deadline = time.monotonic() + 5
+        while not self._lines(tmp_path) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert [e["message"] for e in self._lines(tmp_path)] == ["lonely entry"]
+        writer.close()
+
+    def test_close_writes_all_entries_in_order(self, tmp_path: Path) -> None:
+        """Test close drains the queue and preserves emit order."""
+        writer = StructuredLogWriter(tmp_path, worker_id=0, feature="test", async_writes=True, batch_size=7)
+        for i in range(100):
+            writer.emit("info", f"entry {i}", data={"i": i})
+        writer.close()
+
+        assert [e["data"]["i"] for e in self._lines(tmp_path)] == list(range(100))
+        writer.close()  # idempotent
+
+    def test_flush_after_thread_death_drains_on_caller(self, tmp_path: Path) -> None:
+        """Test flush falls back to a synchronous drain if the thread is gone."""
+        writer = StructuredLogWriter(tmp_path, worker_id=0, feature="test", async_writes=True, flush_interval=60)
+        assert writer._thread is not None
+        writer._stopping = True
+        writer._wakeup.set()
+        writer._thread.join(timeout=5)
+        assert not writer._thread.is_alive()
+
+        writer.emit("info", "after crash")
+        writer.flush()
+        assert [e["message"] for e in self._lines(tmp_path)] == ["after crash"]
+        writer.close()
+
+    def test_unserialisable_data_falls_back_to_str(self, tmp_path: Path) -> None:
+        """Test a bad entry neither kills the writer thread nor is dropped."""
+        writer = StructuredLogWriter(tmp_path, worker_id=0, feature="test", async_writes=True)
+        writer.emit("info", "odd", data={"path": Path("/x"), 1: "int key"})
+        writer.emit("info", "normal")
+        writer.close()
+
+        entries = self._lines(tmp_path)
+        assert entries[0]["data"] == {"path": "/x", "1": "int key"}
+        assert entries[1]["message"] == "normal"
+
+    def test_async_rotation(self, tmp_path: Path) -> None:
+        """Test rotation also happens on the background thread."""
+        writer = StructuredLogWriter(
+            tmp_path, worker_id=0, feature="test", max_size_mb=0, async_writes=True, batch_size=1
+        )
+        for i in range(3):
+            writer.emit("info", f"entry {i}")
+            writer.flush()
+        writer.close()
+
+        assert (tmp_path / "workers" / "worker-0.jsonl.1.gz").exists()
+        assert (tmp_path / "workers" / "worker-0.jsonl.2.gz").exists()
+
+
 class TestTaskArtifactCapture:
     """Tests for TaskArtifactCapture."""
 
@@ -24,7 +24,7 @@ import pytest
 
 from zerg.config import QualityGate, ZergConfig
 from zerg.constants import GateResult, MergeStatus
-from zerg.exceptions import MergeConflictError
+from zerg.exceptions import GitError, MergeConflictError
 from zerg.merge import MergeCoordinator, MergeFlowResult
 from zerg.types import GateRunResult
 
@@ -57,6 +57,8 @@ def mock_git():
         "zerg/my-feat/worker-1",
     ]
     git.delete_feature_branches.return_value = 2
+    # Exercise the checkout-based merge path; merge-tree has its own tests
+    git.supports_merge_tree.return_value = False
     return git
 
 
@@ -324,6 +326,49 @@ class TestExecuteMerge:
             )
 
 
+class TestExecuteMergeTree:
+    """Tests for the checkout-free merge-tree backend of execute_merge()."""
+
+    @pytest.fixture
+    def tree_git(self, mock_git):
+        mock_git.supports_merge_tree.return_value = True
+        mock_git.current_branch.return_value = "main"
+        mock_git.merge_without_checkout.return_value = ["sha1111", "sha2222"]
+        return mock_git
+
+    def test_merges_without_checkout(self, coordinator, tree_git):
+        results = coordinator.execute_merge(["worker-0", "worker-1"], "staging")
+        tree_git.merge_without_checkout.assert_called_once_with(["worker-0", "worker-1"], "staging")
+        tree_git.checkout.assert_not_called()
+        tree_git.merge.assert_not_called()
+        assert [r.commit_sha for r in results] == ["sha1111", "sha2222"]
+        assert all(r.status == MergeStatus.MERGED for r in results)
+
+    def test_conflict_falls_back_to_checkout_merge(self, coordinator, tree_git):
+        tree_git.merge_without_checkout.side_effect = MergeConflictError(
+            message="conflict",
+            source_branch="worker-1",
+            target_branch="staging",
+            conflicting_files=["file.py"],
+        )
+        tree_git.merge.side_effect = ["sha1111", "sha2222"]
+        results = coordinator.execute_merge(["worker-0", "worker-1"], "staging")
+        tree_git.checkout.assert_called_once_with("staging")
+        assert [r.commit_sha for r in results] == ["sha1111", "sha2222"]
+
+    def test_checkout_backend_configured(self, coordinator, tree_git, mock_config):
+        mock_config.git.merge_backend = "checkout"
+        tree_git.merge.side_effect = ["sha1111"]
+        coordinator.execute_merge(["worker-0"], "staging")
+        tree_git.merge_without_checkout.assert_not_called()
+
+    def test_staging_checked_out_uses_checkout_merge(self, coordinator, tree_git):
+        tree_git.current_branch.return_value = "staging"
+        tree_git.merge.side_effect = ["sha1111"]
+        coordinator.execute_merge(["worker-0"], "staging")
+        tree_git.merge_without_checkout.assert_not_called()
+
+
 # ===========================================================================
 # run_post_merge_gates
 # ===========================================================================
@@ -455,6 +500,23 @@ class TestFullMergeFlow:
         # Staging branch should be cleaned up
         mock_git.delete_branch.assert_called()
 
+    def test_post_merge_gates_receive_merged_files(self, coordinator, mock_git, mock_gates):
+        """Post-merge plugin gates are told which files the level merge changed."""
+        mock_git.changed_files.return_value = ["src/a.py", "src/b.py"]
+        coordinator.full_merge_flow(level=1, worker_branches=["worker-0"], target_branch="main")
+
+        mock_git.changed_files.assert_called_once_with("main", "zerg/my-feat/staging-1")
+        post_call = mock_gates.run_all_gates.call_args_list[-1]
+        assert post_call.kwargs["changed_files"] == ["src/a.py", "src/b.py"]
+
+    def test_merged_files_unknown_when_diff_fails(self, coordinator, mock_git, mock_gates):
+        """A failing diff leaves changed_files unset so gates check everything."""
+        mock_git.changed_files.side_effect = GitError("bad revision")
+        result = coordinator.full_merge_flow(level=1, worker_branches=["worker-0"])
+
+        assert result.success is True
+        assert mock_gates.run_all_gates.call_args_list[-1].kwargs["changed_files"] is None
+
     def test_success_skip_gates(self, coordinator, mock_git, mock_gates):
         """skip_gates=True bypasses pre/post-merge gates."""
         result = coordinator.full_merge_flow(
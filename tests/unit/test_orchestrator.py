@@ -296,6 +296,18 @@ class TestStopMethod:
 
         assert mock_orchestrator_deps["subprocess_launcher"].terminate.call_count >= 2
 
+    def test_stop_keeps_worktree_pool(self, mock_orchestrator_deps, tmp_path: Path, monkeypatch) -> None:
+        """Test stop leaves idle pooled worktrees for the next run."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".zerg").mkdir()
+
+        orch = Orchestrator("test-feature")
+        orch._running = True
+
+        orch.stop()
+
+        mock_orchestrator_deps["worktree"].drain_pool.assert_not_called()
+
 
 class TestMainLoop:
     """Tests for the main orchestration loop."""
@@ -364,6 +376,7 @@ class TestMainLoop:
                     orch._main_loop()
 
         assert orch._running is False
+        mock_orchestrator_deps["worktree"].drain_pool.assert_not_called()
 
     def test_main_loop_keyboard_interrupt(self, mock_orchestrator_deps, tmp_path: Path, monkeypatch) -> None:
         """Test main loop handles keyboard interrupt."""
@@ -416,6 +429,17 @@ class TestStartLevel:
 
         mock_orchestrator_deps["task_sync"].create_level_tasks.assert_not_called()
 
+    def test_start_level_does_not_warm_worktree_pool(self, mock_orchestrator_deps, tmp_path: Path, monkeypatch) -> None:
+        """Test _start_level leaves pool filling to released worker worktrees."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".zerg").mkdir()
+
+        orch = Orchestrator("test-feature")
+        orch._start_level(1)
+
+        mock_orchestrator_deps["worktree"].warm_pool.assert_not_called()
+        mock_orchestrator_deps["levels"].start_level.assert_called_with(1)
+
 
 class TestLevelCompleteHandler:
     """Tests for _on_level_complete_handler."""
@@ -449,6 +473,16 @@ class TestMergeLevelWithBranches:
 
         mock_orchestrator_deps["merge"].full_merge_flow.assert_called_once()
 
+    def test_merger_shares_plugin_registry(self, mock_orchestrator_deps, tmp_path: Path, monkeypatch) -> None:
+        """Test plugin gates such as architecture also run in the level merge."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".zerg").mkdir()
+
+        with patch("zerg.orchestrator.MergeCoordinator") as merge_cls:
+            orch = Orchestrator("test-feature")
+
+        assert merge_cls.call_args.kwargs["plugin_registry"] is orch._plugin_registry
+
 
 class TestRebaseAllWorkers:
     """Tests for _rebase_all_workers method."""
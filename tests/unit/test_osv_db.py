@@ -0,0 +1,144 @@
+"""Tests for the local OSV vulnerability database."""
+
+import json
+import urllib.error
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from tests.fixtures.osv_fixtures import OSV_RECORDS, write_osv_export
+from zerg.security.cve import scan_dependencies
+from zerg.security.osv_db import VulnerabilityDatabase, update_database, version_key
+
+
+@pytest.fixture
+def osv_db(tmp_path: Path) -> Path:
+    """A database loaded from the fixture exports of every ecosystem."""
+    db_path = tmp_path / "osv.sqlite3"
+    with VulnerabilityDatabase(db_path) as db:
+        for ecosystem in OSV_RECORDS:
+            db.import_export(write_osv_export(tmp_path / "exports", ecosystem), ecosystem)
+    return db_path
+
+
+def _ids(db_path: Path, ecosystem: str, name: str, version: str) -> list[str]:
+    with VulnerabilityDatabase(db_path) as db:
+        hits = db.lookup([(ecosystem, name, version)])
+    return [v["id"] for v in hits.get((ecosystem, name, version), [])]
+
+
+class TestVersionKey:
+    """Ecosystem-aware version ordering."""
+
+    @pytest.mark.parametrize(
+        "lower, higher",
+        [
+            ("1.0.dev1", "1.0a1"),
+            ("1.0a1", "1.0b2"),
+            ("1.0rc1", "1.0"),
+            ("1.0", "1.0.post1"),
+            ("2.9", "2.10"),
+            ("2.0", "1!0.1"),
+        ],
+    )
+    def test_pep440_order(self, lower: str, higher: str) -> None:
+        assert version_key("PyPI", lower) < version_key("PyPI", higher)
+
+    def test_pep440_trailing_zeros_are_equal(self) -> None:
+        assert version_key("PyPI", "1.0") == version_key("PyPI", "1.0.0")
+
+    @pytest.mark.parametrize(
+        "lower, higher",
+        [
+            ("1.0.0-alpha", "1.0.0-alpha.1"),
+            ("1.0.0-alpha.1", "1.0.0-beta"),
+            ("1.0.0-rc.1", "1.0.0"),
+            ("v0.3.7", "0.3.8"),
+            ("0.0.0-20200101000000-abcdef123456", "0.0.1"),
+        ],
+    )
+    def test_semver_order(self, lower: str, higher: str) -> None:
+        assert version_key("npm", lower) < version_key("npm", higher)
+
+    def test_unparseable(self) -> None:
+        assert version_key("PyPI", "not-a-version") is None
+        assert version_key("npm", "latest") is None
+
+
+class TestVulnerabilityDatabase:
+    """Import and lookup against the fixture exports."""
+
+    def test_ranges_fixed_and_last_affected(self, osv_db: Path) -> None:
+        assert _ids(osv_db, "PyPI", "requests", "2.25.0") == ["PYSEC-2023-74"]
+        assert _ids(osv_db, "PyPI", "requests", "2.31.0") == []
+        assert _ids(osv_db, "PyPI", "requests", "2.2.1") == []
+        assert _ids(osv_db, "PyPI", "urllib3", "1.26.4") == ["PYSEC-2021-108"]
+        assert _ids(osv_db, "PyPI", "urllib3", "1.26.5") == []
+
+    def test_multiple_intervals_and_name_normalization(self, osv_db: Path) -> None:
+        assert _ids(osv_db, "PyPI", "django", "3.2.17") == ["GHSA-qw25-v68c-qjf3"]
+        assert _ids(osv_db, "PyPI", "Django", "4.0.9") == ["GHSA-qw25-v68c-qjf3"]
+        assert _ids(osv_db, "PyPI", "django", "3.2.18") == []
+        assert _ids(osv_db, "PyPI", "django", "4.1") == []
+
+    def test_explicit_version_list(self, osv_db: Path) -> None:
+        assert _ids(osv_db, "PyPI", "pyyaml", "5.3") == ["PYSEC-2020-96"]
+        assert _ids(osv_db, "PyPI", "PyYAML", "5.4") == []
+
+    def test_other_ecosystems(self, osv_db: Path) -> None:
+        assert _ids(osv_db, "npm", "lodash", "4.17.20") == ["GHSA-35jh-r3h4-6jhm"]
+        assert _ids(osv_db, "Go", "golang.org/x/text", "v0.3.7") == ["GO-2022-1059"]
+        assert _ids(osv_db, "crates.io", "hyper", "0.14.9") == ["RUSTSEC-2021-0078"]
+        assert _ids(osv_db, "crates.io", "hyper", "0.14.10") == []
+
+    def test_withdrawn_advisories_are_skipped(self, osv_db: Path) -> None:
+        assert _ids(osv_db, "PyPI", "flask", "0.1") == []
+
+    def test_reimport_replaces_ecosystem(self, osv_db: Path, tmp_path: Path) -> None:
+        export = write_osv_export(tmp_path / "new", "npm", records=[])
+        with VulnerabilityDatabase(osv_db) as db:
+            assert db.import_export(export, "npm") == 0
+            assert set(db.imported_ecosystems()) == {"PyPI", "npm", "Go", "crates.io"}
+        assert _ids(osv_db, "npm", "lodash", "4.17.20") == []
+        assert _ids(osv_db, "PyPI", "requests", "2.25.0") == ["PYSEC-2023-74"]
+
+    def test_update_database_downloads_exports(self, tmp_path: Path) -> None:
+        exports = tmp_path / "exports"
+        for ecosystem in ("PyPI", "npm"):
+            write_osv_export(exports, ecosystem)
+
+        counts = update_database(tmp_path / "osv.sqlite3", ["PyPI", "npm"], base_url=exports.as_uri())
+
+        assert counts == {"PyPI": 4, "npm": 1}
+        assert _ids(tmp_path / "osv.sqlite3", "npm", "lodash", "4.0.0") == ["GHSA-35jh-r3h4-6jhm"]
+
+
+class TestOfflineScan:
+    """scan_dependencies against the local database."""
+
+    def test_scan_uses_local_database_without_network(self, osv_db: Path, tmp_path: Path) -> None:
+        project = tmp_path / "project"
+        project.mkdir()
+        (project / "requirements.txt").write_text("requests==2.25.0\nPyYAML==5.3\nclick==8.1.7\n")
+        (project / "requirements.lock").write_text("")
+        (project / "package.json").write_text(json.dumps({"dependencies": {"lodash": "4.17.20"}}))
+        (project / "package-lock.json").write_text("{}")
+
+        with patch("zerg.security.cve.urllib.request.urlopen", side_effect=AssertionError("network used")):
+            findings = scan_dependencies(project, db_path=osv_db)
+
+        by_id = {f.pattern_name: f for f in findings}
+        assert set(by_id) == {"CVE-2023-32681", "CVE-2020-1747", "CVE-2021-23337"}
+        assert by_id["CVE-2023-32681"].severity == "medium"  # CVSS 6.1
+        assert by_id["CVE-2020-1747"].severity == "critical"
+        assert by_id["CVE-2020-1747"].line == 2
+
+    def test_missing_database_leaves_heuristics(self, tmp_path: Path) -> None:
+        (tmp_path / "requirements.txt").write_text("urllib3==1.25.8\n")
+
+        with patch("zerg.security.cve.urllib.request.urlopen", side_effect=urllib.error.URLError("offline")):
+            findings = scan_dependencies(tmp_path, db_path=tmp_path / "missing.sqlite3")
+
+        assert {f.pattern_name for f in findings} == {"CVE-2021-33503", "missing_lockfile"}
+        assert not (tmp_path / "missing.sqlite3").exists()
@@ -6,6 +6,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from zerg.performance.adapters.ast_perf_adapter import NATIVE_TOOL, AstPerfAdapter
+from zerg.performance.adapters.base import BaseToolAdapter
 from zerg.performance.aggregator import PerformanceAuditor
 from zerg.performance.types import (
     DetectedStack,
@@ -80,7 +82,7 @@ class TestPerformanceAuditor:
         mock_registry_cls: MagicMock,
         mock_detect: MagicMock,
     ) -> None:
-        """When no tools are available, report has no findings and overall_score=None."""
+        """When no external tools are available, only the built-in AST analyser runs."""
         mock_detect.return_value = DetectedStack(languages=["python"], frameworks=[])
 
         mock_registry = MagicMock()
@@ -95,12 +97,13 @@ class TestPerformanceAuditor:
         mock_catalog.get_factors_by_category.return_value = {}
         mock_catalog_load.return_value = mock_catalog
 
-        auditor = PerformanceAuditor(".")
+        auditor = PerformanceAuditor(".", use_cache=False)
         report = auditor.run([])
 
         assert report.findings == []
         assert report.overall_score is None
-        assert report.factors_checked == 0
+        assert report.factors_checked == len(AstPerfAdapter.factors_covered)
+        assert any(t.name == NATIVE_TOOL and t.available for t in report.tool_statuses)
 
     @patch("zerg.performance.aggregator.detect_stack")
     @patch("zerg.performance.aggregator.ToolRegistry")
@@ -137,7 +140,7 @@ class TestPerformanceAuditor:
         }
         mock_catalog_load.return_value = mock_catalog
 
-        auditor = PerformanceAuditor(".")
+        auditor = PerformanceAuditor(".", use_cache=False)
 
         fake_adapter = FakeAdapter(
             name="fake",
@@ -187,7 +190,7 @@ class TestPerformanceAuditor:
         }
         mock_catalog_load.return_value = mock_catalog
 
-        auditor = PerformanceAuditor(".")
+        auditor = PerformanceAuditor(".", use_cache=False)
 
         fake_adapter = FakeAdapter(
             name="fake",
@@ -236,7 +239,7 @@ class TestPerformanceAuditor:
         }
         mock_catalog_load.return_value = mock_catalog
 
-        auditor = PerformanceAuditor(".")
+        auditor = PerformanceAuditor(".", use_cache=False)
 
         fake_adapter = FakeAdapter(
             name="fake",
@@ -273,9 +276,168 @@ class TestPerformanceAuditor:
         mock_catalog.get_factors_by_category.return_value = {}
         mock_catalog_load.return_value = mock_catalog
 
-        auditor = PerformanceAuditor(".")
+        auditor = PerformanceAuditor(".", use_cache=False)
         report = auditor.run([])
 
         assert report is not None
         assert report.findings == []
         assert report.overall_score is None
+
+
+class _CountingAdapter(BaseToolAdapter):
+    """Cacheable adapter that reports one finding per analysed file."""
+
+    name = "counting"
+    tool_name = "counting"
+    cacheable = True
+    supports_file_list = True
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def run(self, files: list[str], project_path: str, stack: DetectedStack) -> list[PerformanceFinding]:
+        self.calls.append(list(files))
+        return [
+            PerformanceFinding(
+                factor_id=1,
+                factor_name="Test factor",
+                category="TestCat",
+                severity=Severity.LOW,
+                message=f"finding in {f}",
+                file=f,
+                line=1,
+                tool=self.name,
+            )
+            for f in files
+        ]
+
+
+class _WholeProjectAdapter(_CountingAdapter):
+    """Cacheable adapter that can only analyse the whole input set."""
+
+    name = "whole"
+    tool_name = "whole"
+    supports_file_list = False
+
+
+class TestResultCaching:
+    """Tests for tool-availability and adapter-result caching."""
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        for name in ("a.py", "b.py", "c.py"):
+            (tmp_path / name).write_text(f"# {name}\n")
+        return tmp_path
+
+    def _auditor(self, project) -> PerformanceAuditor:
+        with (
+            patch("zerg.performance.aggregator.detect_stack") as mock_detect,
+            patch("zerg.performance.aggregator.FactorCatalog.load") as mock_catalog_load,
+        ):
+            mock_detect.return_value = DetectedStack(languages=["python"], frameworks=[])
+            mock_catalog = MagicMock()
+            mock_catalog.filter_static_only.return_value = []
+            mock_catalog.get_factors_by_category.return_value = {}
+            mock_catalog_load.return_value = mock_catalog
+            auditor = PerformanceAuditor(str(project))
+        auditor.registry = MagicMock()
+        auditor.registry.check_availability.return_value = [ToolStatus(name="counting", available=True, version="1")]
+        return auditor
+
+    def test_unchanged_files_served_from_cache(self, project) -> None:
+        files = [str(project / n) for n in ("a.py", "b.py", "c.py")]
+        adapter = _CountingAdapter()
+
+        first = self._auditor(project)
+        with patch.object(first, "_get_adapters", return_value=[adapter]):
+            report1 = first.run(files)
+        assert len(adapter.calls) == 1
+        assert len(report1.findings) == 3
+
+        second = self._auditor(project)
+        with patch.object(second, "_get_adapters", return_value=[adapter]):
+            report2 = second.run(files)
+        assert len(adapter.calls) == 1  # nothing re-run
+        assert sorted(f.message for f in report2.findings) == sorted(f.message for f in report1.findings)
+
+    def test_only_changed_files_rerun(self, project) -> None:
+        files = [str(project / n) for n in ("a.py", "b.py", "c.py")]
+        adapter = _CountingAdapter()
+
+        first = self._auditor(project)
+        with patch.object(first, "_get_adapters", return_value=[adapter]):
+            first.run(files)
+
+        (project / "b.py").write_text("# changed\n")
+        second = self._auditor(project)
+        with patch.object(second, "_get_adapters", return_value=[adapter]):
+            report = second.run(files)
+
+        assert adapter.calls[-1] == [str(project / "b.py")]
+        assert len(report.findings) == 3
+
+    def test_whole_result_adapter_reruns_on_any_change(self, project) -> None:
+        files = [str(project / n) for n in ("a.py", "b.py", "c.py")]
+        adapter = _WholeProjectAdapter()
+
+        for _ in range(2):
+            auditor = self._auditor(project)
+            with patch.object(auditor, "_get_adapters", return_value=[adapter]):
+                auditor.run(files)
+        assert len(adapter.calls) == 1
+
+        (project / "a.py").write_text("# changed\n")
+        auditor = self._auditor(project)
+        with patch.object(auditor, "_get_adapters", return_value=[adapter]):
+            auditor.run(files)
+        assert len(adapter.calls) == 2
+        assert adapter.calls[-1] == files
+
+    def test_failed_rerun_keeps_cached_findings(self, project) -> None:
+        files = [str(project / n) for n in ("a.py", "b.py", "c.py")]
+        adapter = _CountingAdapter()
+
+        first = self._auditor(project)
+        with patch.object(first, "_get_adapters", return_value=[adapter]):
+            first.run(files)
+
+        (project / "b.py").write_text("# changed\n")
+        second = self._auditor(project)
+        with (
+            patch.object(second, "_get_adapters", return_value=[adapter]),
+            patch.object(adapter, "run", side_effect=RuntimeError("tool crashed")),
+        ):
+            report = second.run(files)
+
+        assert sorted(f.file for f in report.findings) == [str(project / "a.py"), str(project / "c.py")]
+
+    def test_whole_project_scan_not_cached(self, project) -> None:
+        adapter = _CountingAdapter()
+
+        for _ in range(2):
+            auditor = self._auditor(project)
+            with patch.object(auditor, "_get_adapters", return_value=[adapter]):
+                auditor.run([])
+        assert adapter.calls == [[], []]
+
+    def test_tool_version_change_invalidates(self, project) -> None:
+        files = [str(project / "a.py")]
+        adapter = _CountingAdapter()
+
+        auditor = self._auditor(project)
+        with patch.object(auditor, "_get_adapters", return_value=[adapter]):
+            auditor.run(files)
+
+        auditor = self._auditor(project)
+        auditor.registry.check_availability.return_value = [ToolStatus(name="counting", available=True, version="2")]
+        with patch.object(auditor, "_get_adapters", return_value=[adapter]):
+            auditor.run(files)
+        assert len(adapter.calls) == 2
+
+    def test_cache_disabled(self, project) -> None:
+        with (
+            patch("zerg.performance.aggregator.detect_stack"),
+            patch("zerg.performance.aggregator.FactorCatalog.load"),
+        ):
+            auditor = PerformanceAuditor(str(project), use_cache=False)
+        assert auditor.result_cache is None
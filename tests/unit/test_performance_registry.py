@@ -83,3 +83,50 @@ class TestPrintAdvisory:
         console = Console(file=MagicMock(), force_terminal=False)
         # Should not raise and should return early
         registry.print_advisory(console, [])
+
+
+class TestAvailabilityCache:
+    """Tests for the PATH/binary-mtime keyed availability cache."""
+
+    def _which(self, cmd: str) -> str | None:
+        return "/usr/bin/radon" if cmd == "radon" else None
+
+    def test_cache_hit_skips_version_subprocess(self, tmp_path) -> None:
+        cache_path = tmp_path / "perf-tools.json"
+        with (
+            patch("zerg.performance.tool_registry.shutil.which", side_effect=self._which),
+            patch("zerg.performance.tool_registry.subprocess.run") as mock_run,
+        ):
+            mock_run.return_value = MagicMock(stdout="radon 6.0\n", stderr="")
+            first = ToolRegistry(cache_path=cache_path).check_availability()
+            assert mock_run.call_count == 1
+
+            # A fresh registry (new process) reuses the persisted result
+            second = ToolRegistry(cache_path=cache_path).check_availability()
+            assert mock_run.call_count == 1
+
+        assert [s.to_dict() for s in first] == [s.to_dict() for s in second]
+        assert next(s for s in second if s.name == "radon").version == "radon 6.0"
+
+    def test_path_change_invalidates(self, tmp_path, monkeypatch) -> None:
+        cache_path = tmp_path / "perf-tools.json"
+        with (
+            patch("zerg.performance.tool_registry.shutil.which", side_effect=self._which),
+            patch("zerg.performance.tool_registry.subprocess.run") as mock_run,
+        ):
+            mock_run.return_value = MagicMock(stdout="radon 6.0\n", stderr="")
+            ToolRegistry(cache_path=cache_path).check_availability()
+            monkeypatch.setenv("PATH", "/somewhere/else")
+            ToolRegistry(cache_path=cache_path).check_availability()
+            assert mock_run.call_count == 2
+
+    def test_use_cache_false_always_checks(self) -> None:
+        registry = ToolRegistry()
+        with (
+            patch("zerg.performance.tool_registry.shutil.which", side_effect=self._which),
+            patch("zerg.performance.tool_registry.subprocess.run") as mock_run,
+        ):
+            mock_run.return_value = MagicMock(stdout="radon 6.0\n", stderr="")
+            registry.check_availability(use_cache=False)
+            registry.check_availability(use_cache=False)
+            assert mock_run.call_count == 2
@@ -1,11 +1,21 @@
 """Tests for ZERG port allocation module."""
 
+import os
 import socket
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from zerg.ports import PortAllocator
+from zerg.ports import PortAllocator, ReservationFile, default_reservation_file
+
+
+@pytest.fixture(autouse=True)
+def _isolated_reservations(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep every allocator in these tests off the real host-wide reservation file."""
+    monkeypatch.setattr("zerg.ports.RESERVATION_DIR", tmp_path)
 
 
 class TestPortAllocatorInit:
@@ -232,3 +242,80 @@ class TestAsyncMethods:
             ports = await allocator.allocate_for_worker_async(worker_id=2, ports_per_worker=3)
 
         assert len(ports) == 3
+
+
+class TestReservationFile:
+    """Tests for host-wide reservations shared between allocators."""
+
+    def test_allocators_never_share_ports(self) -> None:
+        first = PortAllocator(range_start=50000, range_end=50039, block_size=8)
+        second = PortAllocator(range_start=50000, range_end=50039, block_size=8)
+        with patch.object(PortAllocator, "is_available", return_value=True):
+            ports = [first.allocate_one() for _ in range(10)] + second.allocate(10)
+
+        assert len(set(ports)) == 20
+        reserved = ReservationFile(default_reservation_file()).reserved()
+        assert set(ports) <= set(reserved)
+        assert set(reserved.values()) == {os.getpid()}
+
+    def test_only_returned_ports_are_probed(self) -> None:
+        allocator = PortAllocator(range_start=50000, range_end=50999, block_size=16)
+        with patch.object(allocator, "is_available", return_value=True) as probe:
+            allocator.allocate(3)
+
+        assert probe.call_count == 3
+
+    def test_block_serves_later_allocations_without_the_file(self) -> None:
+        allocator = PortAllocator(range_start=50000, range_end=50999, block_size=16)
+        with patch.object(allocator, "is_available", return_value=True):
+            allocator.allocate_one()
+            with patch("zerg.ports.ReservationFile.claim") as claim:
+                for _ in range(15):
+                    allocator.allocate_one()
+
+        claim.assert_not_called()
+
+    def test_failed_probes_are_handed_back(self) -> None:
+        allocator = PortAllocator(range_start=50000, range_end=50999, block_size=4)
+        with patch.object(allocator, "is_available", side_effect=lambda port: port != 50000):
+            ports = allocator.allocate(2)
+
+        assert 50000 not in ports
+        assert 50000 not in ReservationFile(default_reservation_file()).reserved()
+
+    def test_release_all_drops_reservations(self) -> None:
+        allocator = PortAllocator(range_start=50000, range_end=50999)
+        with patch.object(allocator, "is_available", return_value=True):
+            allocator.allocate(3)
+        allocator.release_all()
+
+        assert ReservationFile(default_reservation_file()).reserved() == {}
+
+    def test_released_port_is_reused(self) -> None:
+        allocator = PortAllocator(range_start=50000, range_end=50999, block_size=1)
+        with patch.object(allocator, "is_available", return_value=True):
+            port = allocator.allocate_one()
+            allocator.release(port)
+            assert allocator.allocate_one() == port
+
+    def test_reservations_of_exited_processes_are_reclaimed(self, tmp_path: Path) -> None:
+        dead = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"], capture_output=True, text=True)
+        path = tmp_path / "ports.json"
+        path.write_text(f'{{"version": 1, "cursor": 50000, "reservations": {{"50000": {dead.stdout.strip()}}}}}')
+
+        assert ReservationFile(path).claim(50000, 50000, 1) == [50000]
+
+    def test_corrupt_file_is_reset(self) -> None:
+        default_reservation_file().write_text("{not json")
+        allocator = PortAllocator(range_start=50000, range_end=50010)
+        with patch.object(allocator, "is_available", return_value=True):
+            assert allocator.allocate_one() == 50000
+
+    def test_unusable_file_falls_back_to_local_cursor(self, tmp_path: Path) -> None:
+        allocator = PortAllocator(
+            range_start=50000, range_end=50010, reservation_file=tmp_path / "missing" / "ports.json"
+        )
+        with patch.object(allocator, "is_available", return_value=True):
+            ports = allocator.allocate(3)
+
+        assert ports == [50000, 50001, 50002]
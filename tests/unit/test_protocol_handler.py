@@ -7,17 +7,24 @@ logging integration.
 
 from __future__ import annotations
 
-import subprocess
+import json
+import sys
+import time
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from zerg.claude_stream import StreamedRun
 from zerg.constants import (
     LogEvent,
     PluginHookEvent,
     TaskStatus,
     WorkerStatus,
 )
+from zerg.log_writer import TaskArtifactCapture
 from zerg.protocol_handler import ProtocolHandler
 from zerg.protocol_types import CLAUDE_CLI_COMMAND, CLAUDE_CLI_DEFAULT_TIMEOUT, ClaudeInvocationResult
 from zerg.verify import VerificationExecutionResult
@@ -27,6 +34,12 @@ from zerg.verify import VerificationExecutionResult
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def _isolated_zerg_dirs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep task artifacts out of the repository's .zerg/logs."""
+    monkeypatch.setenv("ZERG_LOG_DIR", str(tmp_path / "logs"))
+
+
 def _make_config(**overrides: Any) -> MagicMock:
     """Create a minimal ZergConfig mock."""
     cfg = MagicMock()
@@ -226,113 +239,178 @@ class TestBuildTaskPrompt:
 # ===================================================================
 
 
+_STUB_CLI = """\
+import json, os, sys, time
+
+mode = os.environ.get("STUB_MODE", "ok")
+if mode == "ok":
+    print(json.dumps({"type": "system", "subtype": "init", "task": os.environ["ZERG_TASK_ID"]}), flush=True)
+    tool = {"type": "tool_use", "name": "Edit", "input": {}}
+    print(json.dumps({"type": "assistant", "message": {"content": [tool]}}), flush=True)
+    print(json.dumps({"type": "result", "subtype": "success", "args": sys.argv[1:-1]}), flush=True)
+elif mode == "fail":
+    print("error msg", file=sys.stderr, end="")
+    sys.exit(1)
+elif mode == "hang":
+    print("partial output", flush=True)
+    print("partial error", file=sys.stderr, flush=True)
+    time.sleep(30)
+"""
+
+
+@pytest.fixture
+def stub_cli(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point CLAUDE_CLI_COMMAND at a stub script whose behaviour is set via STUB_MODE."""
+    script = tmp_path / "stub-claude"
+    script.write_text(f"#!{sys.executable}\n{_STUB_CLI}")
+    script.chmod(0o755)
+    monkeypatch.setattr("zerg.protocol_handler.CLAUDE_CLI_COMMAND", str(script))
+    return script
+
+
 class TestInvokeClaudeCode:
     """Tests for Claude CLI invocation."""
 
-    @patch("zerg.protocol_handler.subprocess.run")
-    def test_successful_invocation(self, mock_run: MagicMock, tmp_path: Path) -> None:
-        mock_run.return_value = MagicMock(returncode=0, stdout="output", stderr="")
+    def test_successful_invocation(self, stub_cli: Path, tmp_path: Path) -> None:
         handler = _make_handler(tmp_path)
-        task = _make_task()
 
-        result = handler.invoke_claude_code(task)
+        result = handler.invoke_claude_code(_make_task())
 
         assert result.success is True
         assert result.exit_code == 0
-        assert result.stdout == "output"
         assert result.task_id == "TASK-001"
         assert result.duration_ms >= 0
+        events = [json.loads(line) for line in result.stdout.splitlines()]
+        assert events[0]["task"] == "TASK-001"
+        assert events[-1]["args"] == [
+            "--print",
+            "--dangerously-skip-permissions",
+            "--output-format",
+            "stream-json",
+            "--verbose",
+        ]
+        assert result.progress == {"events": 3, "turns": 1, "tool_uses": 1, "last_tool": "Edit"}
 
-        # Verify correct CLI arguments
-        args, kwargs = mock_run.call_args
-        cmd = args[0]
-        assert cmd[0] == CLAUDE_CLI_COMMAND
-        assert "--print" in cmd
-        assert "--dangerously-skip-permissions" in cmd
-
-    @patch("zerg.protocol_handler.subprocess.run")
-    def test_failed_invocation(self, mock_run: MagicMock, tmp_path: Path) -> None:
-        mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="error msg")
+    def test_failed_invocation(self, stub_cli: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("STUB_MODE", "fail")
         handler = _make_handler(tmp_path)
-        task = _make_task()
 
-        result = handler.invoke_claude_code(task)
+        result = handler.invoke_claude_code(_make_task())
 
         assert result.success is False
         assert result.exit_code == 1
         assert result.stderr == "error msg"
 
-    @patch("zerg.protocol_handler.subprocess.run")
-    def test_timeout_returns_failure(self, mock_run: MagicMock, tmp_path: Path) -> None:
-        mock_run.side_effect = subprocess.TimeoutExpired(cmd="claude", timeout=30)
+    def test_timeout_keeps_partial_output(
+        self, stub_cli: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("STUB_MODE", "hang")
         handler = _make_handler(tmp_path)
-        task = _make_task()
+        artifact = TaskArtifactCapture(tmp_path / "logs", "TASK-001")
 
-        result = handler.invoke_claude_code(task, timeout=30)
+        result = handler.invoke_claude_code(_make_task(), timeout=1, artifact=artifact)
 
         assert result.success is False
         assert result.exit_code == -1
         assert "timed out" in result.stderr
+        assert "partial error" in result.stderr
+        assert result.stdout == "partial output\n"
+        output = artifact.claude_output_path.read_text()
+        assert "=== STDOUT ===\npartial output" in output
+        assert "=== STDERR ===\npartial error" in output
 
-    @patch("zerg.protocol_handler.subprocess.run")
-    def test_file_not_found_returns_failure(self, mock_run: MagicMock, tmp_path: Path) -> None:
-        mock_run.side_effect = FileNotFoundError("claude not found")
+    def test_streams_to_artifact(self, stub_cli: Path, tmp_path: Path) -> None:
         handler = _make_handler(tmp_path)
-        task = _make_task()
+        artifact = TaskArtifactCapture(tmp_path / "logs", "TASK-001")
 
-        result = handler.invoke_claude_code(task)
+        result = handler.invoke_claude_code(_make_task(), artifact=artifact)
+
+        assert result.output_path == str(artifact.claude_output_path)
+        assert artifact.claude_output_path.read_text() == f"=== STDOUT ===\n{result.stdout}\n"
+        assert not list(artifact.task_dir.glob("*.stderr"))
+
+    def test_file_not_found_returns_failure(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("zerg.protocol_handler.CLAUDE_CLI_COMMAND", str(tmp_path / "missing-claude"))
+        handler = _make_handler(tmp_path)
+
+        result = handler.invoke_claude_code(_make_task())
 
         assert result.success is False
         assert result.exit_code == -1
         assert "not found" in result.stderr
 
-    @patch("zerg.protocol_handler.subprocess.run")
+    @patch("zerg.protocol_handler.run_streaming")
     def test_generic_exception_returns_failure(self, mock_run: MagicMock, tmp_path: Path) -> None:
         mock_run.side_effect = OSError("Unexpected OS error")
         handler = _make_handler(tmp_path)
-        task = _make_task()
 
-        result = handler.invoke_claude_code(task)
+        result = handler.invoke_claude_code(_make_task())
 
         assert result.success is False
         assert result.exit_code == -1
         assert "Unexpected OS error" in result.stderr
 
-    @patch("zerg.protocol_handler.subprocess.run")
+    @patch("zerg.protocol_handler.run_streaming")
     def test_custom_timeout_used(self, mock_run: MagicMock, tmp_path: Path) -> None:
-        mock_run.return_value = MagicMock(returncode=0, stdout="ok", stderr="")
+        mock_run.return_value = StreamedRun(returncode=0, stdout="ok", stderr="")
         handler = _make_handler(tmp_path)
-        task = _make_task()
 
-        handler.invoke_claude_code(task, timeout=60)
+        handler.invoke_claude_code(_make_task(), timeout=60)
 
-        _, kwargs = mock_run.call_args
-        assert kwargs["timeout"] == 60
+        assert mock_run.call_args.kwargs["timeout"] == 60
 
-    @patch("zerg.protocol_handler.subprocess.run")
+    @patch("zerg.protocol_handler.run_streaming")
     def test_default_timeout_used(self, mock_run: MagicMock, tmp_path: Path) -> None:
-        mock_run.return_value = MagicMock(returncode=0, stdout="ok", stderr="")
+        mock_run.return_value = StreamedRun(returncode=0, stdout="ok", stderr="")
         handler = _make_handler(tmp_path)
-        task = _make_task()
 
-        handler.invoke_claude_code(task)
+        handler.invoke_claude_code(_make_task())
 
-        _, kwargs = mock_run.call_args
-        assert kwargs["timeout"] == CLAUDE_CLI_DEFAULT_TIMEOUT
+        assert mock_run.call_args.kwargs["timeout"] == CLAUDE_CLI_DEFAULT_TIMEOUT
+        assert mock_run.call_args.args[0][0] == CLAUDE_CLI_COMMAND
 
-    @patch("zerg.protocol_handler.subprocess.run")
+    @patch("zerg.protocol_handler.run_streaming")
     def test_env_vars_include_zerg_ids(self, mock_run: MagicMock, tmp_path: Path) -> None:
-        mock_run.return_value = MagicMock(returncode=0, stdout="ok", stderr="")
+        mock_run.return_value = StreamedRun(returncode=0, stdout="ok", stderr="")
         handler = _make_handler(tmp_path)
-        task = _make_task()
 
-        handler.invoke_claude_code(task)
+        handler.invoke_claude_code(_make_task())
 
-        _, kwargs = mock_run.call_args
-        env = kwargs["env"]
+        env = mock_run.call_args.kwargs["env"]
         assert env["ZERG_TASK_ID"] == "TASK-001"
         assert env["ZERG_WORKER_ID"] == "1"
 
+    def test_stream_events_write_heartbeat(self, stub_cli: Path, tmp_path: Path) -> None:
+        heartbeat = MagicMock()
+        handler = _make_handler(tmp_path)
+        handler._heartbeat_writer = heartbeat
+
+        handler.invoke_claude_code(_make_task())
+
+        # One forced heartbeat at start; stream events within the interval are throttled
+        heartbeat.write.assert_called_with(task_id="TASK-001", step="implementing")
+        assert heartbeat.write.call_count == 1
+        handler._last_heartbeat -= 10
+        handler._write_heartbeat("TASK-001")
+        assert heartbeat.write.call_count == 2
+
+    @patch("zerg.protocol_handler._HEARTBEAT_REFRESH_INTERVAL", 0.05)
+    def test_silent_claude_run_refreshes_heartbeat(self, tmp_path: Path) -> None:
+        heartbeat = MagicMock()
+        handler = _make_handler(tmp_path)
+        handler._heartbeat_writer = heartbeat
+
+        def silent_run(*_args: object, on_tick: Callable[[], None], **_kwargs: object) -> StreamedRun:
+            for _ in range(3):
+                on_tick()
+            return StreamedRun(returncode=0, stdout="", stderr="")
+
+        with patch("zerg.protocol_handler.run_streaming", side_effect=silent_run) as run:
+            handler.invoke_claude_code(_make_task())
+
+        assert run.call_args.kwargs["tick_interval"] == 0.05
+        assert heartbeat.write.call_count == 4  # forced start + every tick
+
 
 # ===================================================================
 # run_verification
@@ -543,6 +621,25 @@ class TestExecuteTask:
         handler.context_tracker.track_task_execution.assert_called_once_with("TASK-001")
         handler.state.record_task_duration.assert_called_once()
 
+    @patch("zerg.protocol_handler._HEARTBEAT_REFRESH_INTERVAL", 0.05)
+    def test_long_verification_refreshes_heartbeat(self, tmp_path: Path) -> None:
+        heartbeat = MagicMock()
+        handler = _make_handler(tmp_path)
+        handler._heartbeat_writer = heartbeat
+
+        def slow_verification(*_args: object, **_kwargs: object) -> bool:
+            time.sleep(0.3)
+            return True
+
+        with patch.object(handler, "invoke_claude_code", return_value=_success_claude_result()):
+            with patch.object(handler, "run_verification", side_effect=slow_verification):
+                with patch.object(handler, "commit_task_changes", return_value=True):
+                    assert handler.execute_task(_make_task()) is True
+
+        steps = [c.kwargs["step"] for c in heartbeat.write.call_args_list]
+        assert steps.count("verifying") >= 3
+        assert "committing" in steps
+
     @patch("zerg.protocol_handler.subprocess.run")
     def test_claude_failure_returns_false(self, _mock_run: MagicMock, tmp_path: Path) -> None:
         handler = _make_handler(tmp_path)
@@ -1,8 +1,12 @@
 """Tests for ZERG JS/TS repo map extractor."""
 
 import textwrap
+from dataclasses import asdict
 from pathlib import Path
 
+import pytest
+
+from tests.fixtures.js_fixtures import JS_CORPUS, corpus_symbols
 from zerg.repo_map_js import extract_js_file, extract_js_symbols
 
 
@@ -106,6 +110,34 @@ class TestExtractJSSymbols:
         assert "function" in kinds
         assert "variable" in kinds
 
+    def test_line_numbers_and_docstrings(self) -> None:
+        source = "const a = 1;\n\n/** Adds. */\nexport function add(x, y) {}\n\nexport class Thing {}\n"
+        symbols = {s.name: s for s in extract_js_symbols(source)}
+        assert symbols["add"].line == 4
+        assert symbols["add"].docstring == "Adds."
+        assert symbols["Thing"].line == 6
+
+    def test_skips_declarations_in_comments_and_templates(self) -> None:
+        source = textwrap.dedent("""\
+            /*
+            function commentedOut() {}
+            */
+            const page = `
+            export const fromTemplate = 1;
+            class InTemplate {}
+            `;
+            const url = "http://example.com/*"; // not a comment start
+            export function real() {}
+            export const alsoReal = () => 1;
+        """)
+        names = [s.name for s in extract_js_symbols(source)]
+        assert names == ["real", "alsoReal"]
+
+    @pytest.mark.parametrize("name", sorted(corpus_symbols()))
+    def test_corpus_parity(self, name: str) -> None:
+        symbols = extract_js_file(JS_CORPUS / name)
+        assert [asdict(s) for s in symbols] == corpus_symbols()[name]
+
 
 class TestExtractJSFile:
     """Tests for extract_js_file."""
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from zerg.rules.loader import Rule, RuleLoader, RulePriority, RuleSet
+from zerg.rules.loader import Rule, RuleIndex, RuleLoader, RulePriority, RuleSet
 
 
 class TestRulePriority:
@@ -325,3 +327,111 @@ class TestRuleLoaderFilterByPriority:
         loader = RuleLoader()
         rules = loader.get_rules_by_priority(RulePriority.CRITICAL, rulesets=rulesets)
         assert rules == []
+
+
+class TestRuleIndex:
+    """Tests for the compiled RuleIndex and RuleLoader.index()."""
+
+    RULES = [
+        Rule(id="all", title="All", applies_to=["*"]),
+        Rule(id="py", title="Python", applies_to=["*.py"]),
+        Rule(id="spec", title="Spec", applies_to=["*.test.ts"]),
+        Rule(id="docker", title="Docker", applies_to=["Dockerfile"]),
+        Rule(id="tests", title="Tests", applies_to=["test_*.py"]),
+        Rule(id="js", title="JS", applies_to=["*.[jt]s"]),
+        Rule(id="off", title="Off", applies_to=["*"], enabled=False),
+        Rule(id="py", title="Python dup", applies_to=["*.pyi"]),
+    ]
+
+    @pytest.mark.parametrize(
+        "files",
+        [
+            ["main.py"],
+            ["src/test_main.py"],
+            ["a.test.ts", "b.js"],
+            ["Dockerfile", "README.md"],
+            ["types.pyi"],
+            [".py"],
+            ["py"],
+            [],
+        ],
+    )
+    def test_matches_fnmatch_semantics(self, files: list[str]) -> None:
+        rulesets = [RuleSet(name="t", rules=self.RULES)]
+        expected = RuleLoader().get_rules_for_files(files, rulesets=rulesets)
+        assert RuleIndex.from_rulesets(rulesets).lookup(files) == expected
+
+    def test_round_trip(self) -> None:
+        index = RuleIndex.from_rulesets([RuleSet(name="t", rules=self.RULES)], {"x": [1, 2]})
+        restored = RuleIndex.from_dict(index.to_dict())
+        assert restored.fingerprint == {"x": [1, 2]}
+        assert restored.lookup(["test_a.py"]) == index.lookup(["test_a.py"])
+
+    def test_from_dict_rejects_other_version(self) -> None:
+        with pytest.raises(ValueError):
+            RuleIndex.from_dict({"version": 0, "rules": [], "fingerprint": {}})
+
+    def test_persisted_index_skips_yaml_parsing(self, tmp_path: Path) -> None:
+        rules_dir = tmp_path / "rules"
+        rules_dir.mkdir()
+        (rules_dir / "a.yaml").write_text("rules:\n  - id: py\n    title: Python\n    applies_to: ['*.py']\n")
+        index_path = tmp_path / "state" / "rule-index.json"
+
+        first = RuleLoader(rules_dir, index_path=index_path)
+        assert [r.id for r in first.get_rules_for_files(["x.py"])] == ["py"]
+        assert index_path.exists()
+
+        second = RuleLoader(rules_dir, index_path=index_path)
+        with patch.object(RuleLoader, "load_all", side_effect=AssertionError("reparsed")):
+            assert [r.id for r in second.get_rules_for_files(["x.py"])] == ["py"]
+
+    def test_rebuilds_when_rule_file_changes(self, tmp_path: Path) -> None:
+        rules_dir = tmp_path / "rules"
+        rules_dir.mkdir()
+        rule_file = rules_dir / "a.yaml"
+        rule_file.write_text("rules:\n  - id: py\n    title: Python\n    applies_to: ['*.py']\n")
+        loader = RuleLoader(rules_dir)
+        assert [r.id for r in loader.get_rules_for_files(["x.py"])] == ["py"]
+
+        rule_file.write_text("rules:\n  - id: go\n    title: Go code\n    applies_to: ['*.go']\n")
+        os.utime(rule_file, ns=(rule_file.stat().st_atime_ns, rule_file.stat().st_mtime_ns + 10**9))
+        assert loader.get_rules_for_files(["x.py"]) == []
+        (rules_dir / "b.yml").write_text("rules:\n  - id: any\n    title: Any\n")
+        assert [r.id for r in loader.get_rules_for_files(["x.go"])] == ["go", "any"]
+
+    def test_in_memory_index_reused(self, tmp_path: Path) -> None:
+        rules_dir = tmp_path / "rules"
+        rules_dir.mkdir()
+        (rules_dir / "a.yaml").write_text("rules:\n  - id: r\n    title: Rule\n")
+        loader = RuleLoader(rules_dir)
+        assert loader.index() is loader.index()
+
+    def test_default_paths_resolve_against_project_root(self, tmp_path: Path, monkeypatch) -> None:
+        rules_dir = tmp_path / ".zerg" / "rules"
+        rules_dir.mkdir(parents=True)
+        (rules_dir / "a.yaml").write_text("rules:\n  - id: py\n    title: Python\n    applies_to: ['*.py']\n")
+        monkeypatch.chdir(tmp_path / ".zerg")
+
+        loader = RuleLoader(project_root=tmp_path)
+        assert loader.rules_dir == rules_dir
+        assert [r.id for r in loader.get_rules_for_files(["x.py"])] == ["py"]
+        assert (tmp_path / ".zerg" / "state" / "rule-index.json").exists()
+        assert not (tmp_path / ".zerg" / ".zerg").exists()
+
+    def test_summary_is_priority_ordered_and_budgeted(self) -> None:
+        rules = [
+            Rule(id="rec", title="Recommended", priority=RulePriority.RECOMMENDED),
+            Rule(id="crit", title="Critical", description="must", priority=RulePriority.CRITICAL),
+            Rule(id="imp", title="Important", priority=RulePriority.IMPORTANT),
+        ]
+        index = RuleIndex(rules)
+
+        assert index.summarize(["a.py"], max_tokens=500).splitlines() == [
+            "- **[CRITICAL]** Critical: must",
+            "- **[IMPORTANT]** Important",
+            "- **[RECOMMENDED]** Recommended",
+        ]
+        budgeted = index.summarize(["a.py"], max_tokens=10)
+        assert budgeted.startswith("- **[CRITICAL]** Critical: must")
+        assert "2 more rules omitted" in budgeted
+        assert index.summarize([], max_tokens=500) == ""
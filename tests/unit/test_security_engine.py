@@ -579,7 +579,7 @@ class TestCVEScannerAPI:
         mock_response.__exit__ = MagicMock(return_value=False)
 
         with patch("zerg.security.cve.urllib.request.urlopen", return_value=mock_response):
-            findings = scan_dependencies(tmp_path)
+            findings = scan_dependencies(tmp_path, query_api=True)
 
         # Should have at least one CVE finding from the API
         # The CVE alias is stored in pattern_name, not in the message
@@ -598,7 +598,7 @@ class TestCVEScannerAPI:
             "zerg.security.cve.urllib.request.urlopen",
             side_effect=urllib.error.URLError("timeout"),
         ):
-            findings = scan_dependencies(tmp_path)
+            findings = scan_dependencies(tmp_path, query_api=True)
 
         # Heuristic should flag unpinned dependency
         unpinned = [f for f in findings if f.pattern_name == "unpinned_dependency"]
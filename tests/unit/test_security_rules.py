@@ -192,3 +192,17 @@ class TestSummarizeRules:
         result = summarize_rules([rule_file], max_tokens=50)
         assert len(result) <= 50 * 4
         assert "cursor.execute" not in result
+
+    def test_summary_cached_until_file_changes(self, tmp_path: Path) -> None:
+        rule_file = tmp_path / "cached.md"
+        rule_file.write_text("## Rule: First\n")
+        assert "First" in summarize_rules([rule_file])
+
+        with patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+            assert "First" in summarize_rules([rule_file])
+
+        rule_file.write_text("## Rule: Second rule\n")
+        assert "Second" in summarize_rules([rule_file])
+
+    def test_missing_file_skipped(self, tmp_path: Path) -> None:
+        assert summarize_rules([tmp_path / "missing.md"]) == ""
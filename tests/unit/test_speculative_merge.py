@@ -0,0 +1,178 @@
+"""Tests for zerg.speculative_merge module."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from zerg.config import QualityGate, ZergConfig
+from zerg.constants import GateResult, MergeStatus
+from zerg.git_ops import GitOps
+from zerg.merge import MergeCoordinator
+from zerg.speculative_merge import SpeculativeMerger
+from zerg.types import GateRunResult
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True, text=True).stdout.strip()
+
+
+def _worker_branch(repo: Path, name: str, files: dict[str, str]) -> str:
+    branch = f"zerg/feat/{name}"
+    _git(repo, "checkout", "-q", "-b", branch, "main")
+    for path, content in files.items():
+        (repo / path).write_text(content)
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", name)
+    _git(repo, "checkout", "-q", "main")
+    return branch
+
+
+@pytest.fixture
+def git(tmp_repo: Path) -> GitOps:
+    ops = GitOps(tmp_repo)
+    if not ops.supports_merge_tree():
+        pytest.skip("git merge-tree --write-tree unavailable")
+    return ops
+
+
+class TestSpeculativeMerger:
+    """Tests for SpeculativeMerger."""
+
+    def test_finalize_merges_delta_into_staging(self, tmp_repo: Path, git: GitOps) -> None:
+        a = _worker_branch(tmp_repo, "worker-0", {"a.txt": "a\n"})
+        b = _worker_branch(tmp_repo, "worker-1", {"b.txt": "b\n"})
+        git.create_branch("zerg/feat/staging", "main")
+
+        spec = SpeculativeMerger("feat", git)
+        try:
+            spec.submit(a)
+            spec.wait()
+            results = spec.finalize([a, b], "zerg/feat/staging")
+        finally:
+            spec.close()
+
+        assert results is not None
+        assert [r.source_branch for r in results] == [a, b]
+        assert all(r.status == MergeStatus.MERGED for r in results)
+        files = _git(tmp_repo, "ls-tree", "--name-only", "zerg/feat/staging").split()
+        assert {"a.txt", "b.txt", "README.md"} <= set(files)
+        assert not git.branch_exists(spec.branch)
+        assert _git(tmp_repo, "rev-parse", "--abbrev-ref", "HEAD") == "main"
+
+    def test_conflict_falls_back(self, tmp_repo: Path, git: GitOps) -> None:
+        a = _worker_branch(tmp_repo, "worker-0", {"same.txt": "one\n"})
+        b = _worker_branch(tmp_repo, "worker-1", {"same.txt": "two\n"})
+        git.create_branch("zerg/feat/staging", "main")
+        staging_tip = git.get_commit("zerg/feat/staging")
+
+        spec = SpeculativeMerger("feat", git)
+        try:
+            spec.submit(a)
+            spec.submit(b)
+            assert spec.finalize([a, b], "zerg/feat/staging") is None
+            assert spec.broken
+        finally:
+            spec.close()
+        assert git.get_commit("zerg/feat/staging") == staging_tip
+
+    def test_base_moved_falls_back(self, tmp_repo: Path, git: GitOps) -> None:
+        a = _worker_branch(tmp_repo, "worker-0", {"a.txt": "a\n"})
+        spec = SpeculativeMerger("feat", git)
+        try:
+            spec.submit(a)
+            (tmp_repo / "late.txt").write_text("late\n")
+            _git(tmp_repo, "add", "-A")
+            _git(tmp_repo, "commit", "-q", "-m", "late")
+            git.create_branch("zerg/feat/staging", "main")
+            assert spec.finalize([a], "zerg/feat/staging") is None
+        finally:
+            spec.close()
+
+    def test_prerun_gates_on_worktree(self, tmp_repo: Path, git: GitOps) -> None:
+        a = _worker_branch(tmp_repo, "worker-0", {"a.txt": "a\n"})
+        gate = QualityGate(name="has-a", command="test -f a.txt", required=True)
+        spec = SpeculativeMerger("feat", git, gates=[gate], config=ZergConfig())
+        try:
+            spec.submit(a)
+            spec.wait()
+            tree = git.get_commit(f"{spec.branch}^{{tree}}")
+            cached = spec.gate_results(tree)
+        finally:
+            spec.close()
+
+        assert cached is not None
+        passed, results = cached
+        assert passed
+        assert [r.gate_name for r in results] == ["has-a"]
+        # Gates ran in the private worktree, never in the main checkout
+        assert not (tmp_repo / "a.txt").exists()
+
+    def test_gate_results_unknown_tree_stops_prerun(self, git: GitOps) -> None:
+        gate = QualityGate(name="noop", command="true", required=True)
+        spec = SpeculativeMerger("feat", git, gates=[gate], config=ZergConfig())
+        try:
+            assert spec.gate_results("0" * 40) is None
+            assert spec._gates_stopped
+        finally:
+            spec.close()
+
+
+class TestFullMergeFlowSpeculative:
+    """Tests for MergeCoordinator.full_merge_flow with a SpeculativeMerger."""
+
+    def test_reuses_gate_results_for_final_tree(self, tmp_repo: Path, git: GitOps) -> None:
+        a = _worker_branch(tmp_repo, "worker-0", {"a.txt": "a\n"})
+        b = _worker_branch(tmp_repo, "worker-1", {"b.txt": "b\n"})
+        config = ZergConfig()
+        config.quality_gates = [QualityGate(name="noop", command="true", required=True)]
+        coordinator = MergeCoordinator("feat", config=config, repo_path=tmp_repo)
+
+        spec = SpeculativeMerger("feat", coordinator.git, gates=config.quality_gates, config=config)
+        spec.submit(a)
+        spec.submit(b)
+        spec.wait()
+        final_tree = git.get_commit(f"{spec.branch}^{{tree}}")
+        assert spec.gate_results(final_tree) is not None
+        spec._gates_stopped = False
+
+        post = MagicMock(return_value=(True, []))
+        pre = MagicMock(return_value=(True, []))
+        try:
+            with (
+                patch.object(coordinator, "run_post_merge_gates", post),
+                patch.object(coordinator, "run_pre_merge_gates", pre),
+            ):
+                result = coordinator.full_merge_flow(1, [a, b], "main", speculative=spec)
+        finally:
+            spec.close()
+
+        assert result.success, result.error
+        post.assert_not_called()
+        assert [r.gate_name for r in result.gate_results] == ["noop"]
+        assert git.get_commit("main^{tree}") == final_tree
+
+    def test_runs_gates_when_tree_differs(self, tmp_repo: Path, git: GitOps) -> None:
+        a = _worker_branch(tmp_repo, "worker-0", {"a.txt": "a\n"})
+        b = _worker_branch(tmp_repo, "worker-1", {"b.txt": "b\n"})
+        config = ZergConfig()
+        coordinator = MergeCoordinator("feat", config=config, repo_path=tmp_repo)
+        spec = SpeculativeMerger("feat", coordinator.git, gates=[], config=config)
+        spec.submit(a)
+
+        post = MagicMock(return_value=(True, [GateRunResult("lint", GateResult.PASS, "true", 0)]))
+        try:
+            with (
+                patch.object(coordinator, "run_post_merge_gates", post),
+                patch.object(coordinator, "run_pre_merge_gates", MagicMock(return_value=(True, []))),
+            ):
+                result = coordinator.full_merge_flow(1, [a, b], "main", speculative=spec)
+        finally:
+            spec.close()
+
+        assert result.success, result.error
+        post.assert_called_once()
+        assert {"a.txt", "b.txt"} <= set(_git(tmp_repo, "ls-tree", "--name-only", "main").split())
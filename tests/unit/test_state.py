@@ -482,6 +482,25 @@ class TestStateSyncServiceEssentials:
         service.sync_from_disk()
         mock_levels.mark_task_complete.assert_called_once_with("TASK-001")
 
+    def test_sync_from_disk_fires_task_complete_callbacks(self, tmp_path: Path) -> None:
+        """Completions synced from disk invoke the callbacks once per task."""
+        state = StateManager("test-feature", state_dir=tmp_path)
+        state.load()
+        levels = LevelController()
+        levels.initialize([{"id": "TASK-001", "level": 1}, {"id": "TASK-002", "level": 1}])
+        levels.start_level(1)
+        completed: list[str] = []
+        service = StateSyncService(state=state, levels=levels, on_task_complete=[completed.append])
+
+        state.set_task_status("TASK-001", TaskStatus.COMPLETE, worker_id=2)
+        service.sync_from_disk()
+        service.sync_from_disk()
+
+        assert completed == ["TASK-001"]
+        assert state.get_task_worker("TASK-001") == 2
+        assert state.get_task_worker("TASK-002") is None
+        assert levels.get_task_status("TASK-001") == TaskStatus.COMPLETE.value
+
     def test_reassign_stranded_tasks_clears_dead_worker(self) -> None:
         """reassign_stranded_tasks unassigns tasks on dead workers."""
         mock_state = MagicMock(spec=StateManager)
@@ -123,6 +123,17 @@ class TestReconcileTaskStates:
         assert result.divergences_found == 1
         mock_levels.mark_task_complete.assert_called_once_with("A-L1-001")
 
+    def test_synced_completion_fires_callbacks(self) -> None:
+        """Test completions synced from disk invoke the task-complete callbacks."""
+        mock_state = MagicMock()
+        mock_state._state = {"tasks": {"A-L1-001": {"status": "complete", "level": 1}}, "workers": {}}
+        mock_levels = MagicMock()
+        mock_levels.get_task_status.return_value = "in_progress"
+        completed: list[str] = []
+        reconciler = StateReconciler(state=mock_state, levels=mock_levels, on_task_complete=[completed.append])
+        reconciler.reconcile_periodic()
+        assert completed == ["A-L1-001"]
+
     def test_no_fix_when_states_match(self, setup) -> None:
         """Test no fix applied when disk and LevelController states match."""
         reconciler, mock_state, mock_levels = setup
@@ -32,8 +32,10 @@ from zerg.commands.test_cmd import (
     TestResult,
     TestRunner,
     TestStubGenerator,
+    _select_affected_tests,
     _watch_loop,
 )
+from zerg.file_watcher import FileWatcher
 
 if TYPE_CHECKING:
     pass
@@ -284,13 +286,43 @@ class TestWatchLoop:
         """Test watch loop handles KeyboardInterrupt."""
         tester = TestCommand()
 
+        watcher = FileWatcher(Path("."), extensions={".py"}, use_inotify=False)
+
         with patch("time.sleep", side_effect=KeyboardInterrupt):
             with patch("zerg.commands.test_cmd.console.print") as mock_print:
-                _watch_loop(tester, TestFramework.PYTEST, ".")
+                _watch_loop(tester, TestFramework.PYTEST, ".", watcher=watcher)
 
                 calls = [str(c) for c in mock_print.call_args_list]
                 assert any("stopped" in str(c).lower() for c in calls)
 
+    def test_select_affected_tests_uses_import_graph(self, tmp_path: Path) -> None:
+        """Changed modules map to importing tests; changed tests run directly."""
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "core.py").write_text("X = 1\n")
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "test_core.py").write_text("from pkg.core import X\n")
+        (tmp_path / "tests" / "test_other.py").write_text("import json\n")
+
+        assert _select_affected_tests(tmp_path, [tmp_path / "pkg" / "core.py"]) == ["tests/test_core.py"]
+        assert _select_affected_tests(tmp_path, [tmp_path / "tests" / "test_other.py"]) == ["tests/test_other.py"]
+
+    def test_select_affected_tests_on_repo_tree(self) -> None:
+        """A leaf-module change selects a few test modules, not every zerg importer."""
+        root = Path(__file__).resolve().parents[2]
+        total = len(list((root / "tests").rglob("test_*.py")))
+
+        targets = _select_affected_tests(root, [root / "zerg" / "file_watcher.py"])
+
+        assert targets is not None
+        assert "tests/unit/test_file_watcher.py" in targets
+        assert all(Path(t).name.startswith("test_") for t in targets)
+        assert len(targets) < total // 10
+
+    def test_select_affected_tests_falls_back_to_full_run(self, tmp_path: Path) -> None:
+        """conftest.py and non-Python changes cannot be scoped."""
+        assert _select_affected_tests(tmp_path, [tmp_path / "tests" / "conftest.py"]) is None
+        assert _select_affected_tests(tmp_path, [tmp_path / "app.ts"]) is None
+
 
 # =============================================================================
 # CLI Command Tests
@@ -260,6 +260,28 @@ class TestFindAffectedTests:
 
         assert result == []
 
+    def test_parent_package_import_does_not_match(self, tmp_path: Path) -> None:
+        """Importing the parent package or a sibling module is not affected."""
+        tests_dir = tmp_path / "tests"
+        tests_dir.mkdir()
+        (tests_dir / "test_pkg.py").write_text("import zerg\nfrom zerg.config import ZergConfig\n")
+        (tests_dir / "test_sub.py").write_text("from zerg import test_scope\n")
+
+        result = find_affected_tests(["zerg/test_scope.py"], tests_dir)
+
+        assert result == ["tests/test_sub.py"]
+
+    def test_only_test_modules_returned(self, tmp_path: Path) -> None:
+        """Helpers, fixtures and conftest.py are never returned as targets."""
+        tests_dir = tmp_path / "tests"
+        (tests_dir / "e2e").mkdir(parents=True)
+        for name in ("conftest.py", "e2e/harness.py", "mock_worker.py", "scope_test.py"):
+            (tests_dir / name).write_text("from zerg.test_scope import find_affected_tests\n")
+
+        result = find_affected_tests(["zerg/test_scope.py"], tests_dir)
+
+        assert result == ["tests/scope_test.py"]
+
 
 class TestBuildPytestPathFilter:
     """Tests for build_pytest_path_filter function."""
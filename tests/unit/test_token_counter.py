@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import time
 from unittest.mock import MagicMock, patch
 
@@ -12,9 +13,7 @@ from zerg.token_counter import TokenCounter, TokenResult
 def _make_counter(tmp_path, **overrides):
     """Create a TokenCounter with tmp_path-based cache and given config overrides."""
     cfg = TokenMetricsConfig(**overrides)
-    counter = TokenCounter(config=cfg)
-    counter._cache_path = tmp_path / "token-cache.json"
-    return counter
+    return TokenCounter(config=cfg, state_dir=tmp_path)
 
 
 class TestHeuristicMode:
@@ -82,6 +81,64 @@ class TestCaching:
         assert not counter._cache_path.exists()
 
 
+class TestCacheLog:
+    def test_misses_append_to_log_not_snapshot(self, tmp_path) -> None:
+        counter = _make_counter(tmp_path, api_counting=False, cache_enabled=True)
+        counter.count("first")
+        counter.count("second")
+        counter.count("first")
+        assert not counter._cache_path.exists()
+        assert len(counter._log_path.read_text().splitlines()) == 2
+
+    def test_new_counter_replays_snapshot_and_log(self, tmp_path) -> None:
+        counter = _make_counter(tmp_path, api_counting=False, cache_enabled=True)
+        counter.count("compacted")
+        counter.close()
+        counter.count("logged")
+        with open(counter._log_path, "a") as f:
+            f.write('["torn", {"cou')  # writer died mid-append
+
+        reloaded = _make_counter(tmp_path, api_counting=False, cache_enabled=True)
+        assert reloaded.count("compacted").source == "cache"
+        assert reloaded.count("logged").source == "cache"
+        assert "torn" not in reloaded._cache
+
+    def test_log_compacts_past_cache_limit(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.setattr(TokenCounter, "MAX_CACHE_ENTRIES", 3)
+        counter = _make_counter(tmp_path, api_counting=False, cache_enabled=True)
+        for i in range(4):
+            counter.count(f"text {i}")
+        assert counter._log_path.read_text() == ""
+        assert len(json.loads(counter._cache_path.read_text())) == 3
+
+
+class TestCountMany:
+    def test_matches_count_and_dedupes(self, tmp_path) -> None:
+        counter = _make_counter(tmp_path, api_counting=False, cache_enabled=True)
+        counter.count("already cached")
+        texts = ["already cached", "new text", "new text", "x" * 400]
+
+        results = counter.count_many(texts)
+
+        assert [r.source for r in results] == ["cache", "heuristic", "heuristic", "heuristic"]
+        assert [r.count for r in results] == [counter._count_heuristic(t) for t in texts]
+        assert len(counter._log_path.read_text().splitlines()) == 3
+        assert [r.source for r in counter.count_many(texts)] == ["cache"] * 4
+
+    def test_cache_disabled(self, tmp_path) -> None:
+        counter = _make_counter(tmp_path, api_counting=False, cache_enabled=False)
+        assert [r.source for r in counter.count_many(["a", "a"])] == ["heuristic", "heuristic"]
+        assert counter.count_many([]) == []
+        assert not counter._log_path.exists()
+
+    def test_api_mode_counts_each_distinct_text_once(self, tmp_path) -> None:
+        counter = _make_counter(tmp_path, api_counting=True, cache_enabled=True)
+        with patch.object(counter, "_count_api", return_value=TokenResult(7, "exact", "api")) as count_api:
+            results = counter.count_many(["a", "b", "a"])
+        assert count_api.call_count == 2
+        assert [r.count for r in results] == [7, 7, 7]
+
+
 class TestEmptyText:
     def test_empty_text_returns_token_result(self, tmp_path) -> None:
         counter = _make_counter(tmp_path, api_counting=False, cache_enabled=False)
@@ -68,6 +68,11 @@ class TestTokenCounterCache:
         test_text = "persistent test text"
         result1 = tc1.count(test_text)
 
+        # Misses go to the append-only log; close() compacts it into the snapshot
+        assert (tmp_path / "token-cache.log").exists()
+        tc1.close()
+        assert (tmp_path / "token-cache.log").read_text() == ""
+
         # Verify cache file exists
         cache_file = tmp_path / "token-cache.json"
         assert cache_file.exists()
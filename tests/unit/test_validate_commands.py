@@ -250,6 +250,20 @@ class TestValidateModuleWiring:
         flagged_names = [m.split(":")[0] for m in messages]
         assert "core.py" not in flagged_names
 
+    def test_module_referenced_by_lazy_import_path_passes(self, tmp_path: Path) -> None:
+        """A module named by dotted path for importlib.import_module counts as imported."""
+        pkg = self._create_package(
+            tmp_path,
+            {
+                "core.py": "def do_stuff(): pass\n",
+                "main.py": 'import importlib\nimportlib.import_module("mypkg.core").do_stuff()\n',
+            },
+        )
+        tests_dir = tmp_path / "tests"
+        tests_dir.mkdir()
+        passed, messages = validate_module_wiring(pkg, tests_dir)
+        assert "core.py" not in " ".join(messages)
+
     def test_module_with_only_test_imports_warns(self, tmp_path: Path) -> None:
         """A module imported only by test files should be flagged as orphaned."""
         pkg = self._create_package(tmp_path, {"orphan.py": "def helper(): pass\n"})
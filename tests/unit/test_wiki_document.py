@@ -3,11 +3,18 @@
 Covers all functions, branches, and edge cases with mocked doc_engine dependencies.
 """
 
+import os
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 from click.testing import CliRunner
 
+from tests.fixtures.wiki_fixtures import synthetic_project
+
+# Imported up front so the renderer binds the real detector/extractor, not the mocks patched in below
+from zerg.doc_engine.manifest import MANIFEST_NAME
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -546,6 +553,74 @@ class TestWikiCommand:
         assert ".zerg/wiki" in result.output
 
 
+class TestWikiIncremental:
+    """Incremental builds against the real doc engine."""
+
+    @pytest.fixture()
+    def project(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        return [p.relative_to(tmp_path) for p in synthetic_project(tmp_path, 8)]
+
+    @staticmethod
+    def _build(*args: str) -> str:
+        from zerg.commands.wiki import wiki
+
+        result = CliRunner().invoke(wiki, list(args), catch_exceptions=False)
+        assert result.exit_code == 0
+        return result.output
+
+    @staticmethod
+    def _tree(directory: Path) -> dict[str, bytes]:
+        return {p.name: p.read_bytes() for p in sorted(directory.glob("*.md"))}
+
+    def test_one_file_change_rerenders_only_that_page(self, project):
+        self._build("-o", "wiki")
+        mtimes = {p.name: p.stat().st_mtime_ns for p in Path("wiki").glob("*.md")}
+        for path in Path("wiki").glob("*.md"):
+            os.utime(path, ns=(0, 0))
+
+        changed = project[3]
+        changed.write_text(changed.read_text().replace("return value + 1", "return value + 2") + "# edited\n")
+        output = self._build("-o", "wiki")
+
+        assert "(1 rendered, 7 unchanged)" in output
+        touched = {p.name for p in Path("wiki").glob("*.md") if p.stat().st_mtime_ns != 0}
+        assert touched == {f"{changed.stem}.md"}
+        assert set(mtimes) == {p.name for p in Path("wiki").glob("*.md")}
+
+        self._build("-o", "clean", "--full")
+        assert self._tree(Path("wiki")) == self._tree(Path("clean"))
+
+    def test_unchanged_tree_renders_nothing(self, project):
+        self._build("-o", "wiki")
+        output = self._build("-o", "wiki")
+        assert "(0 rendered, 8 unchanged)" in output
+        assert "Wrote 0 changed pages" in output
+        assert (Path("wiki") / MANIFEST_NAME).exists()
+
+    def test_full_rerenders_everything(self, project):
+        self._build("-o", "wiki")
+        assert "(8 rendered, 0 unchanged)" in self._build("-o", "wiki", "--full")
+
+    def test_removed_source_removes_its_page(self, project):
+        self._build("-o", "wiki")
+        (Path("wiki") / "notes.md").write_text("kept: not generated by the wiki")
+        project[0].unlink()
+        self._build("-o", "wiki")
+
+        self._build("-o", "clean", "--full")
+        assert self._tree(Path("wiki")) == {**self._tree(Path("clean")), "notes.md": b"kept: not generated by the wiki"}
+
+    def test_hand_edited_page_is_regenerated(self, project):
+        self._build("-o", "wiki")
+        page = Path("wiki") / f"{project[1].stem}.md"
+        original = page.read_text()
+        page.write_text("# edited by hand")
+
+        assert "(1 rendered, 7 unchanged)" in self._build("-o", "wiki")
+        assert page.read_text() == original
+
+
 # ======================================================================
 # document command tests
 # ======================================================================
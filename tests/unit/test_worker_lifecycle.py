@@ -11,9 +11,11 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from zerg.constants import ExitCode, WorkerStatus
+from zerg.heartbeat import HeartbeatMonitor
 from zerg.launcher_types import SpawnResult, WorkerHandle
 from zerg.launchers import SubprocessLauncher
 from zerg.protocol_state import WorkerProtocol
+from zerg.types import Task
 
 
 class TestWorkerSpawn:
@@ -232,6 +234,25 @@ class TestWorkerProtocolStateWrites:
         last_call = calls[-1]
         assert last_call[0][0].status == WorkerStatus.STOPPED
 
+    def test_claiming_heartbeat_removed_on_exit(self, protocol: WorkerProtocol) -> None:
+        """Polling for tasks keeps the heartbeat fresh; exit removes it for the next spawn."""
+        writer = protocol._heartbeat_writer
+        assert writer is not None
+
+        def claim() -> Task | None:
+            return WorkerProtocol.claim_next_task(protocol, max_wait=0)
+
+        with (
+            patch.object(writer, "write", wraps=writer.write) as write,
+            patch.object(protocol, "claim_next_task", side_effect=claim),
+            pytest.raises(SystemExit),
+        ):
+            protocol.start()
+
+        write.assert_called_with(step="claiming")
+        assert not writer.heartbeat_path.exists()
+        assert HeartbeatMonitor(writer.heartbeat_path.parent).read(0) is None
+
     def test_exception_sets_crashed(self, protocol: WorkerProtocol, mock_state_manager: MagicMock) -> None:
         """Unhandled exception in start() loop writes CRASHED status."""
         mock_state_manager.get_tasks_by_status.side_effect = RuntimeError("boom")
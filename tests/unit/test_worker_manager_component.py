@@ -171,6 +171,24 @@ class TestHandleWorkerExit:
         worker_manager.handle_worker_exit(0)
         assert mock_deps["launcher"].spawn.call_count == 2
 
+    @pytest.mark.parametrize("already_complete", [False, True])
+    def test_completed_task_records_success(self, mock_deps, already_complete):
+        """A completed task resets the breaker even when its completion was synced from disk."""
+        breaker = MagicMock()
+        callback = MagicMock()
+        mock_deps["on_task_complete"] = [callback]
+        manager = WorkerManager(**mock_deps, circuit_breaker=breaker)
+        manager.spawn_worker(0)
+        mock_deps["workers"][0].current_task = "TASK-001"
+        mock_deps["parser"].get_task.return_value = {"id": "TASK-001", "verification": {"command": "true"}}
+        mock_deps["levels"].get_task_status.return_value = "complete" if already_complete else "in_progress"
+
+        manager.handle_worker_exit(0)
+
+        breaker.record_success.assert_called_once_with(0)
+        assert mock_deps["levels"].mark_task_complete.called is not already_complete
+        assert callback.called is not already_complete
+
     def test_noop_for_unknown_worker(self, worker_manager, mock_deps):
         """Exit for unknown worker is a no-op."""
         worker_manager.handle_worker_exit(999)
@@ -5,11 +5,13 @@ communication and task execution.
 """
 
 import os
-import subprocess
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from zerg.claude_stream import StreamedRun
 from zerg.constants import DEFAULT_CONTEXT_THRESHOLD, ExitCode, TaskStatus
 from zerg.protocol_state import WorkerProtocol, run_worker
 from zerg.protocol_types import (
@@ -83,6 +85,13 @@ class TestWorkerContext:
         assert ctx2.context_threshold == 0.80
 
 
+@pytest.fixture(autouse=True)
+def _isolated_zerg_dirs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep heartbeats, status records and logs out of the repository's .zerg."""
+    monkeypatch.setenv("ZERG_STATE_DIR", str(tmp_path / "state"))
+    monkeypatch.setenv("ZERG_LOG_DIR", str(tmp_path / "logs"))
+
+
 # Common mock setup helper
 def _make_protocol(
     mock_config_cls,
@@ -161,7 +170,7 @@ class TestWorkerProtocolInit:
         assert protocol.worker_id == 5
         assert protocol.feature == "env-feature"
 
-    @patch.dict(os.environ, {}, clear=True)
+    @patch.dict(os.environ, {})
     @patch("zerg.protocol_state.StateManager")
     @patch("zerg.protocol_state.VerificationExecutor")
     @patch("zerg.protocol_state.GitOps")
@@ -170,6 +179,8 @@ class TestWorkerProtocolInit:
     @patch("zerg.protocol_state.ZergConfig")
     def test_init_defaults_when_no_env(self, mock_config_cls, mock_spec_loader_cls, *mocks) -> None:
         """Test initialization defaults when no environment vars set."""
+        for var in ("ZERG_WORKER_ID", "ZERG_FEATURE", "ZERG_BRANCH", "ZERG_WORKTREE", "ZERG_TASK_GRAPH"):
+            os.environ.pop(var, None)
         # Set up mocks for WorkerProtocol() call below
         mock_config = MagicMock()
         mock_config.context_threshold = 0.70
@@ -306,7 +317,8 @@ class TestWorkerProtocolBuildTaskPrompt:
 class TestWorkerProtocolInvokeClaudeCode:
     """Tests for invoke_claude_code method."""
 
-    @patch("zerg.protocol_handler.subprocess.run")
+    @patch("zerg.protocol_handler.run_streaming")
+    @patch("zerg.protocol_state.HeartbeatWriter")
     @patch("zerg.protocol_state.StateManager")
     @patch("zerg.protocol_state.VerificationExecutor")
     @patch("zerg.protocol_state.GitOps")
@@ -315,8 +327,8 @@ class TestWorkerProtocolInvokeClaudeCode:
     @patch("zerg.protocol_state.ZergConfig")
     def test_invoke_claude_code_success(self, mock_config_cls, mock_spec_loader_cls, *mocks) -> None:
         """Test successful Claude Code invocation."""
-        mock_subprocess_run = mocks[-1]
-        mock_subprocess_run.return_value = MagicMock(returncode=0, stdout="Task completed", stderr="")
+        mock_run_streaming = mocks[-1]
+        mock_run_streaming.return_value = StreamedRun(returncode=0, stdout="Task completed", stderr="")
 
         protocol = _make_protocol(mock_config_cls, mock_spec_loader_cls)
         task = {"id": "TASK-001", "title": "Test", "level": 1}
@@ -324,8 +336,10 @@ class TestWorkerProtocolInvokeClaudeCode:
 
         assert result.success is True
         assert result.exit_code == 0
+        mocks[-2].return_value.write.assert_called_with(task_id="TASK-001", step="implementing")
 
-    @patch("zerg.protocol_handler.subprocess.run")
+    @patch("zerg.protocol_handler.run_streaming")
+    @patch("zerg.protocol_state.HeartbeatWriter")
     @patch("zerg.protocol_state.StateManager")
     @patch("zerg.protocol_state.VerificationExecutor")
     @patch("zerg.protocol_state.GitOps")
@@ -334,19 +348,20 @@ class TestWorkerProtocolInvokeClaudeCode:
     @patch("zerg.protocol_state.ZergConfig")
     def test_invoke_claude_code_errors(self, mock_config_cls, mock_spec_loader_cls, *mocks) -> None:
         """Test Claude Code invocation error handling for timeout, not found, and generic errors."""
-        mock_subprocess_run = mocks[-1]
+        mock_run_streaming = mocks[-1]
 
         cases = [
-            (subprocess.TimeoutExpired(cmd=["claude"], timeout=30), "timed out"),
-            (FileNotFoundError(), "not found"),
-            (Exception("Unknown error"), "Unknown error"),
+            ({"return_value": StreamedRun(returncode=-1, stdout="", stderr="", timed_out=True)}, "timed out"),
+            ({"side_effect": FileNotFoundError()}, "not found"),
+            ({"side_effect": Exception("Unknown error")}, "Unknown error"),
         ]
 
         protocol = _make_protocol(mock_config_cls, mock_spec_loader_cls)
         task = {"id": "TASK-001", "title": "Test", "level": 1}
 
-        for side_effect, expected_stderr_substr in cases:
-            mock_subprocess_run.side_effect = side_effect
+        for behaviour, expected_stderr_substr in cases:
+            mock_run_streaming.reset_mock(return_value=True, side_effect=True)
+            mock_run_streaming.configure_mock(**behaviour)
             result = protocol._handler.invoke_claude_code(task, timeout=30)
 
             assert result.success is False
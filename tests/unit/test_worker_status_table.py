@@ -0,0 +1,222 @@
+"""Tests for the shared worker status table."""
+
+import gc
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from zerg.heartbeat import HeartbeatMonitor, HeartbeatWriter
+from zerg.progress_reporter import ProgressReporter
+from zerg.worker_status_table import (
+    _SEQ,
+    MAX_PAYLOAD,
+    RECORD_SIZE,
+    SLOT_SIZE,
+    WorkerStatusTable,
+    read_all_freshest,
+    read_freshest,
+)
+
+
+class TestWorkerStatusTable:
+    """Tests for WorkerStatusTable records."""
+
+    def test_write_and_read(self, tmp_path: Path) -> None:
+        table = WorkerStatusTable(tmp_path)
+        table.write(3, "heartbeat", {"worker_id": 3, "step": "implementing"})
+        table.write(3, "progress", {"worker_id": 3, "tasks_completed": 1})
+
+        reader = WorkerStatusTable(tmp_path)
+        assert reader.read(3, "heartbeat") == {"worker_id": 3, "step": "implementing"}
+        assert reader.read(3, "progress") == {"worker_id": 3, "tasks_completed": 1}
+        assert reader.read(2, "heartbeat") is None
+        assert reader.read(40, "heartbeat") is None
+
+    def test_read_all_sees_growth_from_other_writers(self, tmp_path: Path) -> None:
+        reader = WorkerStatusTable(tmp_path)
+        assert reader.read_all("heartbeat") == {}
+        assert not reader.exists()
+
+        WorkerStatusTable(tmp_path).write(1, "heartbeat", {"worker_id": 1})
+        assert reader.read_all("heartbeat") == {1: {"worker_id": 1}}
+
+        WorkerStatusTable(tmp_path).write(9, "heartbeat", {"worker_id": 9})
+        assert reader.read_all("heartbeat") == {1: {"worker_id": 1}, 9: {"worker_id": 9}}
+        assert reader.read_all("progress") == {}
+        assert reader.path.stat().st_size == 10 * SLOT_SIZE
+
+    def test_rewrite_in_place(self, tmp_path: Path) -> None:
+        table = WorkerStatusTable(tmp_path)
+        table.write(0, "heartbeat", {"step": "a" * 500})
+        table.write(0, "heartbeat", {"step": "b"})
+        assert table.read(0, "heartbeat") == {"step": "b"}
+
+    def test_clear(self, tmp_path: Path) -> None:
+        table = WorkerStatusTable(tmp_path)
+        table.clear(5, "heartbeat")  # no table yet
+        table.write(5, "heartbeat", {"worker_id": 5})
+        table.write(5, "progress", {"worker_id": 5})
+        table.clear(5, "heartbeat")
+        assert table.read_all("heartbeat") == {}
+        assert table.read(5, "progress") == {"worker_id": 5}
+
+    def test_rejects_oversized_record_and_unknown_kind(self, tmp_path: Path) -> None:
+        table = WorkerStatusTable(tmp_path)
+        with pytest.raises(ValueError, match="max"):
+            table.write(0, "heartbeat", {"step": "x" * MAX_PAYLOAD})
+        with pytest.raises(ValueError, match="Unknown"):
+            table.write(0, "status", {})
+        with pytest.raises(ValueError, match="Invalid worker id"):
+            table.read(-1, "heartbeat")
+
+    def test_record_mid_write_is_skipped(self, tmp_path: Path) -> None:
+        table = WorkerStatusTable(tmp_path)
+        table.write(0, "heartbeat", {"worker_id": 0})
+        table.write(1, "heartbeat", {"worker_id": 1})
+        offset = 1 * SLOT_SIZE
+        with table._lock:
+            mapped = table._mapping(writable=True)
+            assert mapped is not None
+            _SEQ.pack_into(mapped, offset, _SEQ.unpack_from(mapped, offset)[0] + 1)  # writer died here
+
+        reader = WorkerStatusTable(tmp_path)
+        assert reader.read_all("heartbeat") == {0: {"worker_id": 0}}
+
+        # The worker's next write recovers the record
+        table.write(1, "heartbeat", {"worker_id": 1, "step": "restarted"})
+        assert reader.read(1, "heartbeat") == {"worker_id": 1, "step": "restarted"}
+
+    def test_concurrent_writer_process_never_yields_torn_records(self, tmp_path: Path) -> None:
+        # Two payloads of different lengths; a torn copy would mix them or fail to parse
+        writer = textwrap.dedent(
+            f"""
+            from zerg.worker_status_table import WorkerStatusTable
+            table = WorkerStatusTable({str(tmp_path)!r})
+            records = [{{"step": "a" * 3000}}, {{"step": "b" * 100}}]
+            for i in range(20000):
+                table.write(2, "heartbeat", records[i % 2])
+            """
+        )
+        WorkerStatusTable(tmp_path).write(2, "heartbeat", {"step": "b" * 100})
+        proc = subprocess.Popen([sys.executable, "-c", writer])
+        reader = WorkerStatusTable(tmp_path)
+        seen = set()
+        try:
+            while proc.poll() is None:
+                record = reader.read(2, "heartbeat")
+                if record is not None:
+                    seen.add(record["step"])
+        finally:
+            proc.wait(timeout=60)
+        assert proc.returncode == 0
+        assert seen <= {"a" * 3000, "b" * 100}
+
+    def test_record_size_holds_long_step_lists(self, tmp_path: Path) -> None:
+        writer = HeartbeatWriter(worker_id=0, state_dir=tmp_path, json_export=False)
+        writer.write(task_id="T1", current_step=1, total_steps=200, step_states=["in_progress"] * 200)
+        assert HeartbeatMonitor(state_dir=tmp_path).read(0) is not None
+        assert RECORD_SIZE > len(json.dumps(["in_progress"] * 200))
+
+
+class TestStatusTableReaders:
+    """HeartbeatMonitor and ProgressReporter reading through the table."""
+
+    def test_heartbeats_without_json_export(self, tmp_path: Path) -> None:
+        for wid in range(3):
+            HeartbeatWriter(worker_id=wid, state_dir=tmp_path, json_export=False).write(task_id=f"T{wid}")
+
+        assert list(tmp_path.glob("heartbeat-*.json")) == []
+        monitor = HeartbeatMonitor(state_dir=tmp_path)
+        assert {wid: hb.task_id for wid, hb in monitor.read_all().items()} == {0: "T0", 1: "T1", 2: "T2"}
+        assert monitor.read(1) is not None
+        assert monitor.get_stalled_workers([0, 1, 2, 3]) == [3]
+
+    def test_json_files_fill_in_workers_missing_from_table(self, tmp_path: Path) -> None:
+        HeartbeatWriter(worker_id=1, state_dir=tmp_path).write(step="from-table")
+        # Written by a worker that does not use the table (e.g. an agent following worker.core.md)
+        legacy = {"worker_id": 2, "timestamp": "2026-01-01T00:00:00+00:00", "task_id": None, "step": "from-file"}
+        (tmp_path / "heartbeat-2.json").write_text(json.dumps(legacy))
+        # A stale export for a worker that has a table record is ignored
+        stale = tmp_path / "heartbeat-1.json"
+        stale.write_text(json.dumps({**legacy, "worker_id": 1}))
+        os.utime(stale, (0, 0))
+
+        all_hb = HeartbeatMonitor(state_dir=tmp_path).read_all()
+        assert {wid: hb.step for wid, hb in all_hb.items()} == {1: "from-table", 2: "from-file"}
+
+    def test_fresher_json_file_wins_over_old_table_record(self, tmp_path: Path) -> None:
+        # A crashed worker left a table record behind; its replacement only writes the JSON file
+        table = WorkerStatusTable(tmp_path)
+        old = {"worker_id": 3, "timestamp": "2026-01-01T00:00:00+00:00", "task_id": None, "step": "from-table"}
+        table.write(3, "heartbeat", old)
+        table.write(3, "progress", {"worker_id": 3, "current_step": "from-table"})
+        fresh = {**old, "timestamp": datetime.now(UTC).isoformat(), "step": "from-file"}
+        later = time.time() + 10
+        for kind, record in (("heartbeat", fresh), ("progress", {"worker_id": 3, "current_step": "from-file"})):
+            path = tmp_path / f"{kind}-3.json"
+            path.write_text(json.dumps(record))
+            os.utime(path, (later, later))
+
+        assert read_freshest(table, 3, "heartbeat")["step"] == "from-file"
+        assert read_all_freshest(table, "progress")[3]["current_step"] == "from-file"
+        with HeartbeatMonitor(state_dir=tmp_path, stale_timeout_seconds=120) as monitor:
+            assert monitor.read(3).step == "from-file"
+            assert monitor.read_all()[3].step == "from-file"
+            assert not monitor.check_stale(3)
+        assert ProgressReporter.read(3, state_dir=tmp_path).current_step == "from-file"
+        assert ProgressReporter.read_all(state_dir=tmp_path)[3].current_step == "from-file"
+
+    def test_older_json_file_loses_to_table_record(self, tmp_path: Path) -> None:
+        table = WorkerStatusTable(tmp_path)
+        path = tmp_path / "heartbeat-3.json"
+        path.write_text(json.dumps({"worker_id": 3, "step": "from-file"}))
+        earlier = time.time() - 10
+        os.utime(path, (earlier, earlier))
+        table.write(3, "heartbeat", {"worker_id": 3, "step": "from-table"})
+
+        assert read_freshest(table, 3, "heartbeat")["step"] == "from-table"
+
+    @pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="needs /proc/self/fd")
+    def test_monitors_release_the_table_descriptor(self, tmp_path: Path) -> None:
+        HeartbeatWriter(worker_id=0, state_dir=tmp_path, json_export=False).write(task_id="T0")
+        before = len(os.listdir("/proc/self/fd"))
+
+        for _ in range(20):
+            with HeartbeatMonitor(state_dir=tmp_path) as monitor:
+                assert 0 in monitor.read_all()
+        assert len(os.listdir("/proc/self/fd")) == before
+
+        # Unclosed tables are released by their finalizer
+        for _ in range(20):
+            HeartbeatMonitor(state_dir=tmp_path).read_all()
+        gc.collect()
+        assert len(os.listdir("/proc/self/fd")) == before
+
+    def test_cleanup_clears_table_record(self, tmp_path: Path) -> None:
+        writer = HeartbeatWriter(worker_id=4, state_dir=tmp_path)
+        writer.write()
+        monitor = HeartbeatMonitor(state_dir=tmp_path)
+        assert monitor.read(4) is not None
+        writer.cleanup()
+        assert monitor.read(4) is None
+        assert monitor.read_all() == {}
+
+    def test_progress_through_table(self, tmp_path: Path) -> None:
+        reporter = ProgressReporter(worker_id=2, state_dir=tmp_path, json_export=False)
+        reporter.update(current_task="T1", tasks_total=4)
+        reporter.add_tier_result(1, "syntax", True)
+
+        assert not reporter.progress_path.exists()
+        wp = ProgressReporter.read(2, state_dir=tmp_path)
+        assert wp is not None and wp.current_task == "T1" and len(wp.tier_results) == 1
+        assert list(ProgressReporter.read_all(state_dir=tmp_path)) == [2]
+
+        reporter.cleanup()
+        assert ProgressReporter.read_all(state_dir=tmp_path) == {}
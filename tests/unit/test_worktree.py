@@ -1,6 +1,7 @@
 """Unit tests for worktree.py."""
 
 import shutil
+import subprocess
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -139,6 +140,83 @@ class TestWorktreeCreation:
         assert not (info2.path / "test.txt").exists()
 
 
+class TestWorktreePool:
+    """Tests for worktree reuse and the idle worktree pool."""
+
+    def test_create_reuses_existing_worktree_in_place(self, tmp_repo: Path) -> None:
+        (tmp_repo / "keep.txt").write_text("keep")
+        subprocess.run(["git", "add", "keep.txt"], cwd=tmp_repo, check=True)
+        subprocess.run(["git", "commit", "-qm", "keep"], cwd=tmp_repo, check=True)
+        manager = WorktreeManager(tmp_repo, pool_size=2)
+        info1 = manager.create("feat", 0)
+        inode = (info1.path / "keep.txt").stat().st_ino
+        (info1.path / "README.md").write_text("dirty")
+        (info1.path / "untracked.txt").write_text("x")
+
+        info2 = manager.create("feat", 0)
+
+        assert info2.path == info1.path and info2.branch == "zerg/feat/worker-0"
+        assert (info2.path / "README.md").read_text() == "# Test Repo"
+        assert not (info2.path / "untracked.txt").exists()
+        # Unchanged files are not rewritten, unlike a fresh checkout
+        assert (info2.path / "keep.txt").stat().st_ino == inode
+
+    def test_reuse_keeps_existing_branch_commits(self, tmp_repo: Path) -> None:
+        manager = WorktreeManager(tmp_repo, pool_size=2)
+        info = manager.create("feat", 0)
+        (info.path / "work.txt").write_text("work")
+        subprocess.run(["git", "add", "work.txt"], cwd=info.path, check=True)
+        subprocess.run(["git", "commit", "-qm", "work"], cwd=info.path, check=True)
+        head = manager._get_head_commit(info.path)
+
+        again = manager.create("feat", 0)
+        assert again.commit == head and (again.path / "work.txt").exists()
+
+    def test_release_pools_and_create_takes_from_pool(self, tmp_repo: Path) -> None:
+        manager = WorktreeManager(tmp_repo, pool_size=1)
+        info = manager.create("feat-a", 0)
+
+        assert manager.release(info.path) is True
+        assert not info.path.exists()
+        assert manager.pooled() == [manager.pool_path / "slot-0"]
+
+        other = manager.create("feat-b", 3)
+        assert manager.pooled() == []
+        assert manager.get_worktree(other.path).branch == "zerg/feat-b/worker-3"
+        # The released branch is no longer checked out anywhere
+        assert manager.create("feat-a", 0).branch == "zerg/feat-a/worker-0"
+
+    def test_release_deletes_when_pool_full_or_disabled(self, tmp_repo: Path) -> None:
+        manager = WorktreeManager(tmp_repo, pool_size=1)
+        first = manager.create("feat", 0)
+        second = manager.create("feat", 1)
+        assert manager.release(first.path) is True
+        assert manager.release(second.path) is False
+        assert not second.path.exists() and len(manager.pooled()) == 1
+
+        legacy = WorktreeManager(tmp_repo)
+        info = legacy.create("feat", 2)
+        assert legacy.release(info.path) is False and not info.path.exists()
+
+    def test_warm_and_drain_pool(self, tmp_repo: Path) -> None:
+        manager = WorktreeManager(tmp_repo, pool_size=3)
+        assert manager.warm_pool() == 3
+        assert manager.warm_pool() == 0
+        assert len(manager.pooled()) == 3
+        assert manager.drain_pool() == 3
+        assert manager.pooled() == [] and not manager.pool_path.exists()
+
+    def test_unhealthy_pooled_worktree_is_skipped(self, tmp_repo: Path) -> None:
+        manager = WorktreeManager(tmp_repo, pool_size=1)
+        manager.warm_pool()
+        slot = manager.pooled()[0]
+        (slot / ".git").unlink()
+        assert not manager.is_healthy(slot)
+
+        info = manager.create("feat", 0)
+        assert info.path.exists() and manager.is_healthy(info.path)
+
+
 class TestWorktreeDeletion:
     """Tests for worktree deletion."""
 
@@ -196,9 +274,19 @@ class TestWorktreeSync:
 
         with patch("zerg.worktree.subprocess.run", return_value=mock_result) as mock_run:
             manager.sync_with_base(info.path, base_branch="main")
-            assert mock_run.call_count == 2
-            assert "fetch" in mock_run.call_args_list[0][0][0]
-            assert "rebase" in mock_run.call_args_list[1][0][0]
+            mock_run.assert_called_once()
+            assert mock_run.call_args[0][0][-2:] == ["rebase", "main"]
+
+    def test_sync_with_base_uses_local_branch(self, tmp_repo: Path) -> None:
+        """Rebases onto the local base branch without a remote."""
+        manager = WorktreeManager(tmp_repo)
+        info = manager.create("test-feature", 0)
+        (tmp_repo / "new.txt").write_text("new")
+        subprocess.run(["git", "add", "new.txt"], cwd=tmp_repo, check=True)
+        subprocess.run(["git", "commit", "-qm", "new"], cwd=tmp_repo, check=True)
+
+        manager.sync_with_base(info.path, base_branch="main")
+        assert (info.path / "new.txt").exists()
 
 
 class TestGetHeadCommit:
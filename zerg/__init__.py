@@ -3,20 +3,40 @@
 Overwhelm features with coordinated worker instances.
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
 __version__ = "0.3.2"
 __author__ = "ZERG Team"
 
-from zerg.architecture import ArchitectureChecker, ArchitectureConfig
-from zerg.architecture_gate import ArchitectureGate
-from zerg.constants import GateResult, Level, TaskStatus, WorkerStatus
-from zerg.exceptions import ZergError
-from zerg.worker_metrics import (
-    LevelMetrics,
-    TaskExecutionMetrics,
-    WorkerMetrics,
-    WorkerMetricsCollector,
-    estimate_execution_cost,
-)
+# Public names resolved on first access so that ``import zerg`` (and with it
+# every CLI invocation) does not import the architecture and metrics engines.
+_LAZY_EXPORTS = {
+    "Level": "zerg.constants",
+    "TaskStatus": "zerg.constants",
+    "GateResult": "zerg.constants",
+    "WorkerStatus": "zerg.constants",
+    "ZergError": "zerg.exceptions",
+    "ArchitectureChecker": "zerg.architecture",
+    "ArchitectureConfig": "zerg.architecture",
+    "ArchitectureGate": "zerg.architecture_gate",
+    "TaskExecutionMetrics": "zerg.worker_metrics",
+    "WorkerMetrics": "zerg.worker_metrics",
+    "LevelMetrics": "zerg.worker_metrics",
+    "WorkerMetricsCollector": "zerg.worker_metrics",
+    "estimate_execution_cost": "zerg.worker_metrics",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module defining public name *name* on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
+
 
 __all__ = [
     "__version__",
@@ -8,15 +8,26 @@ from __future__ import annotations
 
 import ast
 import fnmatch
+import hashlib
+import json
+import logging
+import os
 import re
 import sys
-from dataclasses import dataclass, field
-from pathlib import Path
+import tempfile
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path, PurePath
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from zerg.ast_cache import ASTCache
 
+logger = logging.getLogger(__name__)
+
+# Bump when FileFacts or the checks change so persisted fact stores are discarded
+_FACTS_VERSION = 1
+
 # Standard library modules (Python 3.10+)
 # Fallback list for older Python versions
 _STDLIB_MODULES: frozenset[str] = frozenset(
@@ -174,6 +185,41 @@ class Violation:
         return f"{self.rule_type.upper()}: {location}\n  {self.message}"
 
 
+@dataclass
+class FileFacts:
+    """Everything the checks need from one parsed file.
+
+    Attributes:
+        imports: ``(module, line)`` for each import, in ``ast.walk`` order.
+        definitions: ``(kind, name, line)`` for each class (``"class"``) and
+            function (``"function"``), in ``ast.walk`` order.
+        parsed: False if the file could not be read or parsed.
+    """
+
+    imports: list[tuple[str, int]] = field(default_factory=list)
+    definitions: list[tuple[str, str, int]] = field(default_factory=list)
+    parsed: bool = True
+
+    @classmethod
+    def from_tree(cls, tree: ast.Module | None) -> FileFacts:
+        """Extract facts from a parsed module (``None`` for an unparseable file)."""
+        if tree is None:
+            return cls(parsed=False)
+        facts = cls()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    facts.imports.append((alias.name, node.lineno))
+            elif isinstance(node, ast.ImportFrom):
+                if node.module:
+                    facts.imports.append((node.module, node.lineno))
+            elif isinstance(node, ast.ClassDef):
+                facts.definitions.append(("class", node.name, node.lineno))
+            elif isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+                facts.definitions.append(("function", node.name, node.lineno))
+        return facts
+
+
 class ArchitectureChecker:
     """Check Python files for architecture compliance."""
 
@@ -212,16 +258,35 @@ class ArchitectureChecker:
         if self._is_file_exempt(relative_path):
             return []
 
+        return self.check_facts(relative_path, self.extract_facts(file_path))
+
+    def extract_facts(self, file_path: Path) -> FileFacts:
+        """Parse *file_path* and extract the facts the checks use."""
+        return FileFacts.from_tree(self._parse_file(file_path))
+
+    def check_facts(self, relative_path: str, facts: FileFacts) -> list[Violation]:
+        """Check a file, given its path relative to the project root and its extracted facts.
+
+        Args:
+            relative_path: File path relative to project root
+            facts: Facts extracted from the file
+
+        Returns:
+            List of violations found
+        """
+        if not self.config.enabled or self._is_file_exempt(relative_path):
+            return []
+
         violations: list[Violation] = []
 
         # Check layer violations
-        violations.extend(self._check_layer_violations(file_path, relative_path))
+        violations.extend(self._check_layer_violations(facts, relative_path))
 
         # Check import rules
-        violations.extend(self._check_import_rules(file_path, relative_path))
+        violations.extend(self._check_import_rules(facts, relative_path))
 
         # Check naming conventions
-        violations.extend(self._check_naming_conventions(file_path, relative_path))
+        violations.extend(self._check_naming_conventions(facts, relative_path))
 
         return violations
 
@@ -246,6 +311,67 @@ class ArchitectureChecker:
 
         return violations
 
+    def check_changed(
+        self,
+        directory: Path,
+        store: ArchitectureFactStore,
+        changed_files: Iterable[str] | None = None,
+    ) -> list[Violation]:
+        """Check *directory* incrementally, re-parsing only files that changed.
+
+        Facts and violations for every file are kept in *store*. A file is
+        re-parsed only if its content hash changed, and its violations are
+        recomputed only then or when the configuration changed. A file's
+        violations depend only on its own imports and the configuration,
+        because import targets are assigned to layers by module name.
+        Editing one file therefore never changes another file's result.
+
+        Args:
+            directory: Project root to check
+            store: Fact store from the previous run (updated in place)
+            changed_files: Paths relative to *directory* that changed since
+                the store was last updated (e.g. from the merge diff). When
+                given, the tree is not walked: the files checked are those
+                in the store plus the changed ones. ``None`` walks the tree.
+
+        Returns:
+            All violations, as :meth:`check_directory` would find them,
+            ordered by file
+        """
+        if not self.config.enabled:
+            return []
+
+        store.bind(self.config_key())
+        if changed_files is None or not store.files:
+            paths = {
+                str(p.relative_to(directory))
+                for p in directory.glob("**/*.py")
+                if p.is_file() and not self._should_skip_path(p)
+            }
+        else:
+            paths = set(store.files)
+            for rel in changed_files:
+                rel = os.path.normpath(rel)
+                if rel.endswith(".py") and not self._should_skip_path(directory / rel):
+                    paths.add(rel)
+
+        violations: list[Violation] = []
+        for rel in sorted(paths):
+            path = directory / rel
+            if not path.is_file():
+                store.forget(rel)
+                continue
+            violations.extend(store.violations(rel, path, self))
+        return violations
+
+    def config_key(self) -> str:
+        """Digest of everything besides file contents that affects the checks."""
+        payload = json.dumps(
+            {"version": _FACTS_VERSION, "python": sys.version_info[:2], "config": asdict(self.config)},
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
     def get_file_layer(self, relative_path: str) -> LayerConfig | None:
         """Determine which layer a file belongs to.
 
@@ -283,7 +409,7 @@ class ArchitectureChecker:
 
         return None
 
-    def _check_layer_violations(self, file_path: Path, relative_path: str) -> list[Violation]:
+    def _check_layer_violations(self, facts: FileFacts, relative_path: str) -> list[Violation]:
         """Check for layer boundary violations."""
         violations: list[Violation] = []
 
@@ -292,10 +418,7 @@ class ArchitectureChecker:
             # File not in any layer, skip layer checking
             return violations
 
-        # Parse file and extract imports
-        imports = self._get_imports(file_path)
-
-        for module_name, line_no in imports:
+        for module_name, line_no in facts.imports:
             # Check if import is exempt
             if self._is_import_exempt(module_name, relative_path):
                 continue
@@ -339,7 +462,7 @@ class ArchitectureChecker:
 
         return violations
 
-    def _check_import_rules(self, file_path: Path, relative_path: str) -> list[Violation]:
+    def _check_import_rules(self, facts: FileFacts, relative_path: str) -> list[Violation]:
         """Check for import rule violations (allow/deny patterns)."""
         violations: list[Violation] = []
 
@@ -351,9 +474,7 @@ class ArchitectureChecker:
         if not applicable_rules:
             return violations
 
-        imports = self._get_imports(file_path)
-
-        for module_name, line_no in imports:
+        for module_name, line_no in facts.imports:
             if self._is_import_exempt(module_name, relative_path):
                 continue
 
@@ -396,9 +517,10 @@ class ArchitectureChecker:
 
         return violations
 
-    def _check_naming_conventions(self, file_path: Path, relative_path: str) -> list[Violation]:
+    def _check_naming_conventions(self, facts: FileFacts, relative_path: str) -> list[Violation]:
         """Check naming convention violations."""
         violations: list[Violation] = []
+        file_path = PurePath(relative_path)
 
         # Find applicable conventions
         for conv in self.config.naming_conventions:
@@ -425,46 +547,44 @@ class ArchitectureChecker:
                         )
                     )
 
-            # Check class and function naming requires parsing
-            if conv.classes or conv.functions:
-                tree = self._parse_file(file_path)
-                if tree:
-                    violations.extend(self._check_ast_naming(tree, relative_path, conv))
+            # Check class and function naming
+            if (conv.classes or conv.functions) and facts.parsed:
+                violations.extend(self._check_definition_naming(facts, relative_path, conv))
 
         return violations
 
-    def _check_ast_naming(self, tree: ast.Module, relative_path: str, conv: NamingConvention) -> list[Violation]:
-        """Check class and function naming in AST."""
+    def _check_definition_naming(self, facts: FileFacts, relative_path: str, conv: NamingConvention) -> list[Violation]:
+        """Check class and function naming."""
         violations: list[Violation] = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef) and conv.classes:
-                if not self._check_name_pattern(node.name, conv.classes):
+        for kind, name, line_no in facts.definitions:
+            if kind == "class" and conv.classes:
+                if not self._check_name_pattern(name, conv.classes):
                     violations.append(
                         Violation(
                             file=relative_path,
-                            line=node.lineno,
+                            line=line_no,
                             rule_type="naming",
                             message=(
-                                f"Class '{node.name}' does not match convention '{conv.classes}'. "
+                                f"Class '{name}' does not match convention '{conv.classes}'. "
                                 f"Expected: {self._pattern_description(conv.classes)}"
                             ),
                             severity="warning",
                         )
                     )
 
-            elif isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef) and conv.functions:
+            elif kind == "function" and conv.functions:
                 # Skip dunder methods
-                if node.name.startswith("__") and node.name.endswith("__"):
+                if name.startswith("__") and name.endswith("__"):
                     continue
-                if not self._check_name_pattern(node.name, conv.functions):
+                if not self._check_name_pattern(name, conv.functions):
                     violations.append(
                         Violation(
                             file=relative_path,
-                            line=node.lineno,
+                            line=line_no,
                             rule_type="naming",
                             message=(
-                                f"Function '{node.name}' does not match convention '{conv.functions}'. "
+                                f"Function '{name}' does not match convention '{conv.functions}'. "
                                 f"Expected: {self._pattern_description(conv.functions)}"
                             ),
                             severity="warning",
@@ -494,24 +614,6 @@ class ArchitectureChecker:
         }
         return descriptions.get(pattern, f"matching '{pattern}'")
 
-    def _get_imports(self, file_path: Path) -> list[tuple[str, int]]:
-        """Extract imports with line numbers from file."""
-        tree = self._parse_file(file_path)
-        if not tree:
-            return []
-
-        imports: list[tuple[str, int]] = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.append((alias.name, node.lineno))
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    imports.append((node.module, node.lineno))
-
-        return imports
-
     def _parse_file(self, file_path: Path) -> ast.Module | None:
         """Parse Python file, using cache if available."""
         try:
@@ -563,6 +665,133 @@ class ArchitectureChecker:
         return any(part.startswith(".") or part == "__pycache__" for part in parts)
 
 
+class ArchitectureFactStore:
+    """Persistent per-file import facts and violations for :meth:`ArchitectureChecker.check_changed`.
+
+    Layout of the store file::
+
+        {
+          "version": 1,
+          "config": "<ArchitectureChecker.config_key()>",
+          "files": {
+            relative_path: {
+              "stat": [mtime_ns, size],
+              "hash": sha256,
+              "facts": {"imports": [...], "definitions": [...], "parsed": true},
+              "violations": [[line, rule_type, message, severity], ...] or null
+            }
+          }
+        }
+
+    The ``stat`` pair only avoids re-reading files whose mtime and size are
+    unchanged; a file is re-parsed only when its content hash changes.
+    Cached violations are dropped when the configuration key changes.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Initialize the store.
+
+        Args:
+            path: JSON file to persist to. ``None`` keeps the store in memory only.
+        """
+        self._path = path
+        self._config_key: str | None = None
+        self.files: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def bind(self, config_key: str) -> None:
+        """Use cached violations only if they were computed under *config_key*."""
+        if self._config_key != config_key:
+            for entry in self.files.values():
+                entry["violations"] = None
+            self._config_key = config_key
+            self._dirty = True
+
+    def violations(self, relative_path: str, path: Path, checker: ArchitectureChecker) -> list[Violation]:
+        """Return the violations for one file, re-parsing it only if its content changed."""
+        entry = self.files.get(relative_path)
+        try:
+            st = path.stat()
+            stat = [st.st_mtime_ns, st.st_size]
+            if entry is None or entry["stat"] != stat:
+                data = path.read_bytes()
+                digest = hashlib.sha256(data).hexdigest()
+                if entry is None or entry["hash"] != digest:
+                    facts = FileFacts.from_tree(_parse_source(data, path))
+                    entry = {"hash": digest, "facts": asdict(facts), "violations": None}
+                    self.files[relative_path] = entry
+                entry["stat"] = stat
+                self._dirty = True
+        except OSError:
+            facts = FileFacts(parsed=False)
+            entry = {"stat": None, "hash": None, "facts": asdict(facts), "violations": None}
+            self.files[relative_path] = entry
+            self._dirty = True
+
+        if entry["violations"] is None:
+            raw = entry["facts"]
+            facts = FileFacts(
+                imports=[(m, line) for m, line in raw["imports"]],
+                definitions=[(kind, name, line) for kind, name, line in raw["definitions"]],
+                parsed=raw["parsed"],
+            )
+            found = checker.check_facts(relative_path, facts)
+            entry["violations"] = [[v.line, v.rule_type, v.message, v.severity] for v in found]
+            self._dirty = True
+        return [Violation(relative_path, *v) for v in entry["violations"]]
+
+    def forget(self, relative_path: str) -> None:
+        """Drop a file that no longer exists."""
+        if self.files.pop(relative_path, None) is not None:
+            self._dirty = True
+
+    def _load(self) -> None:
+        """Load the store file (empty on missing/corrupt/old version)."""
+        if self._path is None or not self._path.exists():
+            return
+        try:
+            payload = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            logger.debug("Ignoring unreadable architecture fact store %s", self._path)
+            return
+        if not isinstance(payload, dict) or payload.get("version") != _FACTS_VERSION:
+            return
+        self._config_key = payload.get("config")
+        self.files = payload.get("files", {})
+
+    def save(self) -> None:
+        """Atomically persist the store via tempfile + os.replace."""
+        if self._path is None or not self._dirty:
+            return
+        payload = {"version": _FACTS_VERSION, "config": self._config_key, "files": self.files}
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(self._path.parent), suffix=".tmp")
+        except OSError:
+            logger.debug("Failed to write architecture fact store to %s", self._path, exc_info=True)
+            return
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, str(self._path))
+            self._dirty = False
+        except OSError:
+            logger.debug("Failed to write architecture fact store to %s", self._path, exc_info=True)
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass  # Best-effort file cleanup
+
+
+def _parse_source(data: bytes, path: Path) -> ast.Module | None:
+    """Parse file bytes as :meth:`ArchitectureChecker._parse_file` would parse the file."""
+    try:
+        return ast.parse(data.decode("utf-8"), filename=str(path))
+    except SyntaxError:
+        return None
+
+
 def load_architecture_config(config_path: Path | None = None) -> ArchitectureConfig:
     """Load architecture configuration from YAML file.
 
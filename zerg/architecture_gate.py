@@ -2,6 +2,8 @@
 
 Runs architecture validation as a quality gate at ship/merge time.
 Respects gates_at_ship_only setting - does not run between levels.
+Per-file import facts persist in ``.zerg/state/architecture-facts.json`` so
+only files changed since the previous run are re-parsed.
 """
 
 from __future__ import annotations
@@ -12,15 +14,18 @@ from pathlib import Path
 from zerg.architecture import (
     ArchitectureChecker,
     ArchitectureConfig,
+    ArchitectureFactStore,
     Violation,
     format_violations,
     load_architecture_config,
 )
 from zerg.ast_cache import ASTCache
-from zerg.constants import GateResult
+from zerg.constants import STATE_DIR, GateResult
 from zerg.plugins import GateContext, QualityGatePlugin
 from zerg.types import GateRunResult
 
+FACTS_FILE = "architecture-facts.json"
+
 
 class ArchitectureGate(QualityGatePlugin):
     """Quality gate for architecture compliance.
@@ -43,8 +48,12 @@ class ArchitectureGate(QualityGatePlugin):
     def run(self, ctx: GateContext) -> GateRunResult:
         """Execute architecture validation.
 
+        Only files whose content changed since the previous run are parsed.
+        When ``ctx.changed_files`` is set (e.g. the files a level merge
+        touched) the tree is not walked either.
+
         Args:
-            ctx: Gate context with cwd, feature, level, config
+            ctx: Gate context with cwd, feature, level, config, changed_files
 
         Returns:
             GateRunResult with pass/fail status and details
@@ -66,7 +75,9 @@ class ArchitectureGate(QualityGatePlugin):
 
         # Run architecture checks
         checker = ArchitectureChecker(config, self._cache)
-        violations = checker.check_directory(ctx.cwd)
+        store = ArchitectureFactStore(ctx.cwd / STATE_DIR / FACTS_FILE)
+        violations = checker.check_changed(ctx.cwd, store, ctx.changed_files)
+        store.save()
 
         duration_ms = int((time.time() - start_time) * 1000)
 
@@ -97,7 +108,7 @@ class ArchitectureGate(QualityGatePlugin):
             )
 
         # Count files checked
-        file_count = sum(1 for _ in ctx.cwd.glob("**/*.py") if not self._should_skip(ctx.cwd, _))
+        file_count = len(store.files)
 
         return GateRunResult(
             gate_name=self.name,
@@ -117,14 +128,6 @@ class ArchitectureGate(QualityGatePlugin):
         self._config = load_architecture_config(config_path)
         return self._config
 
-    def _should_skip(self, root: Path, path: Path) -> bool:
-        """Check if path should be skipped."""
-        try:
-            rel = path.relative_to(root)
-            return any(part.startswith(".") or part == "__pycache__" for part in rel.parts)
-        except ValueError:
-            return True
-
 
 def check_files(files: list[Path], root: Path | None = None) -> list[Violation]:
     """Check specific files for architecture violations.
@@ -0,0 +1,311 @@
+"""Streaming capture of Claude CLI output for ZERG workers.
+
+Runs the CLI with :class:`subprocess.Popen` and tees its stdout/stderr to
+the task artifact file as the bytes arrive, keeping only a bounded tail of
+each stream in memory.  ``stream-json`` events on stdout are parsed on the
+fly so callers can advance heartbeats during long sessions, and output
+written before a timeout is kept on disk.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any
+
+from zerg.logging import get_logger
+
+logger = get_logger("claude_stream")
+
+DEFAULT_TAIL_BYTES = 64 * 1024
+DEFAULT_TICK_INTERVAL = 30.0  # well inside the 120 s heartbeat stall threshold
+_CHUNK_SIZE = 64 * 1024
+_MAX_EVENT_LINE = 1024 * 1024  # longer stdout lines are teed but not parsed
+_READER_JOIN_TIMEOUT = 5.0  # grandchildren may hold the pipes open after a kill
+
+
+class OutputTail:
+    """Ring buffer keeping the last *limit* bytes written to it."""
+
+    def __init__(self, limit: int = DEFAULT_TAIL_BYTES) -> None:
+        self.limit = limit
+        self.total = 0
+        self._chunks: deque[bytes] = deque()
+        self._size = 0
+
+    def append(self, data: bytes) -> None:
+        """Add *data*, dropping the oldest chunks beyond the limit."""
+        self.total += len(data)
+        if len(data) >= self.limit:
+            self._chunks.clear()
+            self._chunks.append(data[-self.limit :])
+            self._size = self.limit
+            return
+        self._chunks.append(data)
+        self._size += len(data)
+        while self._size - len(self._chunks[0]) >= self.limit:
+            self._size -= len(self._chunks.popleft())
+
+    @property
+    def truncated(self) -> bool:
+        """True if more bytes were written than the tail holds."""
+        return self.total > self.limit
+
+    def text(self) -> str:
+        """Return the tail decoded as UTF-8 (invalid bytes replaced)."""
+        return b"".join(self._chunks)[-self.limit :].decode("utf-8", errors="replace")
+
+
+@dataclass
+class StreamProgress:
+    """Session progress derived from ``stream-json`` events."""
+
+    events: int = 0
+    turns: int = 0
+    tool_uses: int = 0
+    last_tool: str | None = None
+    result: dict[str, Any] | None = None
+
+    def update(self, event: dict[str, Any]) -> None:
+        """Fold one ``stream-json`` event into the counters."""
+        self.events += 1
+        event_type = event.get("type")
+        if event_type == "assistant":
+            self.turns += 1
+            message = event.get("message")
+            content = message.get("content") if isinstance(message, dict) else None
+            for block in content if isinstance(content, list) else []:
+                if isinstance(block, dict) and block.get("type") == "tool_use":
+                    self.tool_uses += 1
+                    self.last_tool = block.get("name")
+        elif event_type == "result":
+            self.result = event
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary (without the raw result event)."""
+        return {
+            "events": self.events,
+            "turns": self.turns,
+            "tool_uses": self.tool_uses,
+            "last_tool": self.last_tool,
+        }
+
+
+@dataclass
+class StreamedRun:
+    """Outcome of :func:`run_streaming`."""
+
+    returncode: int
+    stdout: str
+    stderr: str
+    timed_out: bool = False
+    stdout_bytes: int = 0
+    stderr_bytes: int = 0
+    progress: StreamProgress = field(default_factory=StreamProgress)
+
+
+class _EventParser:
+    """Split a byte stream into lines and decode the JSON-object ones."""
+
+    def __init__(self, on_event: Callable[[dict[str, Any]], None]) -> None:
+        self._on_event = on_event
+        self._carry = b""
+        self._skipping = False
+
+    def feed(self, chunk: bytes) -> None:
+        lines = chunk.split(b"\n")
+        for line in lines[:-1]:
+            if self._skipping:
+                self._skipping = False
+                self._carry = b""
+                continue
+            self._emit(self._carry + line)
+            self._carry = b""
+        if not self._skipping:
+            self._carry += lines[-1]
+            if len(self._carry) > _MAX_EVENT_LINE:
+                self._carry = b""
+                self._skipping = True
+
+    def close(self) -> None:
+        if self._carry and not self._skipping:
+            self._emit(self._carry)
+        self._carry = b""
+
+    def _emit(self, line: bytes) -> None:
+        line = line.strip()
+        if not line.startswith(b"{"):
+            return
+        try:
+            event = json.loads(line)
+        except ValueError:
+            return
+        if isinstance(event, dict):
+            self._on_event(event)
+
+
+def run_streaming(
+    cmd: list[str],
+    *,
+    cwd: str | Path,
+    env: dict[str, str],
+    timeout: float,
+    output_path: Path | None = None,
+    on_event: Callable[[dict[str, Any], StreamProgress], None] | None = None,
+    on_tick: Callable[[], None] | None = None,
+    tick_interval: float = DEFAULT_TICK_INTERVAL,
+    tail_bytes: int = DEFAULT_TAIL_BYTES,
+) -> StreamedRun:
+    """Run *cmd*, teeing its output to *output_path* with bounded memory.
+
+    stdout is written to *output_path* under a ``=== STDOUT ===`` header as it
+    arrives; stderr is spooled next to it and appended under
+    ``=== STDERR ===`` once the process ends, matching
+    :meth:`TaskArtifactCapture.capture_claude_output`.
+
+    Args:
+        cmd: Command and arguments
+        cwd: Working directory
+        env: Process environment
+        timeout: Seconds before the process is killed
+        output_path: Artifact file to tee output into (``None`` keeps tails only)
+        on_event: Called from the reader thread for every ``stream-json`` event
+        on_tick: Called every *tick_interval* seconds while the process runs,
+            whether or not it produces output
+        tick_interval: Seconds between *on_tick* calls
+        tail_bytes: Bytes of each stream to keep in memory
+
+    Returns:
+        StreamedRun with the exit code, output tails and parsed progress.
+        ``returncode`` is -1 when the process was killed on timeout.
+
+    Raises:
+        FileNotFoundError: If the executable does not exist.
+    """
+    stdout_tail = OutputTail(tail_bytes)
+    stderr_tail = OutputTail(tail_bytes)
+    progress = StreamProgress()
+
+    def handle_event(event: dict[str, Any]) -> None:
+        progress.update(event)
+        if on_event is not None:
+            try:
+                on_event(event, progress)
+            except Exception as e:  # noqa: BLE001 — intentional: progress callbacks must not stop the output pump
+                logger.debug(f"stream-json event callback failed: {e}")
+
+    parser = _EventParser(handle_event)
+    sink: IO[bytes] | None = None
+    spool: IO[bytes] | None = None
+    spool_path = output_path.with_name(output_path.name + ".stderr") if output_path else None
+
+    try:
+        if output_path is not None and spool_path is not None:
+            sink = open(output_path, "wb", buffering=0)  # noqa: SIM115 — closed in finally
+            spool = open(spool_path, "w+b")  # noqa: SIM115 — closed in finally
+        proc = subprocess.Popen(cmd, cwd=str(cwd), env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        try:
+            timed_out = _pump(proc, timeout, sink, spool, stdout_tail, stderr_tail, parser, on_tick, tick_interval)
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+    finally:
+        for handle in (sink, spool):
+            if handle is not None:
+                handle.close()
+        if spool_path is not None:
+            try:
+                os.unlink(spool_path)
+            except OSError:
+                pass  # Best-effort file cleanup
+
+    return StreamedRun(
+        returncode=-1 if timed_out else proc.returncode,
+        stdout=stdout_tail.text(),
+        stderr=stderr_tail.text(),
+        timed_out=timed_out,
+        stdout_bytes=stdout_tail.total,
+        stderr_bytes=stderr_tail.total,
+        progress=progress,
+    )
+
+
+def _pump(
+    proc: subprocess.Popen[bytes],
+    timeout: float,
+    sink: IO[bytes] | None,
+    spool: IO[bytes] | None,
+    stdout_tail: OutputTail,
+    stderr_tail: OutputTail,
+    parser: _EventParser,
+    on_tick: Callable[[], None] | None = None,
+    tick_interval: float = DEFAULT_TICK_INTERVAL,
+) -> bool:
+    """Drain *proc*'s pipes until it exits or times out; return True on timeout."""
+
+    def pump_stdout(stream: IO[bytes]) -> None:
+        header_written = False
+        while chunk := os.read(stream.fileno(), _CHUNK_SIZE):
+            stdout_tail.append(chunk)
+            if sink is not None:
+                if not header_written:
+                    sink.write(b"=== STDOUT ===\n")
+                    header_written = True
+                sink.write(chunk)
+            parser.feed(chunk)
+        parser.close()
+
+    def pump_stderr(stream: IO[bytes]) -> None:
+        while chunk := os.read(stream.fileno(), _CHUNK_SIZE):
+            stderr_tail.append(chunk)
+            if spool is not None:
+                spool.write(chunk)
+
+    assert proc.stdout is not None and proc.stderr is not None
+    readers = [
+        threading.Thread(target=pump_stdout, args=(proc.stdout,), name="claude-stdout", daemon=True),
+        threading.Thread(target=pump_stderr, args=(proc.stderr,), name="claude-stderr", daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+
+    timed_out = False
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            timed_out = True
+            proc.kill()
+            proc.wait()
+            break
+        try:
+            proc.wait(timeout=min(remaining, tick_interval) if on_tick is not None else remaining)
+            break
+        except subprocess.TimeoutExpired:
+            if on_tick is not None:
+                try:
+                    on_tick()
+                except Exception as e:  # noqa: BLE001 — intentional: tick callbacks must not stop the wait
+                    logger.debug(f"stream tick callback failed: {e}")
+    for reader in readers:
+        reader.join(_READER_JOIN_TIMEOUT)
+
+    if sink is not None and spool is not None and stderr_tail.total:
+        if stdout_tail.total:
+            sink.write(b"\n")
+        sink.write(b"=== STDERR ===\n")
+        spool.seek(0)
+        shutil.copyfileobj(spool, sink)
+        sink.write(b"\n")
+    elif sink is not None and stdout_tail.total:
+        sink.write(b"\n")
+    return timed_out
@@ -5,7 +5,9 @@ and the Python CLI dashboard (which reads StateManager state dicts).
 """
 
 import json
+import os
 import re
+import tempfile
 import time
 from datetime import datetime
 from pathlib import Path
@@ -32,6 +34,12 @@ _STATUS_MAP_NO_BLOCKERS = {
 
 _STATUS_BLOCKED = TaskStatus.BLOCKED.value
 
+# Bump when the on-disk discovery index layout changes
+_INDEX_VERSION = 1
+
+# Files sampled per task list directory during discovery
+_SCAN_SAMPLE_SIZE = 15
+
 
 class ClaudeTasksReader:
     """Read Claude Code Tasks from ~/.claude/tasks/ on disk.
@@ -41,17 +49,28 @@ class ClaudeTasksReader:
     """
 
     TASKS_DIR = Path.home() / ".claude" / "tasks"
+    INDEX_PATH = Path.home() / ".claude" / "zerg-tasks-index.json"
 
-    def __init__(self, tasks_dir: Path | None = None) -> None:
+    def __init__(self, tasks_dir: Path | None = None, index_path: Path | None = None) -> None:
         """Initialize reader.
 
         Args:
             tasks_dir: Override task directory (for testing).
+            index_path: Override the persistent discovery index location.
+                Defaults to INDEX_PATH; when only tasks_dir is overridden the
+                index is kept in memory only.
         """
         self._tasks_dir = tasks_dir or self.TASKS_DIR
+        if index_path is None and tasks_dir is None:
+            index_path = self.INDEX_PATH
+        self._index_path = index_path
+        self._index: dict[str, Any] | None = None
+        self._index_dirty = False
         self._cached_dir: Path | None = None
         self._cache_time: float = 0.0
         self._cache_ttl: float = 10.0  # seconds
+        # Incremental read_tasks cache: path -> ((mtime_ns, size), parsed task or None)
+        self._task_file_cache: dict[Path, tuple[tuple[int, int], dict[str, Any] | None]] = {}
 
     def find_feature_task_list(self, feature: str) -> Path | None:
         """Find the Claude Task list directory containing ZERG tasks for a feature.
@@ -59,6 +78,10 @@ class ClaudeTasksReader:
         Scans ~/.claude/tasks/{UUID}/ directories for task JSON files with
         [L{n}] subject prefixes. Returns the most recently modified match.
 
+        Per-directory scan summaries and feature → directory results are kept
+        in a persistent index validated against directory mtimes, so only
+        directories that changed since the last lookup are re-read.
+
         Args:
             feature: Feature name to match against task descriptions.
 
@@ -77,45 +100,82 @@ class ClaudeTasksReader:
 
         # List all UUID directories, sorted by mtime (newest first)
         try:
-            task_list_dirs = sorted(
-                (d for d in self._tasks_dir.iterdir() if d.is_dir()),
-                key=lambda d: d.stat().st_mtime,
-                reverse=True,
-            )
+            task_list_dirs: list[tuple[Path, int]] = []
+            with os.scandir(self._tasks_dir) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        task_list_dirs.append((Path(entry.path), entry.stat().st_mtime_ns))
         except OSError as e:
             logger.warning("Failed to list tasks directory: %s", e)
             return None
+        task_list_dirs.sort(key=lambda item: item[1], reverse=True)
 
         feature_lower = feature.lower()
-
-        for dir_path in task_list_dirs:
-            zerg_count, feature_match = self._scan_dir_for_zerg_tasks(dir_path, feature_lower)
-            if zerg_count > 0 and feature_match:
+        index = self._load_index()
+        dirs_index: dict[str, Any] = index["dirs"]
+
+        # Fast path: nothing added, removed or modified since the indexed lookup
+        unchanged = len(task_list_dirs) == len(dirs_index) and all(
+            dirs_index.get(d.name, {}).get("mtime_ns") == mtime for d, mtime in task_list_dirs
+        )
+        if unchanged and feature_lower in index["features"]:
+            hit: Path = self._tasks_dir / str(index["features"][feature_lower])
+            self._cached_dir = hit
+            self._cache_time = now
+            return hit
+
+        # Something changed: earlier feature results may no longer be the newest match
+        if index["features"]:
+            index["features"].clear()
+            self._index_dirty = True
+
+        live_names = {d.name for d, _ in task_list_dirs}
+        for stale in [name for name in dirs_index if name not in live_names]:
+            del dirs_index[stale]
+            self._index_dirty = True
+
+        # Summarize every directory once; both passes below reuse the summaries
+        summaries: list[tuple[Path, int, str]] = []
+        for dir_path, mtime in task_list_dirs:
+            zerg_count, text = self._dir_summary(dirs_index, dir_path, mtime)
+            summaries.append((dir_path, zerg_count, text))
+
+        result: Path | None = None
+        for dir_path, zerg_count, text in summaries:
+            if zerg_count > 0 and feature_lower and feature_lower in text:
                 logger.info(
                     "Found ZERG task list for '%s' at %s (%d tasks)",
                     feature,
                     dir_path.name,
                     zerg_count,
                 )
-                self._cached_dir = dir_path
-                self._cache_time = now
-                return dir_path
-
-        # Fallback: return any dir with ZERG tasks (no feature match required)
-        for dir_path in task_list_dirs:
-            zerg_count, _ = self._scan_dir_for_zerg_tasks(dir_path, feature_lower)
-            if zerg_count >= 3:  # At least 3 level tasks = likely a real execution
-                logger.info(
-                    "Found ZERG task list (no feature match) at %s (%d tasks)",
-                    dir_path.name,
-                    zerg_count,
-                )
-                self._cached_dir = dir_path
-                self._cache_time = now
-                return dir_path
+                result = dir_path
+                break
 
-        logger.debug("No ZERG task list found for feature '%s'", feature)
-        return None
+        if result is None:
+            # Fallback: return any dir with ZERG tasks (no feature match required)
+            for dir_path, zerg_count, _ in summaries:
+                if zerg_count >= 3:  # At least 3 level tasks = likely a real execution
+                    logger.info(
+                        "Found ZERG task list (no feature match) at %s (%d tasks)",
+                        dir_path.name,
+                        zerg_count,
+                    )
+                    result = dir_path
+                    break
+
+        if result is not None:
+            index["features"][feature_lower] = result.name
+            self._index_dirty = True
+            self._cached_dir = result
+            self._cache_time = now
+        elif index["features"].pop(feature_lower, None) is not None:
+            self._index_dirty = True
+        self._save_index()
+
+        if result is None:
+            logger.debug("No ZERG task list found for feature '%s'", feature)
+        return result
 
     def read_tasks(self, task_list_dir: Path) -> dict[str, Any]:
         """Read all task JSON files and synthesize a StateManager-compatible state dict.
@@ -136,31 +196,22 @@ class ClaudeTasksReader:
             logger.warning("Failed to list task files: %s", e)
             return self._empty_state()
 
-        for json_path in json_files:
-            try:
-                data = json_loads(json_path.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, OSError) as e:
-                logger.debug("Skipping %s: %s", json_path.name, e)
-                continue
+        # Forget files that disappeared since the previous call
+        live = set(json_files)
+        for gone in [p for p in self._task_file_cache if p.parent == task_list_dir and p not in live]:
+            del self._task_file_cache[gone]
 
-            subject = data.get("subject", "")
-            match = ZERG_TASK_RE.match(subject)
-            if not match:
-                continue  # Skip non-level tasks ([Plan], [Design], etc.)
+        for json_path in json_files:
+            parsed = self._parse_task_file(json_path)
+            if parsed is None:
+                continue  # Unreadable, corrupt or non-level task ([Plan], [Design], etc.)
 
-            level = int(match.group(1))
-            title = match.group(2)
+            level = parsed["level"]
             max_level = max(max_level, level)
-
-            claude_status = data.get("status", "pending")
-            blocked_by = data.get("blockedBy", [])
-            zerg_status = self._map_status(claude_status, blocked_by)
-
-            task_id = data.get("id", json_path.stem)
-            tasks[f"TASK-{task_id}"] = {
-                "status": zerg_status,
+            tasks[f"TASK-{parsed['id']}"] = {
+                "status": parsed["status"],
                 "level": level,
-                "title": title,
+                "title": parsed["title"],
                 "worker_id": None,
                 "started_at": None,
                 "completed_at": None,
@@ -202,30 +253,99 @@ class ClaudeTasksReader:
             "error": None,
         }
 
-    def _scan_dir_for_zerg_tasks(self, dir_path: Path, feature_lower: str) -> tuple[int, bool]:
-        """Scan a task list directory for ZERG tasks.
+    def _parse_task_file(self, json_path: Path) -> dict[str, Any] | None:
+        """Parse a level task file, reusing the previous result if unchanged.
+
+        Args:
+            json_path: Task JSON file.
+
+        Returns:
+            Dict with id, level, title and status, or None if the file is
+            unreadable, corrupt, or not a level task.
+        """
+        try:
+            st = json_path.stat()
+        except OSError as e:
+            logger.debug("Skipping %s: %s", json_path.name, e)
+            self._task_file_cache.pop(json_path, None)
+            return None
+
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._task_file_cache.get(json_path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        parsed: dict[str, Any] | None = None
+        try:
+            data = json_loads(json_path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError) as e:
+            logger.debug("Skipping %s: %s", json_path.name, e)
+            data = None
+
+        if isinstance(data, dict):
+            match = ZERG_TASK_RE.match(data.get("subject", ""))
+            if match:
+                parsed = {
+                    "id": data.get("id", json_path.stem),
+                    "level": int(match.group(1)),
+                    "title": match.group(2),
+                    "status": self._map_status(data.get("status", "pending"), data.get("blockedBy", [])),
+                }
+
+        self._task_file_cache[json_path] = (stamp, parsed)
+        return parsed
+
+    def _dir_summary(self, dirs_index: dict[str, Any], dir_path: Path, mtime_ns: int) -> tuple[int, str]:
+        """Return the indexed scan summary for a directory, rescanning if stale.
+
+        Args:
+            dirs_index: The index's per-directory summaries (updated in place).
+            dir_path: Task list directory.
+            mtime_ns: Current directory mtime in nanoseconds.
+
+        Returns:
+            Tuple of (zerg_task_count, lowercase searchable text).
+        """
+        entry = dirs_index.get(dir_path.name)
+        if entry is not None and entry.get("mtime_ns") == mtime_ns:
+            return int(entry.get("zerg_count", 0)), str(entry.get("text", ""))
+
+        zerg_count, text = self._summarize_dir(dir_path)
+        dirs_index[dir_path.name] = {
+            "mtime_ns": mtime_ns,
+            "zerg_count": zerg_count,
+            # Only ZERG task lists can ever match, so skip storing text for the rest
+            "text": text if zerg_count > 0 else "",
+        }
+        self._index_dirty = True
+        return zerg_count, text
+
+    @staticmethod
+    def _summarize_dir(dir_path: Path) -> tuple[int, str]:
+        """Read a sample of a directory's task files.
 
         Args:
             dir_path: Task list directory to scan.
-            feature_lower: Lowercase feature name for matching.
 
         Returns:
-            Tuple of (zerg_task_count, feature_matched).
+            Tuple of (zerg_task_count, lowercase subject/description text).
         """
         zerg_count = 0
-        feature_match = False
+        texts: list[str] = []
 
         try:
             json_files = sorted(dir_path.glob("*.json"))
         except OSError:
-            return 0, False
+            return 0, ""
 
-        # Sample up to 15 files to avoid scanning huge directories
-        for json_path in json_files[:15]:
+        # Sample a bounded number of files to avoid scanning huge directories
+        for json_path in json_files[:_SCAN_SAMPLE_SIZE]:
             try:
                 data = json_loads(json_path.read_text(encoding="utf-8"))
             except (json.JSONDecodeError, OSError):
                 continue
+            if not isinstance(data, dict):
+                continue
 
             subject = data.get("subject", "")
             description = data.get("description", "")
@@ -233,13 +353,57 @@ class ClaudeTasksReader:
             if ZERG_TASK_RE.match(subject):
                 zerg_count += 1
 
-            # Check for feature name in description or meta tasks
-            if feature_lower:
-                text = f"{subject} {description}".lower()
-                if feature_lower in text:
-                    feature_match = True
+            texts.append(f"{subject} {description}".lower())
 
-        return zerg_count, feature_match
+        return zerg_count, "\n".join(texts)
+
+    def _load_index(self) -> dict[str, Any]:
+        """Load the discovery index (empty on missing, corrupt, or foreign)."""
+        if self._index is not None:
+            return self._index
+
+        index: dict[str, Any] = {}
+        if self._index_path is not None and self._index_path.exists():
+            try:
+                payload = json_loads(self._index_path.read_text(encoding="utf-8"))
+                if (
+                    isinstance(payload, dict)
+                    and payload.get("version") == _INDEX_VERSION
+                    and payload.get("tasks_dir") == str(self._tasks_dir)
+                ):
+                    index = payload
+            except (json.JSONDecodeError, OSError) as e:
+                logger.debug("Ignoring unreadable task index %s: %s", self._index_path, e)
+
+        index.setdefault("version", _INDEX_VERSION)
+        index.setdefault("tasks_dir", str(self._tasks_dir))
+        index.setdefault("dirs", {})
+        index.setdefault("features", {})
+        self._index = index
+        return index
+
+    def _save_index(self) -> None:
+        """Atomically persist the discovery index via tempfile + os.replace."""
+        if self._index is None or not self._index_dirty or self._index_path is None:
+            return
+
+        try:
+            self._index_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(self._index_path.parent), suffix=".tmp")
+        except OSError as e:
+            logger.debug("Failed to write task index %s: %s", self._index_path, e)
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(json.dumps(self._index))
+            os.replace(tmp_path, str(self._index_path))
+            self._index_dirty = False
+        except OSError as e:
+            logger.debug("Failed to write task index %s: %s", self._index_path, e)
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass  # Best-effort file cleanup
 
     @staticmethod
     def _map_status(claude_status: str, blocked_by: list[str]) -> str:
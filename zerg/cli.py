@@ -1,38 +1,131 @@
-"""ZERG command-line interface."""
+"""ZERG command-line interface.
+
+Subcommands are registered lazily: each command module is imported only when
+that command is resolved, so ``zerg status`` or ``zerg --help`` do not pay for
+the analysis, security and documentation engines.
+"""
+
+import importlib
+from typing import Any
 
 import click
-from rich.console import Console
+from click.shell_completion import CompletionItem
 
 from zerg import __version__
-from zerg.commands import (
-    analyze,
-    build,
-    cleanup,
-    debug,
-    design,
-    document,
-    git_cmd,
-    init,
-    install_commands,
-    logs,
-    merge_cmd,
-    plan,
-    refactor,
-    retry,
-    review,
-    rush,
-    security_rules_group,
-    status,
-    stop,
-    test_cmd,
-    uninstall_commands,
-    wiki,
-)
 
-console = Console()
+# Command name -> (module, attribute, summary). The summary is the first
+# paragraph of the command's help text, used to render ``zerg --help`` and
+# shell completions without importing the module; tests/unit/test_cli_lazy.py
+# keeps it in sync with the real commands.
+LAZY_COMMANDS: dict[str, tuple[str, str, str]] = {
+    "analyze": (
+        "zerg.commands.analyze",
+        "analyze",
+        "Run static analysis, complexity metrics, and quality assessment.",
+    ),
+    "build": ("zerg.commands.build", "build", "Build orchestration with error recovery."),
+    "cleanup": ("zerg.commands.cleanup", "cleanup", "Remove ZERG artifacts."),
+    "debug": ("zerg.commands.debug", "debug", "Systematic debugging with root cause analysis."),
+    "design": ("zerg.commands.design", "design", "Generate architecture and task graph."),
+    "document": (
+        "zerg.commands.document",
+        "document",
+        "Generate documentation for a specific component, module, or command.",
+    ),
+    "git": (
+        "zerg.commands.git_cmd",
+        "git_cmd",
+        "Git operations with intelligent commits, PR creation, releases, and more.",
+    ),
+    "init": ("zerg.commands.init", "init", "Initialize ZERG for the current project."),
+    "install-commands": (
+        "zerg.commands.install_commands",
+        "install_commands",
+        "Install ZERG slash commands globally for Claude Code.",
+    ),
+    "logs": ("zerg.commands.logs", "logs", "Stream worker logs."),
+    "merge": ("zerg.commands.merge_cmd", "merge_cmd", "Trigger merge gate execution."),
+    "plan": ("zerg.commands.plan", "plan", "Capture feature requirements."),
+    "refactor": ("zerg.commands.refactor", "refactor", "Automated code improvement and cleanup."),
+    "retry": ("zerg.commands.retry", "retry", "Retry failed or blocked tasks."),
+    "review": ("zerg.commands.review", "review", "Three-stage code review workflow."),
+    "rush": ("zerg.commands.rush", "rush", "Launch parallel worker execution."),
+    "security-rules": (
+        "zerg.commands.security_rules_cmd",
+        "security_rules_group",
+        "Manage secure coding rules from TikiTribe/claude-secure-coding-rules.",
+    ),
+    "status": ("zerg.commands.status", "status", "Show execution progress."),
+    "stop": ("zerg.commands.stop", "stop", "Stop execution gracefully or forcefully."),
+    "test": (
+        "zerg.commands.test_cmd",
+        "test_cmd",
+        "Execute tests with coverage analysis and test generation.",
+    ),
+    "uninstall-commands": (
+        "zerg.commands.install_commands",
+        "uninstall_commands",
+        "Remove ZERG slash commands from the global Claude Code directory.",
+    ),
+    "wiki": ("zerg.commands.wiki", "wiki", "Generate a complete documentation wiki for the ZERG project."),
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports a subcommand's module only when it is resolved.
+
+    Listing commands (``--help``, shell completion) uses the summaries from
+    *lazy_commands* for commands that have not been loaded yet, so the help
+    output matches an eagerly registered group.
+    """
+
+    def __init__(self, *args: Any, lazy_commands: dict[str, tuple[str, str, str]] | None = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
 
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
 
-@click.group()
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module_name, attr, _summary = self.lazy_commands[cmd_name]
+            command = getattr(importlib.import_module(module_name), attr)
+            self.add_command(command, name=cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _short_help(self, ctx: click.Context, cmd_name: str, limit: int) -> str | None:
+        """Short help for *cmd_name* without loading it; None if hidden or unknown."""
+        if cmd_name in self.commands or cmd_name not in self.lazy_commands:
+            cmd = self.get_command(ctx, cmd_name)
+            if cmd is None or cmd.hidden:
+                return None
+            return cmd.get_short_help_str(limit)
+        # A help-only stand-in formats the summary exactly as the real command would
+        return click.Command(cmd_name, help=self.lazy_commands[cmd_name][2]).get_short_help_str(limit)
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        names = [name for name in self.list_commands(ctx) if self._short_help(ctx, name, 45) is not None]
+        if not names:
+            return
+        # allow for 3 times the default spacing
+        limit = formatter.width - 6 - max(len(name) for name in names)
+        rows = [(name, self._short_help(ctx, name, limit) or "") for name in names]
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
+
+    def shell_complete(self, ctx: click.Context, incomplete: str) -> list[CompletionItem]:
+        results = []
+        for name in self.list_commands(ctx):
+            if not name.startswith(incomplete):
+                continue
+            help_text = self._short_help(ctx, name, 45)
+            if help_text is not None:
+                results.append(CompletionItem(name, help=help_text))
+        results.extend(click.Command.shell_complete(self, ctx, incomplete))
+        return results
+
+
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS)
 @click.version_option(version=__version__, prog_name="zerg")
 @click.option("--quick", is_flag=True, help="Quick surface-level analysis")
 @click.option("--think", is_flag=True, help="Structured multi-step analysis")
@@ -93,30 +186,5 @@ def cli(
     ctx.obj["iterations"] = iterations
 
 
-# Register implemented commands
-cli.add_command(analyze)
-cli.add_command(build)
-cli.add_command(cleanup)
-cli.add_command(design)
-cli.add_command(git_cmd, name="git")
-cli.add_command(init)
-cli.add_command(logs)
-cli.add_command(merge_cmd)
-cli.add_command(plan)
-cli.add_command(refactor)
-cli.add_command(retry)
-cli.add_command(review)
-cli.add_command(rush)
-cli.add_command(security_rules_group)
-cli.add_command(status)
-cli.add_command(stop)
-cli.add_command(test_cmd, name="test")
-cli.add_command(debug)
-cli.add_command(document)
-cli.add_command(wiki)
-cli.add_command(install_commands)
-cli.add_command(uninstall_commands)
-
-
 if __name__ == "__main__":
     cli()
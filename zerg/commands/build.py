@@ -13,7 +13,7 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from zerg.command_executor import CommandExecutor, CommandValidationError
-from zerg.fs_utils import collect_files
+from zerg.file_watcher import FileWatcher
 from zerg.json_utils import dumps as json_dumps
 from zerg.logging import get_logger
 
@@ -370,35 +370,30 @@ def _build_docker_image() -> None:
         raise SystemExit(1)
 
 
-def _watch_loop(builder: BuildCommand, system: BuildSystem | None, cwd: str) -> None:
-    """Simple watch loop using polling."""
-    import hashlib
-
-    def get_file_hashes(path: Path) -> dict[str, str]:
-        """Get hashes of all source files."""
-        hashes = {}
-        grouped = collect_files(path, extensions={".py", ".js", ".ts", ".go", ".rs", ".java"})
-        for ext_files in grouped.values():
-            for f in ext_files:
-                try:
-                    content = f.read_bytes()
-                    hashes[str(f)] = hashlib.md5(content).hexdigest()
-                except OSError:
-                    pass  # Best-effort file cleanup
-        return hashes
+def _watch_loop(
+    builder: BuildCommand,
+    system: BuildSystem | None,
+    cwd: str,
+    watcher: FileWatcher | None = None,
+) -> None:
+    """Rebuild whenever watched source files change.
 
-    console.print("[cyan]Watch mode enabled. Press Ctrl+C to stop.[/cyan]\n")
+    Args:
+        builder: Build command used to run the build.
+        system: Build system (auto-detected if None).
+        cwd: Project directory to watch and build in.
+        watcher: Pre-built watcher (tests inject a polling one).
+    """
+    watcher = watcher or FileWatcher(Path(cwd), extensions={".py", ".js", ".ts", ".go", ".rs", ".java"})
 
-    last_hashes = get_file_hashes(Path(cwd))
-    last_build_time = 0.0
+    console.print(f"[cyan]Watch mode enabled ({watcher.backend}). Press Ctrl+C to stop.[/cyan]\n")
 
-    while True:
-        try:
-            time.sleep(1)
-            current_hashes = get_file_hashes(Path(cwd))
-
-            if current_hashes != last_hashes and time.time() - last_build_time > 2:
-                changed = [f for f in current_hashes if f not in last_hashes or current_hashes[f] != last_hashes[f]]
+    with watcher:
+        while True:
+            try:
+                changed = watcher.wait()
+                if not changed:
+                    continue
                 console.print(f"\n[yellow]Changes detected in {len(changed)} files[/yellow]")
 
                 result = builder.run(system=system, cwd=cwd)
@@ -408,12 +403,9 @@ def _watch_loop(builder: BuildCommand, system: BuildSystem | None, cwd: str) ->
                     err = result.errors[0] if result.errors else "Unknown"
                     console.print(f"[red]Build failed:[/red] {err}")
 
-                last_hashes = current_hashes
-                last_build_time = time.time()
-
-        except KeyboardInterrupt:
-            console.print("\n[yellow]Watch mode stopped[/yellow]")
-            break
+            except KeyboardInterrupt:
+                console.print("\n[yellow]Watch mode stopped[/yellow]")
+                break
 
 
 @click.command()
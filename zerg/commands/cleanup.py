@@ -11,7 +11,7 @@ from rich.console import Console
 from rich.table import Table
 
 from zerg.config import ZergConfig
-from zerg.constants import GSD_DIR, SPECS_DIR
+from zerg.constants import GSD_DIR, SPECS_DIR, WORKTREES_DIR
 from zerg.containers import ContainerManager
 from zerg.git_ops import GitOps
 from zerg.logging import get_logger
@@ -207,6 +207,12 @@ def create_cleanup_plan(
                 for log_file in log_dir.glob("*.log"):
                     plan["log_files"].append(str(log_file))
 
+    # Find idle pooled worktrees (shared across features)
+    pool_dir = Path(WORKTREES_DIR) / WorktreeManager.POOL_DIR
+    if features and pool_dir.exists():
+        for slot in sorted(pool_dir.glob("slot-*")):
+            plan["worktrees"].append(str(slot))
+
     return plan
 
 
@@ -284,7 +290,8 @@ def execute_cleanup(plan: dict[str, Any], config: ZergConfig) -> None:
         try:
             wt_path_obj = Path(wt_path)
             if wt_path_obj.exists():
-                worktree_mgr.delete(wt_path_obj)
+                # Pooled worktrees are scratch checkouts, so discard any leftovers
+                worktree_mgr.delete(wt_path_obj, force=wt_path_obj.parent.name == WorktreeManager.POOL_DIR)
                 console.print(f"  [green]✓[/green] {wt_path}")
             else:
                 console.print(f"  [dim]-[/dim] {wt_path} (not found)")
@@ -292,6 +299,10 @@ def execute_cleanup(plan: dict[str, Any], config: ZergConfig) -> None:
             logger.warning(f"Worktree removal failed for {wt_path}: {e}")
             console.print(f"  [red]✗[/red] {wt_path}: {e}")
             errors.append(str(e))
+    try:
+        worktree_mgr.drain_pool()
+    except Exception as e:  # noqa: BLE001 — intentional: pool drain is best-effort during cleanup
+        logger.warning(f"Worktree pool drain failed: {e}")
 
     # Remove branches
     if plan["branches"]:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import re
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -17,12 +18,14 @@ from rich.table import Table
 from zerg.logging import get_logger
 
 if TYPE_CHECKING:
-    from zerg.diagnostics.log_analyzer import LogPattern
+    from zerg.diagnostics.log_analyzer import LogPattern, WorkerLogs
+    from zerg.diagnostics.pipeline import Probe, ProbeOutcome, SharedCommands
     from zerg.diagnostics.recovery import RecoveryPlan
     from zerg.diagnostics.state_introspector import ZergHealthReport
     from zerg.diagnostics.system_diagnostics import SystemHealthReport
     from zerg.diagnostics.types import (
         ErrorFingerprint,
+        Evidence,
         ScoredHypothesis,
         TimelineEvent,
     )
@@ -48,6 +51,8 @@ class DebugConfig:
     verbose: bool = False
     max_hypotheses: int = 3
     auto_test: bool = False
+    probe_timeout: float = 30.0  # seconds any one diagnostic probe may run
+    time_budget: float = 60.0  # seconds for all deep/enhanced diagnostics together
 
 
 @dataclass
@@ -440,170 +445,219 @@ class DebugCommand:
             parsed_error=parsed,
         )
 
-        # Deep diagnostics: ZERG state introspection
-        if feature:
-            result = self._run_zerg_diagnostics(result, feature, worker_id)
+        # Deep and enhanced diagnostics run concurrently; outcomes are applied in a fixed order
+        from zerg.diagnostics.pipeline import ProbePipeline
+
+        probes = self._diagnostic_probes(full_error, stack_trace, feature, worker_id, deep, env)
+        outcomes = ProbePipeline(probes, budget=self.config.time_budget).run()
 
-        # Deep diagnostics: system-level checks
+        if feature:
+            self._apply_zerg_diagnostics(result, outcomes["zerg"])
         if deep:
-            result = self._run_system_diagnostics(result)
+            self._apply_system_diagnostics(result, outcomes["system"])
 
         # Recovery planning
         if auto_fix or feature:
             result = self._plan_recovery(result)
 
-        # Enhanced diagnostics pipeline
-        result = self._run_enhanced_diagnostics(result, full_error, stack_trace, feature, worker_id, deep, env)
+        self._apply_enhanced_diagnostics(result, outcomes)
 
         return result
 
-    def _run_enhanced_diagnostics(
+    def _diagnostic_probes(
         self,
-        result: DiagnosticResult,
         full_error: str,
         stack_trace: str,
         feature: str | None,
         worker_id: int | None,
         deep: bool,
         env: bool,
-    ) -> DiagnosticResult:
-        """Run enhanced diagnostic engines (error intel, log correlation, etc.)."""
-        # Enhanced: Error Intelligence
-        try:
-            from zerg.diagnostics.error_intel import ErrorIntelEngine
-
-            intel = ErrorIntelEngine()
-            result.error_intel = intel.analyze(full_error, stack_trace)
-            intel_evidence = intel.get_evidence(result.error_intel)
-            for ev in intel_evidence:
-                result.evidence.append(ev.description)
-        except Exception as e:  # noqa: BLE001 — intentional: error intel is optional enhanced diagnostic
-            logger.warning(f"Error intelligence failed: {e}")
+    ) -> list[Probe]:
+        """Build the probe graph for the requested diagnostics.
 
-        # Enhanced: Log Correlation (when feature provided)
-        if feature:
-            try:
-                from zerg.diagnostics.log_correlator import LogCorrelationEngine
-                from zerg.diagnostics.types import TimelineEvent as TEType
-
-                correlator = LogCorrelationEngine()
-                log_result = correlator.analyze(worker_id=worker_id)
-                timeline_raw = log_result.get("timeline", [])
-                result.timeline = [TEType(**e) if isinstance(e, dict) else e for e in timeline_raw]
-                result.correlations = log_result.get("correlations", [])
-            except Exception as e:  # noqa: BLE001 — intentional: log correlation is optional enhanced diagnostic
-                logger.warning(f"Log correlation failed: {e}")
-
-        # Enhanced: Hypothesis Engine
-        try:
-            from zerg.diagnostics.hypothesis_engine import HypothesisEngine
-            from zerg.diagnostics.types import Evidence as TypedEvidence
-
-            hypo_engine = HypothesisEngine()
-            if result.error_intel:
-                # Convert string evidence to typed Evidence for the engine
-                typed_evidence = [
-                    TypedEvidence(
-                        description=ev_str,
-                        source="diagnostic",
-                        confidence=0.5,
-                    )
-                    for ev_str in result.evidence
-                ]
-                result.scored_hypotheses = hypo_engine.analyze(result.error_intel, typed_evidence)
-        except Exception as e:  # noqa: BLE001 — intentional: hypothesis engine is optional enhanced diagnostic
-            logger.warning(f"Hypothesis engine failed: {e}")
-
-        # Enhanced: Code-Aware Fixes
-        try:
-            from zerg.diagnostics.code_fixer import CodeAwareFixer
+        Worker logs are read once and shared by the log analyzer and the
+        correlator; commands run by both the system and environment
+        diagnostics (``docker info``) run once.
+        """
+        from zerg.diagnostics.log_analyzer import WorkerLogs
+        from zerg.diagnostics.pipeline import Probe, SharedCommands
 
-            fixer = CodeAwareFixer()
-            if result.error_intel:
-                from zerg.diagnostics.types import Evidence as TypedEvidence2
+        logs = WorkerLogs()
+        commands = SharedCommands()
+        timeout = self.config.probe_timeout
 
-                typed_evidence_fix = [
-                    TypedEvidence2(
-                        description=ev_str,
-                        source="diagnostic",
-                        confidence=0.5,
-                    )
-                    for ev_str in result.evidence
-                ]
-                fix_result = fixer.analyze(result.error_intel, typed_evidence_fix)
-                result.fix_suggestions = fix_result.get("suggestions", [])
-        except Exception as e:  # noqa: BLE001 — intentional: code fixer is optional enhanced diagnostic
-            logger.warning(f"Code fixer failed: {e}")
-
-        # Enhanced: Environment Diagnostics
+        probes = [Probe("intel", lambda _: self._probe_error_intel(full_error, stack_trace), timeout=timeout)]
+        evidence_deps = ["intel"]
+        if feature:
+            probes.append(Probe("zerg", lambda _: self._probe_zerg(feature, worker_id, logs), timeout=timeout))
+            probes.append(Probe("correlation", lambda _: self._probe_correlation(worker_id, logs), timeout=timeout))
+            evidence_deps.insert(0, "zerg")
+        if deep:
+            probes.append(Probe("system", lambda _: self._probe_system(commands), timeout=timeout))
+            evidence_deps.insert(-1, "system")
         if deep or env:
-            try:
-                from zerg.diagnostics.env_diagnostics import EnvDiagnosticsEngine
-
-                env_engine = EnvDiagnosticsEngine()
-                result.env_report = env_engine.run_all()
-            except Exception as e:  # noqa: BLE001 — intentional: env diagnostics is optional enhanced diagnostic
-                logger.warning(f"Environment diagnostics failed: {e}")
-
-        return result
-
-    def _run_zerg_diagnostics(
-        self,
-        result: DiagnosticResult,
-        feature: str,
-        worker_id: int | None = None,
-    ) -> DiagnosticResult:
-        """Run ZERG state introspection and log analysis."""
+            probes.append(Probe("env", lambda _: self._probe_env(commands), timeout=timeout))
+        deps = tuple(evidence_deps)
+        probes.append(Probe("hypotheses", self._probe_hypotheses, deps=deps, timeout=timeout))
+        probes.append(Probe("fixes", self._probe_fixes, deps=deps, timeout=timeout))
+        return probes
+
+    def _probe_zerg(
+        self, feature: str, worker_id: int | None, logs: WorkerLogs
+    ) -> tuple[ZergHealthReport, list[LogPattern]]:
+        """ZERG state introspection and worker log analysis."""
         from zerg.diagnostics.log_analyzer import LogAnalyzer
         from zerg.diagnostics.state_introspector import ZergStateIntrospector
 
-        try:
-            introspector = ZergStateIntrospector()
-            result.zerg_health = introspector.get_health_report(feature)
+        health = ZergStateIntrospector().get_health_report(feature)
+        patterns = LogAnalyzer(logs.logs_dir, logs).scan_worker_logs(worker_id)
+        return health, patterns
 
-            # Add evidence from health report
-            health = result.zerg_health
-            if health.failed_tasks:
-                result.evidence.append(f"{len(health.failed_tasks)} failed task(s)")
-            if health.stale_tasks:
-                result.evidence.append(f"{len(health.stale_tasks)} stale task(s)")
-            if health.global_error:
-                result.evidence.append(f"Global error: {health.global_error}")
-
-            # Log analysis
-            analyzer = LogAnalyzer()
-            result.log_patterns = analyzer.scan_worker_logs(worker_id)
+    def _probe_system(self, commands: SharedCommands) -> SystemHealthReport:
+        """System-level checks (git, disk, docker, ports, worktrees)."""
+        from zerg.diagnostics.system_diagnostics import SystemDiagnostics
 
-            if result.log_patterns:
-                result.evidence.append(f"{len(result.log_patterns)} error pattern(s) in logs")
-        except Exception as e:  # noqa: BLE001 — intentional: ZERG state introspection is best-effort
-            logger.warning(f"ZERG diagnostics failed: {e}")
-            result.evidence.append(f"ZERG diagnostics error: {e}")
+        return SystemDiagnostics(commands=commands).run_all()
+
+    def _probe_error_intel(self, full_error: str, stack_trace: str) -> tuple[ErrorFingerprint, list[str]]:
+        """Error fingerprint and the evidence it yields."""
+        from zerg.diagnostics.error_intel import ErrorIntelEngine
+
+        intel = ErrorIntelEngine()
+        fingerprint = intel.analyze(full_error, stack_trace)
+        return fingerprint, [ev.description for ev in intel.get_evidence(fingerprint)]
+
+    def _probe_correlation(self, worker_id: int | None, logs: WorkerLogs) -> dict[str, Any]:
+        """Cross-worker log correlation."""
+        from zerg.diagnostics.log_correlator import LogCorrelationEngine
+
+        return LogCorrelationEngine(logs.logs_dir, logs).analyze(worker_id=worker_id)
+
+    def _probe_env(self, commands: SharedCommands) -> DiagnosticResultDict:
+        """Environment diagnostics (Python, Docker, resources, config)."""
+        from zerg.diagnostics.env_diagnostics import EnvDiagnosticsEngine
+
+        return EnvDiagnosticsEngine(commands).run_all()
+
+    def _probe_hypotheses(self, inputs: Mapping[str, ProbeOutcome]) -> list[ScoredHypothesis] | None:
+        """Score hypotheses for the error fingerprint against the evidence gathered so far."""
+        from zerg.diagnostics.hypothesis_engine import HypothesisEngine
+
+        intel = inputs["intel"]
+        if not intel.ok:
+            return None
+        return HypothesisEngine().analyze(intel.value[0], self._typed_evidence(inputs))
+
+    def _probe_fixes(self, inputs: Mapping[str, ProbeOutcome]) -> list[dict[str, Any]] | None:
+        """Code-aware fix suggestions for the error fingerprint."""
+        from zerg.diagnostics.code_fixer import CodeAwareFixer
+
+        intel = inputs["intel"]
+        if not intel.ok:
+            return None
+        fix_result = CodeAwareFixer().analyze(intel.value[0], self._typed_evidence(inputs))
+        suggestions: list[dict[str, Any]] = fix_result.get("suggestions", [])
+        return suggestions
+
+    def _typed_evidence(self, inputs: Mapping[str, ProbeOutcome]) -> list[Evidence]:
+        """Evidence from the finished probes, in report order, for the scoring engines."""
+        from zerg.diagnostics.types import Evidence as TypedEvidence
+
+        descriptions: list[str] = []
+        if "zerg" in inputs:
+            descriptions += self._zerg_evidence(inputs["zerg"])
+        if "system" in inputs:
+            descriptions += self._system_evidence(inputs["system"])
+        if inputs["intel"].ok:
+            descriptions += inputs["intel"].value[1]
+        return [TypedEvidence(description=desc, source="diagnostic", confidence=0.5) for desc in descriptions]
+
+    @staticmethod
+    def _zerg_evidence(outcome: ProbeOutcome) -> list[str]:
+        if not outcome.ok:
+            return [f"ZERG diagnostics error: {outcome.error}"]
+        health, patterns = outcome.value
+        evidence: list[str] = []
+        if health.failed_tasks:
+            evidence.append(f"{len(health.failed_tasks)} failed task(s)")
+        if health.stale_tasks:
+            evidence.append(f"{len(health.stale_tasks)} stale task(s)")
+        if health.global_error:
+            evidence.append(f"Global error: {health.global_error}")
+        if patterns:
+            evidence.append(f"{len(patterns)} error pattern(s) in logs")
+        return evidence
+
+    @staticmethod
+    def _system_evidence(outcome: ProbeOutcome) -> list[str]:
+        if not outcome.ok:
+            return [f"System diagnostics error: {outcome.error}"]
+        health = outcome.value
+        evidence: list[str] = []
+        if not health.git_clean:
+            evidence.append(f"{health.git_uncommitted_files} uncommitted file(s)")
+        if health.port_conflicts:
+            evidence.append(f"Port conflicts: {health.port_conflicts}")
+        if health.orphaned_worktrees:
+            evidence.append(f"{len(health.orphaned_worktrees)} orphaned worktree(s)")
+        if health.disk_free_gb < 1.0:
+            evidence.append(f"Low disk space: {health.disk_free_gb:.1f} GB free")
+        return evidence
+
+    def _apply_zerg_diagnostics(self, result: DiagnosticResult, outcome: ProbeOutcome) -> None:
+        """Record ZERG state introspection and log analysis."""
+        if outcome.ok:
+            result.zerg_health, result.log_patterns = outcome.value
+        else:
+            logger.warning(f"ZERG diagnostics failed: {outcome.error}")
+        result.evidence.extend(self._zerg_evidence(outcome))
 
-        return result
+    def _apply_system_diagnostics(self, result: DiagnosticResult, outcome: ProbeOutcome) -> None:
+        """Record system-level diagnostic checks."""
+        if outcome.ok:
+            result.system_health = outcome.value
+        else:
+            logger.warning(f"System diagnostics failed: {outcome.error}")
+        result.evidence.extend(self._system_evidence(outcome))
 
-    def _run_system_diagnostics(self, result: DiagnosticResult) -> DiagnosticResult:
-        """Run system-level diagnostic checks."""
-        from zerg.diagnostics.system_diagnostics import SystemDiagnostics
+    def _apply_enhanced_diagnostics(self, result: DiagnosticResult, outcomes: Mapping[str, ProbeOutcome]) -> None:
+        """Record enhanced diagnostic engines (error intel, log correlation, etc.)."""
+        from zerg.diagnostics.types import TimelineEvent as TEType
 
-        try:
-            sys_diag = SystemDiagnostics()
-            result.system_health = sys_diag.run_all()
-
-            health = result.system_health
-            if not health.git_clean:
-                result.evidence.append(f"{health.git_uncommitted_files} uncommitted file(s)")
-            if health.port_conflicts:
-                result.evidence.append(f"Port conflicts: {health.port_conflicts}")
-            if health.orphaned_worktrees:
-                result.evidence.append(f"{len(health.orphaned_worktrees)} orphaned worktree(s)")
-            if health.disk_free_gb < 1.0:
-                result.evidence.append(f"Low disk space: {health.disk_free_gb:.1f} GB free")
-        except Exception as e:  # noqa: BLE001 — intentional: system diagnostics is best-effort
-            logger.warning(f"System diagnostics failed: {e}")
-            result.evidence.append(f"System diagnostics error: {e}")
+        intel = outcomes["intel"]
+        if intel.ok:
+            result.error_intel, intel_evidence = intel.value
+            result.evidence.extend(intel_evidence)
+        else:
+            logger.warning(f"Error intelligence failed: {intel.error}")
 
-        return result
+        correlation = outcomes.get("correlation")
+        if correlation is not None:
+            if correlation.ok:
+                timeline_raw = correlation.value.get("timeline", [])
+                result.timeline = [TEType(**e) if isinstance(e, dict) else e for e in timeline_raw]
+                result.correlations = correlation.value.get("correlations", [])
+            else:
+                logger.warning(f"Log correlation failed: {correlation.error}")
+
+        hypotheses = outcomes["hypotheses"]
+        if not hypotheses.ok:
+            logger.warning(f"Hypothesis engine failed: {hypotheses.error}")
+        elif hypotheses.value is not None:
+            result.scored_hypotheses = hypotheses.value
+
+        fixes = outcomes["fixes"]
+        if not fixes.ok:
+            logger.warning(f"Code fixer failed: {fixes.error}")
+        elif fixes.value is not None:
+            result.fix_suggestions = fixes.value
+
+        env = outcomes.get("env")
+        if env is not None:
+            if env.ok:
+                result.env_report = env.value
+            else:
+                logger.warning(f"Environment diagnostics failed: {env.error}")
 
     def _plan_recovery(self, result: DiagnosticResult) -> DiagnosticResult:
         """Generate a recovery plan from diagnostic results."""
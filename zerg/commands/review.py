@@ -1,5 +1,7 @@
 """ZERG review command - two-stage code review workflow."""
 
+import sqlite3
+import zipfile
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -455,6 +457,20 @@ def _collect_files(path: str | None, mode: str) -> list[str]:
     return []
 
 
+def _update_vulnerability_db() -> None:
+    """Refresh the local OSV database used by the CVE scan."""
+    from zerg.security.osv_db import OSV_DB_PATH, update_database
+
+    console.print(f"Updating OSV vulnerability database at {OSV_DB_PATH}...")
+    try:
+        counts = update_database()
+    except (OSError, ValueError, zipfile.BadZipFile, sqlite3.Error) as e:
+        console.print(f"[yellow]Warning: OSV database update failed: {e}[/yellow]")
+        return
+    summary = ", ".join(f"{eco}: {count}" for eco, count in counts.items())
+    console.print(f"[green]OSV database updated[/green] ({summary})\n")
+
+
 @click.command()
 @click.option(
     "--mode",
@@ -467,6 +483,12 @@ def _collect_files(path: str | None, mode: str) -> list[str]:
 @click.option("--output", "-o", help="Output file for review results")
 @click.option("--json", "json_output", is_flag=True, help="Output as JSON")
 @click.option("--no-security", is_flag=True, default=False, help="Skip security scan (Stage 3)")
+@click.option(
+    "--update-db",
+    is_flag=True,
+    default=False,
+    help="Download the OSV vulnerability database before scanning (the scan itself is offline)",
+)
 @click.pass_context
 def review(
     ctx: click.Context,
@@ -475,6 +497,7 @@ def review(
     output: str | None,
     json_output: bool,
     no_security: bool,
+    update_db: bool,
 ) -> None:
     """Three-stage code review workflow.
 
@@ -494,6 +517,8 @@ def review(
 
         zerg review --no-security
 
+        zerg review --update-db
+
         zerg review --output review.md
     """
     try:
@@ -503,6 +528,9 @@ def review(
         if no_security:
             console.print("[yellow]Warning: Security scan (Stage 3) skipped via --no-security[/yellow]")
 
+        if update_db:
+            _update_vulnerability_db()
+
         # Collect files
         file_list = _collect_files(files, mode)
 
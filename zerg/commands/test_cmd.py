@@ -12,6 +12,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from zerg.command_executor import CommandExecutor, CommandValidationError
+from zerg.file_watcher import FileWatcher
 from zerg.fs_utils import collect_files
 from zerg.json_utils import dumps as json_dumps
 from zerg.json_utils import loads as json_loads
@@ -195,9 +196,18 @@ class Runner:
 
         return base_cmd
 
-    def run(self, framework: Framework, path: str = ".") -> RunResult:
-        """Run tests and return results."""
-        cmd = self.get_command(framework, path if path != "." else "")
+    def run(self, framework: Framework, path: str = ".", targets: list[str] | None = None) -> RunResult:
+        """Run tests and return results.
+
+        Args:
+            framework: Test framework to run.
+            path: Working directory (and test path) for the run.
+            targets: Specific test files to run instead of the whole suite.
+        """
+        if targets:
+            cmd = self.get_command(framework, " ".join(targets))
+        else:
+            cmd = self.get_command(framework, path if path != "." else "")
         start = time.time()
 
         try:
@@ -382,8 +392,9 @@ class Command:
         framework: Framework | None = None,
         path: str = ".",
         dry_run: bool = False,
+        targets: list[str] | None = None,
     ) -> RunResult:
-        """Run tests."""
+        """Run tests, optionally limited to *targets* (paths relative to *path*)."""
         if dry_run:
             detected = self.detector.detect(Path(path))
             framework_name = detected[0].value if detected else "unknown"
@@ -401,7 +412,7 @@ class Command:
             detected = self.detector.detect(Path(path))
             framework = detected[0] if detected else Framework.PYTEST
 
-        return self.runner.run(framework, path)
+        return self.runner.run(framework, path, targets=targets)
 
     def format_result(self, result: RunResult, fmt: str = "text") -> str:
         """Format test result."""
@@ -448,49 +459,94 @@ class Command:
 TestCommand = Command
 
 
-def _watch_loop(tester: Command, framework: Framework | None, path: str) -> None:
-    """Simple watch loop using polling."""
-    import hashlib
+_WATCH_EXTENSIONS = {".py", ".js", ".ts", ".go", ".rs"}
+
 
-    def get_file_hashes(target: Path) -> dict[str, str]:
-        """Get hashes of test-related files."""
-        hashes = {}
-        grouped = collect_files(target, extensions={".py", ".js", ".ts", ".go", ".rs"})
-        for files in grouped.values():
-            for f in files:
-                try:
-                    content = f.read_bytes()
-                    hashes[str(f)] = hashlib.md5(content).hexdigest()
-                except OSError:
-                    pass  # Best-effort file cleanup
-        return hashes
+def _select_affected_tests(root: Path, changed: list[Path]) -> list[str] | None:
+    """Map changed files to the pytest targets that exercise them.
 
-    console.print("[cyan]Watch mode enabled. Press Ctrl+C to stop.[/cyan]\n")
+    Changed test files are rerun directly; changed modules are resolved to
+    the tests importing them via :func:`zerg.test_scope.find_affected_tests`.
 
-    last_hashes = get_file_hashes(Path(path))
-    last_run_time = 0.0
+    Args:
+        root: Project root the tests run from.
+        changed: Files reported by the watcher.
 
-    while True:
+    Returns:
+        Test paths relative to *root*, or ``None`` when the change cannot be
+        scoped (non-Python files, ``conftest.py``, files outside *root*) and
+        the whole suite should run.
+    """
+    from zerg.test_scope import find_affected_tests
+
+    root = root.resolve()
+    targets: set[str] = set()
+    modules: list[str] = []
+    for path in changed:
+        if path.suffix != ".py" or path.name == "conftest.py":
+            return None
         try:
-            time.sleep(1)
-            current_hashes = get_file_hashes(Path(path))
+            rel = path.resolve().relative_to(root)
+        except ValueError:
+            return None
+        if rel.parts[0] in ("tests", "test") and path.name.startswith("test_"):
+            if path.exists():
+                targets.add(rel.as_posix())
+            continue
+        if rel.parts[0] == "src" and len(rel.parts) > 1:
+            rel = Path(*rel.parts[1:])
+        modules.append(rel.as_posix())
+
+    if modules:
+        targets.update(find_affected_tests(modules, root / "tests"))
+    return sorted(targets)
+
+
+def _watch_loop(
+    tester: Command,
+    framework: Framework | None,
+    path: str,
+    watcher: FileWatcher | None = None,
+) -> None:
+    """Rerun affected tests whenever watched source files change.
+
+    Args:
+        tester: Test command used to run the suite.
+        framework: Test framework (auto-detected if None).
+        path: Project path to watch and run tests in.
+        watcher: Pre-built watcher (tests inject a polling one).
+    """
+    root = Path(path)
+    watcher = watcher or FileWatcher(root, extensions=_WATCH_EXTENSIONS)
+
+    console.print(f"[cyan]Watch mode enabled ({watcher.backend}). Press Ctrl+C to stop.[/cyan]\n")
 
-            if current_hashes != last_hashes and time.time() - last_run_time > 2:
-                changed = [f for f in current_hashes if f not in last_hashes or current_hashes[f] != last_hashes[f]]
+    with watcher:
+        while True:
+            try:
+                changed = watcher.wait()
+                if not changed:
+                    continue
                 console.print(f"\n[yellow]Changes detected in {len(changed)} files[/yellow]")
 
-                result = tester.run(framework=framework, path=path)
+                targets: list[str] | None = None
+                if framework in (None, Framework.PYTEST):
+                    targets = _select_affected_tests(root, changed)
+                    if targets == []:
+                        console.print("[dim]No tests affected[/dim]")
+                        continue
+                    if targets:
+                        console.print(f"[dim]Running {len(targets)} affected test files[/dim]")
+
+                result = tester.run(framework=framework, path=path, targets=targets)
                 if result.success:
                     console.print(f"[green]✓ {result.passed}/{result.total} tests passed[/green]")
                 else:
                     console.print(f"[red]✗ {result.failed}/{result.total} tests failed[/red]")
 
-                last_hashes = current_hashes
-                last_run_time = time.time()
-
-        except KeyboardInterrupt:
-            console.print("\n[yellow]Watch mode stopped[/yellow]")
-            break
+            except KeyboardInterrupt:
+                console.print("\n[yellow]Watch mode stopped[/yellow]")
+                break
 
 
 @click.command("test")
@@ -18,7 +18,7 @@ DEFAULT_OUTPUT = ".zerg/wiki"
 @click.option(
     "--full",
     is_flag=True,
-    help="Regenerate all pages from scratch (default: incremental)",
+    help="Regenerate all pages from scratch (default: only pages whose source changed)",
 )
 @click.option(
     "--push",
@@ -64,6 +64,7 @@ def wiki(
     from zerg.doc_engine.dependencies import DependencyMapper
     from zerg.doc_engine.detector import ComponentDetector
     from zerg.doc_engine.extractor import SymbolExtractor
+    from zerg.doc_engine.manifest import WikiManifest, content_hash, render_pages, write_if_changed
     from zerg.doc_engine.mermaid import MermaidGenerator
     from zerg.doc_engine.renderer import DocRenderer
     from zerg.doc_engine.sidebar import SidebarGenerator
@@ -100,38 +101,66 @@ def wiki(
         py_files = collect_files(project_root / "zerg", extensions={".py"}).get(".py", [])
         py_files = [f for f in py_files if not f.name.startswith("__")]
 
+        # Reuse pages whose source is unchanged since the last build; render the rest
+        manifest = WikiManifest.load(output_dir)
         pages: dict[str, str] = {}
-        generated = 0
-
+        reused: dict[Path, str] = {}
+        source_hashes: dict[Path, str] = {}
         for source_file in py_files:
-            page_name = source_file.stem
             try:
-                content = renderer.render(source_file)
-                pages[page_name] = content
-                generated += 1
+                source_hashes[source_file] = content_hash(source_file.read_bytes())
+            except OSError:
+                continue
+            if not full:
+                content = manifest.reuse(_source_key(source_file), source_hashes[source_file], output_dir)
+                if content is not None:
+                    reused[source_file] = content
 
-                if not dry_run:
-                    page_path = output_dir / f"{page_name}.md"
-                    page_path.write_text(content)
+        to_render = [f for f in py_files if f not in reused]
+        rendered = dict(zip(to_render, render_pages(renderer, to_render, project_root), strict=True))
 
-            except Exception as e:  # noqa: BLE001 — intentional: best-effort page generation; skip and continue
-                logger.warning("Failed to generate page for %s: %s", source_file, e)
+        generated = 0
+        for source_file in py_files:
+            page_name = source_file.stem
+            content = reused[source_file] if source_file in reused else rendered[source_file]
+            if content is None:
                 continue
+            pages[page_name] = content
+            generated += 1
+            if source_file in source_hashes:
+                manifest.record(_source_key(source_file), source_hashes[source_file], page_name, content)
+
+        console.print(
+            f"Generated {generated} pages from {len(py_files)} source files "
+            f"({len(to_render)} rendered, {len(reused)} unchanged)"
+        )
 
-        console.print(f"Generated {generated} pages from {len(py_files)} source files")
+        written = 0
+        if not dry_run:
+            for page_name, content in pages.items():
+                written += write_if_changed(output_dir / f"{page_name}.md", content)
 
         # Cross-references
         glossary = crossref.build_glossary(pages)
         if not dry_run and glossary:
             glossary_content = crossref.generate_glossary_page(glossary)
-            (output_dir / "Glossary.md").write_text(glossary_content)
+            written += write_if_changed(output_dir / "Glossary.md", glossary_content)
             pages["Glossary"] = glossary_content
 
         # Sidebar
         sidebar_pages = sorted(pages.keys())
         sidebar_content = sidebar_gen.generate(sidebar_pages)
         if not dry_run:
-            (output_dir / "_Sidebar.md").write_text(sidebar_content)
+            written += write_if_changed(output_dir / "_Sidebar.md", sidebar_content)
+
+            # Drop pages whose source was removed (or no longer renders)
+            outputs = set(pages) | {"_Sidebar"}
+            for stale in sorted(manifest.outputs - outputs):
+                (output_dir / f"{stale}.md").unlink(missing_ok=True)
+            current = {_source_key(f) for f in py_files}
+            manifest.sources = {src: r for src, r in manifest.sources.items() if src in current}
+            manifest.save(outputs)
+            console.print(f"Wrote {written} changed pages")
 
         console.print(f"[green]Wiki generation complete: {len(pages)} pages[/green]")
 
@@ -173,3 +202,8 @@ def wiki(
         console.print(f"\n[red]Error:[/red] {e}")
         logger.exception("Wiki command failed")
         raise SystemExit(1) from e
+
+
+def _source_key(path: Path) -> str:
+    """Manifest key for a source file: its path as given, with forward slashes."""
+    return path.as_posix()
@@ -137,6 +137,14 @@ class WorkersConfig(BaseModel):
         description="Maximum respawn attempts per worker before giving up",
     )
 
+    # Performance: reuse worktrees across levels and runs instead of re-checking out
+    worktree_pool_size: int = Field(
+        default=DEFAULT_WORKERS,
+        ge=0,
+        le=20,
+        description="Idle worker worktrees kept for reuse; 0 re-creates a worktree for every spawn",
+    )
+
 
 class PortsConfig(BaseModel):
     """Port allocation configuration."""
@@ -175,6 +183,8 @@ class LoggingConfig(BaseModel):
     ephemeral_retain_on_success: bool = False
     ephemeral_retain_on_failure: bool = True
     max_log_size_mb: int = Field(default=50, ge=1, le=1000)
+    max_log_backups: int = Field(default=5, ge=0, le=100)
+    async_writes: bool = True
     structured_output: bool = True
 
 
@@ -304,6 +314,8 @@ class HeartbeatConfig(BaseModel):
     interval_seconds: int = Field(default=15, ge=5, le=300)
     stall_timeout_seconds: int = Field(default=120, ge=30, le=600)
     max_restarts: int = Field(default=2, ge=0, le=5)
+    # Also write heartbeat-{id}.json / progress-{id}.json next to the shared status table
+    json_export: bool = Field(default=True)
 
 
 class EscalationConfig(BaseModel):
@@ -396,6 +408,10 @@ class RushConfig(BaseModel):
         default=True,
         description="Run quality gates only at ship time, not after each level",
     )
+    speculative_merge: bool = Field(
+        default=False,
+        description="Merge worker branches and pre-run gates as tasks complete, ahead of the level barrier",
+    )
 
 
 class ZergConfig(BaseModel):
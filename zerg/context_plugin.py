@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 import os
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from zerg.command_splitter import CommandSplitter
 from zerg.efficiency import CompactFormatter
@@ -14,6 +14,9 @@ from zerg.plugins import ContextPlugin
 from zerg.security.rules import filter_rules_for_files, summarize_rules
 from zerg.spec_loader import SpecLoader
 
+if TYPE_CHECKING:
+    from zerg.rules import RuleInjector
+
 logger = logging.getLogger(__name__)
 
 # Default location for security rules within a project
@@ -40,6 +43,8 @@ class ContextEngineeringPlugin(ContextPlugin):
         self._config = config or ContextEngineeringConfig()
         self._splitter = CommandSplitter()
         self._formatter: CompactFormatter | None = self._init_formatter()
+        # Shared across tasks so the compiled rule index is built once per run
+        self._rule_injector: RuleInjector | None = None
 
     @staticmethod
     def _init_formatter() -> CompactFormatter | None:
@@ -234,8 +239,11 @@ class ContextEngineeringPlugin(ContextPlugin):
 
             breakdown: dict[str, int] = {}
             mode = "estimated"
-            for component_name, component_text in context_components.items():
-                result = counter.count(component_text)
+            try:
+                results = counter.count_many(list(context_components.values()))
+            finally:
+                counter.close()
+            for component_name, result in zip(context_components, results, strict=True):
                 breakdown[component_name] = result.count
                 mode = result.mode
 
@@ -326,9 +334,11 @@ class ContextEngineeringPlugin(ContextPlugin):
             Markdown section string, or empty string on failure.
         """
         try:
-            from zerg.rules import RuleInjector
+            if self._rule_injector is None:
+                from zerg.rules import RuleInjector
 
-            injector = RuleInjector()
+                self._rule_injector = RuleInjector()
+            injector = self._rule_injector
             task: dict[str, Any] = {"files": {"create": file_paths, "modify": []}}
             section = injector.inject_rules(task, max_tokens=max_tokens)
             if section:
@@ -28,7 +28,7 @@ from zerg.diagnostics.hypothesis_engine import (
     HypothesisTestRunner,
 )
 from zerg.diagnostics.knowledge_base import KNOWN_PATTERNS, KnownPattern, PatternMatcher
-from zerg.diagnostics.log_analyzer import LogAnalyzer, LogPattern
+from zerg.diagnostics.log_analyzer import LogAnalyzer, LogPattern, WorkerLogs
 from zerg.diagnostics.log_correlator import (
     CrossWorkerCorrelator,
     ErrorEvolutionTracker,
@@ -36,6 +36,7 @@ from zerg.diagnostics.log_correlator import (
     TemporalClusterer,
     TimelineBuilder,
 )
+from zerg.diagnostics.pipeline import Probe, ProbeOutcome, ProbePipeline, SharedCommands
 from zerg.diagnostics.recovery import RecoveryPlan, RecoveryPlanner, RecoveryStep
 from zerg.diagnostics.state_introspector import ZergHealthReport, ZergStateIntrospector
 from zerg.diagnostics.system_diagnostics import SystemDiagnostics, SystemHealthReport
@@ -80,17 +81,22 @@ __all__ = [
     "LogPattern",
     "MultiLangErrorParser",
     "PatternMatcher",
+    "Probe",
+    "ProbeOutcome",
+    "ProbePipeline",
     "PythonEnvDiagnostics",
     "RecoveryPlan",
     "RecoveryPlanner",
     "RecoveryStep",
     "ResourceDiagnostics",
     "ScoredHypothesis",
+    "SharedCommands",
     "SystemDiagnostics",
     "SystemHealthReport",
     "TemporalClusterer",
     "TimelineBuilder",
     "TimelineEvent",
+    "WorkerLogs",
     "ZergHealthReport",
     "ZergStateIntrospector",
 ]
@@ -2,19 +2,33 @@
 
 from __future__ import annotations
 
+import contextlib
+import importlib.machinery
+import importlib.metadata
+import importlib.util
 import json
 import os
+import queue
+import re
 import shutil
+import site
 import subprocess
 import sys
+import sysconfig
+import tempfile
+import threading
 from pathlib import Path
-from typing import Any
+from typing import IO, TYPE_CHECKING, Any
 
+from zerg.constants import STATE_DIR
 from zerg.diagnostics.types import Evidence
 from zerg.json_utils import loads as json_loads
 from zerg.logging import get_logger
 from zerg.types import DiagnosticResultDict
 
+if TYPE_CHECKING:
+    from zerg.diagnostics.pipeline import SharedCommands
+
 __all__ = [
     "ConfigValidator",
     "DockerDiagnostics",
@@ -26,11 +40,64 @@ __all__ = [
 logger = get_logger("diagnostics.env")
 
 
+# Run in one child interpreter by check_imports: imports (argv[2] == "import")
+# or only locates (argv[2] == "find") every module named in argv[1] (a JSON
+# list) and prints one JSON line per module as it finishes, so a module that
+# hangs or crashes the interpreter is identified by the lines that came before
+# it. Output from the imported modules themselves goes to a throwaway buffer.
+_IMPORT_PROBE = """\
+import importlib, importlib.util, io, json, sys
+out = sys.stdout
+sys.stdout = io.StringIO()
+for name in json.loads(sys.argv[1]):
+    try:
+        if sys.argv[2] == "find":
+            found = importlib.util.find_spec(name) is not None
+            error = None if found else f"ModuleNotFoundError: No module named '{name}'"
+        else:
+            importlib.import_module(name)
+            error = None
+    except BaseException as e:
+        error = f"{type(e).__name__}: {e}"
+    out.write(json.dumps({"module": name, "error": error}) + "\\n")
+    out.flush()
+"""
+
+_PROBE_CACHE_VERSION = 2
+
+
+def _normalize_name(name: str) -> str:
+    """PEP 503 normalized distribution name."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _pump_lines(stream: IO[str], lines: queue.Queue[str | None]) -> None:
+    """Forward *stream* line by line into *lines*, then None at end of file."""
+    with stream:
+        for line in stream:
+            lines.put(line)
+    lines.put(None)
+
+
 class PythonEnvDiagnostics:
-    """Diagnostics for the Python environment."""
+    """Diagnostics for the Python environment.
+
+    Packages are listed in process from ``importlib.metadata`` and top-level
+    module presence is checked with ``importlib.util.find_spec``; submodules
+    (whose lookup imports their parents) and real import tests run in a single
+    child interpreter. Package listings and successful imports of modules
+    installed in site-packages or the standard library are cached in
+    ``.zerg/state/env-probe-cache.json``, keyed on the interpreter path and
+    the modification times of its site-packages directories.
+    """
 
     SUBPROCESS_TIMEOUT = 5
 
+    def __init__(self, cache_path: Path | None = None) -> None:
+        self._cache_path = cache_path or Path(STATE_DIR) / "env-probe-cache.json"
+        self._cache: dict[str, Any] | None = None
+        self._cache_key_value = ""
+
     def _run_cmd(self, cmd: list[str]) -> tuple[str, bool]:
         """Run a command with timeout, return (stdout, success)."""
         try:
@@ -62,51 +129,211 @@ class PythonEnvDiagnostics:
             "count": 0,
         }
 
-        stdout, ok = self._run_cmd([sys.executable, "-m", "pip", "list", "--format=json"])
-        if not ok:
-            logger.warning("Failed to list pip packages")
-            return result
+        cache = self._load_cache()
+        installed_list: list[dict[str, str]] | None = cache.get("packages")
+        if installed_list is None:
+            installed_list = []
+            seen: set[str] = set()
+            # First distribution on sys.path wins, as for imports
+            for dist in importlib.metadata.distributions():
+                name = dist.metadata["Name"] or ""
+                if not name or _normalize_name(name) in seen:
+                    continue
+                seen.add(_normalize_name(name))
+                installed_list.append({"name": name, "version": dist.version or ""})
+            installed_list.sort(key=lambda pkg: pkg["name"].lower())
+            cache["packages"] = installed_list
+            self._save_cache()
 
-        try:
-            packages = json_loads(stdout)
-        except (json.JSONDecodeError, ValueError):
-            logger.warning("Failed to parse pip list output")
-            return result
-
-        installed_list: list[dict[str, str]] = [
-            {"name": pkg.get("name", ""), "version": pkg.get("version", "")} for pkg in packages
-        ]
         result["installed"] = installed_list
         result["count"] = len(installed_list)
 
         if required:
-            installed_names = {pkg["name"].lower() for pkg in installed_list}
-            result["missing"] = [name for name in required if name.lower() not in installed_names]
+            installed_names = {_normalize_name(pkg["name"]) for pkg in installed_list}
+            result["missing"] = [name for name in required if _normalize_name(name) not in installed_names]
 
         return result
 
-    def check_imports(self, modules: list[str]) -> dict[str, Any]:
-        """Check whether Python modules can be imported."""
-        success: list[str] = []
-        failed: list[dict[str, str]] = []
+    def check_imports(self, modules: list[str], import_test: bool = True) -> dict[str, Any]:
+        """Check whether Python modules can be imported.
+
+        Args:
+            modules: Module names, dotted names allowed.
+            import_test: Actually import the modules that are present, in one
+                child interpreter, to catch errors raised at import time. When
+                False only presence is checked (``find_spec``).
+        """
+        errors: dict[str, str | None] = {}
+        to_import: list[str] = []
+        to_find: list[str] = []
+        cacheable: set[str] = set()
+        cache = self._load_cache()
+        imported_ok: list[str] = cache.setdefault("imported", [])
 
         for module in modules:
-            stdout, ok = self._run_cmd([sys.executable, "-c", f"import {module}"])
-            if ok:
-                success.append(module)
+            # Only top-level names are looked up here: finding a submodule
+            # imports its parent packages into this process
+            top = module.partition(".")[0]
+            try:
+                spec = importlib.util.find_spec(top)
+            except Exception as e:  # noqa: BLE001 — intentional: an unresolvable module is a failure
+                errors[module] = f"{type(e).__name__}: {e}"
+                continue
+            if spec is None:
+                errors[module] = f"ModuleNotFoundError: No module named '{top}'"
+            elif import_test and module in imported_ok:
+                errors[module] = None
+            elif import_test:
+                to_import.append(module)
+                if self._is_installed(spec):
+                    cacheable.add(module)
+            elif module != top:
+                to_find.append(module)
             else:
-                failed.append({"module": module, "error": stdout or "import failed"})
-
+                errors[module] = None
+
+        if to_find:
+            errors.update(self._probe_in_child(to_find, "find"))
+        if to_import:
+            imported = self._probe_in_child(to_import, "import")
+            errors.update(imported)
+            # Failures are not cached: they are often fixed without touching
+            # site-packages (a missing environment variable, a local file)
+            fresh = [m for m, error in imported.items() if error is None and m in cacheable]
+            if fresh:
+                imported_ok.extend(fresh)
+                self._save_cache()
+
+        success = [m for m in modules if errors[m] is None]
+        failed = [{"module": m, "error": error} for m in modules if (error := errors[m]) is not None]
         return {"success": success, "failed": failed}
 
+    def _probe_in_child(self, modules: list[str], mode: str) -> dict[str, str | None]:
+        """Import or find *modules* in one child interpreter; return ``{module: error or None}``.
+
+        The child reports each module as it finishes. A module not reported
+        within SUBPROCESS_TIMEOUT of the previous one, or that kills the
+        child, is reported as failed and the remaining modules are probed in
+        a new child.
+        """
+        results: dict[str, str | None] = {}
+        pending = list(modules)
+        while pending:
+            cmd = [sys.executable, "-c", _IMPORT_PROBE, json.dumps(pending), mode]
+            try:
+                proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+            except OSError as e:
+                logger.warning(f"Import check failed to start: {e}")
+                results.update(dict.fromkeys(pending, str(e)))
+                break
+
+            assert proc.stdout is not None
+            lines: queue.Queue[str | None] = queue.Queue()
+            threading.Thread(target=_pump_lines, args=(proc.stdout, lines), daemon=True).start()
+            while True:
+                try:
+                    line = lines.get(timeout=self.SUBPROCESS_TIMEOUT)
+                except queue.Empty:
+                    proc.kill()
+                    problem = f"import timed out after {self.SUBPROCESS_TIMEOUT}s"
+                    break
+                if line is None:
+                    problem = f"interpreter exited with code {proc.wait()}"
+                    break
+                try:
+                    record = json_loads(line)
+                    results[record["module"]] = record["error"]
+                except (ValueError, KeyError, TypeError):
+                    continue
+            proc.wait()
+
+            pending = [m for m in pending if m not in results]
+            if pending:
+                # The first unreported module is the one that was being probed
+                results[pending.pop(0)] = problem
+        return results
+
+    def _is_installed(self, spec: importlib.machinery.ModuleSpec) -> bool:
+        """Whether *spec* resolves inside site-packages or the standard library.
+
+        Only those results are cached: the cache key tracks site-packages, not
+        modules imported from the working tree.
+        """
+        origin = spec.origin
+        if origin in ("built-in", "frozen"):
+            return True
+        if not origin:
+            return False
+        roots = [*self._site_dirs(), sysconfig.get_paths()["stdlib"]]
+        return any(origin.startswith(os.path.join(root, "")) for root in roots)
+
+    @staticmethod
+    def _site_dirs() -> list[str]:
+        paths = sysconfig.get_paths()
+        dirs = {paths["purelib"], paths["platlib"]}
+        if site.ENABLE_USER_SITE and site.USER_SITE:
+            dirs.add(site.USER_SITE)
+        return sorted(dirs)
+
+    def _cache_key(self) -> str:
+        parts = [sys.executable]
+        for path in self._site_dirs():
+            try:
+                parts.append(f"{path}:{os.stat(path).st_mtime_ns}")
+            except OSError:
+                parts.append(f"{path}:-")
+        return "|".join(parts)
+
+    def _load_cache(self) -> dict[str, Any]:
+        """Return the cached probe results for the current interpreter state."""
+        if self._cache is not None:
+            return self._cache
+        self._cache = {}
+        self._cache_key_value = self._cache_key()
+        try:
+            data = json_loads(self._cache_path.read_text())
+            results = data.get("results")
+            if (
+                data.get("version") == _PROBE_CACHE_VERSION
+                and data.get("key") == self._cache_key_value
+                and isinstance(results, dict)
+            ):
+                self._cache = results
+        except (OSError, ValueError, AttributeError):
+            logger.debug(f"No usable environment probe cache at {self._cache_path}")
+        return self._cache
+
+    def _save_cache(self) -> None:
+        """Atomically persist the probe cache, if the state directory exists."""
+        if self._cache is None or not self._cache_path.parent.is_dir():
+            return
+        payload = {"version": _PROBE_CACHE_VERSION, "key": self._cache_key_value, "results": self._cache}
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=str(self._cache_path.parent), suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, self._cache_path)
+        except OSError:
+            logger.debug("Could not save environment probe cache", exc_info=True)
+            if tmp_path is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_path)
+
 
 class DockerDiagnostics:
     """Diagnostics for Docker environment."""
 
     SUBPROCESS_TIMEOUT = 5
 
+    def __init__(self, commands: SharedCommands | None = None) -> None:
+        """Initialize; *commands* shares command output with other engines."""
+        self._commands = commands
+
     def _run_cmd(self, cmd: list[str]) -> tuple[str, bool]:
         """Run a command with timeout, return (stdout, success)."""
+        if self._commands is not None:
+            return self._commands.run(cmd, self.SUBPROCESS_TIMEOUT)
         try:
             result = subprocess.run(
                 cmd,
@@ -200,8 +427,14 @@ class ResourceDiagnostics:
 
     SUBPROCESS_TIMEOUT = 5
 
+    def __init__(self, commands: SharedCommands | None = None) -> None:
+        """Initialize; *commands* shares command output with other engines."""
+        self._commands = commands
+
     def _run_cmd(self, cmd: list[str]) -> tuple[str, bool]:
         """Run a command with timeout, return (stdout, success)."""
+        if self._commands is not None:
+            return self._commands.run(cmd, self.SUBPROCESS_TIMEOUT)
         try:
             result = subprocess.run(
                 cmd,
@@ -389,10 +622,10 @@ class ConfigValidator:
 class EnvDiagnosticsEngine:
     """Facade that runs all environment diagnostics and collects evidence."""
 
-    def __init__(self) -> None:
+    def __init__(self, commands: SharedCommands | None = None) -> None:
         self._python = PythonEnvDiagnostics()
-        self._docker = DockerDiagnostics()
-        self._resources = ResourceDiagnostics()
+        self._docker = DockerDiagnostics(commands)
+        self._resources = ResourceDiagnostics(commands)
         self._config = ConfigValidator()
 
     def run_all(self, config_path: Path | None = None) -> DiagnosticResultDict:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -757,14 +758,181 @@ KNOWN_PATTERNS: list[KnownPattern] = _PYTHON_PATTERNS + _ZERG_PATTERNS + _GENERA
 # ---------------------------------------------------------------------------
 
 
+# Non-ASCII characters that re.IGNORECASE matches against ASCII letters
+_ASCII_FOLD = str.maketrans({"İ": "i", "ı": "i", "ſ": "s", "K": "k"})
+_QUANTIFIERS = "*?+{"
+
+
+def _skip_group(regex: str, i: int, open_char: str, close_char: str) -> int:
+    """Return the index just past the group or class opened at *i*."""
+    depth = 0
+    while i < len(regex):
+        c = regex[i]
+        if c == "\\":
+            i += 2
+            continue
+        if open_char == "(" and c == "[":
+            i = _skip_group(regex, i, "[", "]")
+            continue
+        if c == open_char and (open_char == "(" or depth == 0):
+            depth += 1
+            if open_char == "[" and regex[i + 1 : i + 2] == "]":
+                i += 1  # "[]...]": a leading ] is literal
+        elif c == close_char:
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return i
+
+
+def _atoms(regex: str) -> list[tuple[str | None, str]]:
+    """Split *regex* into ``(literal_char_or_None, quantifier)`` atoms.
+
+    Groups, classes, ``.``, anchors and escapes other than escaped
+    punctuation become ``None`` atoms. A top-level ``|`` yields a single
+    ``("|", "")`` marker.
+    """
+    atoms: list[tuple[str | None, str]] = []
+    i = 0
+    while i < len(regex):
+        c = regex[i]
+        atom: str | None = None
+        if c == "\\" and i + 1 < len(regex):
+            if not regex[i + 1].isalnum():
+                atom = regex[i + 1]
+            i += 2
+        elif c == "(":
+            i = _skip_group(regex, i, "(", ")")
+        elif c == "[":
+            i = _skip_group(regex, i, "[", "]")
+        elif c == "|":
+            atoms.append(("|", ""))
+            i += 1
+            continue
+        elif c in ".^$" + _QUANTIFIERS:
+            i += 1
+        else:
+            atom = c
+            i += 1
+
+        start = i
+        if i < len(regex) and regex[i] in _QUANTIFIERS:
+            # The quantifier plus any lazy/possessive suffix
+            i = regex.index("}", i) + 1 if regex[i] == "{" and "}" in regex[i:] else i + 1
+            if i < len(regex) and regex[i] in "?+":
+                i += 1
+        atoms.append((atom, regex[start:i]))
+    return atoms
+
+
+def required_literals(regex: str) -> tuple[str, ...]:
+    """Return lowercase literal substrings every match of *regex* must contain.
+
+    Conservative: anything the scanner does not understand (groups, classes,
+    escapes other than escaped punctuation) ends the current literal run, and
+    a top-level alternation yields an empty tuple, meaning "no prefilter".
+    """
+    runs: list[str] = []
+    run: list[str] = []
+    for atom, quantifier in _atoms(regex):
+        if atom == "|" and not quantifier:
+            return ()
+        if atom is not None and (not quantifier or quantifier.startswith("+")):
+            run.append(atom.lower())  # "x+" still needs one x
+        if atom is None or quantifier:
+            runs.append("".join(run))
+            run = []
+    runs.append("".join(run))
+    return tuple(dict.fromkeys(r for r in runs if len(r) >= 3 and r.isascii()))
+
+
+def _split_alternatives(regex: str) -> list[str]:
+    """Split *regex* at top-level ``|``; unsplittable regexes come back whole."""
+    if "(?" in regex or re.search(r"\\\d", regex):
+        return [regex]  # Inline flags or backreferences depend on the whole pattern
+    branches: list[str] = []
+    start = i = 0
+    while i < len(regex):
+        c = regex[i]
+        if c == "\\":
+            i += 2
+            continue
+        if c in "([":
+            i = _skip_group(regex, i, c, ")" if c == "(" else "]")
+            continue
+        if c == "|":
+            branches.append(regex[start:i])
+            start = i + 1
+        i += 1
+    branches.append(regex[start:])
+    return branches
+
+
+@dataclass
+class _SymptomBranch:
+    """One top-level alternative of a symptom regex, with its prefilter."""
+
+    regex: re.Pattern[str]
+    literals: tuple[str, ...]
+    plain: str | None  # the whole branch, if it is a plain literal
+    prefix: str | None  # literal every match starts with
+
+    @classmethod
+    def build(cls, branch: str) -> _SymptomBranch:
+        atoms = _atoms(branch)
+        text = "".join(a for a, _ in atoms if a is not None).lower()
+        literal_only = atoms and not any(a is None or a == "|" or q for a, q in atoms)
+        plain = text if literal_only and text.isascii() else None
+        prefix: list[str] = []
+        for atom, quantifier in atoms:
+            if atom is None or atom == "|" or (quantifier and not quantifier.startswith("+")):
+                break
+            prefix.append(atom.lower())
+            if quantifier:
+                break
+        head = "".join(prefix)
+        return cls(
+            regex=re.compile(branch, re.IGNORECASE),
+            literals=required_literals(branch),
+            plain=plain,
+            prefix=head if len(head) >= 3 and head.isascii() else None,
+        )
+
+    def search(self, text: str, folded: str, find: Callable[[str], int]) -> bool:
+        """Return True if the branch matches *text* (*folded* is its case-folded copy)."""
+        if any(find(lit) < 0 for lit in self.literals):
+            return False
+        if self.plain is not None:
+            return find(self.plain) >= 0
+        if self.prefix is None:
+            return self.regex.search(text) is not None
+        # Every match starts at an occurrence of the prefix
+        pos = find(self.prefix)
+        while pos >= 0:
+            if self.regex.match(text, pos):
+                return True
+            pos = folded.find(self.prefix, pos + 1)
+        return False
+
+
 class PatternMatcher:
-    """Match error text against known failure patterns."""
+    """Match error text against known failure patterns.
+
+    Symptom regexes are split into top-level alternatives, each paired with
+    the literal substrings it requires. ``match`` case-folds the text once
+    and looks each literal up at most once; regexes only run for branches
+    whose literals are all present, and only at occurrences of their literal
+    prefix where they have one.
+    """
 
     def __init__(self) -> None:
         self._patterns = KNOWN_PATTERNS
-        self._compiled: dict[str, list[re.Pattern[str]]] = {}
+        self._branches: dict[str, list[list[_SymptomBranch]]] = {}
         for pattern in self._patterns:
-            self._compiled[pattern.name] = [re.compile(s, re.IGNORECASE) for s in pattern.symptoms]
+            self._branches[pattern.name] = [
+                [_SymptomBranch.build(b) for b in _split_alternatives(s)] for s in pattern.symptoms
+            ]
 
     def match(self, error_text: str) -> list[tuple[KnownPattern, float]]:
         """Return matched patterns with match scores (0-1).
@@ -773,11 +941,20 @@ class PatternMatcher:
         Only patterns with at least one matching symptom are returned.
         Results are sorted by score descending.
         """
+        # translate() keeps lengths equal, so offsets in folded are offsets in error_text
+        folded = (error_text if error_text.isascii() else error_text.translate(_ASCII_FOLD)).lower()
+        first: dict[str, int] = {}
+
+        def find(literal: str) -> int:
+            if literal not in first:
+                first[literal] = folded.find(literal)
+            return first[literal]
+
         results: list[tuple[KnownPattern, float]] = []
         for pattern in self._patterns:
-            compiled = self._compiled[pattern.name]
-            total = len(compiled)
-            matched = sum(1 for rx in compiled if rx.search(error_text))
+            symptoms = self._branches[pattern.name]
+            total = len(symptoms)
+            matched = sum(1 for branches in symptoms if any(b.search(error_text, folded, find) for b in branches))
             if matched > 0:
                 score = matched / total
                 results.append((pattern, score))
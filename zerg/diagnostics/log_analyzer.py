@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -35,6 +36,45 @@ class LogPattern:
         }
 
 
+class WorkerLogs:
+    """Worker log files read once and shared between analyzers.
+
+    ``zerg debug`` runs LogAnalyzer and the log correlator concurrently over
+    the same files; giving both one WorkerLogs means each file is read once.
+    Contents are kept for the life of the object, so create a new one to see
+    later writes.
+    """
+
+    def __init__(self, logs_dir: Path | str = Path(".zerg/logs")) -> None:
+        self.logs_dir = Path(logs_dir)
+        self._lock = threading.Lock()
+        self._contents: dict[Path, str | OSError] = {}
+
+    def read(self, path: Path) -> str:
+        """Return the contents of *path*, reading it on first use.
+
+        Raises:
+            OSError: If the file could not be read (also on later calls).
+        """
+        with self._lock:
+            if path not in self._contents:
+                try:
+                    self._contents[path] = path.read_text(encoding="utf-8", errors="replace")
+                except OSError as e:
+                    self._contents[path] = e
+            content = self._contents[path]
+        if isinstance(content, OSError):
+            raise content
+        return content
+
+
+def read_log(path: Path, logs: WorkerLogs | None) -> str:
+    """Read a worker log file, through *logs* when it covers the file's directory."""
+    if logs is not None and path.parent == logs.logs_dir:
+        return logs.read(path)
+    return path.read_text(encoding="utf-8", errors="replace")
+
+
 class LogAnalyzer:
     """Analyze worker logs for error patterns and correlations."""
 
@@ -43,8 +83,9 @@ class LogAnalyzer:
     # Lines that indicate errors
     ERROR_INDICATORS = re.compile(r"(?i)(error|exception|traceback|failed|fatal|panic|abort|segfault)")
 
-    def __init__(self, logs_dir: Path | str = Path(".zerg/logs")) -> None:
+    def __init__(self, logs_dir: Path | str = Path(".zerg/logs"), logs: WorkerLogs | None = None) -> None:
         self.logs_dir = Path(logs_dir)
+        self.logs = logs
 
     def _strip_ansi(self, text: str) -> str:
         """Remove ANSI escape codes from text."""
@@ -75,7 +116,7 @@ class LogAnalyzer:
                 continue
 
             try:
-                content = log_file.read_text(encoding="utf-8", errors="replace")
+                content = read_log(log_file, self.logs)
             except OSError as e:
                 logger.warning(f"Failed to read {log_file}: {e}")
                 continue
@@ -131,7 +172,7 @@ class LogAnalyzer:
                 continue
 
             try:
-                content = log_file.read_text(encoding="utf-8", errors="replace")
+                content = read_log(log_file, self.logs)
             except OSError:
                 continue
 
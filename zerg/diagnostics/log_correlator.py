@@ -7,7 +7,7 @@ import re
 from pathlib import Path
 from typing import Any
 
-from zerg.diagnostics.log_analyzer import LogAnalyzer, LogPattern
+from zerg.diagnostics.log_analyzer import LogAnalyzer, LogPattern, WorkerLogs, read_log
 from zerg.diagnostics.types import Evidence, TimelineEvent
 from zerg.json_utils import loads as json_loads
 from zerg.logging import get_logger
@@ -82,11 +82,12 @@ def _jaccard(a: set[str], b: set[str]) -> float:
 class TimelineBuilder:
     """Build a chronological timeline of events from worker log files."""
 
-    def build(self, logs_dir: Path) -> list[TimelineEvent]:
+    def build(self, logs_dir: Path, logs: WorkerLogs | None = None) -> list[TimelineEvent]:
         """Read all worker log files and produce a sorted timeline.
 
         Args:
             logs_dir: Directory containing worker-*.stderr.log / worker-*.stdout.log.
+            logs: Shared reader for the files in *logs_dir*, if any.
 
         Returns:
             Sorted list of TimelineEvent objects.
@@ -103,17 +104,17 @@ class TimelineBuilder:
             wid = _parse_worker_id(log_file.name)
             if wid < 0:
                 continue
-            file_events = self._parse_file(log_file, wid)
+            file_events = self._parse_file(log_file, wid, logs)
             events.extend(file_events)
 
         # Sort by timestamp string (ISO sorts lexicographically)
         events.sort(key=lambda e: e.timestamp)
         return events
 
-    def _parse_file(self, path: Path, worker_id: int) -> list[TimelineEvent]:
+    def _parse_file(self, path: Path, worker_id: int, logs: WorkerLogs | None = None) -> list[TimelineEvent]:
         """Parse a single log file into timeline events."""
         try:
-            content = path.read_text(encoding="utf-8", errors="replace")
+            content = read_log(path, logs)
         except OSError as exc:
             logger.warning("Failed to read %s: %s", path, exc)
             return []
@@ -373,13 +374,14 @@ class ErrorEvolutionTracker:
 class LogCorrelationEngine:
     """Facade for cross-worker log correlation analysis."""
 
-    def __init__(self, logs_dir: Path | str = Path(".zerg/logs")) -> None:
+    def __init__(self, logs_dir: Path | str = Path(".zerg/logs"), logs: WorkerLogs | None = None) -> None:
         self.logs_dir = Path(logs_dir)
+        self.logs = logs
         self._timeline_builder = TimelineBuilder()
         self._clusterer = TemporalClusterer()
         self._correlator = CrossWorkerCorrelator()
         self._evolution_tracker = ErrorEvolutionTracker()
-        self._log_analyzer = LogAnalyzer(self.logs_dir)
+        self._log_analyzer = LogAnalyzer(self.logs_dir, logs)
 
     def analyze(
         self,
@@ -398,7 +400,7 @@ class LogCorrelationEngine:
         target_dir = logs_dir or self.logs_dir
 
         # Build timeline
-        all_events = self._timeline_builder.build(target_dir)
+        all_events = self._timeline_builder.build(target_dir, self.logs)
         if worker_id is not None:
             all_events = [e for e in all_events if e.worker_id == worker_id]
 
@@ -409,7 +411,7 @@ class LogCorrelationEngine:
         correlations = self._correlator.correlate(all_events)
 
         # Error evolution
-        analyzer = LogAnalyzer(target_dir)
+        analyzer = LogAnalyzer(target_dir, self.logs)
         patterns = analyzer.scan_worker_logs(worker_id=worker_id)
         evolution = self._evolution_tracker.track(patterns)
 
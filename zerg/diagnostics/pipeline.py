@@ -0,0 +1,207 @@
+"""Concurrent diagnostics pipeline for ``zerg debug``.
+
+The diagnostics engines mostly wait on subprocesses (git, docker, df,
+sysctl) and files, so ``zerg debug`` runs them as a small task graph on
+threads instead of one after another:
+
+* a :class:`Probe` names its dependencies; it starts as soon as they have
+  finished (successfully or not) and receives their :class:`ProbeOutcome`;
+* every probe has its own deadline and the whole run has a time budget.
+  A probe that misses either is reported as timed out and its thread is
+  abandoned. Probe threads are daemons, so an abandoned probe does not keep
+  the process alive past the budget; probes not started when the budget
+  runs out are skipped;
+* probes never touch shared results. The caller applies outcomes in a
+  fixed order, so the report does not depend on which probe finished first.
+
+:class:`SharedCommands` lets engines that run the same command (``docker
+info`` is checked by both the system and the environment diagnostics) share
+one execution.
+"""
+
+from __future__ import annotations
+
+import math
+import subprocess
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass
+from typing import Any
+
+from zerg.logging import get_logger
+
+__all__ = ["Probe", "ProbeOutcome", "ProbePipeline", "SharedCommands"]
+
+logger = get_logger("diagnostics.pipeline")
+
+
+@dataclass(frozen=True)
+class Probe:
+    """One diagnostic step.
+
+    Attributes:
+        name: Unique name; other probes refer to it in ``deps``.
+        run: Called with the outcomes of ``deps`` by name; returns the value.
+        deps: Probes that must finish first.
+        timeout: Seconds the probe may run, or None for the pipeline budget only.
+    """
+
+    name: str
+    run: Callable[[Mapping[str, ProbeOutcome]], Any]
+    deps: tuple[str, ...] = ()
+    timeout: float | None = None
+
+
+@dataclass
+class ProbeOutcome:
+    """Result of one probe: its value, or why there is none."""
+
+    name: str
+    value: Any = None
+    error: str | None = None
+    elapsed: float = 0.0
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """Whether the probe returned a value."""
+        return self.error is None
+
+
+class ProbePipeline:
+    """Run probes concurrently in dependency order within a time budget."""
+
+    def __init__(self, probes: Iterable[Probe], budget: float | None = None, max_workers: int | None = None) -> None:
+        """Initialize the pipeline.
+
+        Args:
+            probes: Probes to run. Dependencies must name probes listed earlier.
+            budget: Seconds for the whole run, or None for no limit.
+            max_workers: Probes running at once. Defaults to one per probe, so
+                no ready probe waits for a thread.
+
+        Raises:
+            ValueError: On duplicate names or a dependency on an unknown or
+                later probe.
+        """
+        self.probes: dict[str, Probe] = {}
+        for probe in probes:
+            if probe.name in self.probes:
+                raise ValueError(f"Duplicate probe: {probe.name}")
+            missing = [dep for dep in probe.deps if dep not in self.probes]
+            if missing:
+                raise ValueError(f"Probe {probe.name} depends on unknown probe(s): {', '.join(missing)}")
+            self.probes[probe.name] = probe
+        self.budget = budget
+        self.max_workers = max_workers
+
+    def run(self) -> dict[str, ProbeOutcome]:
+        """Run every probe and return the outcomes by name."""
+        outcomes: dict[str, ProbeOutcome] = {}
+        if not self.probes:
+            return outcomes
+
+        started = time.monotonic()
+        budget_deadline = started + self.budget if self.budget is not None else math.inf
+        pending = dict(self.probes)
+        running: dict[Future[tuple[Any, float]], tuple[Probe, float, float]] = {}
+        max_running = self.max_workers or len(self.probes)
+        while pending or running:
+            now = time.monotonic()
+            for name, probe in list(pending.items()):
+                if not all(dep in outcomes for dep in probe.deps):
+                    continue
+                if now >= budget_deadline:
+                    del pending[name]
+                    outcomes[name] = ProbeOutcome(name, error="skipped: time budget exhausted", timed_out=True)
+                    continue
+                if len(running) >= max_running:
+                    continue
+                del pending[name]
+                inputs = {dep: outcomes[dep] for dep in probe.deps}
+                deadline = min(budget_deadline, now + probe.timeout if probe.timeout is not None else math.inf)
+                running[_start(probe, inputs)] = (probe, now, deadline)
+            if not running:
+                continue  # everything left was skipped; dependents resolve on the next pass
+
+            next_deadline = min(deadline for _probe, _start_time, deadline in running.values())
+            wait_for = None if next_deadline == math.inf else max(0.0, next_deadline - time.monotonic())
+            done, _ = wait(running, timeout=wait_for, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                probe, _start_time, _deadline = running.pop(future)
+                try:
+                    value, elapsed = future.result()
+                    outcomes[probe.name] = ProbeOutcome(probe.name, value=value, elapsed=elapsed)
+                except Exception as e:  # noqa: BLE001 — intentional: a failed probe is reported, not fatal
+                    outcomes[probe.name] = ProbeOutcome(probe.name, error=str(e) or type(e).__name__)
+
+            now = time.monotonic()
+            for future, (probe, start, deadline) in list(running.items()):
+                if now >= deadline:
+                    # The probe's daemon thread is abandoned; its result is ignored
+                    del running[future]
+                    elapsed = now - start
+                    logger.warning(f"Diagnostic probe {probe.name!r} timed out after {elapsed:.1f}s")
+                    outcomes[probe.name] = ProbeOutcome(
+                        probe.name, error=f"timed out after {elapsed:.1f}s", elapsed=elapsed, timed_out=True
+                    )
+        return outcomes
+
+
+def _start(probe: Probe, inputs: Mapping[str, ProbeOutcome]) -> Future[tuple[Any, float]]:
+    """Run *probe* on a daemon thread; the future resolves with (value, elapsed)."""
+    future: Future[tuple[Any, float]] = Future()
+    future.set_running_or_notify_cancel()
+
+    def target() -> None:
+        start = time.monotonic()
+        try:
+            value = probe.run(inputs)
+        except BaseException as e:  # noqa: BLE001 — intentional: handed to the pipeline through the future
+            future.set_exception(e)
+        else:
+            future.set_result((value, time.monotonic() - start))
+
+    threading.Thread(target=target, name=f"zerg-probe-{probe.name}", daemon=True).start()
+    return future
+
+
+class SharedCommands:
+    """Run each distinct command once and share its output between engines.
+
+    Concurrent callers of a command that is already running wait for that
+    run instead of starting their own.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._results: dict[tuple[str, ...], Future[tuple[str, bool]]] = {}
+
+    def run(self, cmd: list[str], timeout: float) -> tuple[str, bool]:
+        """Run *cmd* (or reuse its earlier run), return (stdout, success)."""
+        key = tuple(cmd)
+        with self._lock:
+            future = self._results.get(key)
+            owner = future is None
+            if future is None:
+                future = self._results[key] = Future()
+        if owner:
+            try:
+                result = _run_cmd(cmd, timeout)
+            except BaseException as e:  # noqa: BLE001 — intentional: waiters must see the failure, not block
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+        return future.result()
+
+
+def _run_cmd(cmd: list[str], timeout: float) -> tuple[str, bool]:
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+        return result.stdout.strip(), result.returncode == 0
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError) as e:
+        logger.warning(f"Command failed: {cmd!r}: {e}")
+        return "", False
@@ -13,6 +13,7 @@ from zerg.logging import get_logger
 
 if TYPE_CHECKING:
     from zerg.config import ZergConfig
+    from zerg.diagnostics.pipeline import SharedCommands
 
 logger = get_logger("diagnostics.system")
 
@@ -51,11 +52,14 @@ class SystemHealthReport:
 class SystemDiagnostics:
     """Run system-level diagnostic checks."""
 
-    def __init__(self, config: ZergConfig | None = None) -> None:
+    def __init__(self, config: ZergConfig | None = None, commands: SharedCommands | None = None) -> None:
         self.config = config
+        self._commands = commands
 
     def _run_cmd(self, cmd: list[str]) -> tuple[str, bool]:
         """Run a command with timeout, return (stdout, success)."""
+        if self._commands is not None:
+            return self._commands.run(cmd, SUBPROCESS_TIMEOUT)
         try:
             result = subprocess.run(
                 cmd,
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import bisect
 import re
-from collections import Counter
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
 
 
@@ -32,6 +33,10 @@ _BOLD_DEF_PATTERN = re.compile(r"\*\*([^*]+)\*\*\s*[:—–-]\s*(.+?)(?:\n|$)")
 _CODE_BLOCK_PATTERN = re.compile(r"```[\s\S]*?```|`[^`]+`")
 _HEADING_LINE_PATTERN = re.compile(r"^#{1,6}\s+.*$", re.MULTILINE)
 _WIKI_LINK_PATTERN = re.compile(r"\[\[([^|\]]+)(?:\|[^\]]+)?\]\]")
+_WORD_PATTERN = re.compile(r"\w+")
+
+# Non-ASCII characters that re.IGNORECASE matches against ASCII letters
+_ASCII_FOLD = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
 
 # Words too common to be meaningful keywords
 _STOP_WORDS = frozenset(
@@ -150,6 +155,56 @@ def _is_inside_heading(content: str, start: int) -> bool:
     return bool(_HEADING_LINE_PATTERN.match(line))
 
 
+def _is_word_char(char: str) -> bool:
+    """Match the ``\\w`` class of :mod:`re` for str patterns."""
+    return char.isalnum() or char == "_"
+
+
+class _GlossaryIndex:
+    """Glossary needles (terms and aliases) indexed by their first word.
+
+    Built once per glossary so :meth:`CrossRefBuilder.inject_links` finds
+    every occurrence on a page with one word scan instead of one regex per
+    term. Needles that do not start with an ASCII word are rare and are
+    found with a per-needle regex instead.
+    """
+
+    def __init__(self, glossary: list[GlossaryEntry]) -> None:
+        self.glossary = glossary
+        self.size = len(glossary)
+        # Longest terms first; sorted() is stable, so ties keep glossary order
+        self.entries = sorted(glossary, key=lambda e: len(e.term), reverse=True)
+        self.needles: list[tuple[str, ...]] = [(e.term, *e.aliases) for e in self.entries]
+        self.by_first_word: dict[str, set[str]] = defaultdict(set)
+        self.scanned: set[str] = set()  # needles found with their own regex
+        self.bodies: dict[str, re.Pattern[str]] = {}
+        for needles in self.needles:
+            for needle in needles:
+                if needle in self.bodies:
+                    continue
+                self.bodies[needle] = re.compile(re.escape(needle), re.IGNORECASE)
+                first = _WORD_PATTERN.match(needle)
+                if first and first.group().isascii():
+                    self.by_first_word[first.group().lower()].add(needle)
+                else:
+                    self.scanned.add(needle)
+
+    def occurrences(self, masked: str) -> dict[str, list[int]]:
+        """Return ``{needle: [start, ...]}`` for every candidate start in *masked*."""
+        found: dict[str, list[int]] = defaultdict(list)
+        by_first_word = self.by_first_word
+        for word in _WORD_PATTERN.finditer(masked):
+            key = word.group()
+            key = (key if key.isascii() else key.translate(_ASCII_FOLD)).lower()
+            for needle in by_first_word.get(key, ()):
+                found[needle].append(word.start())
+        for needle in self.scanned:
+            # Zero-width lookahead: overlapping occurrences are all reported
+            lookahead = re.compile("(?=" + re.escape(needle) + ")", re.IGNORECASE)
+            found[needle] = [m.start() for m in lookahead.finditer(masked)]
+        return found
+
+
 class CrossRefBuilder:
     """Build cross-references and glossaries across a set of wiki pages.
 
@@ -157,6 +212,11 @@ class CrossRefBuilder:
     links, discovering related pages, and generating a full glossary page.
     """
 
+    def __init__(self) -> None:
+        # Reused while callers pass the same glossary / page set again
+        self._glossary_cache: _GlossaryIndex | None = None
+        self._site_cache: _SiteIndex | None = None
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -241,45 +301,69 @@ class CrossRefBuilder:
         Returns:
             The content string with wiki links injected.
         """
-        # Sort terms longest-first so longer matches take priority
-        terms = sorted(
-            [e for e in glossary if e.page != current_page],
-            key=lambda e: len(e.term),
-            reverse=True,
-        )
-
+        index = self._glossary_index(glossary)
         masked = _mask_code_blocks(content)
-        linked_terms: set[str] = set()
+        found = index.occurrences(masked)
+        if not found:
+            return content
+
+        # Links replace text with spaces in the mask; track them as sorted spans
+        starts: list[int] = []
+        spans: list[tuple[int, int, str]] = []
+
+        def overlaps(start: int, end: int) -> bool:
+            i = bisect.bisect_left(starts, end)
+            return i > 0 and spans[i - 1][1] > start
+
+        def is_word(pos: int) -> bool:
+            if pos < 0 or pos >= len(masked) or overlaps(pos, pos + 1):
+                return False
+            return _is_word_char(masked[pos])
+
+        def at_boundary(pos: int) -> bool:
+            return is_word(pos - 1) != is_word(pos)
 
-        for entry in terms:
+        linked_terms: set[str] = set()
+        for entry, needles in zip(index.entries, index.needles, strict=True):
+            if entry.page == current_page:
+                continue
             term_lower = entry.term.lower()
             if term_lower in linked_terms:
                 continue
-
-            # Build pattern matching the term (or aliases) as a whole word
-            needles = [re.escape(entry.term)] + [re.escape(a) for a in entry.aliases]
-            pattern = re.compile(r"\b(" + "|".join(needles) + r")\b", re.IGNORECASE)
-
-            for match in pattern.finditer(masked):
-                start = match.start()
+            candidates: dict[int, list[str]] = {}
+            for needle in needles:
+                for pos in found.get(needle, ()):
+                    candidates.setdefault(pos, []).append(needle)
+            for start in sorted(candidates):
+                # Like re alternation: the first needle that matches here wins
+                for needle in candidates[start]:
+                    end = start + len(needle)
+                    if (
+                        index.bodies[needle].match(masked, start)
+                        and not overlaps(start, end)
+                        and at_boundary(start)
+                        and at_boundary(end)
+                    ):
+                        break
+                else:
+                    continue
                 # Skip if inside a heading line
                 if _is_inside_heading(content, start):
                     continue
-
-                # The masked string guarantees we are not inside a code block
-                # (code regions are replaced with spaces, so the regex won't
-                # match there).
-                original_text = content[match.start() : match.end()]
-                link = f"[[{entry.term}|{original_text}]]"
-                # Perform the replacement in the real content
-                content = content[: match.start()] + link + content[match.end() :]
-                # Update the mask to keep offsets consistent
-                mask_replacement = " " * len(link)
-                masked = masked[: match.start()] + mask_replacement + masked[match.end() :]
+                at = bisect.bisect_left(starts, start)
+                starts.insert(at, start)
+                spans.insert(at, (start, end, f"[[{entry.term}|{content[start:end]}]]"))
                 linked_terms.add(term_lower)
                 break  # first occurrence only
 
-        return content
+        parts: list[str] = []
+        position = 0
+        for start, end, link in spans:
+            parts.append(content[position:start])
+            parts.append(link)
+            position = end
+        parts.append(content[position:])
+        return "".join(parts)
 
     def see_also(
         self,
@@ -305,45 +389,60 @@ class CrossRefBuilder:
         if page_name not in all_pages:
             return []
 
-        source_content = all_pages[page_name]
-        source_keywords = Counter(_extract_keywords(source_content))
-
-        scores: dict[str, float] = {}
-
-        for other_name, other_content in all_pages.items():
-            if other_name == page_name:
-                continue
-
-            score = 0.0
-
-            # 1. Shared keywords
-            other_keywords = Counter(_extract_keywords(other_content))
-            shared = set(source_keywords.keys()) & set(other_keywords.keys())
-            for kw in shared:
-                score += min(source_keywords[kw], other_keywords[kw])
-
-            # 2. Explicit cross-references (wiki links mentioning the other page)
-            for link_match in _WIKI_LINK_PATTERN.finditer(source_content):
-                linked_page = link_match.group(1).strip()
-                if linked_page.lower() == other_name.lower():
-                    score += 10.0
-
-            # Reverse direction: other page links to this page
-            for link_match in _WIKI_LINK_PATTERN.finditer(other_content):
-                linked_page = link_match.group(1).strip()
-                if linked_page.lower() == page_name.lower():
-                    score += 10.0
-
-            # 3. Shared heading terms (higher weight than body keywords)
-            source_headings = {m.group(2).strip().lower() for m in _HEADING_PATTERN.finditer(source_content)}
-            other_headings = {m.group(2).strip().lower() for m in _HEADING_PATTERN.finditer(other_content)}
-            score += len(source_headings & other_headings) * 5.0
+        site = self._site_index(all_pages)
+        source = site.features[page_name]
+        source_lower = page_name.lower()
+
+        scores: dict[str, float] = defaultdict(float)
+
+        # 1. Shared keywords
+        for kw, count in source.keywords.items():
+            for other_count, names in site.keyword_pages[kw].items():
+                shared = count if count < other_count else other_count
+                for other_name in names:
+                    scores[other_name] += shared
+
+        # 2. Explicit cross-references (wiki links mentioning the other page)
+        for target, count in source.links.items():
+            for other_name in site.names_by_lower.get(target, ()):
+                scores[other_name] += 10.0 * count
+
+        # Reverse direction: other page links to this page
+        for other_name, count in site.linked_from.get(source_lower, ()):
+            scores[other_name] += 10.0 * count
+
+        # 3. Shared heading terms (higher weight than body keywords)
+        for heading in source.headings:
+            for other_name in site.heading_pages[heading]:
+                scores[other_name] += 5.0
+
+        scores.pop(page_name, None)
+        # Page order breaks ties, as when every page was compared in turn
+        ranked = sorted(
+            (name for name, score in scores.items() if score > 0),
+            key=lambda n: (-scores[n], site.order[n]),
+        )
+        return ranked[:max_related]
 
-            if score > 0:
-                scores[other_name] = score
+    # ------------------------------------------------------------------
+    # Indexes
+    # ------------------------------------------------------------------
 
-        ranked = sorted(scores, key=lambda n: scores[n], reverse=True)
-        return ranked[:max_related]
+    def _glossary_index(self, glossary: list[GlossaryEntry]) -> _GlossaryIndex:
+        """Return the index for *glossary*, reusing it across pages."""
+        cached = self._glossary_cache
+        if cached is None or cached.glossary is not glossary or cached.size != len(glossary):
+            cached = _GlossaryIndex(glossary)
+            self._glossary_cache = cached
+        return cached
+
+    def _site_index(self, all_pages: dict[str, str]) -> _SiteIndex:
+        """Return the see-also index for *all_pages*, rebuilding it when any page changed."""
+        cached = self._site_cache
+        if cached is None or not cached.matches(all_pages):
+            cached = _SiteIndex(all_pages)
+            self._site_cache = cached
+        return cached
 
     def generate_glossary_page(self, glossary: list[GlossaryEntry]) -> str:
         """Generate a full ``Glossary.md`` page from glossary entries.
@@ -383,3 +482,48 @@ class CrossRefBuilder:
             lines.append("")
 
         return "\n".join(lines)
+
+
+@dataclass
+class _PageFeatures:
+    """What :meth:`CrossRefBuilder.see_also` compares, parsed once per page."""
+
+    keywords: Counter[str]
+    links: Counter[str]  # lowercased link targets
+    headings: set[str]
+
+    @classmethod
+    def parse(cls, content: str) -> _PageFeatures:
+        return cls(
+            keywords=Counter(_extract_keywords(content)),
+            links=Counter(m.group(1).strip().lower() for m in _WIKI_LINK_PATTERN.finditer(content)),
+            headings={m.group(2).strip().lower() for m in _HEADING_PATTERN.finditer(content)},
+        )
+
+
+class _SiteIndex:
+    """Per-page features plus inverted indexes from keyword, link and heading to pages."""
+
+    def __init__(self, pages: dict[str, str]) -> None:
+        self.contents = dict(pages)
+        self.order = {name: i for i, name in enumerate(pages)}
+        self.features = {name: _PageFeatures.parse(content) for name, content in pages.items()}
+        # keyword -> {count on page: pages}, so shared counts are computed once per group
+        self.keyword_pages: dict[str, dict[int, list[str]]] = defaultdict(lambda: defaultdict(list))
+        self.heading_pages: dict[str, list[str]] = defaultdict(list)
+        self.linked_from: dict[str, list[tuple[str, int]]] = defaultdict(list)
+        self.names_by_lower: dict[str, list[str]] = defaultdict(list)
+        for name, features in self.features.items():
+            self.names_by_lower[name.lower()].append(name)
+            for kw, count in features.keywords.items():
+                self.keyword_pages[kw][count].append(name)
+            for heading in features.headings:
+                self.heading_pages[heading].append(name)
+            for target, count in features.links.items():
+                self.linked_from[target].append((name, count))
+
+    def matches(self, pages: dict[str, str]) -> bool:
+        """True if *pages* still holds exactly the contents this index was built from."""
+        if len(pages) != len(self.contents):
+            return False
+        return all(pages.get(name) is content for name, content in self.contents.items())
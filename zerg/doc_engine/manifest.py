@@ -0,0 +1,186 @@
+"""Wiki build manifest -- lets ``zerg wiki`` re-render only the pages whose sources changed."""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+
+from zerg.doc_engine.renderer import RENDERER_VERSION, DocRenderer
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = ".wiki-manifest.json"
+MANIFEST_VERSION = 1
+
+# Below this many pages the process-pool start-up costs more than it saves
+_PARALLEL_THRESHOLD = 64
+
+
+def content_hash(data: bytes) -> str:
+    """Return the hex SHA-256 digest of *data*."""
+    return hashlib.sha256(data).hexdigest()
+
+
+@dataclass
+class SourceRecord:
+    """What one source file rendered to on the previous run.
+
+    Attributes:
+        source_hash: Digest of the source file's bytes.
+        page: Name of the generated page (without ``.md``).
+        page_hash: Digest of the generated page's bytes.
+    """
+
+    source_hash: str
+    page: str
+    page_hash: str
+
+
+class WikiManifest:
+    """Maps source files to the pages generated from them.
+
+    Stored as ``.wiki-manifest.json`` in the wiki output directory. A
+    manifest written by a different renderer version is discarded on load,
+    so every page is rendered again.
+
+    Usage::
+
+        manifest = WikiManifest.load(output_dir)
+        content = manifest.reuse("zerg/launcher.py", source_hash, output_dir)
+        ...
+        manifest.record("zerg/launcher.py", source_hash, "launcher", content)
+        manifest.save()
+    """
+
+    def __init__(self, output_dir: Path, renderer_version: str = RENDERER_VERSION) -> None:
+        self.path = Path(output_dir) / MANIFEST_NAME
+        self.renderer_version = renderer_version
+        self.sources: dict[str, SourceRecord] = {}
+        self.outputs: set[str] = set()
+
+    @classmethod
+    def load(cls, output_dir: Path, renderer_version: str = RENDERER_VERSION) -> WikiManifest:
+        """Load the manifest in *output_dir*, or return an empty one if it is missing or stale."""
+        manifest = cls(output_dir, renderer_version)
+        try:
+            data = json.loads(manifest.path.read_text(encoding="utf-8"))
+            if data.get("version") != MANIFEST_VERSION:
+                return manifest
+            # Pages written by any renderer are ours to clean up, even if none can be reused
+            manifest.outputs = set(data.get("outputs", []))
+            if data.get("renderer_version") == renderer_version:
+                manifest.sources = {src: SourceRecord(*record) for src, record in data.get("sources", {}).items()}
+        except (OSError, ValueError, TypeError, AttributeError):
+            logger.debug("No usable wiki manifest at %s", manifest.path, exc_info=True)
+        return manifest
+
+    def reuse(self, source: str, source_hash: str, output_dir: Path) -> str | None:
+        """Return the page generated from *source* if neither it nor the page changed since it was recorded."""
+        record = self.sources.get(source)
+        if record is None or record.source_hash != source_hash:
+            return None
+        try:
+            data = (Path(output_dir) / f"{record.page}.md").read_bytes()
+        except OSError:
+            return None
+        # The page may have been edited or overwritten by another source with the same stem
+        if content_hash(data) != record.page_hash:
+            return None
+        return data.decode("utf-8")
+
+    def record(self, source: str, source_hash: str, page: str, content: str) -> None:
+        """Remember that *source* (with digest *source_hash*) rendered to *content*."""
+        self.sources[source] = SourceRecord(source_hash, page, content_hash(content.encode("utf-8")))
+
+    def save(self, outputs: set[str]) -> None:
+        """Write the manifest, listing *outputs* as the pages this build produced."""
+        self.outputs = set(outputs)
+        data = {
+            "version": MANIFEST_VERSION,
+            "renderer_version": self.renderer_version,
+            "sources": {src: [r.source_hash, r.page, r.page_hash] for src, r in sorted(self.sources.items())},
+            "outputs": sorted(self.outputs),
+        }
+        self.path.write_text(json.dumps(data, indent=1))
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write *content* to *path* unless the file already holds exactly those bytes.
+
+    Returns:
+        True if the file was written.
+    """
+    try:
+        if path.read_bytes() == content.encode("utf-8"):
+            return False
+    except OSError:
+        pass
+    path.write_text(content)
+    return True
+
+
+@functools.lru_cache(maxsize=4)
+def _worker_renderer(project_root: str) -> DocRenderer:
+    return DocRenderer(project_root=Path(project_root))
+
+
+def render_page(project_root: str, target: str) -> tuple[str | None, str | None]:
+    """Render one source file, returning ``(content, None)`` or ``(None, error)``.
+
+    Module-level so it can run in a worker process.
+    """
+    try:
+        return _worker_renderer(project_root).render(Path(target)), None
+    except Exception as e:  # noqa: BLE001 — intentional: a page that fails to render is reported, not fatal
+        return None, str(e)
+
+
+def render_pages(
+    renderer: DocRenderer,
+    targets: list[Path],
+    project_root: Path,
+    max_workers: int | None = None,
+) -> list[str | None]:
+    """Render *targets* in order, in worker processes for large batches.
+
+    Small batches use *renderer* in this process; large ones give each
+    worker process its own :class:`DocRenderer` for *project_root*.
+
+    Returns:
+        The rendered markdown per target, or ``None`` where rendering failed
+        (the failure is logged).
+    """
+    workers = max_workers or min(8, os.cpu_count() or 1)
+    results: list[tuple[str | None, str | None]] | None = None
+    if len(targets) >= _PARALLEL_THRESHOLD and workers > 1:
+        try:
+            # spawn: forking a process that may hold locks from other threads is unsafe
+            ctx = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as executor:
+                roots = [str(project_root)] * len(targets)
+                chunksize = max(1, len(targets) // (workers * 4))
+                results = list(executor.map(render_page, roots, map(str, targets), chunksize=chunksize))
+        except (OSError, BrokenProcessPool):
+            logger.debug("Process pool unavailable; rendering serially", exc_info=True)
+    if results is None:
+        results = []
+        for target in targets:
+            try:
+                results.append((renderer.render(target), None))
+            except Exception as e:  # noqa: BLE001 — intentional: best-effort page generation; skip and continue
+                results.append((None, str(e)))
+
+    pages: list[str | None] = []
+    for target, (content, error) in zip(targets, results, strict=True):
+        if error is not None:
+            logger.warning("Failed to generate page for %s: %s", target, error)
+        pages.append(content)
+    return pages
@@ -12,6 +12,9 @@ from zerg.doc_engine.templates import TEMPLATES
 
 logger = logging.getLogger(__name__)
 
+# Bump when rendered output changes (templates, table builders) so wiki manifests are invalidated
+RENDERER_VERSION = "1"
+
 
 class DocRenderer:
     """Orchestrates component detection, symbol extraction, and template rendering.
@@ -2,30 +2,133 @@
 
 This module provides the EventEmitter class for JSONL-based event
 streaming between orchestrator and status monitors.
+
+Next to the event file the emitter keeps a sparse sidecar index
+(``{feature}-events.idx``): roughly every ``INDEX_INTERVAL_BYTES`` of events
+it appends ``<max_us> <offset>``, where *offset* is the start of an event
+line and *max_us* the latest timestamp (microseconds since the epoch) of
+any event before it. ``get_events(since=...)`` bisects the index, seeks past
+everything at or before *since*, and decodes only the tail.
 """
 
 from __future__ import annotations
 
+import bisect
+import ctypes
 import json
+import os
+import select
 import threading
 import time
 from collections.abc import Callable
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import Any
-
+from typing import IO, Any
+
+from zerg.file_watcher import (
+    _EVENT_HEADER,
+    _IN_CLOEXEC,
+    _IN_CREATE,
+    _IN_DELETE,
+    _IN_MODIFY,
+    _IN_MOVED_TO,
+    _IN_NONBLOCK,
+    _load_libc,
+)
 from zerg.logging import get_logger
 
 logger = get_logger(__name__)
 
 EventCallback = Callable[[str, dict[str, Any]], None]
 
+INDEX_INTERVAL_BYTES = 64 * 1024
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_ONE_US = timedelta(microseconds=1)
+
+
+def _timestamp_us(value: str | datetime) -> int:
+    """Microseconds since the epoch for an aware datetime or ISO timestamp."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return (value - _EPOCH) // _ONE_US
+
+
+class _FileNotifier:
+    """Wake a watcher when one file in a directory is written, created or removed.
+
+    Uses inotify on the parent directory (so the file may not exist yet) and
+    falls back to sleeping *poll_interval* elsewhere.
+    """
+
+    def __init__(self, path: Path, poll_interval: float = 0.1, use_inotify: bool | None = None) -> None:
+        self._name = os.fsencode(path.name)
+        self.poll_interval = poll_interval
+        self._fd = -1
+        libc = _load_libc() if use_inotify is not False else None
+        if libc is not None:
+            fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+            mask = _IN_MODIFY | _IN_CREATE | _IN_DELETE | _IN_MOVED_TO
+            if fd >= 0 and libc.inotify_add_watch(fd, os.fsencode(path.parent), mask) >= 0:
+                self._fd = fd
+            else:
+                logger.debug("inotify unavailable for %s (errno %d); polling", path, ctypes.get_errno())
+                if fd >= 0:
+                    os.close(fd)
+        if self._fd < 0 and use_inotify:
+            raise OSError("inotify is not available on this system")
+
+    @property
+    def backend(self) -> str:
+        """Return ``"inotify"`` or ``"polling"``."""
+        return "inotify" if self._fd >= 0 else "polling"
+
+    def wait(self, timeout: float) -> None:
+        """Return once the file may have changed, or after at most *timeout* seconds."""
+        if self._fd < 0:
+            time.sleep(min(timeout, self.poll_interval))
+            return
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            try:
+                ready, _, _ = select.select([self._fd], [], [], remaining)
+            except (OSError, ValueError):
+                return
+            if not ready or self._drain():
+                return
+
+    def _drain(self) -> bool:
+        """Read queued inotify events; True if any names the watched file."""
+        hit = False
+        while True:
+            try:
+                data = os.read(self._fd, 65536)
+            except OSError:
+                return hit
+            if not data:
+                return hit
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                _wd, _mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                hit = hit or data[offset : offset + length].rstrip(b"\0") == self._name
+                offset += length
+
+    def close(self) -> None:
+        """Release the inotify descriptor, if any."""
+        if self._fd >= 0:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass  # Best-effort descriptor cleanup
+            self._fd = -1
+
 
 class EventEmitter:
     """JSONL file-based event emitter for live streaming.
 
     Events are written to .zerg/state/{feature}-events.jsonl and can
-    be subscribed to for real-time updates.
+    be subscribed to for real-time updates. The event and index files stay
+    open for appending until :meth:`close` (or :meth:`cleanup`).
     """
 
     def __init__(self, feature: str, state_dir: Path | str | None = None) -> None:
@@ -38,10 +141,24 @@ class EventEmitter:
         self._feature = feature
         self._state_dir = Path(state_dir) if state_dir else Path(".zerg/state")
         self._event_file = self._state_dir / f"{feature}-events.jsonl"
+        self._index_file = self._state_dir / f"{feature}-events.idx"
         self._subscribers: list[EventCallback] = []
         self._lock = threading.Lock()
         self._running = False
         self._watch_thread: threading.Thread | None = None
+        self._notifier: _FileNotifier | None = None
+
+        # Writer state (guarded by _lock), set up on the first emit
+        self._file: IO[bytes] | None = None
+        self._index: IO[bytes] | None = None
+        self._max_us = 0  # latest timestamp written so far
+        self._last_indexed = 0  # offset of the last index entry
+
+        # Reader-side copy of the index, extended incrementally
+        self._index_ino = 0
+        self._index_read = 0
+        self._index_max: list[int] = []
+        self._index_offsets: list[int] = []
 
         # Ensure state directory exists
         self._state_dir.mkdir(parents=True, exist_ok=True)
@@ -58,21 +175,21 @@ class EventEmitter:
             event_type: Type of event (e.g., 'task_claim', 'level_complete')
             data: Event data dictionary
         """
-        event = {
-            "timestamp": datetime.now(UTC).isoformat(),
-            "type": event_type,
-            "feature": self._feature,
-            "data": data or {},
-        }
-
         with self._lock:
+            # Timestamp under the lock so file order matches timestamp order
+            now = datetime.now(UTC)
+            event = {
+                "timestamp": now.isoformat(),
+                "type": event_type,
+                "feature": self._feature,
+                "data": data or {},
+            }
             try:
-                with open(self._event_file, "a") as f:
-                    f.write(json.dumps(event) + "\n")
-                    f.flush()
+                self._append(json.dumps(event).encode() + b"\n", _timestamp_us(now))
                 logger.debug(f"Emitted event: {event_type}")
             except OSError as e:
                 logger.error(f"Failed to write event: {e}")
+                self._close_files()
 
         # Notify in-process subscribers
         event_data: dict[str, Any] = data or {}
@@ -101,7 +218,7 @@ class EventEmitter:
             self._subscribers.remove(callback)
             logger.debug(f"Removed subscriber, total: {len(self._subscribers)}")
 
-    def start_watching(self, callback: EventCallback) -> None:
+    def start_watching(self, callback: EventCallback, use_inotify: bool | None = None) -> None:
         """Start watching the event file for new events.
 
         This is useful for status monitors that need to read events
@@ -109,15 +226,20 @@ class EventEmitter:
 
         Args:
             callback: Function called with (event_type, data) for each new event
+            use_inotify: Force (True) or disable (False) inotify wake-ups.
+                ``None`` uses inotify where available and polls otherwise.
         """
         if self._running:
             logger.warning("Already watching events")
             return
 
+        self._notifier = _FileNotifier(self._event_file, use_inotify=use_inotify)
+        # Start from end of file if it exists; events emitted after this call are delivered
+        start = self._event_file.stat().st_size if self._event_file.exists() else 0
         self._running = True
-        self._watch_thread = threading.Thread(target=self._watch_loop, args=(callback,), daemon=True)
+        self._watch_thread = threading.Thread(target=self._watch_loop, args=(callback, start), daemon=True)
         self._watch_thread.start()
-        logger.info(f"Started watching {self._event_file}")
+        logger.info(f"Started watching {self._event_file} ({self._notifier.backend})")
 
     def stop_watching(self) -> None:
         """Stop watching the event file."""
@@ -125,31 +247,38 @@ class EventEmitter:
         if self._watch_thread:
             self._watch_thread.join(timeout=2.0)
             self._watch_thread = None
+        if self._notifier is not None:
+            self._notifier.close()
+            self._notifier = None
         logger.info("Stopped watching events")
 
-    def _watch_loop(self, callback: EventCallback) -> None:
+    def _watch_loop(self, callback: EventCallback, last_position: int = 0) -> None:
         """Internal loop for watching event file.
 
         Args:
             callback: Function to call for new events
+            last_position: Byte offset to start reading from
         """
-        last_position = 0
-
-        # Start from end of file if it exists
-        if self._event_file.exists():
-            last_position = self._event_file.stat().st_size
+        notifier = self._notifier
+        assert notifier is not None
 
         while self._running:
             try:
                 if not self._event_file.exists():
-                    time.sleep(0.5)
+                    last_position = 0
+                    notifier.wait(0.5)
                     continue
 
                 current_size = self._event_file.stat().st_size
+                if current_size < last_position:
+                    last_position = 0  # Cleared and recreated
                 if current_size > last_position:
-                    with open(self._event_file) as f:
+                    with open(self._event_file, "rb") as f:
                         f.seek(last_position)
                         for line in f:
+                            if not line.endswith(b"\n"):
+                                break  # Partial write; re-read once it is complete
+                            last_position += len(line)
                             line = line.strip()
                             if line:
                                 try:
@@ -157,9 +286,8 @@ class EventEmitter:
                                     callback(event.get("type", "unknown"), event.get("data", {}))
                                 except json.JSONDecodeError as e:
                                     logger.warning(f"Malformed event line: {e}")
-                        last_position = f.tell()
 
-                time.sleep(0.1)  # Poll interval
+                notifier.wait(0.5)
 
             except OSError as e:
                 logger.error(f"Error watching events: {e}")
@@ -168,6 +296,9 @@ class EventEmitter:
     def get_events(self, since: datetime | None = None) -> list[dict[str, Any]]:
         """Get all events, optionally filtered by timestamp.
 
+        With *since*, the sidecar index is used to skip the part of the file
+        that only holds older events.
+
         Args:
             since: Only return events after this timestamp
 
@@ -179,7 +310,9 @@ class EventEmitter:
         if not self._event_file.exists():
             return events
 
-        with open(self._event_file) as f:
+        with open(self._event_file, "rb") as f:
+            if since is not None and since.tzinfo is not None:
+                f.seek(self._seek_offset(f, _timestamp_us(since)))
             for line in f:
                 line = line.strip()
                 if not line:
@@ -199,11 +332,116 @@ class EventEmitter:
     def clear(self) -> None:
         """Clear all events from the file."""
         with self._lock:
+            self._close_files()
+            self._index_file.unlink(missing_ok=True)
             if self._event_file.exists():
                 self._event_file.unlink()
                 logger.info(f"Cleared events: {self._event_file}")
 
+    def close(self) -> None:
+        """Close the append handles; the next emit reopens them."""
+        with self._lock:
+            self._close_files()
+
     def cleanup(self) -> None:
         """Clean up resources and stop watching."""
         self.stop_watching()
         self._subscribers.clear()
+        self.close()
+
+    # -- writer ---------------------------------------------------------------
+
+    def _append(self, line: bytes, ts_us: int) -> None:
+        """Append one event line and index it if due; caller holds ``_lock``."""
+        if self._file is None:
+            self._open_files()
+        assert self._file is not None
+        self._file.write(line)
+        self._file.flush()
+        # In append mode the write lands at the end; tell() is now just past it
+        offset = self._file.tell() - len(line)
+        self._index_event(offset, ts_us)
+
+    def _index_event(self, offset: int, ts_us: int) -> None:
+        """Record an index entry for the event at *offset* when one is due."""
+        if offset - self._last_indexed >= INDEX_INTERVAL_BYTES and self._index is not None:
+            self._index.write(b"%d %d\n" % (self._max_us, offset))
+            self._index.flush()
+            self._last_indexed = offset
+        self._max_us = max(self._max_us, ts_us)
+
+    def _open_files(self) -> None:
+        """Open both append handles and bring the index up to date with the event file."""
+        self._file = open(self._event_file, "ab")  # noqa: SIM115
+        self._index = open(self._index_file, "ab+")  # noqa: SIM115
+        self._max_us, self._last_indexed = 0, 0
+        self._index.seek(0)
+        entries = self._index.read().splitlines()
+        size = self._file.tell()
+        start = 0
+        if entries:
+            try:
+                max_us, offset = (int(v) for v in entries[-1].split())
+            except ValueError:
+                max_us, offset = 0, size + 1
+            if offset <= size:
+                self._max_us, self._last_indexed, start = max_us, offset, offset
+            else:
+                # Index belongs to an older event file; rebuild it
+                self._index.truncate(0)
+        # Index events appended since the last entry (or the whole file, if unindexed)
+        with open(self._event_file, "rb") as f:
+            f.seek(start)
+            position = start
+            for line in f:
+                try:
+                    ts_us = _timestamp_us(json.loads(line)["timestamp"])
+                except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                    ts_us = 0
+                self._index_event(position, ts_us)
+                position += len(line)
+
+    def _close_files(self) -> None:
+        """Close the append handles; caller holds ``_lock``."""
+        for handle in (self._file, self._index):
+            if handle is not None:
+                try:
+                    handle.close()
+                except OSError:
+                    pass  # Best-effort close
+        self._file = self._index = None
+
+    # -- reader ---------------------------------------------------------------
+
+    def _seek_offset(self, f: IO[bytes], since_us: int) -> int:
+        """Offset of the first event that may be newer than *since_us* (0 if unknown)."""
+        try:
+            with open(self._index_file, "rb") as idx:
+                st = os.fstat(idx.fileno())
+                if st.st_ino != self._index_ino or st.st_size < self._index_read:
+                    # Recreated or rewritten since we last read it
+                    self._index_ino, self._index_read, self._index_max, self._index_offsets = st.st_ino, 0, [], []
+                idx.seek(self._index_read)
+                data = idx.read()
+        except OSError:
+            return 0
+        complete = data[: data.rfind(b"\n") + 1]
+        for entry in complete.splitlines():
+            try:
+                max_us, offset = (int(v) for v in entry.split())
+            except ValueError:
+                continue
+            self._index_max.append(max_us)
+            self._index_offsets.append(offset)
+        self._index_read += len(complete)
+
+        # Last entry with every earlier event at or before since
+        i = bisect.bisect_right(self._index_max, since_us) - 1
+        if i < 0:
+            return 0
+        offset = self._index_offsets[i]
+        # The entry must point at a line start in this event file
+        f.seek(offset - 1)
+        if f.read(1) != b"\n":
+            return 0
+        return offset
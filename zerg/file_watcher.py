@@ -0,0 +1,327 @@
+"""Filesystem change watcher for ZERG watch modes.
+
+Uses Linux inotify (via ctypes, no extra dependency) when available and
+falls back to stat-based polling elsewhere.  Both backends share the
+directory ignore rules of :func:`zerg.fs_utils.collect_files`, debounce
+bursts of events, and only hash the paths that were reported as changed so
+an editor re-saving identical content does not trigger a rerun.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import hashlib
+import math
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from types import TracebackType
+
+from zerg.fs_utils import is_excluded_dir
+from zerg.logging import get_logger
+
+logger = get_logger("file_watcher")
+
+# inotify(7) constants
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _load_libc() -> ctypes.CDLL | None:
+    """Return libc with the inotify entry points, or None if unsupported."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class FileWatcher:
+    """Watch a directory tree for content changes to source files.
+
+    Example::
+
+        with FileWatcher(Path("."), extensions={".py"}) as watcher:
+            while True:
+                changed = watcher.wait(timeout=1.0)
+                if changed:
+                    rerun(changed)
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        extensions: set[str] | None = None,
+        exclude_dirs: set[str] | None = None,
+        debounce: float = 0.3,
+        poll_interval: float = 1.0,
+        use_inotify: bool | None = None,
+    ) -> None:
+        """Initialize the watcher and take the initial snapshot.
+
+        Args:
+            root: Directory tree to watch.
+            extensions: File suffixes to report (case-insensitive). ``None`` reports all files.
+            exclude_dirs: Directory names to skip. Defaults to the ``collect_files`` excludes.
+            debounce: Quiet period (seconds) that ends a burst of changes.
+            poll_interval: Rescan interval for the polling backend.
+            use_inotify: Force (True) or disable (False) inotify. ``None`` auto-detects.
+        """
+        self.root = root
+        self._extensions = {ext.lower() for ext in extensions} if extensions is not None else None
+        self._exclude_dirs = exclude_dirs
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self._stats: dict[str, tuple[int, int]] = {}
+        self._hashes: dict[str, str] = {}
+        self._fd = -1
+        self._wd_to_dir: dict[int, str] = {}
+        self._libc: ctypes.CDLL | None = None
+
+        if use_inotify is not False:
+            self._libc = _load_libc()
+            if self._libc is not None:
+                self._fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+                if self._fd < 0:
+                    logger.debug("inotify_init1 failed (errno %d); using polling", ctypes.get_errno())
+            if self._fd < 0 and use_inotify:
+                raise OSError(errno.ENOSYS, "inotify is not available on this system")
+
+        self._stats = self._scan(add_watches=self._fd >= 0)
+        # Baseline content so the first identical re-save of a watched file is ignored
+        for path in self._stats:
+            digest = self._hash(path)
+            if digest is not None:
+                self._hashes[path] = digest
+
+    @property
+    def backend(self) -> str:
+        """Return ``"inotify"`` or ``"polling"``."""
+        return "inotify" if self._fd >= 0 else "polling"
+
+    # -- public API ------------------------------------------------------------
+
+    def wait(self, timeout: float | None = None) -> list[Path]:
+        """Block until files change, then return the debounced set of changed paths.
+
+        Args:
+            timeout: Maximum seconds to wait for the first change. ``None``
+                uses the poll interval.
+
+        Returns:
+            Sorted list of files whose content changed or that were created
+            or deleted. Empty if nothing changed before *timeout*.
+        """
+        if timeout is None:
+            timeout = self.poll_interval
+        candidates = self._collect(timeout)
+        if not candidates:
+            return []
+        while True:
+            more = self._collect(self.debounce)
+            if not more:
+                break
+            candidates |= more
+        return self._confirm(candidates)
+
+    def close(self) -> None:
+        """Release the inotify descriptor, if any."""
+        if self._fd >= 0:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass  # Best-effort descriptor cleanup
+            self._fd = -1
+            self._wd_to_dir.clear()
+
+    def __enter__(self) -> FileWatcher:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    # -- shared helpers --------------------------------------------------------
+
+    def _wanted(self, name: str) -> bool:
+        """Return True if a file named *name* is reported by this watcher."""
+        if self._extensions is None:
+            return True
+        return os.path.splitext(name)[1].lower() in self._extensions
+
+    def _excluded(self, name: str) -> bool:
+        if self._exclude_dirs is None:
+            return is_excluded_dir(name)
+        return is_excluded_dir(name, self._exclude_dirs)
+
+    def _scan(self, top: str | None = None, add_watches: bool = False) -> dict[str, tuple[int, int]]:
+        """Walk the tree (pruning excluded dirs) and return ``{path: (mtime_ns, size)}``."""
+        stats: dict[str, tuple[int, int]] = {}
+        stack = [top or str(self.root)]
+        while stack:
+            directory = stack.pop()
+            if add_watches:
+                self._add_watch(directory)
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not self._excluded(entry.name):
+                            stack.append(entry.path)
+                    elif entry.is_file() and self._wanted(entry.name):
+                        st = entry.stat()
+                        stats[entry.path] = (st.st_mtime_ns, st.st_size)
+                except OSError:
+                    continue
+        return stats
+
+    def _confirm(self, candidates: set[str]) -> list[Path]:
+        """Hash only the candidate paths and drop those whose content is unchanged."""
+        changed: list[Path] = []
+        for path in sorted(candidates):
+            digest = self._hash(path)
+            if digest is None:
+                # Deleted (or unreadable) since the last snapshot
+                self._hashes.pop(path, None)
+                changed.append(Path(path))
+                continue
+            if self._hashes.get(path) == digest:
+                continue
+            self._hashes[path] = digest
+            changed.append(Path(path))
+        return changed
+
+    @staticmethod
+    def _hash(path: str) -> str | None:
+        h = hashlib.sha256()
+        try:
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(65536), b""):
+                    h.update(chunk)
+        except OSError:
+            return None
+        return h.hexdigest()
+
+    def _collect(self, timeout: float) -> set[str]:
+        """Return candidate paths that changed within *timeout* seconds."""
+        if self._fd >= 0:
+            return self._read_events(timeout)
+        ticks = max(1, math.ceil(timeout / self.poll_interval)) if self.poll_interval > 0 else 1
+        for _ in range(ticks):
+            time.sleep(timeout / ticks)
+            candidates = self._poll()
+            if candidates:
+                return candidates
+        return set()
+
+    # -- polling backend -------------------------------------------------------
+
+    def _poll(self) -> set[str]:
+        current = self._scan()
+        candidates = {path for path, sig in current.items() if self._stats.get(path) != sig}
+        candidates.update(path for path in self._stats if path not in current)
+        self._stats = current
+        return candidates
+
+    # -- inotify backend -------------------------------------------------------
+
+    def _add_watch(self, directory: str) -> None:
+        if self._libc is None or self._fd < 0:
+            return
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err == errno.ENOSPC:
+                logger.warning("inotify watch limit reached; falling back to polling")
+                self.close()
+            return
+        self._wd_to_dir[wd] = directory
+
+    def _read_events(self, timeout: float) -> set[str]:
+        try:
+            ready, _, _ = select.select([self._fd], [], [], timeout)
+        except (OSError, ValueError):
+            ready = []
+        if not ready:
+            return set()
+
+        data = b""
+        while True:
+            try:
+                chunk = os.read(self._fd, 65536)
+            except BlockingIOError:
+                break
+            except OSError:
+                break
+            if not chunk:
+                break
+            data += chunk
+
+        candidates: set[str] = set()
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset : offset + length].rstrip(b"\0").decode(errors="surrogateescape")
+            offset += length
+            if mask & _IN_Q_OVERFLOW:
+                candidates |= self._poll()
+                continue
+            if mask & _IN_IGNORED:
+                self._wd_to_dir.pop(wd, None)
+                continue
+            directory = self._wd_to_dir.get(wd)
+            if directory is None or not name:
+                continue
+            path = os.path.join(directory, name)
+            if mask & _IN_ISDIR:
+                candidates |= self._dir_event(path, name, mask)
+            elif self._wanted(name):
+                candidates.add(path)
+        # Keep the stat snapshot current so an overflow rescan only reports new work
+        for path in candidates:
+            try:
+                st = os.stat(path)
+                self._stats[path] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                self._stats.pop(path, None)
+        return candidates
+
+    def _dir_event(self, path: str, name: str, mask: int) -> set[str]:
+        """Handle a directory created/moved in (watch it) or removed/moved out."""
+        if self._excluded(name):
+            return set()
+        if mask & (_IN_CREATE | _IN_MOVED_TO):
+            # Files may land before the new watch exists; report what is already there
+            return set(self._scan(path, add_watches=True))
+        prefix = path + os.sep
+        return {p for p in self._stats if p.startswith(prefix)}
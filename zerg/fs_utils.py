@@ -27,6 +27,15 @@ _DEFAULT_EXCLUDES: set[str] = {
 }
 
 
+def is_excluded_dir(name: str, exclude_dirs: set[str] = _DEFAULT_EXCLUDES) -> bool:
+    """Return True if a directory named *name* is skipped by traversal.
+
+    Shared by :func:`collect_files` and the file watcher so both agree on
+    which directories are ignored (excluded names and hidden directories).
+    """
+    return name in exclude_dirs or name.startswith(".")
+
+
 def collect_files(
     root: Path,
     extensions: set[str] | None = None,
@@ -72,7 +81,7 @@ def collect_files(
             continue
 
         if any(
-            part in exclude_dirs or part.startswith(".")
+            is_excluded_dir(part, exclude_dirs)
             for part in rel_parts[:-1]  # check directory components only
         ):
             continue
@@ -131,6 +131,7 @@ class GateRunner:
         required_only: bool = False,
         feature: str = "",
         level: int = 0,
+        changed_files: list[str] | None = None,
     ) -> tuple[bool, list[GateRunResult]]:
         """Run all quality gates.
 
@@ -141,6 +142,8 @@ class GateRunner:
             required_only: Only run required gates
             feature: Feature name for plugin gate context
             level: Level number for plugin gate context
+            changed_files: Files changed since the last gated tree, passed to
+                plugin gates so they can limit their work (None if unknown)
 
         Returns:
             Tuple of (all_passed, list of results)
@@ -179,6 +182,7 @@ class GateRunner:
                     level=level,
                     cwd=Path(cwd) if cwd else Path.cwd(),
                     config=self.config,
+                    changed_files=changed_files,
                 )
             )
             for result in plugin_results:
@@ -1,6 +1,9 @@
 """GitRunner base class -- low-level git command execution."""
 
 import subprocess
+import threading
+import weakref
+from dataclasses import dataclass
 from pathlib import Path
 
 from zerg.exceptions import GitError
@@ -8,6 +11,120 @@ from zerg.logging import get_logger
 
 logger = get_logger("git.base")
 
+# Separator between for-each-ref fields; refnames and object names cannot contain NUL
+_REF_FIELD_SEP = "\x00"
+
+
+@dataclass(frozen=True)
+class ObjectInfo:
+    """Object metadata reported by ``git cat-file --batch-check``."""
+
+    sha: str
+    type: str
+    size: int
+
+
+def _stop_process(proc: subprocess.Popen[bytes]) -> None:
+    """Close a cat-file co-process's stdin and reap it."""
+    if proc.poll() is not None:
+        return
+    try:
+        if proc.stdin is not None:
+            proc.stdin.close()
+        proc.wait(timeout=5)
+    except (OSError, subprocess.TimeoutExpired):
+        proc.kill()
+        proc.wait()
+
+
+class CatFileSession:
+    """Long-lived ``git cat-file --batch`` or ``--batch-check`` co-process.
+
+    Each query is one line on the co-process's stdin instead of a new git
+    process. Object names are resolved when queried, so ref updates made after
+    the session started are seen. The process is started on first use and
+    stopped by :meth:`close` or when the session is garbage collected.
+    """
+
+    def __init__(self, repo_path: Path, contents: bool = False) -> None:
+        """Initialize the session.
+
+        Args:
+            repo_path: Repository to query
+            contents: Use ``--batch`` (metadata and contents) instead of ``--batch-check``
+        """
+        self.repo_path = repo_path
+        self.contents = contents
+        self._proc: subprocess.Popen[bytes] | None = None
+        self._finalizer: weakref.finalize[[subprocess.Popen[bytes]], CatFileSession] | None = None
+        self._lock = threading.Lock()
+
+    def _start(self) -> subprocess.Popen[bytes]:
+        mode = "--batch" if self.contents else "--batch-check"
+        cmd = ["git", "-C", str(self.repo_path), "cat-file", mode]
+        logger.debug(f"Starting: {' '.join(cmd)}")
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        self._finalizer = weakref.finalize(self, _stop_process, proc)
+        return proc
+
+    def query(self, rev: str) -> tuple[ObjectInfo, bytes | None] | None:
+        """Look up *rev* (any revision expression ``git rev-parse`` accepts).
+
+        Args:
+            rev: Object name, e.g. ``HEAD``, ``main^{tree}`` or ``v1.0:README.md``
+
+        Returns:
+            ``(info, contents)`` -- contents is None in ``--batch-check`` mode --
+            or None if the object does not exist or the name is ambiguous.
+
+        Raises:
+            ValueError: If *rev* contains a newline
+            GitError: If the co-process cannot be started or dies mid-query
+        """
+        if "\n" in rev or "\r" in rev:
+            raise ValueError(f"Invalid object name: {rev!r}")
+        with self._lock:
+            for attempt in range(2):
+                if self._proc is None or self._proc.poll() is not None:
+                    self._proc = self._start()
+                try:
+                    return self._query(self._proc, rev)
+                except (BrokenPipeError, EOFError) as e:
+                    # The co-process died (e.g. killed); restart it once
+                    self._proc = None
+                    if attempt:
+                        raise GitError(
+                            f"git cat-file session failed: {e}",
+                            command=f"git cat-file {rev}",
+                            exit_code=-1,
+                        ) from e
+        return None  # pragma: no cover -- loop always returns or raises
+
+    def _query(self, proc: subprocess.Popen[bytes], rev: str) -> tuple[ObjectInfo, bytes | None] | None:
+        assert proc.stdin is not None and proc.stdout is not None
+        proc.stdin.write(rev.encode() + b"\n")
+        proc.stdin.flush()
+        header = proc.stdout.readline()
+        if not header:
+            raise EOFError("git cat-file exited")
+        parts = header.decode().rstrip("\n").rsplit(" ", 2)
+        if len(parts) != 3 or parts[2] in ("missing", "ambiguous") or not parts[2].isdigit():
+            return None
+        info = ObjectInfo(sha=parts[0], type=parts[1], size=int(parts[2]))
+        if not self.contents:
+            return info, None
+        data = proc.stdout.read(info.size + 1)[:-1]  # contents are followed by LF
+        if len(data) != info.size:
+            raise EOFError("git cat-file exited")
+        return info, data
+
+    def close(self) -> None:
+        """Stop the co-process (a later query restarts it)."""
+        with self._lock:
+            if self._finalizer is not None:
+                self._finalizer()
+            self._proc = None
+
 
 class GitRunner:
     """Low-level git command runner with repository validation.
@@ -28,6 +145,8 @@ class GitRunner:
         """
         self.repo_path = Path(repo_path).resolve()
         self._validate_repo()
+        self._cat_file_check = CatFileSession(self.repo_path)
+        self._cat_file_batch = CatFileSession(self.repo_path, contents=True)
 
     def _validate_repo(self) -> None:
         """Validate that repo_path is a git repository."""
@@ -87,6 +206,52 @@ class GitRunner:
                 exit_code=e.returncode,
             ) from e
 
+    def object_info(self, rev: str) -> ObjectInfo | None:
+        """Resolve *rev* through the persistent ``cat-file --batch-check`` session.
+
+        Args:
+            rev: Revision expression (branch, tag, SHA, ``ref^{tree}``, ``ref:path``)
+
+        Returns:
+            ObjectInfo, or None if *rev* does not name an object
+        """
+        result = self._cat_file_check.query(rev)
+        return result[0] if result else None
+
+    def read_object(self, rev: str) -> tuple[ObjectInfo, bytes] | None:
+        """Read an object through the persistent ``cat-file --batch`` session.
+
+        Args:
+            rev: Revision expression, e.g. ``HEAD:path/to/file``
+
+        Returns:
+            ``(info, raw contents)``, or None if *rev* does not name an object
+        """
+        result = self._cat_file_batch.query(rev)
+        if result is None:
+            return None
+        info, data = result
+        return info, data or b""
+
+    def for_each_ref(self, *patterns: str, fields: tuple[str, ...] = ("refname", "objectname")) -> list[list[str]]:
+        """List refs and selected fields with a single ``git for-each-ref`` call.
+
+        Args:
+            *patterns: Ref patterns, e.g. ``refs/tags/zerg-snapshot-*`` (all refs if empty)
+            fields: for-each-ref field names (without ``%()``)
+
+        Returns:
+            One list of field values per ref, in the order of *fields*
+        """
+        fmt = "%00".join(f"%({name})" for name in fields)
+        result = self._run("for-each-ref", f"--format={fmt}", *patterns)
+        return [line.split(_REF_FIELD_SEP) for line in result.stdout.splitlines() if line]
+
+    def close(self) -> None:
+        """Stop any persistent ``git cat-file`` co-processes."""
+        self._cat_file_check.close()
+        self._cat_file_batch.close()
+
     def current_branch(self) -> str:
         """Get the current branch name.
 
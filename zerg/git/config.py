@@ -59,6 +59,8 @@ class GitConfig(BaseModel):
     rescue: GitRescueConfig = Field(default_factory=GitRescueConfig)
     review: GitReviewConfig = Field(default_factory=GitReviewConfig)
     context_mode: str = Field(default="auto", pattern="^(solo|team|swarm|auto)$")
+    # Level merges: "merge-tree" works in the object database only, "checkout" runs git merge
+    merge_backend: str = Field(default="auto", pattern="^(auto|merge-tree|checkout)$")
 
 
 def detect_context(runner: GitRunner) -> str:
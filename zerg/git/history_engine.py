@@ -89,6 +89,33 @@ def _detect_type_from_message(message: str) -> CommitType | None:
     return None
 
 
+_NUMSTAT_LINE = re.compile(r"^(\d+|-)\t(\d+|-)\t(.+)$")
+_RENAME_BRACES = re.compile(r"\{[^{}]* => ([^{}]*)\}")
+
+
+def _parse_numstat_line(line: str) -> tuple[str, int] | None:
+    """Parse a ``--numstat`` line into (path, lines added + deleted).
+
+    Renames (``old => new`` or ``dir/{old => new}/f``) resolve to the new
+    path, matching what ``--name-only`` reports. Binary files count as 0.
+
+    Args:
+        line: One line of numstat output.
+
+    Returns:
+        (path, lines changed), or None if *line* is not a numstat line.
+    """
+    match = _NUMSTAT_LINE.match(line)
+    if match is None:
+        return None
+    ins, dels, path = match.groups()
+    if " => " in path:
+        path = _RENAME_BRACES.sub(r"\1", path).replace("//", "/")
+        path = path.rsplit(" => ", 1)[-1]
+    changed = (int(ins) if ins != "-" else 0) + (int(dels) if dels != "-" else 0)
+    return path, changed
+
+
 def _get_lines_changed(runner: GitRunner, sha: str) -> int:
     """Get the total lines changed for a commit.
 
@@ -122,8 +149,9 @@ class HistoryAnalyzer:
     def get_commits(self, base_branch: str = "main") -> list[CommitInfo]:
         """Get commits between base branch and HEAD.
 
-        Uses git log with a custom format and --name-only to capture
-        both metadata and file lists per commit.
+        Uses a single git log with a custom format and --numstat to
+        capture metadata, file lists and line counts for every commit,
+        rather than one ``git show`` per commit.
 
         Args:
             base_branch: Base branch to compare against.
@@ -137,7 +165,7 @@ class HistoryAnalyzer:
             "log",
             f"{base_branch}..HEAD",
             "--format=%H|||%s|||%an|||%ai",
-            "--name-only",
+            "--numstat",
             check=False,
         )
 
@@ -148,10 +176,11 @@ class HistoryAnalyzer:
         return self._parse_log_output(output)
 
     def _parse_log_output(self, output: str) -> list[CommitInfo]:
-        """Parse the combined log + name-only output.
+        """Parse the combined log + numstat (or name-only) output.
 
         The format alternates between commit metadata lines
-        (containing |||) and file name lines.
+        (containing |||) and per-file lines, either numstat
+        (``added<TAB>deleted<TAB>path``) or bare file names.
 
         Args:
             output: Raw git log output.
@@ -165,6 +194,7 @@ class HistoryAnalyzer:
         current_author = ""
         current_date = ""
         current_files: list[str] = []
+        current_lines = 0
 
         for line in output.splitlines():
             line = line.strip()
@@ -182,6 +212,7 @@ class HistoryAnalyzer:
                             date=current_date,
                             files=tuple(current_files),
                             commit_type=_detect_type_from_message(current_message),
+                            lines_changed=current_lines,
                         )
                     )
 
@@ -193,12 +224,18 @@ class HistoryAnalyzer:
                     current_author = parts[2].strip()
                     current_date = parts[3].strip()
                     current_files = []
+                    current_lines = 0
                 else:
                     current_sha = ""
             else:
                 # File name line
                 if current_sha and line:
-                    current_files.append(line)
+                    numstat = _parse_numstat_line(line)
+                    if numstat is None:
+                        current_files.append(line)
+                    else:
+                        current_files.append(numstat[0])
+                        current_lines += numstat[1]
 
         # Don't forget the last commit
         if current_sha:
@@ -210,6 +247,7 @@ class HistoryAnalyzer:
                     date=current_date,
                     files=tuple(current_files),
                     commit_type=_detect_type_from_message(current_message),
+                    lines_changed=current_lines,
                 )
             )
 
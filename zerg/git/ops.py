@@ -1,5 +1,6 @@
 """GitOps -- high-level git operations for branch management and merging."""
 
+import re
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -35,6 +36,7 @@ class GitOps(GitRunner):
             repo_path: Path to the git repository
         """
         super().__init__(repo_path)
+        self._merge_tree_supported: bool | None = None
 
     def branch_exists(self, branch: str) -> bool:
         """Check if a branch exists.
@@ -45,8 +47,7 @@ class GitOps(GitRunner):
         Returns:
             True if branch exists
         """
-        result = self._run("branch", "--list", branch, check=False)
-        return bool(result.stdout.strip())
+        return self.object_info(f"refs/heads/{branch}") is not None
 
     def create_branch(self, branch: str, base: str = "HEAD") -> str:
         """Create a new branch.
@@ -90,7 +91,14 @@ class GitOps(GitRunner):
 
         Returns:
             Full commit SHA
+
+        Raises:
+            GitError: If the reference cannot be resolved
         """
+        info = self.object_info(ref)
+        if info is not None:
+            return info.sha
+        # Unresolvable: let rev-parse produce the error (and accept anything it does)
         result = self._run("rev-parse", ref)
         return result.stdout.strip()
 
@@ -183,6 +191,154 @@ class GitOps(GitRunner):
         logger.info(f"Merged {branch} into {self.current_branch()}: {commit_sha[:8]}")
         return commit_sha
 
+    def supports_merge_tree(self) -> bool:
+        """Check whether git supports ``merge-tree --write-tree`` (git >= 2.38).
+
+        Returns:
+            True if checkout-free merges are available
+        """
+        if self._merge_tree_supported is None:
+            supported = False
+            try:
+                match = re.search(r"(\d+)\.(\d+)", self._run("version", check=False).stdout)
+                if match:
+                    supported = (int(match.group(1)), int(match.group(2))) >= (2, 38)
+            except GitError:
+                pass  # Treat an unusable git as lacking merge-tree
+            self._merge_tree_supported = supported
+        return self._merge_tree_supported
+
+    def merge_tree(self, ours: str, theirs: str) -> tuple[str, list[str]]:
+        """Compute a merge result in the object database without touching the working tree.
+
+        Args:
+            ours: Commit-ish to merge into
+            theirs: Commit-ish being merged
+
+        Returns:
+            Tuple of (tree SHA, conflicting file paths). The list is empty for
+            a clean merge; on conflicts the tree contains conflict markers and
+            must not be committed.
+
+        Raises:
+            GitError: If merge-tree fails for reasons other than conflicts
+        """
+        result = self._run(
+            "merge-tree", "--write-tree", "--name-only", "--no-messages", "-z", ours, theirs, check=False
+        )
+        if result.returncode not in (0, 1):
+            raise GitError(
+                f"git merge-tree failed: {result.stderr.strip()}",
+                command=f"git merge-tree --write-tree {ours} {theirs}",
+                exit_code=result.returncode,
+            )
+        fields = result.stdout.split("\0")
+        conflicts: list[str] = []
+        for name in fields[1:]:
+            if not name:
+                break
+            if name not in conflicts:
+                conflicts.append(name)
+        return fields[0].strip(), conflicts
+
+    def commit_tree(self, tree: str, parents: list[str], message: str) -> str:
+        """Create a commit object for *tree* without updating any ref.
+
+        Args:
+            tree: Tree SHA
+            parents: Parent commit SHAs (first parent first)
+            message: Commit message
+
+        Returns:
+            New commit SHA
+        """
+        args = ["commit-tree", tree]
+        for parent in parents:
+            args.extend(["-p", parent])
+        args.extend(["-m", message])
+        return self._run(*args).stdout.strip()
+
+    def update_ref(self, ref: str, new: str, old: str | None = None) -> None:
+        """Point *ref* at *new*, optionally only if it still points at *old*.
+
+        Args:
+            ref: Full ref name (e.g. ``refs/heads/main``)
+            new: New commit SHA
+            old: Expected current SHA (compare-and-swap)
+        """
+        args = ["update-ref", "-m", "zerg: merge", ref, new]
+        if old:
+            args.append(old)
+        self._run(*args)
+
+    def is_ancestor(self, ancestor: str, descendant: str) -> bool:
+        """Check whether *ancestor* is reachable from *descendant*.
+
+        Args:
+            ancestor: Candidate ancestor commit-ish
+            descendant: Descendant commit-ish
+
+        Returns:
+            True if *ancestor* is an ancestor of (or equal to) *descendant*
+        """
+        result = self._run("merge-base", "--is-ancestor", ancestor, descendant, check=False)
+        return result.returncode == 0
+
+    def changed_files(self, base: str, head: str = "HEAD") -> list[str]:
+        """List files that differ between two commits.
+
+        Args:
+            base: Commit-ish to compare from
+            head: Commit-ish to compare to
+
+        Returns:
+            Paths relative to the repository root (renames appear as a
+            deletion plus an addition)
+        """
+        result = self._run("diff", "--name-only", "--no-renames", "-z", base, head)
+        return [name for name in result.stdout.split("\0") if name]
+
+    def merge_without_checkout(self, branches: list[str], target: str) -> list[str]:
+        """Merge *branches* into branch *target* entirely in the object database.
+
+        Each branch is merged with ``merge-tree --write-tree`` and recorded as a
+        ``--no-ff`` style merge commit via ``commit-tree``; the target ref is
+        advanced once at the end with a compare-and-swap ``update-ref``. The
+        working tree, index and HEAD are never touched. Branches already
+        contained in the target are skipped, as ``git merge`` would.
+
+        Args:
+            branches: Branches to merge, in order
+            target: Branch name to merge into (must not be checked out)
+
+        Returns:
+            Commit SHA of the target after each branch merge
+
+        Raises:
+            MergeConflictError: If any branch conflicts; the target ref is unchanged
+        """
+        start = self.get_commit(target)
+        tip = start
+        commits: list[str] = []
+        for branch in branches:
+            if self.is_ancestor(branch, tip):
+                commits.append(tip)
+                continue
+            tree, conflicts = self.merge_tree(tip, branch)
+            if conflicts:
+                raise MergeConflictError(
+                    f"Merge conflict: {branch} into {target}",
+                    source_branch=branch,
+                    target_branch=target,
+                    conflicting_files=conflicts,
+                )
+            tip = self.commit_tree(tree, [tip, self.get_commit(branch)], f"Merge {branch} into {target}")
+            commits.append(tip)
+        if tip != start:
+            self.update_ref(f"refs/heads/{target}", tip, start)
+        logger.info(f"Merged {len(branches)} branches into {target} without checkout: {tip[:8]}")
+        return commits
+
     def abort_merge(self) -> None:
         """Abort an in-progress merge."""
         self._run("merge", "--abort", check=False)
@@ -49,6 +49,36 @@ _DOMAIN_RULE_PATHS: dict[str, list[str]] = {
 }
 
 
+def _truncate_hunks(hunks: str, budget_chars: int) -> str:
+    """Truncate diff text to *budget_chars*, marking the cut."""
+    if len(hunks) <= budget_chars:
+        return hunks
+    return hunks[:budget_chars] + "\n... [truncated]"
+
+
+def _split_diff(diff: str) -> dict[str, str]:
+    """Split multi-file ``git diff --no-renames`` output into per-file sections.
+
+    Args:
+        diff: Raw diff output.
+
+    Returns:
+        Mapping of file path to the section starting at its ``diff --git`` line.
+    """
+    sections: dict[str, str] = {}
+    for section in re.split(r"^(?=diff --git )", diff, flags=re.MULTILINE):
+        header, _, _ = section.partition("\n")
+        rest = header.removeprefix("diff --git ")
+        if rest == header or not rest.startswith("a/"):
+            continue  # preamble, or a quoted path git escaped
+        # Without renames the header is "a/<path> b/<path>" with both paths equal
+        path_len = (len(rest) - len("a/ b/")) // 2
+        path = rest[2 : 2 + path_len]
+        if rest == f"a/{path} b/{path}":
+            sections[path] = section
+    return sections
+
+
 class ContextPreparer:
     """Prepares code context from changed files for AI review."""
 
@@ -87,10 +117,20 @@ class ContextPreparer:
             Diff hunk text, truncated if necessary.
         """
         result = self._runner._run("diff", f"{base_branch}..HEAD", "--", filepath)
-        hunks = result.stdout
-        if len(hunks) <= budget_chars:
-            return hunks
-        return hunks[:budget_chars] + "\n... [truncated]"
+        return _truncate_hunks(result.stdout, budget_chars)
+
+    def get_all_hunks(self, base_branch: str = "main") -> dict[str, str]:
+        """Get untruncated diff hunks for every changed file with a single ``git diff``.
+
+        Args:
+            base_branch: Branch to diff against.
+
+        Returns:
+            Mapping of file path to its diff text. Files whose header path is
+            quoted by git (unusual characters) are omitted.
+        """
+        result = self._runner._run("diff", "--no-renames", f"{base_branch}..HEAD")
+        return _split_diff(result.stdout)
 
     def prepare_context(
         self,
@@ -117,9 +157,13 @@ class ContextPreparer:
         per_file_budget = max(200, hunk_budget // len(changed))
         truncated = False
 
+        all_hunks = self.get_all_hunks(base_branch)
         files = []
         for fpath in changed:
-            hunks = self.get_file_hunks(fpath, base_branch, per_file_budget)
+            if fpath in all_hunks:
+                hunks = _truncate_hunks(all_hunks[fpath], per_file_budget)
+            else:
+                hunks = self.get_file_hunks(fpath, base_branch, per_file_budget)
             if hunks.endswith("... [truncated]"):
                 truncated = True
             ext = Path(fpath).suffix
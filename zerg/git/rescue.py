@@ -188,33 +188,30 @@ class SnapshotManager:
         Returns:
             List of RescueSnapshot objects sorted by timestamp
         """
-        result = self._runner._run("tag", "--list", f"{self.TAG_PREFIX}*", check=False)
-        tags = [t.strip() for t in result.stdout.strip().split("\n") if t.strip()]
+        # One for-each-ref call resolves every tag; *objectname is the peeled
+        # commit for annotated tags and empty for lightweight ones
+        try:
+            refs = self._runner.for_each_ref(
+                f"refs/tags/{self.TAG_PREFIX}*",
+                fields=("refname:strip=2", "objectname", "*objectname"),
+            )
+        except GitError:
+            logger.warning("Could not list snapshot tags")
+            return []
 
         snapshots: list[RescueSnapshot] = []
-        for tag in sorted(tags):
+        for tag, target, peeled in sorted(refs):
             _validate_name(tag, "tag")
-            try:
-                # Get the commit the tag points to
-                commit_result = self._runner._run("rev-list", "-1", tag)
-                commit = commit_result.stdout.strip()
-
-                # Extract timestamp from tag name
-                timestamp = tag.removeprefix(self.TAG_PREFIX)
-
-                snapshots.append(
-                    RescueSnapshot(
-                        timestamp=timestamp,
-                        branch="",  # branch info not stored in lightweight tags
-                        commit=commit,
-                        operation="",
-                        tag=tag,
-                        description="",
-                    )
+            snapshots.append(
+                RescueSnapshot(
+                    timestamp=tag.removeprefix(self.TAG_PREFIX),
+                    branch="",  # branch info not stored in lightweight tags
+                    commit=peeled or target,
+                    operation="",
+                    tag=tag,
+                    description="",
                 )
-            except GitError:
-                logger.warning(f"Could not resolve snapshot tag: {tag}")
-                continue
+            )
 
         return snapshots
 
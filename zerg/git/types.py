@@ -30,6 +30,7 @@ class CommitInfo:
     date: str
     files: tuple[str, ...] = ()
     commit_type: CommitType | None = None
+    lines_changed: int = 0
 
 
 @dataclass
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
 import os
 import tempfile
@@ -12,8 +13,11 @@ from typing import TYPE_CHECKING, Any
 
 from zerg.constants import STATE_DIR
 from zerg.logging import get_logger
+from zerg.worker_status_table import WorkerStatusTable, read_all_freshest, read_freshest
 
 if TYPE_CHECKING:
+    from types import TracebackType
+
     from zerg.config import HeartbeatConfig
 
 logger = get_logger("heartbeat")
@@ -95,12 +99,19 @@ class Heartbeat:
 
 
 class HeartbeatWriter:
-    """Worker-side heartbeat writer. Writes periodic heartbeat JSON files."""
+    """Worker-side heartbeat writer.
+
+    Publishes heartbeats into the shared worker status table and, unless
+    json_export is disabled, also as a ``heartbeat-{id}.json`` file for
+    readers that still expect one.
+    """
 
-    def __init__(self, worker_id: int, state_dir: str | Path | None = None) -> None:
+    def __init__(self, worker_id: int, state_dir: str | Path | None = None, json_export: bool = True) -> None:
         self._worker_id = worker_id
         self._state_dir = Path(state_dir) if state_dir else Path(STATE_DIR)
         self._state_dir.mkdir(parents=True, exist_ok=True)
+        self._json_export = json_export
+        self._table = WorkerStatusTable(self._state_dir)
 
     @property
     def heartbeat_path(self) -> Path:
@@ -116,7 +127,7 @@ class HeartbeatWriter:
         total_steps: int | None = None,
         step_states: list[str] | None = None,
     ) -> Heartbeat:
-        """Write a heartbeat file atomically (temp+rename).
+        """Publish a heartbeat to the status table (and JSON file if exported).
 
         Args:
             task_id: Current task ID being executed.
@@ -137,6 +148,17 @@ class HeartbeatWriter:
             step_states=step_states,
         )
 
+        try:
+            self._table.write(self._worker_id, "heartbeat", heartbeat.to_dict())
+        except (OSError, ValueError):
+            logger.debug(
+                "Failed to publish heartbeat for worker %d",
+                self._worker_id,
+                exc_info=True,
+            )
+        if not self._json_export:
+            return heartbeat
+
         target = self.heartbeat_path
         try:
             fd, tmp_path = tempfile.mkstemp(dir=str(self._state_dir), suffix=".tmp")
@@ -152,11 +174,13 @@ class HeartbeatWriter:
         return heartbeat
 
     def cleanup(self) -> None:
-        """Remove heartbeat file on clean shutdown."""
+        """Remove heartbeat record and file on clean shutdown."""
         try:
+            self._table.clear(self._worker_id, "heartbeat")
             self.heartbeat_path.unlink(missing_ok=True)
         except OSError:
             pass  # Best-effort heartbeat cleanup
+        self._table.close()
 
 
 class HeartbeatMonitor:
@@ -178,7 +202,8 @@ class HeartbeatMonitor:
         """Initialize HeartbeatMonitor.
 
         Args:
-            state_dir: Directory containing heartbeat files. Defaults to STATE_DIR.
+            state_dir: Directory containing the status table and heartbeat
+                files. Defaults to STATE_DIR.
             stale_timeout_seconds: Default stale timeout in seconds. If not provided,
                 uses DEFAULT_STALE_TIMEOUT_SECONDS (120). Can be overridden per-call.
         """
@@ -186,6 +211,7 @@ class HeartbeatMonitor:
         self._stale_timeout_seconds = (
             stale_timeout_seconds if stale_timeout_seconds is not None else self.DEFAULT_STALE_TIMEOUT_SECONDS
         )
+        self._table = WorkerStatusTable(self._state_dir)
 
     @property
     def stale_timeout_seconds(self) -> int:
@@ -213,33 +239,32 @@ class HeartbeatMonitor:
         )
 
     def read(self, worker_id: int) -> Heartbeat | None:
-        """Read heartbeat file for a given worker."""
-        path = self._state_dir / f"heartbeat-{worker_id}.json"
-        if not path.exists():
+        """Read the heartbeat for a given worker.
+
+        The newer of the worker's status-table record and
+        ``heartbeat-{id}.json`` wins; the file is only parsed when it is newer.
+        """
+        record = read_freshest(self._table, worker_id, "heartbeat")
+        if record is None:
             return None
         try:
-            data = json.loads(path.read_text())
-            return Heartbeat.from_dict(data)
-        except (json.JSONDecodeError, KeyError, OSError):
-            logger.debug(
-                "Failed to read heartbeat for worker %d",
-                worker_id,
-                exc_info=True,
-            )
+            return Heartbeat.from_dict(record)
+        except (KeyError, TypeError):
+            logger.debug("Failed to read heartbeat for worker %d", worker_id, exc_info=True)
             return None
 
     def read_all(self) -> dict[int, Heartbeat]:
-        """Read all heartbeat files in the state directory."""
+        """Read the heartbeats of all workers.
+
+        All table records come from one mapping of the status table; a JSON
+        file is parsed only when it is newer than its worker's table record.
+        """
         result: dict[int, Heartbeat] = {}
         if not self._state_dir.exists():
             return result
-        for path in self._state_dir.glob("heartbeat-*.json"):
-            try:
-                data = json.loads(path.read_text())
-                hb = Heartbeat.from_dict(data)
-                result[hb.worker_id] = hb
-            except (json.JSONDecodeError, KeyError, OSError):
-                continue
+        for wid, record in read_all_freshest(self._table, "heartbeat").items():
+            with contextlib.suppress(KeyError, TypeError):
+                result[wid] = Heartbeat.from_dict(record)
         return result
 
     def check_stale(self, worker_id: int, timeout_seconds: int | None = None) -> bool:
@@ -271,8 +296,25 @@ class HeartbeatMonitor:
             List of worker IDs with stale or missing heartbeats.
         """
         effective_timeout = timeout_seconds if timeout_seconds is not None else self._stale_timeout_seconds
+        heartbeats = self.read_all()
         stalled = []
         for wid in worker_ids:
-            if self.check_stale(wid, effective_timeout):
+            hb = heartbeats.get(wid)
+            if hb is None or hb.is_stale(effective_timeout):
                 stalled.append(wid)
         return stalled
+
+    def close(self) -> None:
+        """Release the status table mapping."""
+        self._table.close()
+
+    def __enter__(self) -> HeartbeatMonitor:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -11,7 +11,7 @@ import asyncio
 import os
 import subprocess
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
@@ -23,6 +23,7 @@ from zerg.env_validator import (
 )
 from zerg.launcher_types import LauncherConfig, SpawnResult, WorkerHandle
 from zerg.launchers.base import WorkerLauncher
+from zerg.launchers.container_monitor import ContainerMonitor
 from zerg.logging import get_logger
 
 logger = get_logger("launcher")
@@ -42,6 +43,15 @@ class ContainerLauncher(WorkerLauncher):
     WORKER_ENTRY_SCRIPT = ".zerg/worker_entry.sh"
     # Performance: Skip docker calls if status was checked recently (FR-1)
     MONITOR_COOLDOWN_SECONDS = 10
+    # Label on every worker container; docker events are filtered on it
+    WORKER_LABEL = "zerg.worker"
+    # Docker healthcheck on the alive marker (the entry script removes it on
+    # exit), so monitor() reads it from docker inspect/events instead of
+    # running docker exec per worker. The start period matches the old
+    # 60s grace period for the marker to appear.
+    HEALTH_INTERVAL = "15s"
+    HEALTH_START_PERIOD = "60s"
+    HEALTH_RETRIES = 2
 
     def __init__(
         self,
@@ -50,6 +60,7 @@ class ContainerLauncher(WorkerLauncher):
         network: str | None = None,
         memory_limit: str = "4g",
         cpu_limit: float = 2.0,
+        monitor_events: bool = True,
     ) -> None:
         """Initialize container launcher.
 
@@ -59,13 +70,27 @@ class ContainerLauncher(WorkerLauncher):
             network: Docker network name (default: zerg-internal)
             memory_limit: Docker --memory limit (e.g., '4g', '512m')
             cpu_limit: Docker --cpus limit (e.g., 2.0)
+            monitor_events: Track container status from ``docker events``
+                rather than polling with batched ``docker inspect``
         """
         super().__init__(config)
         self.image_name = image_name
         self.network = network or self.DEFAULT_NETWORK
         self.memory_limit = memory_limit
         self.cpu_limit = cpu_limit
+        self.monitor_events = monitor_events
         self._container_ids: dict[int, str] = {}
+        self._status_monitor: ContainerMonitor | None = None
+
+    def _container_monitor(self) -> ContainerMonitor:
+        """Return the shared container status monitor, creating it on first use."""
+        if self._status_monitor is None:
+            self._status_monitor = ContainerMonitor(
+                label=self.WORKER_LABEL,
+                use_events=self.monitor_events,
+                refresh_interval=self.MONITOR_COOLDOWN_SECONDS,
+            )
+        return self._status_monitor
 
     def spawn(
         self,
@@ -234,6 +259,16 @@ class ContainerLauncher(WorkerLauncher):
             "-d",
             "--name",
             container_name,
+            "--label",
+            f"{self.WORKER_LABEL}={container_name}",
+            "--health-cmd",
+            f"test -f {CONTAINER_HEALTH_FILE}",
+            "--health-interval",
+            self.HEALTH_INTERVAL,
+            "--health-start-period",
+            self.HEALTH_START_PERIOD,
+            "--health-retries",
+            str(self.HEALTH_RETRIES),
             "--user",
             f"{uid}:{gid}",
             "-v",
@@ -487,6 +522,8 @@ class ContainerLauncher(WorkerLauncher):
             del self._container_ids[worker_id]
         if worker_id in self._workers:
             del self._workers[worker_id]
+        if self._status_monitor is not None:
+            self._status_monitor.forget(container_id)
 
     def monitor(self, worker_id: int) -> WorkerStatus:
         """Check worker container status.
@@ -511,51 +548,39 @@ class ContainerLauncher(WorkerLauncher):
                 return handle.status
 
         try:
-            # Check container state
-            result = subprocess.run(
-                ["docker", "inspect", "-f", "{{.State.Running}},{{.State.ExitCode}}", container_id],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
+            # One batched docker call (or none, with the event stream) covers
+            # every tracked container; later workers this tick hit the cache
+            states = self._container_monitor().states(list(self._container_ids.values()))
+            state = states.get(container_id)
 
-            if result.returncode != 0:
+            if state is None:
                 handle.status = WorkerStatus.STOPPED
                 return WorkerStatus.STOPPED
 
-            running, exit_code_str = result.stdout.strip().split(",")
-
-            if running == "true":
+            if state.running:
                 # Container is running, but the CMD sleep keeps it alive after
-                # the worker process exits. Check /tmp/.zerg-alive marker file
-                # which the entry script removes on exit.
-                # Only check after a grace period (marker created during init).
-                if handle.started_at:
-                    from datetime import timedelta
-
-                    uptime = datetime.now() - handle.started_at
-                    if uptime > timedelta(seconds=60):
-                        alive_check = subprocess.run(
-                            ["docker", "exec", container_id, "test", "-f", CONTAINER_HEALTH_FILE],  # noqa: S607
-                            capture_output=True,
-                            timeout=5,
-                        )
-                        if alive_check.returncode != 0:
-                            logger.info(f"Worker {worker_id} process exited (marker file absent)")
-                            handle.status = WorkerStatus.STOPPED
-                            return WorkerStatus.STOPPED
+                # the worker process exits. The healthcheck tests the
+                # /tmp/.zerg-alive marker which the entry script removes on exit.
+                if state.health == "unhealthy":
+                    logger.info(f"Worker {worker_id} process exited (marker file absent)")
+                    handle.status = WorkerStatus.STOPPED
+                    return WorkerStatus.STOPPED
+                if not state.health and self._marker_absent(handle, container_id):
+                    logger.info(f"Worker {worker_id} process exited (marker file absent)")
+                    handle.status = WorkerStatus.STOPPED
+                    return WorkerStatus.STOPPED
                 if handle.status == WorkerStatus.INITIALIZING:
                     handle.status = WorkerStatus.RUNNING
                 return handle.status
             else:
                 # Container has exited
-                handle.exit_code = int(exit_code_str)
+                handle.exit_code = state.exit_code
 
-                if exit_code_str == "0":
+                if state.exit_code == 0:
                     handle.status = WorkerStatus.STOPPED
-                elif exit_code_str == "2":
+                elif state.exit_code == 2:
                     handle.status = WorkerStatus.CHECKPOINTING
-                elif exit_code_str == "3":
+                elif state.exit_code == 3:
                     handle.status = WorkerStatus.BLOCKED
                 else:
                     handle.status = WorkerStatus.CRASHED
@@ -570,6 +595,27 @@ class ContainerLauncher(WorkerLauncher):
             if handle:
                 handle.health_check_at = datetime.now()
 
+    def _marker_absent(self, handle: WorkerHandle, container_id: str) -> bool:
+        """Check the alive marker with docker exec, for containers without a healthcheck.
+
+        Only checked after a grace period (the marker is created during init).
+
+        Args:
+            handle: Worker handle
+            container_id: Container ID
+
+        Returns:
+            True if the marker file is gone
+        """
+        if not handle.started_at or datetime.now() - handle.started_at <= timedelta(seconds=60):
+            return False
+        alive_check = subprocess.run(
+            ["docker", "exec", container_id, "test", "-f", CONTAINER_HEALTH_FILE],  # noqa: S607
+            capture_output=True,
+            timeout=5,
+        )
+        return alive_check.returncode != 0
+
     async def _terminate_impl(
         self,
         worker_id: int,
@@ -634,6 +680,8 @@ class ContainerLauncher(WorkerLauncher):
             # Also remove from worker handles to prevent stale state
             if worker_id in self._workers:
                 del self._workers[worker_id]
+            if self._status_monitor is not None:
+                self._status_monitor.forget(container_id)
 
     def terminate(self, worker_id: int, force: bool = False) -> bool:
         """Terminate a worker container.
@@ -0,0 +1,255 @@
+"""ContainerMonitor — batched and event-driven worker container status.
+
+Polling each worker with its own ``docker inspect`` (plus a ``docker exec``
+for the alive marker) costs several docker CLI round-trips per worker per
+orchestrator tick. ContainerMonitor keeps one state table for all worker
+containers instead:
+
+* it subscribes once to ``docker events`` for labelled worker containers and
+  applies ``start``/``die``/``health_status``/``destroy`` events as they arrive;
+* containers it has not seen yet are fetched with one ``docker inspect`` for
+  all of them;
+* if the event stream is unavailable it falls back to one batched
+  ``docker inspect`` per refresh interval.
+
+Either way the number of docker calls per tick does not grow with the number
+of workers.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import subprocess
+import threading
+import time
+from collections.abc import Collection
+from dataclasses import dataclass
+
+from zerg.logging import get_logger
+
+logger = get_logger("launcher")
+
+# One line per container: "<id> <running> <exit code> <health status or empty>"
+INSPECT_FORMAT = "{{.Id}} {{.State.Running}} {{.State.ExitCode}} {{if .State.Health}}{{.State.Health.Status}}{{end}}"
+
+
+@dataclass
+class ContainerState:
+    """Last known state of one container."""
+
+    running: bool
+    exit_code: int = 0
+    health: str = ""  # "", "starting", "healthy" or "unhealthy"
+
+
+class ContainerMonitor:
+    """Shared status table for worker containers.
+
+    Thread-safe: the event reader thread and orchestrator callers share the
+    table under a lock.
+    """
+
+    def __init__(
+        self,
+        label: str,
+        use_events: bool = True,
+        refresh_interval: float = 10.0,
+    ) -> None:
+        """Initialize the monitor.
+
+        Args:
+            label: Docker label carried by every worker container (event filter)
+            use_events: Subscribe to ``docker events`` instead of polling
+            refresh_interval: Seconds between batched inspects when polling
+        """
+        self.label = label
+        self.use_events = use_events
+        self.refresh_interval = refresh_interval
+        self._states: dict[str, ContainerState] = {}
+        self._gone: set[str] = set()
+        # Bumped by every event for a container, so an inspect that raced
+        # with an event does not overwrite the newer state
+        self._event_seq: dict[str, int] = {}
+        self._refreshed_at = 0.0
+        self._lock = threading.Lock()
+        self._events_proc: subprocess.Popen[str] | None = None
+        self._events_failed = False
+        self._closed = False
+        atexit.register(self.close)
+
+    @property
+    def streaming(self) -> bool:
+        """True while the ``docker events`` subscription is alive."""
+        proc = self._events_proc
+        return proc is not None and proc.poll() is None
+
+    def states(self, container_ids: Collection[str]) -> dict[str, ContainerState]:
+        """Return the state of each known container in *container_ids*.
+
+        Containers missing from the result no longer exist.
+
+        Args:
+            container_ids: IDs (full or prefix) or names of tracked containers
+
+        Returns:
+            Mapping of the requested ID to its state
+
+        Raises:
+            subprocess.SubprocessError, OSError: If docker cannot be run
+            ValueError: If docker inspect output cannot be parsed
+        """
+        with self._lock:
+            # Track the IDs before subscribing so replayed events match them
+            for cid in container_ids:
+                self._event_seq.setdefault(cid, 0)
+
+        if self.use_events and not self._events_failed and not self.streaming:
+            self._subscribe()
+
+        with self._lock:
+            if self.streaming:
+                stale = [cid for cid in container_ids if cid not in self._states and cid not in self._gone]
+            elif time.monotonic() - self._refreshed_at >= self.refresh_interval or any(
+                cid not in self._states and cid not in self._gone for cid in container_ids
+            ):
+                stale = list(container_ids)
+            else:
+                stale = []
+            seq_before = dict(self._event_seq)
+
+        if stale:
+            found = self._inspect(stale)
+            with self._lock:
+                for cid in stale:
+                    if self._event_seq.get(cid) != seq_before.get(cid):
+                        continue  # an event arrived during the inspect; it is newer
+                    if cid in found:
+                        self._states[cid] = found[cid]
+                        self._gone.discard(cid)
+                    else:
+                        self._states.pop(cid, None)
+                        self._gone.add(cid)
+                if not self.streaming:
+                    self._refreshed_at = time.monotonic()
+
+        with self._lock:
+            return {cid: self._states[cid] for cid in container_ids if cid in self._states}
+
+    def forget(self, container_id: str) -> None:
+        """Drop a container that is no longer tracked."""
+        with self._lock:
+            self._states.pop(container_id, None)
+            self._gone.discard(container_id)
+            self._event_seq.pop(container_id, None)
+
+    def _inspect(self, container_ids: list[str]) -> dict[str, ContainerState]:
+        """Fetch the state of several containers with one ``docker inspect``."""
+        result = subprocess.run(
+            ["docker", "inspect", "-f", INSPECT_FORMAT, *container_ids],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        found: dict[str, ContainerState] = {}
+        for line in result.stdout.splitlines():
+            if not line.strip():
+                continue
+            parts = line.split(" ")
+            if len(parts) != 4 or parts[1] not in ("true", "false"):
+                raise ValueError(f"Unexpected docker inspect output: {line!r}")
+            full_id, running, exit_code, health = parts
+            state = ContainerState(running=running == "true", exit_code=int(exit_code), health=health)
+            for cid in container_ids:
+                if full_id.startswith(cid):
+                    found[cid] = state
+        # docker exits non-zero when any container is missing, still printing
+        # the ones it found; anything absent here no longer exists
+        return found
+
+    def _subscribe(self) -> None:
+        """Start the ``docker events`` subscription and its reader thread."""
+        # Callers inspect unseen containers only after subscribing, so replaying
+        # from here covers a container that dies between that inspect and the
+        # stream connecting. One second back absorbs the whole-second rounding.
+        since = str(int(time.time()) - 1)
+        try:
+            proc = subprocess.Popen(
+                [
+                    "docker",
+                    "events",
+                    "--since",
+                    since,
+                    "--filter",
+                    "type=container",
+                    "--filter",
+                    f"label={self.label}",
+                    "--format",
+                    "{{json .}}",
+                ],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+        except OSError as e:
+            logger.debug(f"docker events unavailable, polling instead: {e}")
+            self._events_failed = True
+            return
+        self._events_proc = proc
+        threading.Thread(target=self._read_events, args=(proc,), name="zerg-docker-events", daemon=True).start()
+
+    def _read_events(self, proc: subprocess.Popen[str]) -> None:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            self._apply_event(event)
+        if not self._closed:
+            logger.warning("docker events stream ended, falling back to polling")
+            self._events_failed = True
+
+    def _apply_event(self, event: dict[str, object]) -> None:
+        """Update the table from one ``docker events`` JSON record."""
+        actor = event.get("Actor")
+        attributes = actor.get("Attributes", {}) if isinstance(actor, dict) else {}
+        full_id = str(event.get("id") or (actor.get("ID") if isinstance(actor, dict) else "") or "")
+        action = str(event.get("Action") or event.get("status") or "")
+        if not full_id or not action:
+            return
+
+        with self._lock:
+            # Events carry full IDs; tracked IDs may be prefixes of them
+            known = {*self._states, *self._gone, *self._event_seq}
+            targets = [cid for cid in known if full_id.startswith(cid)] or [full_id]
+            for cid in targets:
+                self._event_seq[cid] = self._event_seq.get(cid, 0) + 1
+                state = self._states.get(cid)
+                if action == "start":
+                    self._states[cid] = ContainerState(running=True)
+                    self._gone.discard(cid)
+                elif action == "die":
+                    exit_code = int(str(attributes.get("exitCode", "0")) or 0)
+                    self._states[cid] = ContainerState(
+                        running=False, exit_code=exit_code, health=state.health if state else ""
+                    )
+                elif action.startswith("health_status:"):
+                    if state is not None:
+                        state.health = action.partition(":")[2].strip()
+                elif action == "destroy":
+                    self._states.pop(cid, None)
+                    self._gone.add(cid)
+
+    def close(self) -> None:
+        """Stop the event subscription (idempotent)."""
+        self._closed = True
+        proc = self._events_proc
+        self._events_proc = None
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        atexit.unregister(self.close)
@@ -34,6 +34,7 @@ from zerg.merge import MergeCoordinator, MergeFlowResult
 from zerg.metrics import MetricsCollector
 from zerg.parser import TaskParser
 from zerg.plugins import LifecycleEvent, PluginRegistry
+from zerg.speculative_merge import SpeculativeMerger
 from zerg.state import StateManager
 from zerg.task_sync import TaskSyncBridge, load_design_manifest
 from zerg.types import GateRunResult
@@ -102,6 +103,7 @@ class LevelCoordinator:
         self._backpressure = backpressure
         self._paused = False
         self.last_merge_result: MergeFlowResult | None = None
+        self._speculative: SpeculativeMerger | None = None
 
     @property
     def paused(self) -> bool:
@@ -174,6 +176,52 @@ class LevelCoordinator:
                 if worker_id is not None:
                     self.state.set_task_status(task_id, TaskStatus.PENDING, worker_id=worker_id)
 
+        self._start_speculation(level)
+
+    def _start_speculation(self, level: int) -> None:
+        """Begin speculative merging for a level when ``rush.speculative_merge`` is on."""
+        self._stop_speculation()
+        rush = self.config.rush
+        if not rush.speculative_merge or rush.defer_merge_to_ship:
+            return
+        gates = [] if rush.gates_at_ship_only else list(self.config.quality_gates)
+        try:
+            self._speculative = SpeculativeMerger(
+                self.feature, self.merger.git, "main", gates=gates, config=self.config
+            )
+            logger.info(f"Speculative merging enabled for level {level}")
+        except Exception as e:  # noqa: BLE001 — intentional: speculation is optional; barrier merge still runs
+            logger.warning(f"Could not start speculative merging for level {level}: {e}")
+            self._speculative = None
+
+    def _stop_speculation(self) -> None:
+        if self._speculative is not None:
+            try:
+                self._speculative.close()
+            except Exception as e:  # noqa: BLE001 — intentional: cleanup of speculative refs is best-effort
+                logger.debug(f"Speculative merge cleanup failed: {e}")
+            self._speculative = None
+
+    def on_task_complete(self, task_id: str) -> None:
+        """Speculatively merge the branch of the worker that just completed *task_id*.
+
+        Registered as an orchestrator task-complete callback; a no-op unless
+        speculative merging is active for the current level. Completions are
+        usually synced from disk after the worker has moved on, so the worker
+        is found through the task's recorded ``worker_id`` first.
+
+        Args:
+            task_id: Completed task
+        """
+        if self._speculative is None:
+            return
+        worker_id = self.state.get_task_worker(task_id)
+        worker = self._workers.get(worker_id) if worker_id is not None else None
+        if worker is None or not worker.branch:
+            worker = next((w for _wid, w in self._workers.items() if w.current_task == task_id and w.branch), None)
+        if worker is not None and worker.branch:
+            self._speculative.submit(worker.branch)
+
     def handle_level_complete(self, level: int) -> bool:
         """Handle level completion.
 
@@ -383,12 +431,17 @@ class LevelCoordinator:
             logger.info(f"Skipping gates for level {level} (gates_at_ship_only=True)")
 
         # Execute full merge flow and store result for loop reuse
-        result = self.merger.full_merge_flow(
-            level=level,
-            worker_branches=worker_branches,
-            target_branch="main",
-            skip_gates=skip_gates,
-        )
+        try:
+            result = self.merger.full_merge_flow(
+                level=level,
+                worker_branches=worker_branches,
+                target_branch="main",
+                skip_gates=skip_gates,
+                speculative=self._speculative,
+            )
+        finally:
+            # Speculation is single-use; merge retries take the regular path
+            self._stop_speculation()
         self.last_merge_result = result
         return result
 
@@ -2,21 +2,49 @@
 
 Each worker writes to its own worker-{id}.jsonl file.
 Thread-safe via threading.Lock on write operations.
+
+With ``async_writes`` enabled, entries are buffered and a background thread
+serialises them in batches, flushing on a size or time threshold so callers
+never block on file I/O.  Rotated files are kept as gzip-compressed
+generations (worker-{id}.jsonl.1.gz is the newest).
 """
 
+import atexit
+import gzip
 import json
+import shutil
 import threading
+from collections import deque
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from zerg.constants import LogEvent, LogPhase
+from zerg.json_utils import dumps
+
+
+def _encode(entry: dict[str, Any]) -> str:
+    """Serialise *entry* as one JSONL line (orjson when available).
+
+    Falls back to stdlib json with ``default=str`` for values orjson rejects
+    (e.g. non-str dict keys) so a bad entry never kills the writer thread.
+    """
+    try:
+        return dumps(entry) + "\n"
+    except TypeError:
+        return json.dumps(entry, default=str) + "\n"
 
 
 class StructuredLogWriter:
     """Writes structured JSONL log entries to a per-worker file.
 
     Thread-safe. Each worker gets its own file: workers/worker-{id}.jsonl
+
+    In synchronous mode (the default) every :meth:`emit` writes and flushes
+    the entry before returning. In asynchronous mode :meth:`emit` only
+    buffers the entry; call :meth:`flush` (crash paths) or :meth:`close`
+    (shutdown) to force pending entries to disk. ``close`` is also registered
+    with :mod:`atexit`.
     """
 
     def __init__(
@@ -25,6 +53,10 @@ class StructuredLogWriter:
         worker_id: int | str,
         feature: str,
         max_size_mb: int = 50,
+        backup_count: int = 5,
+        async_writes: bool = False,
+        batch_size: int = 256,
+        flush_interval: float = 0.5,
     ) -> None:
         """Initialize writer.
 
@@ -33,12 +65,20 @@ class StructuredLogWriter:
             worker_id: Worker identifier (int or "orchestrator")
             feature: Feature name
             max_size_mb: Max file size in MB before rotation
+            backup_count: Number of gzip-compressed rotated generations to keep
+            async_writes: Write from a background thread instead of the caller's
+            batch_size: Async mode: entries buffered before a write is forced
+            flush_interval: Async mode: max seconds an entry waits before being written
         """
         self.log_dir = Path(log_dir)
         self.worker_id = worker_id
         self.feature = feature
         self.max_size_bytes = max_size_mb * 1024 * 1024
+        self.backup_count = backup_count
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
         self._lock = threading.Lock()
+        self._closed = False
 
         # Create workers directory
         workers_dir = self.log_dir / "workers"
@@ -48,6 +88,24 @@ class StructuredLogWriter:
         self._file_path = workers_dir / f"worker-{worker_id}.jsonl"
         self._file = open(self._file_path, "a")  # noqa: SIM115
 
+        # Async mode: callers append to a deque (atomic under the GIL) and only
+        # wake the writer thread once a batch is full; otherwise it wakes every
+        # flush_interval.
+        self._pending: deque[dict[str, Any]] | None = None
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+        if async_writes:
+            self._pending = deque()
+            self._thread = threading.Thread(target=self._writer_loop, name=f"zerg-log-writer-{worker_id}", daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+
+    @property
+    def is_async(self) -> bool:
+        """True if entries are written by the background thread."""
+        return self._thread is not None
+
     def emit(
         self,
         level: str,
@@ -68,6 +126,9 @@ class StructuredLogWriter:
             event: Optional event type
             data: Optional extra data dict
             duration_ms: Optional duration in milliseconds
+
+        In async mode *data* is serialised later on the writer thread, so it
+        must not be mutated after the call.
         """
         entry: dict[str, Any] = {
             "ts": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
@@ -88,29 +149,99 @@ class StructuredLogWriter:
         if duration_ms is not None:
             entry["duration_ms"] = duration_ms
 
-        line = json.dumps(entry) + "\n"
+        pending = self._pending
+        if pending is not None and not self._closed:
+            pending.append(entry)
+            if len(pending) >= self.batch_size and not self._wakeup.is_set():
+                self._wakeup.set()
+            return
+
+        line = _encode(entry)
 
         with self._lock:
             self._rotate_if_needed()
             self._file.write(line)
             self._file.flush()
 
+    def flush(self) -> None:
+        """Synchronously write all pending entries to disk.
+
+        Drains the async buffer on the calling thread, so it is safe to call
+        from crash handlers even if the background thread has died.
+        """
+        if self._closed:
+            return
+        self._write_pending()
+        with self._lock:
+            self._file.flush()
+
+    def _writer_loop(self) -> None:
+        """Background thread: write pending entries on a size or time threshold."""
+        while not self._stopping:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self._write_pending()
+
+    def _write_pending(self) -> None:
+        """Take every buffered entry and write them as one batch."""
+        pending = self._pending
+        if not pending:
+            return
+        with self._lock:
+            batch = [pending.popleft() for _ in range(len(pending))]
+            self._write_lines("".join(_encode(entry) for entry in batch))
+
+    def _write_lines(self, lines: str) -> None:
+        """Write serialised lines with a single write and flush (caller holds the lock)."""
+        if not lines or self._closed:
+            return
+        try:
+            self._rotate_if_needed()
+            self._file.write(lines)
+            self._file.flush()
+        except (OSError, ValueError):
+            pass  # Best-effort: a failed write must not kill the writer thread
+
     def _rotate_if_needed(self) -> None:
         """Rotate log file if it exceeds max size."""
         try:
             pos = self._file.tell()
             if pos > self.max_size_bytes:
                 self._file.close()
-                # Rename current to .1 (overwrite previous rotation)
-                rotated = self._file_path.with_suffix(".jsonl.1")
-                self._file_path.rename(rotated)
+                self._rotate()
                 self._file = open(self._file_path, "a")  # noqa: SIM115
         except OSError:
             pass  # Best-effort rotation
 
+    def _rotate(self) -> None:
+        """Shift compressed generations up by one and gzip the current file into .1.gz."""
+        if self.backup_count < 1:
+            self._file_path.unlink(missing_ok=True)
+            return
+        for generation in range(self.backup_count - 1, 0, -1):
+            src = self._generation_path(generation)
+            if src.exists():
+                src.replace(self._generation_path(generation + 1))
+        with open(self._file_path, "rb") as src_f, gzip.open(self._generation_path(1), "wb") as dst_f:
+            shutil.copyfileobj(src_f, dst_f)
+        self._file_path.unlink()
+
+    def _generation_path(self, generation: int) -> Path:
+        """Path of rotated generation *generation* (1 is the newest)."""
+        return self._file_path.with_name(f"{self._file_path.name}.{generation}.gz")
+
     def close(self) -> None:
         """Flush and close the log file."""
+        if self._closed:
+            return
+        if self._thread is not None:
+            atexit.unregister(self.close)
+            self._stopping = True
+            self._wakeup.set()
+            self._thread.join(timeout=5.0)
+            self._write_pending()
         with self._lock:
+            self._closed = True
             self._file.flush()
             self._file.close()
 
@@ -137,6 +268,11 @@ class TaskArtifactCapture:
         self.task_dir = self.log_dir / "tasks" / task_id
         self.task_dir.mkdir(parents=True, exist_ok=True)
 
+    @property
+    def claude_output_path(self) -> Path:
+        """Path of the Claude CLI output artifact (streamed to by ProtocolHandler)."""
+        return self.task_dir / "claude_output.txt"
+
     def capture_claude_output(self, stdout: str, stderr: str) -> None:
         """Capture Claude CLI output.
 
@@ -144,8 +280,7 @@ class TaskArtifactCapture:
             stdout: Standard output
             stderr: Standard error
         """
-        output_path = self.task_dir / "claude_output.txt"
-        with open(output_path, "w") as f:
+        with open(self.claude_output_path, "w") as f:
             if stdout:
                 f.write("=== STDOUT ===\n")
                 f.write(str(stdout))
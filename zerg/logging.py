@@ -276,6 +276,8 @@ def setup_structured_logging(
     feature: str,
     level: str = "info",
     max_size_mb: int = 50,
+    backup_count: int = 5,
+    async_writes: bool = False,
 ) -> StructuredLogWriter:
     """Set up structured JSONL logging for a worker.
 
@@ -288,6 +290,8 @@ def setup_structured_logging(
         feature: Feature name
         level: Log level
         max_size_mb: Max file size before rotation
+        backup_count: Number of gzip-compressed rotated generations to keep
+        async_writes: Batch writes on a background thread
 
     Returns:
         The StructuredLogWriter instance (caller should close on shutdown)
@@ -299,6 +303,8 @@ def setup_structured_logging(
         worker_id=worker_id,
         feature=feature,
         max_size_mb=max_size_mb,
+        backup_count=backup_count,
+        async_writes=async_writes,
     )
 
     log_level = getattr(logging, level.upper(), logging.INFO)
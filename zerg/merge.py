@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING, Any
 
 from zerg.config import ZergConfig
 from zerg.constants import GateResult, MergeStatus
-from zerg.exceptions import MergeConflictError
+from zerg.exceptions import GitError, MergeConflictError
 from zerg.gates import GateRunner
 from zerg.git_ops import GitOps
 from zerg.logging import get_logger
@@ -18,6 +18,8 @@ from zerg.types import GateRunResult, MergeResult
 if TYPE_CHECKING:
     # CodeQL: cyclic import is compile-time only; no runtime cycle
     from zerg.level_coordinator import GatePipeline
+    from zerg.plugins import PluginRegistry
+    from zerg.speculative_merge import SpeculativeMerger
 
 logger = get_logger("merge")
 
@@ -58,6 +60,7 @@ class MergeCoordinator:
         config: ZergConfig | None = None,
         repo_path: str | Path = ".",
         gate_pipeline: GatePipeline | None = None,
+        plugin_registry: PluginRegistry | None = None,
     ) -> None:
         """Initialize merge coordinator.
 
@@ -66,12 +69,13 @@ class MergeCoordinator:
             config: ZERG configuration
             repo_path: Path to git repository
             gate_pipeline: Optional GatePipeline for cached gate execution
+            plugin_registry: Optional registry whose plugin gates run with the config gates
         """
         self.feature = feature
         self.config = config or ZergConfig.load()
         self.repo_path = Path(repo_path).resolve()
         self.git = GitOps(repo_path)
-        self.gates = GateRunner(self.config)
+        self.gates = GateRunner(self.config, plugin_registry=plugin_registry)
         self._gate_pipeline = gate_pipeline
         self._current_level: int = 0  # Track level for cache key
 
@@ -130,11 +134,15 @@ class MergeCoordinator:
             logger.info(f"Pre-merge gates: {passed_count} passed, {failed_count} failed")
             return all_passed, results
 
-        # Fallback to uncached execution
+        # Fallback to uncached execution. The staging branch was just cut
+        # from the target, so plugin gates have nothing new to check.
         all_passed, results = self.gates.run_all_gates(
             gates=required_gates,
             cwd=cwd,
             required_only=True,
+            feature=self.feature,
+            level=self._current_level,
+            changed_files=[],
         )
 
         summary = self.gates.get_summary()
@@ -149,6 +157,11 @@ class MergeCoordinator:
     ) -> list[MergeResult]:
         """Merge source branches into staging branch.
 
+        Uses a checkout-free ``git merge-tree`` merge when available (see
+        ``git.merge_backend``) and falls back to ``git merge`` in the checked
+        out staging branch when it reports conflicts, so conflict handling
+        and reporting are unchanged.
+
         Args:
             source_branches: Worker branches to merge
             staging_branch: Target staging branch
@@ -159,6 +172,41 @@ class MergeCoordinator:
         Raises:
             MergeConflictError: If any merge has conflicts
         """
+        if self._use_merge_tree(staging_branch):
+            try:
+                return self._execute_merge_tree(source_branches, staging_branch)
+            except MergeConflictError as e:
+                logger.info(f"merge-tree reported conflicts in {e.conflicting_files}; retrying with checkout merge")
+
+        return self._execute_checkout_merge(source_branches, staging_branch)
+
+    def _use_merge_tree(self, staging_branch: str) -> bool:
+        """Decide whether to merge in the object database instead of the checkout."""
+        backend = self.config.git.merge_backend
+        if backend == "checkout":
+            return False
+        if not self.git.supports_merge_tree():
+            if backend == "merge-tree":
+                logger.warning("git merge-tree --write-tree unavailable (needs git >= 2.38); using checkout merge")
+            return False
+        # Moving the ref under a checked-out branch would desync its working tree
+        return bool(self.git.current_branch() != staging_branch)
+
+    def _execute_merge_tree(self, source_branches: list[str], staging_branch: str) -> list[MergeResult]:
+        """Merge all branches into the staging ref without touching the working tree."""
+        commits = self.git.merge_without_checkout(source_branches, staging_branch)
+        return [
+            MergeResult(
+                source_branch=branch,
+                target_branch=staging_branch,
+                status=MergeStatus.MERGED,
+                commit_sha=commit,
+            )
+            for branch, commit in zip(source_branches, commits, strict=True)
+        ]
+
+    def _execute_checkout_merge(self, source_branches: list[str], staging_branch: str) -> list[MergeResult]:
+        """Merge branches one by one with ``git merge`` in the checked-out staging branch."""
         results = []
 
         # Checkout staging branch
@@ -200,6 +248,7 @@ class MergeCoordinator:
         self,
         cwd: str | Path | None = None,
         skip_tests: bool = False,
+        changed_files: list[str] | None = None,
     ) -> tuple[bool, list[GateRunResult]]:
         """Run post-merge quality gates.
 
@@ -210,6 +259,8 @@ class MergeCoordinator:
         Args:
             cwd: Working directory
             skip_tests: Skip test gates (run lint only for faster iteration)
+            changed_files: Files the merge changed, passed to plugin gates
+                (e.g. ``architecture``) so they only re-check those
 
         Returns:
             Tuple of (all_passed, results)
@@ -244,6 +295,9 @@ class MergeCoordinator:
             gates=required_gates,
             cwd=cwd,
             required_only=True,
+            feature=self.feature,
+            level=self._current_level,
+            changed_files=changed_files,
         )
 
         summary = self.gates.get_summary()
@@ -251,6 +305,14 @@ class MergeCoordinator:
 
         return all_passed, results
 
+    def _merged_files(self, target_branch: str, staging_branch: str) -> list[str] | None:
+        """Files the level merge changed relative to the target, or None if git cannot tell."""
+        try:
+            return self.git.changed_files(target_branch, staging_branch)
+        except GitError as e:
+            logger.debug(f"Could not diff {target_branch}..{staging_branch}: {e}")
+            return None
+
     def finalize(
         self,
         staging_branch: str,
@@ -313,6 +375,7 @@ class MergeCoordinator:
         target_branch: str = "main",
         skip_gates: bool = False,
         skip_tests: bool = False,
+        speculative: SpeculativeMerger | None = None,
     ) -> MergeFlowResult:
         """Execute complete merge flow for a level.
 
@@ -322,6 +385,8 @@ class MergeCoordinator:
             target_branch: Final target branch
             skip_gates: Skip quality gates entirely
             skip_tests: Skip test gates (run lint only for faster iteration)
+            speculative: Speculative merger that already merged (and gated)
+                some branches during the level; only the delta is merged here
 
         Returns:
             MergeFlowResult with outcome
@@ -365,12 +430,28 @@ class MergeCoordinator:
                         error="Pre-merge gates failed",
                     )
 
-            # Step 3: Merge all worker branches
-            self.execute_merge(worker_branches, staging_branch)
+            # Step 3: Merge all worker branches (only the remaining delta
+            # when speculation already merged some of them)
+            merged = speculative.finalize(worker_branches, staging_branch) if speculative else None
+            if merged is None:
+                self.execute_merge(worker_branches, staging_branch)
 
-            # Step 4: Run post-merge gates
+            # Step 4: Run post-merge gates (on the merged tree, which a
+            # checkout-free merge has not written to disk yet)
             if not skip_gates:
-                passed, results = self.run_post_merge_gates(skip_tests=skip_tests)
+                reused = None
+                if speculative is not None and merged is not None and not skip_tests:
+                    reused = speculative.gate_results(self.git.get_commit(f"{staging_branch}^{{tree}}"))
+                if reused is not None:
+                    logger.info("Reusing speculative gate results for the merged tree")
+                    passed, results = reused
+                else:
+                    if self.git.current_branch() != staging_branch:
+                        self.git.checkout(staging_branch)
+                    passed, results = self.run_post_merge_gates(
+                        skip_tests=skip_tests,
+                        changed_files=self._merged_files(target_branch, staging_branch),
+                    )
                 gate_results.extend(results)
                 if not passed:
                     self.abort(staging_branch)
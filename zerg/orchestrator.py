@@ -95,11 +95,11 @@ class Orchestrator:
         self.levels = LevelController()
         self.parser = TaskParser()
         self.gates = GateRunner(self.config, plugin_registry=self._plugin_registry)
-        self.worktrees = WorktreeManager(self.repo_path)
+        self.worktrees = WorktreeManager(self.repo_path, pool_size=self.config.workers.worktree_pool_size)
         self.containers = ContainerManager(self.config)
         self.ports = PortAllocator(range_start=self.config.ports.range_start, range_end=self.config.ports.range_end)
         self.assigner: WorkerAssignment | None = None
-        self.merger = MergeCoordinator(feature, self.config, self.repo_path)
+        self.merger = MergeCoordinator(feature, self.config, self.repo_path, plugin_registry=self._plugin_registry)
         tl_id = os.environ.get("CLAUDE_CODE_TASK_LIST_ID", feature)
         self.task_sync = TaskSyncBridge(feature, self.state, task_list_id=tl_id)
         self._launcher_config = LauncherConfigurator(self.config, self.repo_path, self._plugin_registry)
@@ -120,6 +120,7 @@ class Orchestrator:
             self._structured_writer = setup_structured_logging(
                 log_dir=self.repo_path / Path(lc.directory), worker_id="orchestrator",
                 feature=feature, level=lc.level, max_size_mb=lc.max_log_size_mb,
+                backup_count=lc.max_log_backups, async_writes=lc.async_writes,
             )
         except Exception:  # noqa: BLE001 — intentional: structured logging setup is non-critical
             pass  # Structured logging setup non-critical
@@ -140,7 +141,9 @@ class Orchestrator:
             config=self.config, state=self.state, levels=self.levels,
             repo_path=self.repo_path, structured_writer=self._structured_writer,
         )
-        self._state_sync = StateSyncService(state=self.state, levels=self.levels)
+        self._state_sync = StateSyncService(
+            state=self.state, levels=self.levels, on_task_complete=self._on_task_complete
+        )
         er = self.config.error_recovery
         self._circuit_breaker = CircuitBreaker(
             failure_threshold=er.circuit_breaker.failure_threshold,
@@ -165,6 +168,7 @@ class Orchestrator:
             on_level_complete_callbacks=self._on_level_complete, assigner=self.assigner,
             structured_writer=self._structured_writer, backpressure=self._backpressure,
         )
+        self._on_task_complete.append(self._level_coord.on_task_complete)
 
         self._loop_controller: LoopController | None = None
         if self._capabilities and self._capabilities.loop_enabled:
@@ -378,9 +382,12 @@ class Orchestrator:
             self._worker_manager.terminate_worker(wid, force=force)
         self.ports.release_all()
         self.state.append_event("rush_stopped", {"force": force})
+        if self._structured_writer is not None:
+            self._structured_writer.flush()
 
     def stop(self, force: bool = False) -> None:
         self._do_stop(force)
+        self.event_emitter.close()
         self.state.save()
         with contextlib.suppress(Exception):
             self.state.generate_state_md()
@@ -522,6 +529,7 @@ class Orchestrator:
 
     async def stop_async(self, force: bool = False) -> None:
         self._do_stop(force)
+        self.event_emitter.close()
         await self.state.save_async()
         with contextlib.suppress(Exception):
             self.state.generate_state_md()
@@ -0,0 +1,515 @@
+"""Native AST-based detector for Python performance anti-patterns.
+
+Needs no external binaries, so performance audits still produce code-level
+findings in locked-down containers where semgrep and friends are missing.
+Each rule maps to a factor ID from ``factors.json``.
+"""
+
+from __future__ import annotations
+
+import ast
+import functools
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+from zerg.performance.adapters.base import BaseToolAdapter
+from zerg.performance.types import DetectedStack, PerformanceFinding, Severity
+
+logger = logging.getLogger(__name__)
+
+# Pseudo tool name reported in tool statuses; always available
+NATIVE_TOOL = "zerg-ast"
+
+# Bump when rules change so cached results are invalidated
+ANALYZER_VERSION = "1"
+
+# Below this many files the process-pool start-up costs more than it saves
+_PARALLEL_THRESHOLD = 64
+
+# rule_id -> (factor_id, severity, suggestion)
+_RULES: dict[str, tuple[int, Severity, str]] = {
+    "string-concat-in-loop": (
+        67,
+        Severity.MEDIUM,
+        "Collect the pieces in a list and ''.join() them after the loop",
+    ),
+    "list-pop-front": (72, Severity.MEDIUM, "Use collections.deque and popleft() for FIFO access"),
+    "list-insert-front": (72, Severity.MEDIUM, "Use collections.deque and appendleft() for front inserts"),
+    "list-membership-in-loop": (72, Severity.LOW, "Use a set for repeated membership tests"),
+    "regex-compile-in-loop": (68, Severity.MEDIUM, "Compile the pattern once outside the loop"),
+    "repeated-parse-in-loop": (56, Severity.MEDIUM, "Parse once before the loop and reuse the result"),
+    "blocking-call-in-async": (
+        62,
+        Severity.HIGH,
+        "Use an async equivalent or offload the call with asyncio.to_thread()",
+    ),
+    "subprocess-in-loop": (42, Severity.MEDIUM, "Batch the work into fewer subprocess invocations"),
+    "await-in-loop": (64, Severity.LOW, "Run independent awaits concurrently with asyncio.gather()"),
+    "unbounded-lru-cache": (53, Severity.MEDIUM, "Give the cache a maxsize so it cannot grow without bound"),
+    "unbounded-module-cache": (
+        21,
+        Severity.MEDIUM,
+        "Bound the cache (LRU eviction, TTL or size check) so it cannot grow forever",
+    ),
+}
+
+_PARSE_CALLS = frozenset({"json.loads", "json.load", "yaml.safe_load", "yaml.load", "tomllib.loads", "ast.parse"})
+
+_SUBPROCESS_CALLS = frozenset(
+    {
+        "subprocess.run",
+        "subprocess.call",
+        "subprocess.check_call",
+        "subprocess.check_output",
+        "subprocess.Popen",
+        "os.system",
+        "os.popen",
+    }
+)
+
+_BLOCKING_CALLS = _SUBPROCESS_CALLS | frozenset(
+    {
+        "time.sleep",
+        "open",
+        "input",
+        "urllib.request.urlopen",
+        "socket.create_connection",
+        "requests.get",
+        "requests.post",
+        "requests.put",
+        "requests.patch",
+        "requests.delete",
+        "requests.head",
+        "requests.request",
+    }
+)
+
+# A raw finding produced by a worker: (rule_id, line, message)
+RawFinding = tuple[str, int, str]
+
+
+def _dotted_name(node: ast.expr) -> str:
+    """Return ``a.b.c`` for a Name/Attribute chain, or ``""``."""
+    parts: list[str] = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if isinstance(node, ast.Name):
+        parts.append(node.id)
+        return ".".join(reversed(parts))
+    return ""
+
+
+def _stored_names(nodes: list[ast.AST]) -> set[str]:
+    """Names (re)bound anywhere inside *nodes*."""
+    names: set[str] = set()
+    for root in nodes:
+        for node in ast.walk(root):
+            if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
+                names.add(node.id)
+    return names
+
+
+def _is_str_expr(node: ast.expr) -> bool:
+    return isinstance(node, ast.JoinedStr) or (isinstance(node, ast.Constant) and isinstance(node.value, str))
+
+
+def _is_list_expr(node: ast.expr) -> bool:
+    if isinstance(node, ast.List | ast.ListComp):
+        return True
+    return isinstance(node, ast.Call) and _dotted_name(node.func) == "list"
+
+
+class _PerfVisitor(ast.NodeVisitor):
+    """Single-pass visitor that records anti-pattern hits for one module."""
+
+    def __init__(self) -> None:
+        self.findings: list[RawFinding] = []
+        # Names bound by each enclosing loop (innermost last)
+        self._loops: list[set[str]] = []
+        # Per function scope: is it async, names holding str / list values
+        self._async: list[bool] = [False]
+        self._str_names: list[set[str]] = [set()]
+        self._list_names: list[set[str]] = [set()]
+        self._functools_names: set[str] = set()
+        # Module-level cache dicts: name -> line; and what happens to them
+        self._module_caches: dict[str, int] = {}
+        self._cache_writes: set[str] = set()
+        self._cache_evictions: set[str] = set()
+        self._flagged_await_loops: set[int] = set()
+        self._loop_nodes: list[ast.AST] = []
+
+    # -- helpers ---------------------------------------------------------------
+
+    def _add(self, rule_id: str, node: ast.AST, message: str) -> None:
+        self.findings.append((rule_id, getattr(node, "lineno", 0), message))
+
+    def _in_loop(self) -> bool:
+        return bool(self._loops)
+
+    def _loop_invariant(self, args: list[ast.expr]) -> bool:
+        """True if *args* cannot change between iterations of the innermost loop."""
+        bound = self._loops[-1]
+        for arg in args:
+            for node in ast.walk(arg):
+                if isinstance(node, ast.Call | ast.Await | ast.Yield | ast.YieldFrom | ast.NamedExpr):
+                    return False
+                if isinstance(node, ast.Name) and node.id in bound:
+                    return False
+        return True
+
+    def _visit_loop(self, loop: ast.AST, bound: set[str], inside: list[ast.AST]) -> None:
+        self._loops.append(bound)
+        self._loop_nodes.append(loop)
+        for node in inside:
+            self.visit(node)
+        self._loop_nodes.pop()
+        self._loops.pop()
+
+    def _visit_scope(self, node: ast.AST, is_async: bool, body: list[ast.AST]) -> None:
+        saved_loops, saved_loop_nodes = self._loops, self._loop_nodes
+        self._loops, self._loop_nodes = [], []
+        self._async.append(is_async)
+        self._str_names.append(set())
+        self._list_names.append(set())
+        for child in body:
+            self.visit(child)
+        self._list_names.pop()
+        self._str_names.pop()
+        self._async.pop()
+        self._loops, self._loop_nodes = saved_loops, saved_loop_nodes
+
+    # -- scopes ----------------------------------------------------------------
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self._check_cache_decorators(node)
+        for deco in node.decorator_list:
+            self.visit(deco)
+        self._visit_scope(node, False, list(node.body))
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        self._check_cache_decorators(node)
+        for deco in node.decorator_list:
+            self.visit(deco)
+        self._visit_scope(node, True, list(node.body))
+
+    def visit_Lambda(self, node: ast.Lambda) -> None:
+        self._visit_scope(node, False, [node.body])
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        for deco in node.decorator_list:
+            self.visit(deco)
+        self._visit_scope(node, False, list(node.body))
+
+    # -- loops -----------------------------------------------------------------
+
+    def visit_For(self, node: ast.For) -> None:
+        self.visit(node.iter)  # evaluated once
+        inside: list[ast.AST] = [node.target, *node.body]
+        self._visit_loop(node, _stored_names(inside), inside)
+        for child in node.orelse:
+            self.visit(child)
+
+    def visit_AsyncFor(self, node: ast.AsyncFor) -> None:
+        self.visit(node.iter)
+        inside: list[ast.AST] = [node.target, *node.body]
+        self._visit_loop(node, _stored_names(inside), inside)
+        for child in node.orelse:
+            self.visit(child)
+
+    def visit_While(self, node: ast.While) -> None:
+        inside: list[ast.AST] = [node.test, *node.body]
+        self._visit_loop(node, _stored_names(inside), inside)
+        for child in node.orelse:
+            self.visit(child)
+
+    def _visit_comprehension(self, node: ast.ListComp | ast.SetComp | ast.GeneratorExp | ast.DictComp) -> None:
+        first, *rest = node.generators
+        self.visit(first.iter)  # the outermost iterable is evaluated once
+        elts: list[ast.AST] = [node.key, node.value] if isinstance(node, ast.DictComp) else [node.elt]
+        inside: list[ast.AST] = [first.target, *first.ifs]
+        for gen in rest:
+            inside.extend([gen.target, gen.iter, *gen.ifs])
+        inside.extend(elts)
+        bound = _stored_names([g.target for g in node.generators])
+        self._visit_loop(node, bound, inside)
+
+    visit_ListComp = _visit_comprehension
+    visit_SetComp = _visit_comprehension
+    visit_GeneratorExp = _visit_comprehension
+    visit_DictComp = _visit_comprehension
+
+    # -- statements ------------------------------------------------------------
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            if alias.name == "functools":
+                self._functools_names.add(alias.asname or alias.name)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if node.module == "functools":
+            for alias in node.names:
+                if alias.name in ("cache", "lru_cache"):
+                    self._functools_names.add(alias.asname or alias.name)
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        self.generic_visit(node)
+        if len(node.targets) != 1:
+            return
+        target = node.targets[0]
+        if isinstance(target, ast.Subscript):
+            self._cache_writes.add(_dotted_name(target.value))
+            return
+        if not isinstance(target, ast.Name):
+            return
+
+        name = target.id
+        value = node.value
+        if self._in_loop() and isinstance(value, ast.BinOp) and isinstance(value.op, ast.Add):
+            left = value.left
+            if isinstance(left, ast.Name) and left.id == name and self._is_str_target(name, value.right):
+                self._add("string-concat-in-loop", node, f"String '{name}' built by repeated concatenation in a loop")
+
+        self._track_binding(name, value)
+        if len(self._async) == 1 and not self._in_loop() and self._is_cache_dict(name, value):
+            self._module_caches[name] = node.lineno
+
+    def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
+        self.generic_visit(node)
+        if isinstance(node.target, ast.Name) and node.value is not None:
+            self._track_binding(node.target.id, node.value)
+            if len(self._async) == 1 and self._is_cache_dict(node.target.id, node.value):
+                self._module_caches[node.target.id] = node.lineno
+
+    def visit_AugAssign(self, node: ast.AugAssign) -> None:
+        self.generic_visit(node)
+        if (
+            self._in_loop()
+            and isinstance(node.op, ast.Add)
+            and isinstance(node.target, ast.Name)
+            and self._is_str_target(node.target.id, node.value)
+        ):
+            self._add(
+                "string-concat-in-loop",
+                node,
+                f"String '{node.target.id}' built with += in a loop",
+            )
+
+    def visit_Delete(self, node: ast.Delete) -> None:
+        self.generic_visit(node)
+        for target in node.targets:
+            if isinstance(target, ast.Subscript):
+                self._cache_evictions.add(_dotted_name(target.value))
+
+    # -- expressions -----------------------------------------------------------
+
+    def visit_Await(self, node: ast.Await) -> None:
+        self.generic_visit(node)
+        loop = self._loop_nodes[-1] if self._loop_nodes else None
+        if isinstance(loop, ast.For) and isinstance(node.value, ast.Call) and id(loop) not in self._flagged_await_loops:
+            self._flagged_await_loops.add(id(loop))
+            self._add("await-in-loop", node, "Sequential awaits inside a for loop")
+
+    def visit_Compare(self, node: ast.Compare) -> None:
+        self.generic_visit(node)
+        if not self._in_loop():
+            return
+        for op, comparator in zip(node.ops, node.comparators, strict=False):
+            if (
+                isinstance(op, ast.In | ast.NotIn)
+                and isinstance(comparator, ast.Name)
+                and comparator.id in self._list_names[-1]
+            ):
+                self._add(
+                    "list-membership-in-loop",
+                    node,
+                    f"Membership test against list '{comparator.id}' inside a loop is O(n) per check",
+                )
+
+    def visit_Call(self, node: ast.Call) -> None:
+        self.generic_visit(node)
+        name = _dotted_name(node.func)
+
+        if isinstance(node.func, ast.Attribute):
+            attr = node.func.attr
+            owner = _dotted_name(node.func.value)
+            if attr in ("pop", "popitem", "clear") and owner:
+                self._cache_evictions.add(owner)
+            elif attr in ("setdefault", "update") and owner:
+                self._cache_writes.add(owner)
+            if self._in_loop() and len(node.args) >= 1 and _is_zero(node.args[0]):
+                if attr == "pop" and len(node.args) == 1:
+                    self._add("list-pop-front", node, f"'{owner or 'list'}.pop(0)' in a loop is O(n) per call")
+                elif attr == "insert" and len(node.args) == 2:
+                    self._add("list-insert-front", node, f"'{owner or 'list'}.insert(0, ...)' in a loop is O(n)")
+        if name == "len" and node.args:
+            self._cache_evictions.add(_dotted_name(node.args[0]))  # size-checked caches count as bounded
+
+        if self._async[-1] and name in _BLOCKING_CALLS:
+            self._add("blocking-call-in-async", node, f"Blocking call '{name}()' inside async def")
+
+        if not self._in_loop():
+            return
+        if name in _SUBPROCESS_CALLS:
+            self._add("subprocess-in-loop", node, f"'{name}()' spawns a process on every loop iteration")
+        elif name == "re.compile" and node.args and self._loop_invariant(node.args):
+            self._add("regex-compile-in-loop", node, "Loop-invariant regex compiled on every iteration")
+        elif name in _PARSE_CALLS and node.args and self._loop_invariant(node.args):
+            self._add("repeated-parse-in-loop", node, f"'{name}()' re-parses the same input on every iteration")
+
+    # -- tracking --------------------------------------------------------------
+
+    def _is_str_target(self, name: str, value: ast.expr) -> bool:
+        return _is_str_expr(value) or name in self._str_names[-1]
+
+    def _track_binding(self, name: str, value: ast.expr) -> None:
+        str_names, list_names = self._str_names[-1], self._list_names[-1]
+        if self._in_loop():
+            # Rebinding inside a loop keeps whatever the name held before
+            return
+        str_names.discard(name)
+        list_names.discard(name)
+        if _is_str_expr(value):
+            str_names.add(name)
+        elif _is_list_expr(value):
+            list_names.add(name)
+
+    @staticmethod
+    def _is_cache_dict(name: str, value: ast.expr) -> bool:
+        if "cache" not in name.lower():
+            return False
+        if isinstance(value, ast.Dict):
+            return not value.keys
+        return isinstance(value, ast.Call) and _dotted_name(value.func) == "dict" and not value.args
+
+    def _check_cache_decorators(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        for deco in node.decorator_list:
+            func = deco.func if isinstance(deco, ast.Call) else deco
+            name = _dotted_name(func)
+            base = name.rsplit(".", 1)[-1]
+            qualified = name.startswith("functools.") or name in self._functools_names
+            if not qualified or base not in ("cache", "lru_cache"):
+                continue
+            unbounded = base == "cache"
+            if isinstance(deco, ast.Call):
+                for kw in deco.keywords:
+                    if kw.arg == "maxsize" and isinstance(kw.value, ast.Constant) and kw.value.value is None:
+                        unbounded = True
+                if deco.args and isinstance(deco.args[0], ast.Constant) and deco.args[0].value is None:
+                    unbounded = True
+            if unbounded:
+                self._add("unbounded-lru-cache", deco, f"'{node.name}' is memoised by an unbounded cache")
+
+    def finish(self) -> None:
+        """Emit findings that need the whole module (module-level caches)."""
+        for name, line in self._module_caches.items():
+            if name in self._cache_writes and name not in self._cache_evictions:
+                self.findings.append(
+                    (
+                        "unbounded-module-cache",
+                        line,
+                        f"Module-level cache '{name}' grows without any eviction",
+                    )
+                )
+
+
+def _is_zero(node: ast.expr) -> bool:
+    return isinstance(node, ast.Constant) and node.value == 0 and not isinstance(node.value, bool)
+
+
+def analyze_file(path: str) -> list[RawFinding]:
+    """Analyse one Python file and return raw ``(rule_id, line, message)`` hits.
+
+    Module-level so it can run in a worker process.
+    """
+    try:
+        source = Path(path).read_text(encoding="utf-8")
+        tree = ast.parse(source, filename=path)
+    except (OSError, UnicodeDecodeError, SyntaxError, ValueError):
+        logger.debug("Skipping unparseable file %s", path, exc_info=True)
+        return []
+    visitor = _PerfVisitor()
+    visitor.visit(tree)
+    visitor.finish()
+    return sorted(visitor.findings, key=lambda f: f[1])
+
+
+@functools.lru_cache(maxsize=1)
+def _factor_meta() -> dict[int, tuple[str, str]]:
+    """Map factor ID -> (factor name, category) from the bundled catalog."""
+    from zerg.performance.catalog import FactorCatalog
+
+    return {f.id: (f.factor, f.category) for f in FactorCatalog.load().factors}
+
+
+class AstPerfAdapter(BaseToolAdapter):
+    """Built-in AST analyser for Python performance anti-patterns."""
+
+    name: str = "ast-perf"
+    tool_name: str = NATIVE_TOOL
+    factors_covered: list[int] = sorted({rule[0] for rule in _RULES.values()})
+    cacheable: bool = True
+    supports_file_list: bool = True
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+
+    def is_applicable(self, stack: DetectedStack) -> bool:
+        """Only Python sources are analysed."""
+        return "python" in stack.languages
+
+    def input_files(self, files: list[str], project_path: str) -> list[str]:
+        """Only Python files are inspected."""
+        return [f for f in files if f.endswith(".py")]
+
+    def run(
+        self,
+        files: list[str],
+        project_path: str,
+        stack: DetectedStack,
+    ) -> list[PerformanceFinding]:
+        """Analyse the given Python files, in parallel for large batches."""
+        targets = self.input_files(files, project_path)
+        if not targets:
+            return []
+
+        raw = self._analyze(targets)
+        meta = _factor_meta()
+        findings: list[PerformanceFinding] = []
+        for path, hits in zip(targets, raw, strict=True):
+            for rule_id, line, message in hits:
+                factor_id, severity, suggestion = _RULES[rule_id]
+                factor_name, category = meta.get(factor_id, ("Unknown", "Code-Level Patterns"))
+                findings.append(
+                    PerformanceFinding(
+                        factor_id=factor_id,
+                        factor_name=factor_name,
+                        category=category,
+                        severity=severity,
+                        message=message,
+                        file=path,
+                        line=line,
+                        tool=self.name,
+                        rule_id=rule_id,
+                        suggestion=suggestion,
+                    )
+                )
+        return findings
+
+    def _analyze(self, targets: list[str]) -> list[list[RawFinding]]:
+        """Run :func:`analyze_file` over *targets*, preserving order."""
+        if len(targets) < _PARALLEL_THRESHOLD or self.max_workers <= 1:
+            return [analyze_file(t) for t in targets]
+        try:
+            # spawn: the auditor calls us from a worker thread, where fork is unsafe
+            ctx = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=self.max_workers, mp_context=ctx) as executor:
+                chunksize = max(1, len(targets) // (self.max_workers * 4))
+                return list(executor.map(analyze_file, targets, chunksize=chunksize))
+        except (OSError, BrokenProcessPool):
+            logger.debug("Process pool unavailable; analysing serially", exc_info=True)
+            return [analyze_file(t) for t in targets]
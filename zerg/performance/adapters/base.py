@@ -14,6 +14,13 @@ class BaseToolAdapter(ABC):
     tool_name: str = ""  # Binary name for shutil.which
     factors_covered: list[int] = []  # Factor IDs from catalog
 
+    # Result caching (see zerg.performance.result_cache).
+    # cacheable: findings depend only on the contents of input_files() and the tool version.
+    # supports_file_list: run() analyses exactly the given files and reports per-file findings,
+    # so it can be re-run on just the changed subset.
+    cacheable: bool = False
+    supports_file_list: bool = False
+
     @abstractmethod
     def run(
         self,
@@ -27,3 +34,7 @@ class BaseToolAdapter(ABC):
     def is_applicable(self, stack: DetectedStack) -> bool:
         """Whether this adapter applies to the detected stack."""
         return True
+
+    def input_files(self, files: list[str], project_path: str) -> list[str]:
+        """Files whose contents determine this adapter's findings (cache key)."""
+        return files
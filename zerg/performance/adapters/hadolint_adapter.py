@@ -29,11 +29,19 @@ class HadolintAdapter(BaseToolAdapter):
     tool_name: str = "hadolint"
     # Factor IDs: Container Image category (Dockerfile best practices)
     factors_covered: list[int] = [19, 20, 21]
+    cacheable: bool = True
 
     def is_applicable(self, stack: DetectedStack) -> bool:
         """Only applicable when the project uses Docker."""
         return stack.has_docker
 
+    def input_files(self, files: list[str], project_path: str) -> list[str]:
+        """Findings depend only on the Dockerfiles under *project_path*."""
+        try:
+            return [str(p) for p in self._find_dockerfiles(project_path)]
+        except OSError:
+            return []
+
     def run(
         self,
         files: list[str],
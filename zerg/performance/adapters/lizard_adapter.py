@@ -20,6 +20,8 @@ class LizardAdapter(BaseToolAdapter):
     tool_name: str = "lizard"
     # Factor IDs: 1 = Algorithm complexity, 29 = Function size
     factors_covered: list[int] = [1, 29]
+    cacheable: bool = True
+    supports_file_list: bool = True
 
     def is_applicable(self, stack: DetectedStack) -> bool:
         """Lizard supports many languages — always applicable."""
@@ -31,10 +33,14 @@ class LizardAdapter(BaseToolAdapter):
         project_path: str,
         stack: DetectedStack,
     ) -> list[PerformanceFinding]:
-        """Run ``lizard --csv`` and return findings based on thresholds."""
+        """Run ``lizard --csv`` and return findings based on thresholds.
+
+        Analyses the given files, or all of *project_path* when no files are given.
+        """
+        targets = files or [project_path]
         try:
             result = subprocess.run(
-                ["lizard", project_path, "--csv"],
+                ["lizard", *targets, "--csv"],
                 capture_output=True,
                 text=True,
                 timeout=180,
@@ -28,32 +28,45 @@ class RadonAdapter(BaseToolAdapter):
     # Factor IDs: 1 = Algorithm complexity (CPU/Compute),
     # plus maintainability-related factors from Code-Level Patterns
     factors_covered: list[int] = [1, 28, 29]
+    cacheable: bool = True
+    supports_file_list: bool = True
 
     def is_applicable(self, stack: DetectedStack) -> bool:
         """Radon only works on Python source code."""
         return "python" in stack.languages
 
+    def input_files(self, files: list[str], project_path: str) -> list[str]:
+        """Radon only inspects Python files."""
+        return [f for f in files if f.endswith(".py")]
+
     def run(
         self,
         files: list[str],
         project_path: str,
         stack: DetectedStack,
     ) -> list[PerformanceFinding]:
-        """Run radon cc and radon mi, return combined findings."""
+        """Run radon cc and radon mi, return combined findings.
+
+        Analyses the given Python files, or all of *project_path* when no
+        files are given.
+        """
+        targets = self.input_files(files, project_path) if files else [project_path]
+        if not targets:
+            return []
         findings: list[PerformanceFinding] = []
-        findings.extend(self._run_cyclomatic_complexity(project_path))
-        findings.extend(self._run_maintainability_index(project_path))
+        findings.extend(self._run_cyclomatic_complexity(targets))
+        findings.extend(self._run_maintainability_index(targets))
         return findings
 
     # ------------------------------------------------------------------
     # Cyclomatic complexity (radon cc)
     # ------------------------------------------------------------------
 
-    def _run_cyclomatic_complexity(self, project_path: str) -> list[PerformanceFinding]:
+    def _run_cyclomatic_complexity(self, targets: list[str]) -> list[PerformanceFinding]:
         """Run ``radon cc -j -a`` and return findings for ranks C-F."""
         try:
             result = subprocess.run(
-                ["radon", "cc", "-j", "-a", project_path],
+                ["radon", "cc", "-j", "-a", *targets],
                 capture_output=True,
                 text=True,
                 timeout=120,
@@ -95,11 +108,11 @@ class RadonAdapter(BaseToolAdapter):
     # Maintainability index (radon mi)
     # ------------------------------------------------------------------
 
-    def _run_maintainability_index(self, project_path: str) -> list[PerformanceFinding]:
+    def _run_maintainability_index(self, targets: list[str]) -> list[PerformanceFinding]:
         """Run ``radon mi -j`` and return findings for ranks C-F."""
         try:
             result = subprocess.run(
-                ["radon", "mi", "-j", project_path],
+                ["radon", "mi", "-j", *targets],
                 capture_output=True,
                 text=True,
                 timeout=120,
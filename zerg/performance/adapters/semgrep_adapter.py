@@ -246,6 +246,8 @@ class SemgrepAdapter(BaseToolAdapter):
         125,  # Excessive mocking in tests
         126,  # Missing performance tests
     ]
+    cacheable: bool = True
+    supports_file_list: bool = True
 
     def run(
         self,
@@ -259,7 +261,9 @@ class SemgrepAdapter(BaseToolAdapter):
             logger.warning("No semgrep configs determined for stack: %s", stack.languages)
             return []
 
-        cmd = ["semgrep", "--json", "--quiet"] + [f"--config={c}" for c in configs] + [project_path]
+        # Scan only the given files when provided, otherwise the whole project
+        targets = files or [project_path]
+        cmd = ["semgrep", "--json", "--quiet"] + [f"--config={c}" for c in configs] + targets
 
         try:
             result = subprocess.run(  # noqa: S603
@@ -5,7 +5,9 @@ from __future__ import annotations
 import logging
 import re
 import subprocess
+from pathlib import Path
 
+from zerg.fs_utils import collect_files
 from zerg.performance.adapters.base import BaseToolAdapter
 from zerg.performance.types import DetectedStack, PerformanceFinding, Severity
 
@@ -26,11 +28,17 @@ class VultureAdapter(BaseToolAdapter):
     tool_name: str = "vulture"
     # Factor IDs: 30 = Dead code, 31 = Code volume
     factors_covered: list[int] = [30, 31]
+    cacheable: bool = True
 
     def is_applicable(self, stack: DetectedStack) -> bool:
         """Vulture only works on Python source code."""
         return "python" in stack.languages
 
+    def input_files(self, files: list[str], project_path: str) -> list[str]:
+        """Dead-code detection is whole-program: every Python file under *project_path*."""
+        grouped = collect_files(Path(project_path), extensions={".py"})
+        return [str(p) for p in grouped.get(".py", [])]
+
     def run(
         self,
         files: list[str],
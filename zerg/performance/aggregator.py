@@ -4,9 +4,14 @@ from __future__ import annotations
 
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
 
+from zerg.constants import STATE_DIR
+from zerg.performance.adapters.ast_perf_adapter import ANALYZER_VERSION, NATIVE_TOOL, AstPerfAdapter
 from zerg.performance.adapters.base import BaseToolAdapter
 from zerg.performance.catalog import STATIC_TOOLS, FactorCatalog
+from zerg.performance.result_cache import AdapterResultCache
 from zerg.performance.stack_detector import detect_stack
 from zerg.performance.tool_registry import ToolRegistry
 from zerg.performance.types import (
@@ -15,6 +20,7 @@ from zerg.performance.types import (
     PerformanceFinding,
     PerformanceReport,
     Severity,
+    ToolStatus,
 )
 
 logger = logging.getLogger(__name__)
@@ -29,14 +35,33 @@ SEVERITY_WEIGHTS: dict[Severity, int] = {
 }
 
 
+@dataclass
+class _AdapterPlan:
+    """What an adapter must (re-)run and which findings are already cached."""
+
+    adapter: BaseToolAdapter
+    run_files: list[str] | None  # None = nothing to run, cached findings are complete
+    cached: list[PerformanceFinding] = field(default_factory=list)
+    key: str = ""
+    hashes: dict[str, str] = field(default_factory=dict)
+
+
 class PerformanceAuditor:
-    """Main orchestrator that runs all tool adapters and produces a unified report."""
+    """Main orchestrator that runs all tool adapters and produces a unified report.
+
+    Tool availability and adapter findings are cached under
+    ``<project>/.zerg/state`` so repeated audits only re-run tools on files
+    whose contents changed.  Pass ``use_cache=False`` to always run everything.
+    """
 
-    def __init__(self, project_path: str = ".") -> None:
+    def __init__(self, project_path: str = ".", use_cache: bool = True) -> None:
         self.project_path = project_path
         self.catalog = FactorCatalog.load()
-        self.registry = ToolRegistry()
+        state_dir = Path(project_path) / STATE_DIR
+        self.registry = ToolRegistry(cache_path=state_dir / "perf-tools.json" if use_cache else None)
+        self.result_cache = AdapterResultCache(state_dir / "perf-results.json") if use_cache else None
         self.stack = detect_stack(project_path)
+        self._tool_versions: dict[str, str] = {}
 
     def run(self, files: list[str]) -> PerformanceReport:
         """Run full performance audit.
@@ -47,9 +72,12 @@ class PerformanceAuditor:
         Returns:
             A complete ``PerformanceReport`` with scores, findings and metadata.
         """
-        # 1. Check tool availability (parallel)
+        # 1. Check tool availability (parallel, cached on PATH + binary mtimes)
         tool_statuses = self.registry.check_availability()
+        # The built-in AST analyser needs no binary and is always available
+        tool_statuses.append(ToolStatus(name=NATIVE_TOOL, available=True, version=ANALYZER_VERSION))
         available_tools = {t.name for t in tool_statuses if t.available}
+        self._tool_versions = {t.name: t.version for t in tool_statuses}
 
         # 2. Get static-only factors
         static_factors = self.catalog.filter_static_only()
@@ -57,7 +85,7 @@ class PerformanceAuditor:
         # 3. Select applicable adapters
         adapters = self._get_adapters(available_tools)
 
-        # 4. Run adapters in parallel
+        # 4. Run adapters in parallel (only over files changed since the cached run)
         all_findings = self._run_adapters(adapters, files)
 
         # 5. Compute category scores
@@ -111,31 +139,92 @@ class PerformanceAuditor:
             HadolintAdapter(),
             TrivyAdapter(),
             ClocAdapter(),
+            AstPerfAdapter(),
         ]
 
         # Filter to applicable + available
         return [a for a in all_adapters if a.tool_name in available_tools and a.is_applicable(self.stack)]
 
     def _run_adapters(self, adapters: list[BaseToolAdapter], files: list[str]) -> list[PerformanceFinding]:
-        """Run all adapters in parallel."""
+        """Run all adapters in parallel, reusing cached findings where possible."""
         all_findings: list[PerformanceFinding] = []
 
         if not adapters:
             return all_findings
 
-        with ThreadPoolExecutor(max_workers=min(len(adapters), 8)) as executor:
-            futures = {executor.submit(a.run, files, self.project_path, self.stack): a for a in adapters}
-            for future in as_completed(futures):
-                adapter = futures[future]
-                try:
-                    findings = future.result(timeout=300)
+        plans = [self._plan_adapter(a, files) for a in adapters]
+        to_run = [p for p in plans if p.run_files is not None]
+        for plan in plans:
+            if plan.run_files is None:
+                all_findings.extend(plan.cached)
+                logger.info("Adapter %s: %d cached findings", plan.adapter.name, len(plan.cached))
+
+        if to_run:
+            with ThreadPoolExecutor(max_workers=min(len(to_run), 8)) as executor:
+                futures = {
+                    executor.submit(p.adapter.run, p.run_files or [], self.project_path, self.stack): p for p in to_run
+                }
+                for future in as_completed(futures):
+                    plan = futures[future]
+                    adapter = plan.adapter
+                    # Cached findings are for unchanged files and stay valid if the re-run fails
+                    all_findings.extend(plan.cached)
+                    try:
+                        findings = future.result(timeout=300)
+                    except Exception:  # noqa: BLE001 — intentional: best-effort adapter run; skip failed adapters
+                        logger.warning("Adapter %s failed", adapter.name, exc_info=True)
+                        continue
                     all_findings.extend(findings)
-                    logger.info("Adapter %s: %d findings", adapter.name, len(findings))
-                except Exception:  # noqa: BLE001 — intentional: best-effort adapter run; skip failed adapters
-                    logger.warning("Adapter %s failed", adapter.name, exc_info=True)
-
+                    logger.info(
+                        "Adapter %s: %d findings (%d cached)",
+                        adapter.name,
+                        len(findings) + len(plan.cached),
+                        len(plan.cached),
+                    )
+                    self._store_results(plan, findings)
+
+        if self.result_cache is not None:
+            self.result_cache.save()
         return all_findings
 
+    def _plan_adapter(self, adapter: BaseToolAdapter, files: list[str]) -> _AdapterPlan:
+        """Decide which files an adapter must analyse given the result cache."""
+        cache = self.result_cache
+        if cache is None or not getattr(adapter, "cacheable", False):
+            return _AdapterPlan(adapter=adapter, run_files=files)
+        if adapter.supports_file_list and not files:
+            # Without a file list the adapter scans the whole project; its inputs are unknown
+            return _AdapterPlan(adapter=adapter, run_files=files)
+
+        key = cache.adapter_key(self._tool_versions.get(adapter.tool_name, ""), self.stack)
+        hashes = cache.hash_files(adapter.input_files(files, self.project_path))
+
+        if adapter.supports_file_list:
+            cached, misses = cache.lookup_per_file(adapter.name, key, hashes)
+            miss_set = set(misses)
+            return _AdapterPlan(
+                adapter=adapter,
+                run_files=[p for p in hashes if p in miss_set] if misses else None,
+                cached=cached,
+                key=key,
+                hashes={p: hashes[p] for p in misses},
+            )
+
+        combined = cache.lookup_combined(adapter.name, key, hashes)
+        if combined is not None:
+            return _AdapterPlan(adapter=adapter, run_files=None, cached=combined)
+        return _AdapterPlan(adapter=adapter, run_files=files, key=key, hashes=hashes)
+
+    def _store_results(self, plan: _AdapterPlan, findings: list[PerformanceFinding]) -> None:
+        """Record fresh adapter findings in the result cache."""
+        cache = self.result_cache
+        if cache is None or not plan.key:
+            return
+        if plan.adapter.supports_file_list and plan.run_files:
+            cache.store_per_file(plan.adapter.name, plan.key, plan.hashes, findings)
+        else:
+            cache.store_combined(plan.adapter.name, plan.key, plan.hashes, findings)
+
     def _compute_category_scores(
         self,
         findings: list[PerformanceFinding],
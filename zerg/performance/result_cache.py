@@ -0,0 +1,214 @@
+"""Content-hash keyed cache of performance adapter results.
+
+Lets ``PerformanceAuditor`` skip re-running external tools over files whose
+contents have not changed since the previous audit.  Adapters that analyse
+individual files (``supports_file_list``) cache findings per file; the rest
+cache their whole result keyed on a digest of every input file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from zerg.performance.types import DetectedStack, PerformanceFinding
+
+logger = logging.getLogger(__name__)
+
+_CACHE_VERSION = 1
+
+
+def _norm(path: str) -> str:
+    """Normalise a path string for use as a cache key."""
+    return os.path.normpath(path)
+
+
+class AdapterResultCache:
+    """Persistent per-adapter findings cache keyed on file content hashes.
+
+    Layout of the cache file::
+
+        {
+          "version": 1,
+          "stat": {path: [mtime_ns, size, sha256]},
+          "adapters": {
+            name: {
+              "key": "<tool version + stack digest>",
+              "files": {path: {"hash": sha256, "findings": [...]}},
+              "combined": {"digest": sha256, "findings": [...]}
+            }
+          }
+        }
+
+    The ``stat`` table only avoids re-reading files whose mtime and size are
+    unchanged; validity is always decided by content hash.
+    """
+
+    def __init__(self, cache_path: Path | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_path: JSON file to persist to. ``None`` keeps the cache in memory only.
+        """
+        self._cache_path = cache_path
+        self._stat: dict[str, list[Any]] = {}
+        self._adapters: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    # -- keys ----------------------------------------------------------------
+
+    @staticmethod
+    def adapter_key(tool_version: str, stack: DetectedStack) -> str:
+        """Digest of everything besides file contents that affects an adapter's output."""
+        payload = json.dumps({"version": tool_version, "stack": stack.to_dict()}, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def hash_files(self, paths: list[str]) -> dict[str, str]:
+        """Return ``{normalised path: sha256}`` for every readable file in *paths*."""
+        hashes: dict[str, str] = {}
+        for path in paths:
+            key = _norm(path)
+            try:
+                st = os.stat(key)
+            except OSError:
+                continue
+            memo = self._stat.get(key)
+            if memo is not None and memo[0] == st.st_mtime_ns and memo[1] == st.st_size:
+                hashes[key] = memo[2]
+                continue
+            h = hashlib.sha256()
+            try:
+                with open(key, "rb") as f:
+                    for chunk in iter(lambda: f.read(65536), b""):
+                        h.update(chunk)
+            except OSError:
+                continue
+            hashes[key] = h.hexdigest()
+            self._stat[key] = [st.st_mtime_ns, st.st_size, hashes[key]]
+            self._dirty = True
+        return hashes
+
+    # -- per-file adapters ---------------------------------------------------
+
+    def lookup_per_file(
+        self, adapter: str, key: str, hashes: dict[str, str]
+    ) -> tuple[list[PerformanceFinding], list[str]]:
+        """Split files into cached findings and files that must be re-analysed.
+
+        Returns:
+            Tuple of (findings for unchanged files, paths needing a re-run).
+        """
+        files = self._entry(adapter, key)["files"]
+        cached: list[PerformanceFinding] = []
+        misses: list[str] = []
+        for path, digest in hashes.items():
+            hit = files.get(path)
+            if hit is not None and hit.get("hash") == digest:
+                cached.extend(PerformanceFinding.from_dict(f) for f in hit.get("findings", []))
+            else:
+                misses.append(path)
+        return cached, misses
+
+    def store_per_file(
+        self,
+        adapter: str,
+        key: str,
+        hashes: dict[str, str],
+        findings: list[PerformanceFinding],
+    ) -> None:
+        """Record findings for freshly analysed files.
+
+        Findings are attributed by their ``file`` field; every analysed file
+        gets an entry (possibly empty) so clean files are cached too.
+        """
+        by_file: dict[str, list[dict[str, Any]]] = {path: [] for path in hashes}
+        for finding in findings:
+            path = _norm(finding.file) if finding.file else ""
+            if path in by_file:
+                by_file[path].append(finding.to_dict())
+        files = self._entry(adapter, key)["files"]
+        for path, digest in hashes.items():
+            files[path] = {"hash": digest, "findings": by_file[path]}
+        self._dirty = True
+
+    # -- whole-result adapters -----------------------------------------------
+
+    @staticmethod
+    def _digest(hashes: dict[str, str]) -> str:
+        joined = "\n".join(f"{path}\0{digest}" for path, digest in sorted(hashes.items()))
+        return hashlib.sha256(joined.encode()).hexdigest()
+
+    def lookup_combined(self, adapter: str, key: str, hashes: dict[str, str]) -> list[PerformanceFinding] | None:
+        """Return cached findings if no input file changed, else ``None``."""
+        combined = self._entry(adapter, key).get("combined")
+        if not combined or combined.get("digest") != self._digest(hashes):
+            return None
+        return [PerformanceFinding.from_dict(f) for f in combined.get("findings", [])]
+
+    def store_combined(
+        self,
+        adapter: str,
+        key: str,
+        hashes: dict[str, str],
+        findings: list[PerformanceFinding],
+    ) -> None:
+        """Record an adapter's whole result for the given input file set."""
+        self._entry(adapter, key)["combined"] = {
+            "digest": self._digest(hashes),
+            "findings": [f.to_dict() for f in findings],
+        }
+        self._dirty = True
+
+    # -- persistence ---------------------------------------------------------
+
+    def _entry(self, adapter: str, key: str) -> dict[str, Any]:
+        """Return the adapter's cache entry, resetting it if its key changed."""
+        entry = self._adapters.get(adapter)
+        if entry is None or entry.get("key") != key:
+            entry = {"key": key, "files": {}, "combined": None}
+            self._adapters[adapter] = entry
+            self._dirty = True
+        return entry
+
+    def _load(self) -> None:
+        """Load the cache file (empty on missing/corrupt/old version)."""
+        if self._cache_path is None or not self._cache_path.exists():
+            return
+        try:
+            payload = json.loads(self._cache_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            logger.debug("Ignoring unreadable performance cache %s", self._cache_path)
+            return
+        if not isinstance(payload, dict) or payload.get("version") != _CACHE_VERSION:
+            return
+        self._stat = payload.get("stat", {})
+        self._adapters = payload.get("adapters", {})
+
+    def save(self) -> None:
+        """Atomically persist the cache via tempfile + os.replace."""
+        if self._cache_path is None or not self._dirty:
+            return
+        payload = {"version": _CACHE_VERSION, "stat": self._stat, "adapters": self._adapters}
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(self._cache_path.parent), suffix=".tmp")
+        except OSError:
+            logger.debug("Failed to write performance cache to %s", self._cache_path, exc_info=True)
+            return
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, str(self._cache_path))
+            self._dirty = False
+        except OSError:
+            logger.debug("Failed to write performance cache to %s", self._cache_path, exc_info=True)
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass  # Best-effort file cleanup
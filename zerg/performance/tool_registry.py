@@ -6,10 +6,16 @@ used by the performance analysis adapters.
 
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
+import os
 import shutil
 import subprocess
+import tempfile
 from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from pathlib import Path
 
 from rich.console import Console
 from rich.panel import Panel
@@ -17,6 +23,8 @@ from rich.table import Table
 
 from zerg.performance.types import ToolStatus
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class ToolSpec:
@@ -32,6 +40,11 @@ class ToolRegistry:
     """Registry of external CLI tools used by the performance analysis system.
 
     Provides parallel availability checking and advisory output for missing tools.
+
+    Availability results are cached against a fingerprint of ``PATH`` and the
+    resolved binaries' mtimes, so the ``--version`` subprocesses only run
+    again when a tool is installed, upgraded or removed.  Pass *cache_path* to
+    also persist the cache across processes.
     """
 
     TOOL_SPECS: dict[str, ToolSpec] = {
@@ -103,6 +116,69 @@ class ToolRegistry:
         ),
     }
 
+    def __init__(self, cache_path: Path | None = None) -> None:
+        """Initialize registry.
+
+        Args:
+            cache_path: Optional JSON file for persisting availability results.
+        """
+        self._cache_path = cache_path
+        self._cached: tuple[str, list[ToolStatus]] | None = None
+
+    def _fingerprint(self) -> str:
+        """Digest of PATH plus each tool's resolved binary path and mtime."""
+        parts = [os.environ.get("PATH", "")]
+        for spec in self.TOOL_SPECS.values():
+            path = shutil.which(spec.check_cmd)
+            mtime = 0
+            if path is not None:
+                try:
+                    mtime = os.stat(path).st_mtime_ns
+                except OSError:
+                    pass  # Treat unreadable binaries as unchanged-unknown
+            parts.append(f"{spec.name}\0{path}\0{mtime}")
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+    def _load_cached(self, fingerprint: str) -> list[ToolStatus] | None:
+        """Return cached statuses matching *fingerprint*, from memory or disk."""
+        if self._cached is not None and self._cached[0] == fingerprint:
+            return self._cached[1]
+        if self._cache_path is None or not self._cache_path.exists():
+            return None
+        try:
+            payload = json.loads(self._cache_path.read_text(encoding="utf-8"))
+            if payload.get("fingerprint") != fingerprint:
+                return None
+            statuses = [ToolStatus.from_dict(s) for s in payload["statuses"]]
+        except (OSError, json.JSONDecodeError, KeyError, TypeError, AttributeError):
+            logger.debug("Ignoring unreadable tool cache %s", self._cache_path)
+            return None
+        self._cached = (fingerprint, statuses)
+        return statuses
+
+    def _store_cached(self, fingerprint: str, statuses: list[ToolStatus]) -> None:
+        """Remember statuses in memory and atomically persist them if configured."""
+        self._cached = (fingerprint, statuses)
+        if self._cache_path is None:
+            return
+        data = json.dumps({"fingerprint": fingerprint, "statuses": [s.to_dict() for s in statuses]})
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(self._cache_path.parent), suffix=".tmp")
+        except OSError:
+            logger.debug("Failed to write tool cache to %s", self._cache_path, exc_info=True)
+            return
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(data)
+            os.replace(tmp_path, str(self._cache_path))
+        except OSError:
+            logger.debug("Failed to write tool cache to %s", self._cache_path, exc_info=True)
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass  # Best-effort file cleanup
+
     def _check_tool(self, spec: ToolSpec) -> ToolStatus:
         """Check availability and version of a single tool."""
         path = shutil.which(spec.check_cmd)
@@ -130,14 +206,27 @@ class ToolRegistry:
 
         return ToolStatus(name=spec.name, available=True, version=version)
 
-    def check_availability(self) -> list[ToolStatus]:
+    def check_availability(self, use_cache: bool = True) -> list[ToolStatus]:
         """Check all registered tools for availability in parallel.
 
+        Args:
+            use_cache: Reuse the previous result while the PATH/binary
+                fingerprint is unchanged.
+
         Returns a list of ToolStatus for every tool in the registry.
         """
+        fingerprint = self._fingerprint() if use_cache else ""
+        if use_cache:
+            cached = self._load_cached(fingerprint)
+            if cached is not None:
+                return [replace(s) for s in cached]
+
         specs = list(self.TOOL_SPECS.values())
         with ThreadPoolExecutor(max_workers=8) as executor:
             statuses = list(executor.map(self._check_tool, specs))
+
+        if use_cache:
+            self._store_cached(fingerprint, statuses)
         return statuses
 
     def get_available(self) -> list[str]:
@@ -81,6 +81,22 @@ class PerformanceFinding:
             "suggestion": self.suggestion,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PerformanceFinding:
+        """Create from dictionary (inverse of ``to_dict``)."""
+        return cls(
+            factor_id=data["factor_id"],
+            factor_name=data["factor_name"],
+            category=data["category"],
+            severity=Severity(data["severity"]),
+            message=data["message"],
+            file=data.get("file", ""),
+            line=data.get("line", 0),
+            tool=data.get("tool", ""),
+            rule_id=data.get("rule_id", ""),
+            suggestion=data.get("suggestion", ""),
+        )
+
 
 @dataclass
 class ToolStatus:
@@ -100,6 +116,16 @@ class ToolStatus:
             "factors_covered": self.factors_covered,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ToolStatus:
+        """Create from dictionary (inverse of ``to_dict``)."""
+        return cls(
+            name=data["name"],
+            available=data["available"],
+            version=data.get("version", ""),
+            factors_covered=data.get("factors_covered", 0),
+        )
+
 
 @dataclass
 class CategoryScore:
@@ -41,6 +41,8 @@ class GateContext:
     level: int
     cwd: Path
     config: Any
+    # Paths relative to cwd changed since the last gated tree (e.g. by a level merge); None if unknown
+    changed_files: list[str] | None = None
 
 
 # ============================================================================
@@ -1,23 +1,196 @@
-"""Port allocation for ZERG workers."""
+"""Port allocation for ZERG workers.
+
+Ports are reserved host-wide in a small JSON file
+(``$TMPDIR/zerg-ports-<uid>.json``) so separate zerg processes on the same
+host never hand out the same port:
+
+* the file holds a cursor and the reserving process ID of every claimed
+  port; it is read and rewritten under an exclusive ``fcntl.flock``;
+* each allocator claims ports in blocks starting at the cursor, skipping
+  ports reserved by live processes, and serves later requests from its
+  block without touching the file;
+* only a port that is about to be returned is probe-bound. Ports that fail
+  the probe are handed back to the file with the next claim;
+* reservations of processes that exited are reclaimed, and an allocator's
+  reservations are dropped by ``release_all`` or when it is garbage
+  collected.
+
+If the file cannot be used, allocation falls back to probe-binding ports
+from a process-local cursor, as before.
+"""
 
 import asyncio
-import random
+import contextlib
+import fcntl
+import json
+import os
 import socket
+import tempfile
+import threading
+import weakref
+from collections import deque
+from collections.abc import Container, Iterator
 from dataclasses import dataclass, field
+from pathlib import Path
 
 from zerg.constants import DEFAULT_PORT_RANGE_END, DEFAULT_PORT_RANGE_START
 from zerg.logging import get_logger
 
 logger = get_logger("ports")
 
+RESERVATION_DIR = Path(tempfile.gettempdir())
+RESERVATION_VERSION = 1
+
+# Ports claimed from the reservation file at a time
+DEFAULT_BLOCK_SIZE = 16
+
+
+def default_reservation_file() -> Path:
+    """Return the host-wide reservation file for the current user."""
+    return RESERVATION_DIR / f"zerg-ports-{os.getuid()}.json"
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # exists, owned by another user
+    return True
+
+
+class ReservationFile:
+    """Host-wide port reservations shared by every allocator on the host."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+
+    def claim(
+        self,
+        range_start: int,
+        range_end: int,
+        count: int,
+        release: Container[int] = (),
+        exclude: Container[int] = (),
+    ) -> list[int]:
+        """Reserve up to *count* free ports for this process.
+
+        Ports in *release* (reserved by this process) are freed first, in the
+        same locked update. Ports in *exclude* are never claimed.
+
+        Returns:
+            The claimed ports, in cursor order. Fewer than *count* (possibly
+            none) when the range is exhausted.
+
+        Raises:
+            OSError: If the file cannot be opened or locked.
+        """
+        pid = os.getpid()
+        claimed: list[int] = []
+        with self._locked() as (reservations, state):
+            alive = {owner: owner == pid or _pid_alive(owner) for owner in set(reservations.values())}
+            for port, owner in list(reservations.items()):
+                if not alive[owner] or (owner == pid and port in release):
+                    del reservations[port]
+
+            size = range_end - range_start + 1
+            cursor = state.get("cursor", range_start)
+            if not range_start <= cursor <= range_end:
+                cursor = range_start
+            for offset in range(size):
+                if len(claimed) >= count:
+                    break
+                port = range_start + (cursor - range_start + offset) % size
+                if port not in reservations and port not in exclude:
+                    reservations[port] = pid
+                    claimed.append(port)
+            if claimed:
+                state["cursor"] = range_start + (claimed[-1] - range_start + 1) % size
+        return claimed
+
+    def release(self, ports: Container[int]) -> None:
+        """Drop this process's reservations of *ports*."""
+        pid = os.getpid()
+        with self._locked() as (reservations, _state):
+            for port in [p for p, owner in reservations.items() if owner == pid and p in ports]:
+                del reservations[port]
+
+    def reserved(self) -> dict[int, int]:
+        """Return the current reservations as ``{port: pid}``."""
+        with self._locked() as (reservations, _state):
+            return dict(reservations)
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[tuple[dict[int, int], dict[str, int]]]:
+        """Lock the file and yield its reservations and state; write them back on success."""
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            reservations: dict[int, int] = {}
+            state: dict[str, int] = {}
+            raw = b""
+            while chunk := os.read(fd, 65536):
+                raw += chunk
+            try:
+                data = json.loads(raw) if raw else {}
+                if data.get("version") == RESERVATION_VERSION:
+                    reservations = {int(p): int(owner) for p, owner in data.get("reservations", {}).items()}
+                    state["cursor"] = int(data.get("cursor", 0))
+            except (ValueError, TypeError, AttributeError):
+                logger.debug(f"Ignoring unreadable port reservations in {self.path}")
+
+            yield reservations, state
+
+            data = {
+                "version": RESERVATION_VERSION,
+                "cursor": state.get("cursor", 0),
+                "reservations": {str(p): owner for p, owner in sorted(reservations.items())},
+            }
+            # Rewritten in place: the lock is held on this inode, so it cannot be replaced
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.ftruncate(fd, 0)
+            os.write(fd, json.dumps(data).encode())
+        finally:
+            os.close(fd)  # closing drops the flock
+
+
+def _release_reservations(reservations: ReservationFile, ports: set[int]) -> None:
+    if not ports:
+        return
+    try:
+        reservations.release(set(ports))
+    except OSError:
+        logger.debug(f"Could not release port reservations in {reservations.path}")
+    ports.clear()
+
 
 @dataclass
 class PortAllocator:
-    """Allocate and track ephemeral ports for workers."""
+    """Allocate and track ephemeral ports for workers.
+
+    Ports come from blocks claimed in the host-wide reservation file (see
+    the module docstring), so allocators in different processes never
+    return the same port.
+    """
 
     range_start: int = DEFAULT_PORT_RANGE_START
     range_end: int = DEFAULT_PORT_RANGE_END
     _allocated: set[int] = field(default_factory=set)
+    reservation_file: Path | None = None
+    block_size: int = DEFAULT_BLOCK_SIZE
+    _pool: deque[int] = field(default_factory=deque, init=False, repr=False)
+    _reserved: set[int] = field(default_factory=set, init=False, repr=False)
+    _cursor: int | None = field(default=None, init=False, repr=False)
+    _lock: threading.RLock = field(default_factory=threading.RLock, init=False, repr=False)
+    _reservations: ReservationFile | None = field(default=None, init=False, repr=False)
+
+    def _reservation_store(self) -> ReservationFile:
+        if self._reservations is None:
+            self._reservations = ReservationFile(self.reservation_file or default_reservation_file())
+            # Drop this allocator's reservations if it is discarded without release_all()
+            weakref.finalize(self, _release_reservations, self._reservations, self._reserved)
+        return self._reservations
 
     def is_available(self, port: int) -> bool:
         """Check if a port is available for binding.
@@ -39,6 +212,33 @@ class PortAllocator:
         except OSError:
             return False
 
+    def _claim(self, count: int, failed: set[int], tried: set[int]) -> list[int]:
+        """Claim up to *count* more candidate ports, handing *failed* back."""
+        store = self._reservation_store()
+        try:
+            claimed = store.claim(self.range_start, self.range_end, count, release=failed, exclude=tried)
+        except OSError as e:
+            logger.debug(f"Port reservation file unavailable ({e}); allocating without it")
+            return self._claim_local(count, tried)
+        self._reserved.difference_update(failed)
+        self._reserved.update(claimed)
+        failed.clear()
+        return claimed
+
+    def _claim_local(self, count: int, tried: set[int]) -> list[int]:
+        size = self.range_end - self.range_start + 1
+        cursor = self._cursor if self._cursor is not None else self.range_start
+        claimed: list[int] = []
+        for offset in range(size):
+            if len(claimed) >= count:
+                break
+            port = self.range_start + (cursor - self.range_start + offset) % size
+            if port not in tried and port not in self._allocated and port not in self._pool:
+                claimed.append(port)
+        if claimed:
+            self._cursor = self.range_start + (claimed[-1] - self.range_start + 1) % size
+        return claimed
+
     def allocate(self, count: int = 1) -> list[int]:
         """Allocate available ports.
 
@@ -53,24 +253,37 @@ class PortAllocator:
         """
         allocated: list[int] = []
         max_attempts = count * 10  # Allow some retries
-
-        # Generate candidates in random order to avoid collisions
-        candidates = list(range(self.range_start, self.range_end + 1))
-        random.shuffle(candidates)
-
-        for attempts, port in enumerate(candidates):
-            if len(allocated) >= count:
-                break
-
-            if self.is_available(port):
-                self._allocated.add(port)
-                allocated.append(port)
-                logger.debug(f"Allocated port {port}")
-
-            if attempts + 1 >= max_attempts:
-                break
+        failed: set[int] = set()  # reserved by us but bound by someone else
+        tried: set[int] = set()
+
+        with self._lock:
+            attempts = 0
+            while len(allocated) < count and attempts < max_attempts:
+                if not self._pool:
+                    claimed = self._claim(max(count - len(allocated), self.block_size), failed, tried)
+                    if not claimed:
+                        break
+                    self._pool.extend(claimed)
+
+                port = self._pool.popleft()
+                tried.add(port)
+                attempts += 1
+                if self.is_available(port):
+                    self._allocated.add(port)
+                    allocated.append(port)
+                    logger.debug(f"Allocated port {port}")
+                else:
+                    failed.add(port)
+
+            if failed and self._reservations is not None:
+                self._reserved.difference_update(failed)
+                _release_reservations(self._reservations, failed)
 
         if len(allocated) < count:
+            # Nothing handed out: return the ports to the pool for the next request
+            for port in reversed(allocated):
+                self._allocated.discard(port)
+                self._pool.appendleft(port)
             raise RuntimeError(
                 f"Could not allocate {count} ports. "
                 f"Only {len(allocated)} available in range "
@@ -91,17 +304,27 @@ class PortAllocator:
     def release(self, port: int) -> None:
         """Release an allocated port.
 
+        The port stays reserved for this allocator and is reused by a later
+        allocation; ``release_all`` hands reservations back to the host.
+
         Args:
             port: Port number to release
         """
-        if port in self._allocated:
-            self._allocated.discard(port)
-            logger.debug(f"Released port {port}")
+        with self._lock:
+            if port in self._allocated:
+                self._allocated.discard(port)
+                if port in self._reserved:
+                    self._pool.append(port)
+                logger.debug(f"Released port {port}")
 
     def release_all(self) -> None:
-        """Release all allocated ports."""
-        count = len(self._allocated)
-        self._allocated.clear()
+        """Release all allocated ports and this allocator's host-wide reservations."""
+        with self._lock:
+            count = len(self._allocated)
+            self._allocated.clear()
+            self._pool.clear()
+            if self._reservations is not None:
+                _release_reservations(self._reservations, self._reserved)
         logger.info(f"Released {count} ports")
 
     def get_allocated(self) -> set[int]:
@@ -150,7 +373,8 @@ class PortAllocator:
     async def allocate_many_async(self, count: int) -> list[int]:
         """Allocate multiple ports asynchronously.
 
-        Uses asyncio.gather for parallel allocation.
+        Runs one ``allocate`` call in a worker thread; the ports come from a
+        single claimed block rather than one thread per port.
 
         Args:
             count: Number of ports to allocate
@@ -158,8 +382,7 @@ class PortAllocator:
         Returns:
             List of allocated port numbers
         """
-        tasks = [asyncio.to_thread(self.allocate_one) for _ in range(count)]
-        return list(await asyncio.gather(*tasks))
+        return await asyncio.to_thread(self.allocate, count)
 
     async def allocate_for_worker_async(self, worker_id: int, ports_per_worker: int = 1) -> list[int]:
         """Allocate ports for a specific worker asynchronously.
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
 import os
 import tempfile
@@ -11,6 +12,7 @@ from typing import Any
 
 from zerg.constants import STATE_DIR
 from zerg.logging import get_logger
+from zerg.worker_status_table import WorkerStatusTable, read_all_freshest, read_freshest
 
 logger = get_logger("progress")
 
@@ -63,13 +65,19 @@ class WorkerProgress:
 
 
 class ProgressReporter:
-    """Worker-side progress writer and orchestrator-side reader."""
+    """Worker-side progress writer and orchestrator-side reader.
 
-    def __init__(self, worker_id: int, state_dir: str | Path | None = None) -> None:
+    Progress is published into the shared worker status table and, unless
+    json_export is disabled, also as a ``progress-{id}.json`` file.
+    """
+
+    def __init__(self, worker_id: int, state_dir: str | Path | None = None, json_export: bool = True) -> None:
         self._worker_id = worker_id
         self._state_dir = Path(state_dir) if state_dir else Path(STATE_DIR)
         self._state_dir.mkdir(parents=True, exist_ok=True)
         self._progress = WorkerProgress(worker_id=worker_id)
+        self._json_export = json_export
+        self._table = WorkerStatusTable(self._state_dir)
 
     @property
     def progress_path(self) -> Path:
@@ -107,7 +115,18 @@ class ProgressReporter:
         self._progress.tier_results.clear()
 
     def _write(self) -> None:
-        """Write progress file atomically."""
+        """Publish progress to the status table and, if exported, a JSON file."""
+        try:
+            self._table.write(self._worker_id, "progress", self._progress.to_dict())
+        except (OSError, ValueError):
+            logger.debug(
+                "Failed to publish progress for worker %d",
+                self._worker_id,
+                exc_info=True,
+            )
+        if not self._json_export:
+            return
+
         target = self.progress_path
         try:
             fd, tmp_path = tempfile.mkstemp(dir=str(self._state_dir), suffix=".tmp")
@@ -122,37 +141,50 @@ class ProgressReporter:
             )
 
     def cleanup(self) -> None:
-        """Remove progress file on clean shutdown."""
+        """Remove progress record and file on clean shutdown."""
         try:
+            self._table.clear(self._worker_id, "progress")
             self.progress_path.unlink(missing_ok=True)
         except OSError:
             pass  # Best-effort file cleanup
+        self._table.close()
 
     @staticmethod
     def read(worker_id: int, state_dir: str | Path | None = None) -> WorkerProgress | None:
-        """Read progress file for a worker (orchestrator-side)."""
-        sd = Path(state_dir) if state_dir else Path(STATE_DIR)
-        path = sd / f"progress-{worker_id}.json"
-        if not path.exists():
+        """Read progress for a worker (orchestrator-side).
+
+        The newer of the worker's status-table record and
+        ``progress-{id}.json`` wins.
+        """
+        table = WorkerStatusTable(state_dir)
+        try:
+            record = read_freshest(table, worker_id, "progress")
+        finally:
+            table.close()
+        if record is None:
             return None
         try:
-            data = json.loads(path.read_text())
-            return WorkerProgress.from_dict(data)
-        except (json.JSONDecodeError, KeyError, OSError):
+            return WorkerProgress.from_dict(record)
+        except (KeyError, TypeError):
             return None
 
     @staticmethod
     def read_all(state_dir: str | Path | None = None) -> dict[int, WorkerProgress]:
-        """Read all progress files (orchestrator-side)."""
+        """Read progress for all workers (orchestrator-side).
+
+        Table records are read from one mapping of the status table; a JSON
+        file is parsed only when it is newer than its worker's table record.
+        """
         sd = Path(state_dir) if state_dir else Path(STATE_DIR)
         result: dict[int, WorkerProgress] = {}
         if not sd.exists():
             return result
-        for path in sd.glob("progress-*.json"):
-            try:
-                data = json.loads(path.read_text())
-                wp = WorkerProgress.from_dict(data)
-                result[wp.worker_id] = wp
-            except (json.JSONDecodeError, KeyError, OSError):
-                continue
+        table = WorkerStatusTable(sd)
+        try:
+            records = read_all_freshest(table, "progress")
+        finally:
+            table.close()
+        for wid, record in records.items():
+            with contextlib.suppress(KeyError, TypeError):
+                result[wid] = WorkerProgress.from_dict(record)
         return result
@@ -10,10 +10,13 @@ from __future__ import annotations
 import contextlib
 import os
 import subprocess
+import threading
 import time
+from collections.abc import Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from zerg.claude_stream import run_streaming
 from zerg.constants import (
     LogEvent,
     LogPhase,
@@ -31,6 +34,7 @@ if TYPE_CHECKING:
     from zerg.config import ZergConfig
     from zerg.context_tracker import ContextTracker
     from zerg.git_ops import GitOps
+    from zerg.heartbeat import HeartbeatWriter
     from zerg.log_writer import StructuredLogWriter
     from zerg.plugins import PluginRegistry
     from zerg.state import StateManager
@@ -38,6 +42,11 @@ if TYPE_CHECKING:
 
 logger = get_logger("protocol_handler")
 
+# Minimum seconds between heartbeat writes driven by stream-json events
+_HEARTBEAT_MIN_INTERVAL = 5.0
+# Heartbeat refresh period while a step produces no events (stall threshold is 120 s)
+_HEARTBEAT_REFRESH_INTERVAL = 30.0
+
 
 class ProtocolHandler:
     """Task execution pipeline handler for ZERG workers.
@@ -68,6 +77,7 @@ class ProtocolHandler:
         spec_context: str = "",
         structured_writer: StructuredLogWriter | None = None,
         plugin_registry: PluginRegistry | None = None,
+        heartbeat_writer: HeartbeatWriter | None = None,
     ) -> None:
         """Initialize the protocol handler.
 
@@ -84,6 +94,7 @@ class ProtocolHandler:
             spec_context: Pre-loaded spec context string for prompt injection.
             structured_writer: Optional structured JSONL log writer.
             plugin_registry: Optional plugin registry for lifecycle hooks.
+            heartbeat_writer: Optional heartbeat writer, advanced while Claude runs.
         """
         self.worker_id = worker_id
         self.feature = feature
@@ -97,6 +108,8 @@ class ProtocolHandler:
         self._spec_context = spec_context
         self._structured_writer = structured_writer
         self._plugin_registry = plugin_registry
+        self._heartbeat_writer = heartbeat_writer
+        self._last_heartbeat = 0.0
 
     def execute_task(
         self,
@@ -159,10 +172,11 @@ class ProtocolHandler:
         success = False
         try:
             # Step 1: Invoke Claude Code to implement the task
-            claude_result = self.invoke_claude_code(task)
+            claude_result = self.invoke_claude_code(task, artifact=artifact)
 
-            # Capture Claude output
-            artifact.capture_claude_output(claude_result.stdout, claude_result.stderr)
+            # Capture Claude output (already streamed to disk when output_path is set)
+            if claude_result.output_path is None:
+                artifact.capture_claude_output(claude_result.stdout, claude_result.stderr)
             artifact.write_event(
                 {
                     "event": "claude_invocation",
@@ -194,7 +208,11 @@ class ProtocolHandler:
                 return False
 
             # Step 2: Run verification if specified
-            if task.get("verification") and not self.run_verification(task, artifact=artifact):
+            verified = True
+            if task.get("verification"):
+                with self._heartbeat_keepalive(task_id, "verifying"):
+                    verified = self.run_verification(task, artifact=artifact)
+            if not verified:
                 logger.error(f"Verification failed for {task_id}")
                 if self._structured_writer:
                     self._structured_writer.emit(
@@ -206,8 +224,10 @@ class ProtocolHandler:
                     )
                 return False
 
-            # Step 3: Commit changes
-            if not self.commit_task_changes(task, artifact=artifact):
+            # Step 3: Commit changes (pre-commit hooks may run for a while)
+            with self._heartbeat_keepalive(task_id, "committing"):
+                committed = self.commit_task_changes(task, artifact=artifact)
+            if not committed:
                 logger.error(f"Commit failed for {task_id}")
                 return False
 
@@ -287,18 +307,24 @@ class ProtocolHandler:
         self,
         task: Task,
         timeout: int | None = None,
+        artifact: TaskArtifactCapture | None = None,
     ) -> ClaudeInvocationResult:
         """Invoke Claude Code CLI to implement a task.
 
         Builds a prompt from the task specification and runs Claude Code
-        in non-interactive mode with --print flag.
+        in non-interactive mode with --print flag. Output is streamed: it is
+        teed to the artifact's ``claude_output.txt`` as it arrives (so it
+        survives a timeout) and only a bounded tail is kept in memory.
+        ``stream-json`` events advance the worker heartbeat, which is also
+        refreshed periodically while Claude is silent (long tool calls).
 
         Args:
             task: Task to implement.
             timeout: Timeout in seconds (default: CLAUDE_CLI_DEFAULT_TIMEOUT).
+            artifact: Task artifact capture to stream output into.
 
         Returns:
-            ClaudeInvocationResult with success status and output.
+            ClaudeInvocationResult with success status and the output tails.
         """
         task_id = task["id"]
         timeout = timeout or CLAUDE_CLI_DEFAULT_TIMEOUT
@@ -308,10 +334,14 @@ class ProtocolHandler:
 
         # Build command - use --print for non-interactive execution
         # --dangerously-skip-permissions allows tool execution in automated mode
+        # stream-json (requires --verbose with --print) emits one event per line
         cmd = [
             CLAUDE_CLI_COMMAND,
             "--print",
             "--dangerously-skip-permissions",
+            "--output-format",
+            "stream-json",
+            "--verbose",
             prompt,
         ]
 
@@ -319,49 +349,57 @@ class ProtocolHandler:
         logger.debug(f"Prompt: {prompt[:200]}...")
 
         start_time = time.time()
+        output_path = artifact.claude_output_path if artifact else None
+        self._write_heartbeat(task_id, force=True)
 
         try:
-            result = subprocess.run(
+            run = run_streaming(
                 cmd,
-                cwd=str(self.worktree_path),
-                capture_output=True,
-                text=True,
-                timeout=timeout,
+                cwd=self.worktree_path,
                 env={
                     **os.environ,
                     "ZERG_TASK_ID": task_id,
                     "ZERG_WORKER_ID": str(self.worker_id),
                 },
+                timeout=timeout,
+                output_path=output_path,
+                on_event=lambda _event, _progress: self._write_heartbeat(task_id),
+                on_tick=lambda: self._write_heartbeat(task_id, force=True),
+                tick_interval=_HEARTBEAT_REFRESH_INTERVAL,
             )
 
             duration_ms = int((time.time() - start_time) * 1000)
-            invocation_success = result.returncode == 0
+
+            if run.timed_out:
+                logger.error(f"Claude Code timed out for {task_id} after {timeout}s")
+                message = f"Claude Code invocation timed out after {timeout}s"
+                return ClaudeInvocationResult(
+                    success=False,
+                    exit_code=-1,
+                    stdout=run.stdout,
+                    stderr=f"{message}\n{run.stderr}" if run.stderr else message,
+                    duration_ms=duration_ms,
+                    task_id=task_id,
+                    output_path=str(output_path) if output_path else None,
+                    progress=run.progress.to_dict(),
+                )
+
+            invocation_success = run.returncode == 0
 
             if invocation_success:
                 logger.info(f"Claude Code completed for {task_id} ({duration_ms}ms)")
             else:
-                logger.warning(f"Claude Code failed for {task_id} (exit {result.returncode})")
+                logger.warning(f"Claude Code failed for {task_id} (exit {run.returncode})")
 
             return ClaudeInvocationResult(
                 success=invocation_success,
-                exit_code=result.returncode,
-                stdout=result.stdout,
-                stderr=result.stderr,
-                duration_ms=duration_ms,
-                task_id=task_id,
-            )
-
-        except subprocess.TimeoutExpired:
-            duration_ms = int((time.time() - start_time) * 1000)
-            logger.error(f"Claude Code timed out for {task_id} after {timeout}s")
-
-            return ClaudeInvocationResult(
-                success=False,
-                exit_code=-1,
-                stdout="",
-                stderr=f"Claude Code invocation timed out after {timeout}s",
+                exit_code=run.returncode,
+                stdout=run.stdout,
+                stderr=run.stderr,
                 duration_ms=duration_ms,
                 task_id=task_id,
+                output_path=str(output_path) if output_path else None,
+                progress=run.progress.to_dict(),
             )
 
         except FileNotFoundError:
@@ -390,6 +428,45 @@ class ProtocolHandler:
                 task_id=task_id,
             )
 
+    def _write_heartbeat(self, task_id: str, force: bool = False, step: str = "implementing") -> None:
+        """Write a heartbeat for *step*, at most every few seconds unless *force*."""
+        if self._heartbeat_writer is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_heartbeat < _HEARTBEAT_MIN_INTERVAL:
+            return
+        self._last_heartbeat = now
+        try:
+            self._heartbeat_writer.write(task_id=task_id, step=step)
+        except Exception as e:  # noqa: BLE001 — intentional: heartbeat updates are best-effort, must not stop the task
+            logger.debug(f"Failed to update heartbeat: {e}")
+
+    @contextlib.contextmanager
+    def _heartbeat_keepalive(self, task_id: str, step: str) -> Iterator[None]:
+        """Refresh the heartbeat for *step* on a timer while the body runs.
+
+        Verification and commit hooks are bounded by their own timeouts but
+        emit no events, so without this a long test run looks stalled.
+        """
+        if self._heartbeat_writer is None:
+            yield
+            return
+        stop = threading.Event()
+
+        def refresh() -> None:
+            while True:
+                self._write_heartbeat(task_id, force=True, step=step)
+                if stop.wait(_HEARTBEAT_REFRESH_INTERVAL):
+                    return
+
+        thread = threading.Thread(target=refresh, name=f"zerg-heartbeat-{step}", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join(timeout=1.0)
+
     def _build_task_prompt(self, task: Task) -> str:
         """Build a Claude Code prompt from task specification.
 
@@ -24,6 +24,7 @@ from zerg.constants import (
 from zerg.context_tracker import ContextTracker
 from zerg.dependency_checker import DependencyChecker
 from zerg.git_ops import GitOps
+from zerg.heartbeat import HeartbeatWriter
 from zerg.logging import get_logger, set_worker_context, setup_structured_logging
 from zerg.parser import TaskParser
 from zerg.plugins import PluginRegistry
@@ -94,6 +95,13 @@ class WorkerProtocol:
         self.verifier = VerificationExecutor()
         self.git = GitOps(self.worktree_path)
         self.context_tracker = ContextTracker(threshold_percent=self.context_threshold * 100)
+        self._heartbeat_writer: HeartbeatWriter | None = None
+        try:
+            self._heartbeat_writer = HeartbeatWriter(
+                self.worker_id, state_dir=state_dir, json_export=self.config.heartbeat.json_export
+            )
+        except OSError as e:
+            logger.warning(f"Failed to set up heartbeat writer: {e}")
 
         # Task parser for loading task details
         self.task_parser: TaskParser | None = None
@@ -146,6 +154,8 @@ class WorkerProtocol:
                 feature=self.feature,
                 level=self.config.logging.level,
                 max_size_mb=self.config.logging.max_log_size_mb,
+                backup_count=self.config.logging.max_log_backups,
+                async_writes=self.config.logging.async_writes,
             )
         except Exception as e:  # noqa: BLE001 — intentional: structured logging is optional, must not block worker
             logger.warning(f"Failed to set up structured logging: {e}")
@@ -176,6 +186,7 @@ class WorkerProtocol:
             spec_context=self._spec_context,
             structured_writer=self._structured_writer,
             plugin_registry=self._plugin_registry,
+            heartbeat_writer=self._heartbeat_writer,
         )
 
     def _update_worker_state(
@@ -254,7 +265,12 @@ class WorkerProtocol:
                     self.report_failed(task["id"], "Task execution failed")
         except Exception:  # noqa: BLE001 — intentional: crash handler must catch all, re-raises
             self._update_worker_state(WorkerStatus.CRASHED, current_task=None)
+            if self._structured_writer is not None:
+                self._structured_writer.flush()
             raise
+        finally:
+            # Covers checkpoint exits too; a respawned worker must not inherit this record
+            self._cleanup_heartbeat()
 
         # Clean exit
         self._update_worker_state(WorkerStatus.STOPPED, current_task=None)
@@ -360,6 +376,9 @@ class WorkerProtocol:
         attempt = 0
 
         while True:
+            # Polling for work is not a stall
+            self._write_claiming_heartbeat()
+
             # Reload state from disk to pick up orchestrator writes
             self.state.load()
 
@@ -393,6 +412,25 @@ class WorkerProtocol:
             await asyncio.sleep(interval)
             interval = min(interval * 1.5, 10.0)  # backoff, cap at 10s
 
+    def _write_claiming_heartbeat(self) -> None:
+        """Publish a heartbeat while waiting to claim a task."""
+        if self._heartbeat_writer is None:
+            return
+        try:
+            self._heartbeat_writer.write(step="claiming")
+        except Exception as e:  # noqa: BLE001 — intentional: heartbeat updates are best-effort
+            logger.debug(f"Failed to update heartbeat: {e}")
+
+    def _cleanup_heartbeat(self) -> None:
+        """Remove this worker's heartbeat record and file on exit."""
+        if self._heartbeat_writer is None:
+            return
+        try:
+            self._heartbeat_writer.cleanup()
+        except Exception as e:  # noqa: BLE001 — intentional: heartbeat cleanup is best-effort
+            logger.debug(f"Failed to clean up heartbeat: {e}")
+        self._heartbeat_writer = None
+
     def _load_task_details(self, task_id: str) -> Task:
         """Load full task details from task graph.
 
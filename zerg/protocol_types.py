@@ -26,6 +26,9 @@ class ClaudeInvocationResult:
     duration_ms: int
     task_id: str
     timestamp: datetime = field(default_factory=datetime.now)
+    # Set when the full output was streamed to disk; stdout/stderr then hold only the tail
+    output_path: str | None = None
+    progress: dict[str, Any] | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -37,6 +40,8 @@ class ClaudeInvocationResult:
             "duration_ms": self.duration_ms,
             "task_id": self.task_id,
             "timestamp": self.timestamp.isoformat(),
+            "output_path": self.output_path,
+            "progress": self.progress,
         }
 
 
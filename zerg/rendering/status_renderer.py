@@ -359,8 +359,9 @@ class DashboardRenderer:
         """Render worker status section with step progress."""
         workers = self.state.get_all_workers()
 
-        # Initialize heartbeat monitor for reading step progress
-        heartbeat_monitor = HeartbeatMonitor(state_dir=STATE_DIR)
+        # Read all heartbeats once for step progress
+        with HeartbeatMonitor(state_dir=STATE_DIR) as monitor:
+            heartbeats = monitor.read_all()
 
         lines = []
         for worker_id, worker in sorted(workers.items()):
@@ -380,7 +381,7 @@ class DashboardRenderer:
             # Get step progress from heartbeat
             step_progress = None
             if worker.current_task:
-                heartbeat = heartbeat_monitor.read(worker_id)
+                heartbeat = heartbeats.get(worker_id)
                 if heartbeat and heartbeat.task_id == worker.current_task:
                     step_progress = heartbeat.get_step_progress_display()
 
@@ -729,36 +730,35 @@ def show_tasks_view(state: StateManager, level_filter: int | None, *, _console:
         return
 
     # Initialize heartbeat monitor for reading step progress
-    heartbeat_monitor = HeartbeatMonitor(state_dir=STATE_DIR)
-
-    for task_id, task in sorted(all_tasks.items()):
-        task_level = task.get("level", 1)
-        if level_filter and task_level != level_filter:
-            continue
-
-        status = task.get("status", "pending")
-        if status == TaskStatus.COMPLETE.value:
-            status_display = "[green]complete[/green]"
-        elif status == TaskStatus.IN_PROGRESS.value:
-            status_display = "[yellow]in_progress[/yellow]"
-        elif status == TaskStatus.FAILED.value:
-            status_display = "[red]failed[/red]"
-        else:
-            status_display = f"[dim]{status}[/dim]"
+    with HeartbeatMonitor(state_dir=STATE_DIR) as heartbeat_monitor:
+        for task_id, task in sorted(all_tasks.items()):
+            task_level = task.get("level", 1)
+            if level_filter and task_level != level_filter:
+                continue
 
-        worker_id = task.get("worker_id")
-        worker_display = f"W{worker_id}" if worker_id is not None else "-"
+            status = task.get("status", "pending")
+            if status == TaskStatus.COMPLETE.value:
+                status_display = "[green]complete[/green]"
+            elif status == TaskStatus.IN_PROGRESS.value:
+                status_display = "[yellow]in_progress[/yellow]"
+            elif status == TaskStatus.FAILED.value:
+                status_display = "[red]failed[/red]"
+            else:
+                status_display = f"[dim]{status}[/dim]"
 
-        # Get step progress from heartbeat if task is in progress
-        step_progress = "-"
-        if status == TaskStatus.IN_PROGRESS.value and worker_id is not None:
-            progress = get_step_progress_for_task(task_id, worker_id, heartbeat_monitor)
-            if progress:
-                step_progress = progress
+            worker_id = task.get("worker_id")
+            worker_display = f"W{worker_id}" if worker_id is not None else "-"
 
-        desc = task.get("description", task.get("title", ""))[:40]
+            # Get step progress from heartbeat if task is in progress
+            step_progress = "-"
+            if status == TaskStatus.IN_PROGRESS.value and worker_id is not None:
+                progress = get_step_progress_for_task(task_id, worker_id, heartbeat_monitor)
+                if progress:
+                    step_progress = progress
 
-        table.add_row(task_id, status_display, str(task_level), worker_display, step_progress, desc)
+            desc = task.get("description", task.get("title", ""))[:40]
+
+            table.add_row(task_id, status_display, str(task_level), worker_display, step_progress, desc)
 
     c.print(table)
 
@@ -790,8 +790,9 @@ def show_workers_view(state: StateManager, *, _console: Console | None = None) -
         c.print("[dim]No workers active[/dim]")
         return
 
-    # Initialize heartbeat monitor for reading step progress
-    heartbeat_monitor = HeartbeatMonitor(state_dir=STATE_DIR)
+    # Read all heartbeats once for step progress
+    with HeartbeatMonitor(state_dir=STATE_DIR) as monitor:
+        heartbeats = monitor.read_all()
 
     for worker_id, worker in sorted(workers.items()):
         color = WORKER_COLORS.get(worker.status, "white")
@@ -806,7 +807,7 @@ def show_workers_view(state: StateManager, *, _console: Console | None = None) -
         # Get step progress from heartbeat
         step_progress = "-"
         if worker.current_task:
-            heartbeat = heartbeat_monitor.read(worker_id)
+            heartbeat = heartbeats.get(worker_id)
             if heartbeat and heartbeat.task_id == worker.current_task:
                 progress = heartbeat.get_step_progress_display()
                 if progress:
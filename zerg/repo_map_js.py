@@ -7,7 +7,9 @@ and variable exports. Does not use tree-sitter; regex covers ~90% of cases.
 from __future__ import annotations
 
 import re
+from bisect import bisect_right
 from dataclasses import dataclass
+from itertools import accumulate
 from pathlib import Path
 
 
@@ -58,43 +60,92 @@ _TYPE_ALIAS = re.compile(
     re.MULTILINE,
 )
 
+_DECLARATIONS = (
+    _FUNCTION_DECL,
+    _ARROW_EXPORT,
+    _CLASS_DECL,
+    _INTERFACE_DECL,
+    _TYPE_ALIAS,
+    _IMPORT_STMT,
+    _VARIABLE_EXPORT,
+)
+
+# One pass over the source: ``decl`` marks each line start whose first word
+# can begin one of the declarations above. Comments and string literals are
+# consumed whole, so line starts inside block comments and multi-line
+# template literals are never visited.
+_SCANNER = re.compile(
+    r"""
+    (?P<decl>^(?=(?:export|default|async|abstract|function|class|interface|type|const|let|var|import)\b))
+    | //[^\n]*
+    | /\*.*?(?:\*/|\Z)
+    | `(?:[^`\\]|\\.)*+(?:`|\Z)
+    | '(?:[^'\\\n]|\\.)*+'
+    | "(?:[^"\\\n]|\\.)*+"
+    """,
+    re.MULTILINE | re.DOTALL | re.VERBOSE,
+)
+
 
 def extract_js_symbols(source: str, filepath: str = "") -> list[JSSymbol]:
     """Extract symbols from JavaScript/TypeScript source code.
 
+    The source is scanned once; each line that could start a declaration is
+    matched against the patterns above, and lines inside comments or
+    multi-line template literals are skipped.
+
     Args:
         source: File contents.
         filepath: Path for reference (not required).
 
     Returns:
-        List of extracted symbols.
+        List of extracted symbols, grouped by kind as functions, arrow
+        functions, classes, interfaces, type aliases, imports and then
+        variable exports, each in source order.
     """
-    symbols: list[JSSymbol] = []
     lines = source.split("\n")
+    line_starts = list(accumulate((len(line) + 1 for line in lines[:-1]), initial=0))
+    found: dict[re.Pattern[str], list[re.Match[str]]] = {pattern: [] for pattern in _DECLARATIONS}
+    # Matches of one pattern never overlap, as with finditer
+    ends = dict.fromkeys(_DECLARATIONS, 0)
+
+    for token in _SCANNER.finditer(source):
+        if token.lastgroup != "decl":
+            continue
+        pos = token.start()
+        for pattern in _DECLARATIONS:
+            if pos >= ends[pattern] and (m := pattern.match(source, pos)):
+                ends[pattern] = m.end()
+                found[pattern].append(m)
 
     def _line_number(match: re.Match[str]) -> int:
-        return source[: match.start()].count("\n") + 1
+        return bisect_right(line_starts, match.start())
+
+    symbols: list[JSSymbol] = []
 
     # Functions
-    for m in _FUNCTION_DECL.finditer(source):
+    for m in found[_FUNCTION_DECL]:
         name = m.group(1)
         params = m.group(2)
+        line = _line_number(m)
         symbols.append(
             JSSymbol(
                 name=name,
                 kind="function",
                 signature=f"function {name}{params}",
-                line=_line_number(m),
-                docstring=_get_preceding_comment(lines, _line_number(m) - 1),
+                line=line,
+                docstring=_get_preceding_comment(lines, line - 1),
             )
         )
 
     # Arrow function exports
-    for m in _ARROW_EXPORT.finditer(source):
+    function_names = {s.name for s in symbols}
+    for m in found[_ARROW_EXPORT]:
         name = m.group(1)
         # Skip if already captured as a function
-        if any(s.name == name and s.kind == "function" for s in symbols):
+        if name in function_names:
             continue
+        function_names.add(name)
         symbols.append(
             JSSymbol(
                 name=name,
@@ -105,24 +156,25 @@ def extract_js_symbols(source: str, filepath: str = "") -> list[JSSymbol]:
         )
 
     # Classes
-    for m in _CLASS_DECL.finditer(source):
+    for m in found[_CLASS_DECL]:
         name = m.group(1)
         extends = m.group(2)
         sig = f"class {name}"
         if extends:
             sig += f" extends {extends}"
+        line = _line_number(m)
         symbols.append(
             JSSymbol(
                 name=name,
                 kind="class",
                 signature=sig,
-                line=_line_number(m),
-                docstring=_get_preceding_comment(lines, _line_number(m) - 1),
+                line=line,
+                docstring=_get_preceding_comment(lines, line - 1),
             )
         )
 
     # Interfaces (TS)
-    for m in _INTERFACE_DECL.finditer(source):
+    for m in found[_INTERFACE_DECL]:
         name = m.group(1)
         symbols.append(
             JSSymbol(
@@ -134,7 +186,7 @@ def extract_js_symbols(source: str, filepath: str = "") -> list[JSSymbol]:
         )
 
     # Type aliases (TS)
-    for m in _TYPE_ALIAS.finditer(source):
+    for m in found[_TYPE_ALIAS]:
         name = m.group(1)
         symbols.append(
             JSSymbol(
@@ -146,7 +198,7 @@ def extract_js_symbols(source: str, filepath: str = "") -> list[JSSymbol]:
         )
 
     # Imports
-    for m in _IMPORT_STMT.finditer(source):
+    for m in found[_IMPORT_STMT]:
         named = m.group(1)
         default = m.group(2)
         module = m.group(3)
@@ -173,11 +225,13 @@ def extract_js_symbols(source: str, filepath: str = "") -> list[JSSymbol]:
             )
 
     # Variable exports (not already captured)
-    for m in _VARIABLE_EXPORT.finditer(source):
+    names = {s.name for s in symbols}
+    for m in found[_VARIABLE_EXPORT]:
         name = m.group(1)
         type_ann = m.group(2)
-        if any(s.name == name for s in symbols):
+        if name in names:
             continue
+        names.add(name)
         sig = f"export const {name}"
         if type_ann:
             sig += f": {type_ann.strip()}"
@@ -1,11 +1,12 @@
 """ZERG engineering rules framework."""
 
 from zerg.rules.injector import RuleInjector
-from zerg.rules.loader import Rule, RuleLoader, RulePriority, RuleSet
+from zerg.rules.loader import Rule, RuleIndex, RuleLoader, RulePriority, RuleSet
 from zerg.rules.validator import RuleValidator, ValidationResult
 
 __all__ = [
     "RuleLoader",
+    "RuleIndex",
     "Rule",
     "RuleSet",
     "RulePriority",
@@ -5,20 +5,10 @@ from __future__ import annotations
 from typing import Any
 
 from zerg.logging import get_logger
-from zerg.rules.loader import Rule, RuleLoader, RulePriority
+from zerg.rules.loader import CHARS_PER_TOKEN, Rule, RuleLoader, format_rule, summarize_lines  # noqa: F401 -- re-export
 
 logger = get_logger("rules.injector")
 
-# Rough approximation: 1 token ~ 4 characters
-CHARS_PER_TOKEN = 4
-
-# Priority display labels
-_PRIORITY_LABELS: dict[RulePriority, str] = {
-    RulePriority.CRITICAL: "CRITICAL",
-    RulePriority.IMPORTANT: "IMPORTANT",
-    RulePriority.RECOMMENDED: "RECOMMENDED",
-}
-
 
 class RuleInjector:
     """Generates compact markdown rule sections for worker task context."""
@@ -51,24 +41,11 @@ class RuleInjector:
             return ""
 
         try:
-            rules = self._loader.get_rules_for_files(file_paths)
+            return self._loader.summarize_rules_for_files(file_paths, max_tokens)
         except (OSError, ValueError) as exc:
             logger.debug("Failed to load rules for injection: %s", exc)
             return ""
 
-        if not rules:
-            return ""
-
-        # Sort by priority: critical first, then important, then recommended
-        priority_order = {
-            RulePriority.CRITICAL: 0,
-            RulePriority.IMPORTANT: 1,
-            RulePriority.RECOMMENDED: 2,
-        }
-        rules.sort(key=lambda r: priority_order.get(r.priority, 99))
-
-        return self.summarize_rules(rules, max_tokens)
-
     def format_rule(self, rule: Rule) -> str:
         """Format a single rule as compact markdown.
 
@@ -78,11 +55,7 @@ class RuleInjector:
         Returns:
             Markdown string for this rule.
         """
-        label = _PRIORITY_LABELS.get(rule.priority, rule.priority.value.upper())
-        line = f"- **[{label}]** {rule.title}"
-        if rule.description:
-            line += f": {rule.description}"
-        return line
+        return format_rule(rule)
 
     def summarize_rules(self, rules: list[Rule], max_tokens: int) -> str:
         """Summarize rules within a token budget.
@@ -99,26 +72,7 @@ class RuleInjector:
         """
         if not rules:
             return ""
-
-        max_chars = max_tokens * CHARS_PER_TOKEN
-        lines: list[str] = []
-        current_chars = 0
-
-        for rule in rules:
-            formatted = self.format_rule(rule)
-            line_chars = len(formatted) + 1  # +1 for newline
-
-            if current_chars + line_chars > max_chars and lines:
-                remaining = len(rules) - len(lines)
-                if remaining > 0:
-                    truncation_note = f"\n_({remaining} more rules omitted due to token budget)_"
-                    lines.append(truncation_note)
-                break
-
-            lines.append(formatted)
-            current_chars += line_chars
-
-        return "\n".join(lines)
+        return summarize_lines([format_rule(rule) for rule in rules], max_tokens)
 
     @staticmethod
     def _extract_file_paths(task: dict[str, Any]) -> list[str]:
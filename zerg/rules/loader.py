@@ -4,16 +4,30 @@ from __future__ import annotations
 
 import enum
 import fnmatch
+import json
+import os
+import re
+import tempfile
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from zerg.constants import STATE_DIR
 from zerg.logging import get_logger
 
 logger = get_logger("rules.loader")
 
+DEFAULT_RULES_DIR = Path(".zerg/rules")
+INDEX_FILENAME = "rule-index.json"
+
+# Rough approximation: 1 token ~ 4 characters
+CHARS_PER_TOKEN = 4
+
+_INDEX_VERSION = 1
+_GLOB_CHARS = frozenset("*?[")
+
 
 class RulePriority(enum.Enum):
     """Priority levels for engineering rules."""
@@ -100,17 +114,207 @@ def _parse_rule(data: dict[str, Any]) -> Rule:
     )
 
 
+# Summary order: critical first, then important, then recommended
+_PRIORITY_ORDER: dict[RulePriority, int] = {
+    RulePriority.CRITICAL: 0,
+    RulePriority.IMPORTANT: 1,
+    RulePriority.RECOMMENDED: 2,
+}
+
+
+def format_rule(rule: Rule) -> str:
+    """Format a single rule as one compact markdown line."""
+    line = f"- **[{rule.priority.value.upper()}]** {rule.title}"
+    if rule.description:
+        line += f": {rule.description}"
+    return line
+
+
+def summarize_lines(lines: list[str], max_tokens: int) -> str:
+    """Join pre-formatted rule lines until the token budget is exhausted.
+
+    Args:
+        lines: Formatted rules, highest priority first.
+        max_tokens: Maximum token budget.
+
+    Returns:
+        Markdown string fitting within the budget, with a note counting the
+        rules that were left out.
+    """
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    kept: list[str] = []
+    current_chars = 0
+
+    for line in lines:
+        line_chars = len(line) + 1  # +1 for newline
+        if current_chars + line_chars > max_chars and kept:
+            kept.append(f"\n_({len(lines) - len(kept)} more rules omitted due to token budget)_")
+            break
+        kept.append(line)
+        current_chars += line_chars
+
+    return "\n".join(kept)
+
+
+def _rule_to_dict(rule: Rule) -> dict[str, Any]:
+    """Serialise a Rule for the on-disk index."""
+    return {
+        "id": rule.id,
+        "title": rule.title,
+        "description": rule.description,
+        "priority": rule.priority.value,
+        "category": rule.category,
+        "applies_to": list(rule.applies_to),
+        "enabled": rule.enabled,
+    }
+
+
+class RuleIndex:
+    """Compiled lookup table from file basenames to applicable rules.
+
+    Enabled rules are bucketed by the shape of each ``applies_to`` pattern:
+
+    - ``*`` matches every file;
+    - ``*.ext`` (no other wildcards) is keyed by the literal suffix;
+    - patterns without wildcards are keyed by exact basename;
+    - anything else is kept as a precompiled regex.
+
+    Matching a file list is then a few dict hits per basename plus the
+    (usually empty) list of true globs, with results identical to
+    ``fnmatch.fnmatchcase`` over every rule and pattern. Each rule's summary
+    line is formatted once, so :meth:`summarize` only joins strings.
+    """
+
+    def __init__(self, rules: list[Rule], fingerprint: dict[str, list[int]] | None = None) -> None:
+        """Build the index.
+
+        Args:
+            rules: Rules in load order (earlier wins on duplicate IDs).
+            fingerprint: ``{path: [mtime_ns, size]}`` of the source files.
+        """
+        self._rules = rules
+        self.fingerprint = fingerprint or {}
+        self._match_all: list[int] = []
+        self._by_suffix: dict[str, list[int]] = {}
+        self._by_name: dict[str, list[int]] = {}
+        self._globs: list[tuple[re.Pattern[str], int]] = []
+        self._lines = [format_rule(rule) for rule in rules]
+
+        for pos, rule in enumerate(rules):
+            if not rule.enabled:
+                continue
+            for pattern in rule.applies_to:
+                if pattern == "*":
+                    self._match_all.append(pos)
+                elif pattern.startswith("*.") and not _GLOB_CHARS.intersection(pattern[1:]):
+                    self._by_suffix.setdefault(pattern[1:], []).append(pos)
+                elif not _GLOB_CHARS.intersection(pattern):
+                    self._by_name.setdefault(pattern, []).append(pos)
+                else:
+                    self._globs.append((re.compile(fnmatch.translate(pattern)), pos))
+
+    @classmethod
+    def from_rulesets(cls, rulesets: list[RuleSet], fingerprint: dict[str, list[int]] | None = None) -> RuleIndex:
+        """Build an index from loaded rule sets."""
+        return cls([rule for ruleset in rulesets for rule in ruleset.rules], fingerprint)
+
+    def lookup(self, file_paths: list[str]) -> list[Rule]:
+        """Return the deduplicated enabled rules applicable to *file_paths*.
+
+        Args:
+            file_paths: File paths to match (by basename).
+
+        Returns:
+            Matching rules in load order, first occurrence per rule ID.
+        """
+        return [self._rules[pos] for pos in self._positions(file_paths)]
+
+    def summarize(self, file_paths: list[str], max_tokens: int) -> str:
+        """Return the token-budgeted markdown summary of the rules for *file_paths*.
+
+        Args:
+            file_paths: File paths to match (by basename).
+            max_tokens: Maximum token budget.
+
+        Returns:
+            Matching rules, critical first, or an empty string if none match.
+        """
+        positions = sorted(self._positions(file_paths), key=lambda pos: _PRIORITY_ORDER[self._rules[pos].priority])
+        return summarize_lines([self._lines[pos] for pos in positions], max_tokens)
+
+    def _positions(self, file_paths: list[str]) -> list[int]:
+        """Return rule positions matching *file_paths*, first occurrence per rule ID."""
+        if not file_paths:
+            return []
+
+        hits: set[int] = set(self._match_all)
+        for basename in {Path(fp).name for fp in file_paths}:
+            hits.update(self._by_name.get(basename, ()))
+            dot = basename.find(".")
+            while dot != -1:
+                hits.update(self._by_suffix.get(basename[dot:], ()))
+                dot = basename.find(".", dot + 1)
+            for regex, pos in self._globs:
+                if pos not in hits and regex.match(basename):
+                    hits.add(pos)
+
+        matched: dict[str, int] = {}
+        for pos in sorted(hits):
+            matched.setdefault(self._rules[pos].id, pos)
+        return list(matched.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialise the index for persistence."""
+        return {
+            "version": _INDEX_VERSION,
+            "fingerprint": self.fingerprint,
+            "rules": [_rule_to_dict(rule) for rule in self._rules],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RuleIndex:
+        """Rebuild an index from :meth:`to_dict` output.
+
+        Raises:
+            ValueError: If the payload is malformed or from another version.
+        """
+        if data.get("version") != _INDEX_VERSION:
+            raise ValueError("Rule index version mismatch")
+        try:
+            rules = [_parse_rule(entry) for entry in data["rules"]]
+            fingerprint = {str(k): [int(v[0]), int(v[1])] for k, v in data["fingerprint"].items()}
+        except (KeyError, TypeError, IndexError, AttributeError) as exc:
+            raise ValueError(f"Malformed rule index: {exc}") from None
+        return cls(rules, fingerprint)
+
+
 class RuleLoader:
     """Loads engineering rule sets from YAML files."""
 
-    def __init__(self, rules_dir: Path | None = None) -> None:
+    def __init__(
+        self,
+        rules_dir: Path | None = None,
+        index_path: Path | None = None,
+        project_root: Path | None = None,
+    ) -> None:
         """Initialize the rule loader.
 
         Args:
             rules_dir: Directory containing YAML rule files.
-                       Defaults to ``.zerg/rules/``.
+                       Defaults to ``.zerg/rules/`` under the project root.
+            index_path: Where to persist the compiled rule index. Defaults to
+                ``.zerg/state/rule-index.json`` under the project root for the
+                default rules directory; a custom ``rules_dir`` keeps its
+                index in memory only.
+            project_root: Project the default paths belong to. Defaults to the
+                current working directory at construction time.
         """
-        self._rules_dir = rules_dir or Path(".zerg/rules")
+        root = Path(project_root) if project_root is not None else Path.cwd()
+        self._rules_dir = rules_dir or root / DEFAULT_RULES_DIR
+        if index_path is None and rules_dir is None:
+            index_path = root / STATE_DIR / INDEX_FILENAME
+        self._index_path = index_path
+        self._index: RuleIndex | None = None
 
     @property
     def rules_dir(self) -> Path:
@@ -129,19 +333,84 @@ class RuleLoader:
             return []
 
         rulesets: list[RuleSet] = []
-        for yaml_path in sorted(self._rules_dir.glob("*.yaml")):
-            try:
-                rulesets.append(self.load_file(yaml_path))
-            except (OSError, ValueError, yaml.YAMLError) as exc:
-                logger.warning("Failed to load rule file %s: %s", yaml_path, exc)
-        for yml_path in sorted(self._rules_dir.glob("*.yml")):
+        for path in self._rule_files():
             try:
-                rulesets.append(self.load_file(yml_path))
+                rulesets.append(self.load_file(path))
             except (OSError, ValueError, yaml.YAMLError) as exc:
-                logger.warning("Failed to load rule file %s: %s", yml_path, exc)
+                logger.warning("Failed to load rule file %s: %s", path, exc)
 
         return rulesets
 
+    def _rule_files(self) -> list[Path]:
+        """Return rule files in load order: sorted ``*.yaml`` then sorted ``*.yml``."""
+        return sorted(self._rules_dir.glob("*.yaml")) + sorted(self._rules_dir.glob("*.yml"))
+
+    def _fingerprint(self) -> dict[str, list[int]]:
+        """Return ``{path: [mtime_ns, size]}`` for every rule file."""
+        fingerprint: dict[str, list[int]] = {}
+        if not self._rules_dir.exists():
+            return fingerprint
+        for path in self._rule_files():
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            fingerprint[str(path.resolve())] = [st.st_mtime_ns, st.st_size]
+        return fingerprint
+
+    def index(self) -> RuleIndex:
+        """Return the compiled rule index, rebuilding it only when rule files change.
+
+        The index is validated against the rule files' mtimes and sizes on
+        every call (a directory listing plus one ``stat`` per file). A stale
+        in-memory index falls back to the on-disk copy, and only when both
+        are stale are the YAML files parsed again.
+
+        Returns:
+            Up-to-date RuleIndex for this loader's rules directory.
+        """
+        fingerprint = self._fingerprint()
+        if self._index is not None and self._index.fingerprint == fingerprint:
+            return self._index
+
+        index = self._load_index()
+        if index is None or index.fingerprint != fingerprint:
+            index = RuleIndex.from_rulesets(self.load_all(), fingerprint)
+            self._save_index(index)
+        self._index = index
+        return index
+
+    def _load_index(self) -> RuleIndex | None:
+        """Read the persisted index, or ``None`` if missing or unreadable."""
+        if self._index_path is None or not self._index_path.exists():
+            return None
+        try:
+            return RuleIndex.from_dict(json.loads(self._index_path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, AttributeError):
+            logger.debug("Ignoring unreadable rule index %s", self._index_path)
+            return None
+
+    def _save_index(self, index: RuleIndex) -> None:
+        """Atomically persist the index via tempfile + os.replace."""
+        if self._index_path is None or not self._rules_dir.exists():
+            return
+        try:
+            self._index_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(self._index_path.parent), suffix=".tmp")
+        except OSError:
+            logger.debug("Failed to write rule index to %s", self._index_path, exc_info=True)
+            return
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(index.to_dict(), f)
+            os.replace(tmp_path, str(self._index_path))
+        except OSError:
+            logger.debug("Failed to write rule index to %s", self._index_path, exc_info=True)
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass  # Best-effort file cleanup
+
     def load_file(self, path: Path) -> RuleSet:
         """Load a single YAML rule file into a RuleSet.
 
@@ -197,13 +466,14 @@ class RuleLoader:
 
         Args:
             file_paths: List of file paths to match against.
-            rulesets: Rule sets to filter. Loads all if None.
+            rulesets: Rule sets to filter. Uses the cached rule index
+                for the rules directory if None.
 
         Returns:
             Deduplicated list of matching enabled rules.
         """
         if rulesets is None:
-            rulesets = self.load_all()
+            return self.index().lookup(file_paths)
 
         if not file_paths:
             return []
@@ -222,6 +492,19 @@ class RuleLoader:
 
         return list(matched.values())
 
+    def summarize_rules_for_files(self, file_paths: list[str], max_tokens: int) -> str:
+        """Return the token-budgeted rule summary for *file_paths* from the cached index.
+
+        Args:
+            file_paths: List of file paths to match against.
+            max_tokens: Maximum token budget.
+
+        Returns:
+            Markdown with the applicable rules, critical first, or an empty
+            string if none apply.
+        """
+        return self.index().summarize(file_paths, max_tokens)
+
     def get_rules_by_priority(
         self,
         priority: RulePriority,
@@ -1,4 +1,4 @@
-"""Dependency CVE scanning with osv.dev API and heuristic fallback.
+"""Dependency CVE scanning against a local OSV database with heuristic checks.
 
 Scans project dependency files for known vulnerabilities:
 - requirements.txt (Python/pip)
@@ -6,8 +6,11 @@ Scans project dependency files for known vulnerabilities:
 - Cargo.toml (Rust/cargo)
 - go.mod (Go)
 
-Strategy: query osv.dev API first (5s timeout), fall back to
-heuristic checks (unpinned versions, missing lockfiles) on failure.
+Strategy: look pinned versions up in the local OSV mirror
+(:mod:`zerg.security.osv_db`, refreshed with ``zerg review --update-db``)
+and always run heuristic checks (unpinned versions, missing lockfiles,
+known-bad versions). The live osv.dev API is only queried when explicitly
+requested.
 """
 
 from __future__ import annotations
@@ -15,14 +18,17 @@ from __future__ import annotations
 import json
 import logging
 import re
+import sqlite3
 import urllib.error
 import urllib.request
 from collections.abc import Callable  # noqa: F401 (used in type annotation)
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any  # noqa: F401 (used in type annotation)
 
 from zerg.security import SecurityFinding
+from zerg.security.osv_db import OSV_DB_PATH, VulnerabilityDatabase
 
 logger = logging.getLogger(__name__)
 
@@ -274,13 +280,48 @@ _PARSERS: dict[str, Callable[[Path], list[_Dependency]]] = {
 
 
 def _collect_dependencies(project_path: Path) -> list[_Dependency]:
-    """Collect all dependencies from supported manifest files."""
-    all_deps: list[_Dependency] = []
-    for filename, parser in _PARSERS.items():
-        manifest = project_path / filename
-        if manifest.is_file():
-            all_deps.extend(parser(manifest))
-    return all_deps
+    """Collect all dependencies from supported manifest files.
+
+    Manifests are parsed concurrently; results keep the _PARSERS order.
+    """
+    manifests = [
+        (parser, project_path / filename)
+        for filename, parser in _PARSERS.items()
+        if (project_path / filename).is_file()
+    ]
+    if len(manifests) < 2:
+        return [dep for parser, manifest in manifests for dep in parser(manifest)]
+    with ThreadPoolExecutor(max_workers=len(manifests)) as executor:
+        parsed = list(executor.map(lambda item: item[0](item[1]), manifests))
+    return [dep for deps in parsed for dep in deps]
+
+
+# ---------------------------------------------------------------------------
+# Local OSV database lookup
+# ---------------------------------------------------------------------------
+
+
+def _query_local_db(deps: list[_Dependency], db_path: Path) -> list[SecurityFinding]:
+    """Look pinned dependencies up in the local OSV database.
+
+    Returns no findings (and logs how to create it) if the database does
+    not exist yet.
+    """
+    pinned = [dep for dep in deps if dep.version]
+    if not pinned:
+        return []
+    if not db_path.is_file():
+        logger.info("No local OSV database at %s; run `zerg review --update-db` to download it", db_path)
+        return []
+
+    with VulnerabilityDatabase(db_path) as db:
+        hits = db.lookup((dep.ecosystem, dep.name, dep.version or "") for dep in pinned)
+
+    findings: list[SecurityFinding] = []
+    for dep in pinned:
+        for vuln in hits.get((dep.ecosystem, dep.name, dep.version or ""), []):
+            findings.append(_vuln_finding(dep, vuln))
+    return findings
 
 
 # ---------------------------------------------------------------------------
@@ -336,27 +377,29 @@ def _query_osv(deps: list[_Dependency]) -> list[SecurityFinding]:
         vulns = result.get("vulns", [])
         dep = dep_index[idx]
         for vuln in vulns:
-            vuln_id = vuln.get("id", "UNKNOWN")
-            summary = vuln.get("summary", "Known vulnerability")
-            aliases = vuln.get("aliases", [])
-            # Prefer CVE alias if available
-            cve_id = next((a for a in aliases if a.startswith("CVE-")), None)
-            severity_str = _osv_severity(vuln)
-            findings.append(
-                SecurityFinding(
-                    category="cve",
-                    severity=severity_str,
-                    file=dep.source_file,
-                    line=dep.line,
-                    message=(f"{dep.name}=={dep.version}: {vuln_id} — {summary}"),
-                    cwe=None,
-                    remediation=f"Update {dep.name} to a patched version. See https://osv.dev/vulnerability/{vuln_id}",
-                    pattern_name=cve_id or vuln_id,
-                )
-            )
+            findings.append(_vuln_finding(dep, vuln))
     return findings
 
 
+def _vuln_finding(dep: _Dependency, vuln: dict[str, Any]) -> SecurityFinding:
+    """Build a finding for one OSV vulnerability record affecting *dep*."""
+    vuln_id = vuln.get("id", "UNKNOWN")
+    summary = vuln.get("summary", "Known vulnerability")
+    aliases = vuln.get("aliases", [])
+    # Prefer CVE alias if available
+    cve_id = next((a for a in aliases if a.startswith("CVE-")), None)
+    return SecurityFinding(
+        category="cve",
+        severity=_osv_severity(vuln),
+        file=dep.source_file,
+        line=dep.line,
+        message=(f"{dep.name}=={dep.version}: {vuln_id} — {summary}"),
+        cwe=None,
+        remediation=f"Update {dep.name} to a patched version. See https://osv.dev/vulnerability/{vuln_id}",
+        pattern_name=cve_id or vuln_id,
+    )
+
+
 def _osv_severity(vuln: dict[str, Any]) -> str:
     """Extract a severity string from an OSV vulnerability record."""
     # OSV severity is in database_specific or severity array
@@ -537,21 +580,29 @@ def _check_known_bad_versions(
 # ---------------------------------------------------------------------------
 
 
-def scan_dependencies(project_path: Path) -> list[SecurityFinding]:
+def scan_dependencies(
+    project_path: Path,
+    db_path: str | Path | None = None,
+    query_api: bool = False,
+) -> list[SecurityFinding]:
     """Scan project dependencies for known CVEs and supply-chain risks.
 
     Args:
         project_path: Root directory of the project to scan.
+        db_path: Local OSV database (defaults to OSV_DB_PATH).
+        query_api: Query the live osv.dev batch API instead of the local
+            database. Off by default so scans never touch the network.
 
     Returns:
         List of SecurityFinding instances. Empty list means no issues found.
 
     Strategy:
         1. Parse dependency manifests (requirements.txt, package.json,
-           Cargo.toml, go.mod).
-        2. Query osv.dev batch API with a 5-second timeout.
-        3. On API failure, fall back to heuristic checks (unpinned versions,
-           missing lockfiles, known-bad version ranges).
+           Cargo.toml, go.mod) concurrently.
+        2. Look pinned versions up in the local OSV database (or, with
+           query_api, the osv.dev batch API with a 5-second timeout).
+        3. Always add heuristic checks (unpinned versions, missing
+           lockfiles, known-bad version ranges).
     """
     project_path = Path(project_path).resolve()
     deps = _collect_dependencies(project_path)
@@ -559,11 +610,15 @@ def scan_dependencies(project_path: Path) -> list[SecurityFinding]:
     # Always run heuristic checks for lockfile and unpinned-version findings.
     heuristic_findings = _heuristic_scan(project_path, deps)
 
-    # Attempt API-based CVE lookup for deps that have pinned versions.
+    # CVE lookup for deps that have pinned versions.
     api_findings: list[SecurityFinding] = []
     try:
-        api_findings = _query_osv(deps)
-        logger.debug("osv.dev returned %d vulnerability findings", len(api_findings))
+        if query_api:
+            api_findings = _query_osv(deps)
+            logger.debug("osv.dev returned %d vulnerability findings", len(api_findings))
+        else:
+            api_findings = _query_local_db(deps, Path(db_path or OSV_DB_PATH))
+            logger.debug("Local OSV database returned %d vulnerability findings", len(api_findings))
     except (
         urllib.error.URLError,
         urllib.error.HTTPError,
@@ -571,9 +626,10 @@ def scan_dependencies(project_path: Path) -> list[SecurityFinding]:
         json.JSONDecodeError,
         KeyError,
         ValueError,
+        sqlite3.Error,
     ) as exc:
         logger.warning(
-            "osv.dev API query failed (%s); using heuristic fallback only",
+            "OSV vulnerability lookup failed (%s); using heuristic fallback only",
             exc,
         )
         # Heuristic known-bad checks are already in heuristic_findings,
@@ -0,0 +1,347 @@
+"""Local OSV vulnerability database for offline dependency scanning.
+
+The CVE scanner used to send every scan to the osv.dev batch API, which made
+scans slow, subject to rate limits and impossible without network access.
+This module mirrors the OSV ecosystem exports
+(``https://osv-vulnerabilities.storage.googleapis.com/<ecosystem>/all.zip``)
+into an indexed SQLite database instead:
+
+- ``affected_versions`` holds the explicit version lists of each advisory,
+  indexed by (ecosystem, package, version);
+- ``affected_ranges`` holds SEMVER/ECOSYSTEM ranges flattened into
+  ``introduced``/``fixed``/``last_affected`` intervals, indexed by
+  (ecosystem, package); candidate rows are compared in Python with an
+  ecosystem-aware version key.
+
+Scans only read the database. The network is used only by
+:func:`update_database`, which ``zerg review --update-db`` calls.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import shutil
+import sqlite3
+import tempfile
+import urllib.parse
+import urllib.request
+import zipfile
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from zerg.logging import get_logger
+
+logger = get_logger("security.osv_db")
+
+OSV_DB_PATH = ".zerg/osv/osv.sqlite3"
+OSV_EXPORT_URL = "https://osv-vulnerabilities.storage.googleapis.com"
+OSV_EXPORT_TIMEOUT_SECONDS = 60
+
+# Ecosystems the manifest parsers in cve.py produce
+DEFAULT_ECOSYSTEMS = ("PyPI", "npm", "crates.io", "Go")
+
+# SQLite limits the number of bound parameters per statement
+_QUERY_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS vulns (id TEXT PRIMARY KEY, record TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS affected_versions (
+    ecosystem TEXT NOT NULL, package TEXT NOT NULL, version TEXT NOT NULL, vuln_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_affected_versions ON affected_versions (ecosystem, package, version);
+CREATE TABLE IF NOT EXISTS affected_ranges (
+    ecosystem TEXT NOT NULL, package TEXT NOT NULL,
+    introduced TEXT, fixed TEXT, last_affected TEXT, vuln_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_affected_ranges ON affected_ranges (ecosystem, package);
+"""
+
+
+# ---------------------------------------------------------------------------
+# Names and versions
+# ---------------------------------------------------------------------------
+
+
+def normalize_package(ecosystem: str, name: str) -> str:
+    """Return the lookup key for a package name (PEP 503 for PyPI)."""
+    if ecosystem == "PyPI":
+        return re.sub(r"[-_.]+", "-", name).lower()
+    return name
+
+
+_PEP440_RE = re.compile(
+    r"""
+    ^v?(?:(?P<epoch>\d+)!)?
+    (?P<release>\d+(?:\.\d+)*)
+    (?:[-_.]?(?P<pre>a|b|c|rc|alpha|beta|pre|preview)[-_.]?(?P<pre_n>\d*))?
+    (?:-(?P<post_implicit>\d+)|[-_.]?(?:post|rev|r)[-_.]?(?P<post_n>\d*))?
+    (?:[-_.]?dev[-_.]?(?P<dev_n>\d*))?
+    (?:\+[a-z0-9.]*)?$
+    """,
+    re.VERBOSE | re.IGNORECASE,
+)
+_PRE_RANK = {"a": 0, "alpha": 0, "b": 1, "beta": 1, "c": 2, "rc": 2, "pre": 2, "preview": 2}
+
+_SEMVER_RE = re.compile(r"^v?(?P<core>\d+(?:\.\d+)*)(?:-(?P<pre>[0-9A-Za-z.\-]+))?(?:\+[0-9A-Za-z.\-]+)?$")
+
+
+def _pep440_key(version: str) -> tuple[Any, ...] | None:
+    m = _PEP440_RE.match(version.strip())
+    if not m:
+        return None
+    release = [int(p) for p in m.group("release").split(".")]
+    while len(release) > 1 and release[-1] == 0:
+        release.pop()
+    pre, post = m.group("pre"), m.group("post_implicit") or m.group("post_n")
+    has_post = m.group("post_implicit") is not None or m.group("post_n") is not None
+    has_dev = m.group("dev_n") is not None
+    if pre:
+        pre_key: tuple[int, ...] = (0, _PRE_RANK[pre.lower()], int(m.group("pre_n") or 0))
+    elif has_dev and not has_post:
+        pre_key = (-1,)  # 1.0.dev1 sorts before 1.0a1
+    else:
+        pre_key = (1,)
+    post_key = (int(post or 0),) if has_post else (-1,)
+    dev_key = (0, int(m.group("dev_n") or 0)) if has_dev else (1,)
+    return (int(m.group("epoch") or 0), tuple(release), pre_key, post_key, dev_key)
+
+
+def _semver_key(version: str) -> tuple[Any, ...] | None:
+    m = _SEMVER_RE.match(version.strip())
+    if not m:
+        return None
+    core = [int(p) for p in m.group("core").split(".")]
+    core += [0] * (3 - len(core))
+    pre = m.group("pre")
+    if pre is None:
+        return (tuple(core), (1,))
+    # Numeric identifiers sort before alphanumeric ones
+    idents = tuple((0, int(p), "") if p.isdigit() else (1, 0, p) for p in pre.split("."))
+    return (tuple(core), (0, idents))
+
+
+def version_key(ecosystem: str, version: str) -> tuple[Any, ...] | None:
+    """Return a sortable key for *version*, or None if it cannot be parsed."""
+    if version == "0":
+        return ()  # OSV's "introduced: 0" sorts before every version
+    return _pep440_key(version) if ecosystem == "PyPI" else _semver_key(version)
+
+
+# ---------------------------------------------------------------------------
+# Export parsing
+# ---------------------------------------------------------------------------
+
+
+def _range_intervals(events: list[dict[str, str]]) -> Iterator[tuple[str, str | None, str | None]]:
+    """Flatten OSV range events into (introduced, fixed, last_affected) intervals."""
+    introduced: str | None = None
+    for event in events:
+        if "introduced" in event:
+            if introduced is not None:
+                yield introduced, None, None
+            introduced = event["introduced"]
+        elif "fixed" in event and introduced is not None:
+            yield introduced, event["fixed"], None
+            introduced = None
+        elif "last_affected" in event and introduced is not None:
+            yield introduced, None, event["last_affected"]
+            introduced = None
+    if introduced is not None:
+        yield introduced, None, None
+
+
+def _iter_export(zip_path: Path) -> Iterator[dict[str, Any]]:
+    """Yield the OSV records in an ecosystem export zip."""
+    with zipfile.ZipFile(zip_path) as archive:
+        for name in archive.namelist():
+            if not name.endswith(".json"):
+                continue
+            try:
+                record = json.loads(archive.read(name))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                logger.debug("Skipping unreadable OSV record %s", name)
+                continue
+            if isinstance(record, dict) and "id" in record:
+                yield record
+
+
+# ---------------------------------------------------------------------------
+# Database
+# ---------------------------------------------------------------------------
+
+
+class VulnerabilityDatabase:
+    """SQLite mirror of OSV advisories, queried by ecosystem/package/version."""
+
+    def __init__(self, path: str | Path = OSV_DB_PATH) -> None:
+        """Open (and create if needed) the database at *path*."""
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> VulnerabilityDatabase:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def imported_ecosystems(self) -> dict[str, str]:
+        """Return ecosystem -> ISO timestamp of its last import."""
+        rows = self._conn.execute("SELECT key, value FROM meta WHERE key LIKE 'imported:%'").fetchall()
+        return {key.removeprefix("imported:"): value for key, value in rows}
+
+    def import_export(self, zip_path: str | Path, ecosystem: str) -> int:
+        """Replace *ecosystem*'s advisories with those in an OSV export zip.
+
+        Args:
+            zip_path: Path to ``<ecosystem>/all.zip`` (or any zip of OSV JSON records).
+            ecosystem: OSV ecosystem name, e.g. ``"PyPI"``.
+
+        Returns:
+            Number of advisories imported.
+        """
+        count = 0
+        versions: list[tuple[str, str, str, str]] = []
+        ranges: list[tuple[str, str, str, str | None, str | None, str]] = []
+        vulns: list[tuple[str, str]] = []
+        for record in _iter_export(Path(zip_path)):
+            if record.get("withdrawn"):
+                continue
+            vuln_id = record["id"]
+            matched = False
+            for affected in record.get("affected", []):
+                package = affected.get("package", {})
+                if package.get("ecosystem") != ecosystem or not package.get("name"):
+                    continue
+                matched = True
+                name = normalize_package(ecosystem, package["name"])
+                versions.extend((ecosystem, name, v, vuln_id) for v in affected.get("versions", []))
+                for rng in affected.get("ranges", []):
+                    if rng.get("type") not in ("SEMVER", "ECOSYSTEM"):
+                        continue  # GIT ranges are covered by the explicit version list
+                    for introduced, fixed, last in _range_intervals(rng.get("events", [])):
+                        ranges.append((ecosystem, name, introduced, fixed, last, vuln_id))
+            if matched:
+                summary = {k: record[k] for k in ("id", "summary", "details", "aliases", "severity") if k in record}
+                vulns.append((vuln_id, json.dumps(summary)))
+                count += 1
+
+        with self._conn:
+            self._conn.execute("DELETE FROM affected_versions WHERE ecosystem = ?", (ecosystem,))
+            self._conn.execute("DELETE FROM affected_ranges WHERE ecosystem = ?", (ecosystem,))
+            self._conn.executemany("INSERT OR REPLACE INTO vulns VALUES (?, ?)", vulns)
+            self._conn.executemany("INSERT INTO affected_versions VALUES (?, ?, ?, ?)", versions)
+            self._conn.executemany("INSERT INTO affected_ranges VALUES (?, ?, ?, ?, ?, ?)", ranges)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                (f"imported:{ecosystem}", datetime.now(UTC).isoformat()),
+            )
+        logger.debug("Imported %d %s advisories into %s", count, ecosystem, self.path)
+        return count
+
+    def lookup(self, packages: Iterable[tuple[str, str, str]]) -> dict[tuple[str, str, str], list[dict[str, Any]]]:
+        """Find advisories affecting each (ecosystem, name, version).
+
+        Args:
+            packages: (ecosystem, package name, exact version) triples.
+
+        Returns:
+            Mapping of each input triple that is affected to its OSV records.
+        """
+        by_package: dict[tuple[str, str], list[tuple[str, str, str]]] = {}
+        for triple in packages:
+            ecosystem, name, _version = triple
+            by_package.setdefault((ecosystem, normalize_package(ecosystem, name)), []).append(triple)
+
+        hits: dict[tuple[str, str, str], set[str]] = {}
+        for ecosystem in {eco for eco, _ in by_package}:
+            names = sorted(name for eco, name in by_package if eco == ecosystem)
+            for start in range(0, len(names), _QUERY_CHUNK):
+                chunk = names[start : start + _QUERY_CHUNK]
+                marks = ",".join("?" * len(chunk))
+                for package, version, vuln_id in self._conn.execute(
+                    f"SELECT package, version, vuln_id FROM affected_versions "
+                    f"WHERE ecosystem = ? AND package IN ({marks})",
+                    (ecosystem, *chunk),
+                ):
+                    for triple in by_package[(ecosystem, package)]:
+                        if triple[2] == version:
+                            hits.setdefault(triple, set()).add(vuln_id)
+                for package, introduced, fixed, last, vuln_id in self._conn.execute(
+                    f"SELECT package, introduced, fixed, last_affected, vuln_id FROM affected_ranges "
+                    f"WHERE ecosystem = ? AND package IN ({marks})",
+                    (ecosystem, *chunk),
+                ):
+                    for triple in by_package[(ecosystem, package)]:
+                        if _in_interval(ecosystem, triple[2], introduced, fixed, last):
+                            hits.setdefault(triple, set()).add(vuln_id)
+
+        records = self._records({vuln_id for ids in hits.values() for vuln_id in ids})
+        return {
+            triple: [records[vuln_id] for vuln_id in sorted(ids) if vuln_id in records] for triple, ids in hits.items()
+        }
+
+    def _records(self, vuln_ids: set[str]) -> dict[str, dict[str, Any]]:
+        ids = sorted(vuln_ids)
+        records: dict[str, dict[str, Any]] = {}
+        for start in range(0, len(ids), _QUERY_CHUNK):
+            chunk = ids[start : start + _QUERY_CHUNK]
+            marks = ",".join("?" * len(chunk))
+            for vuln_id, record in self._conn.execute(
+                f"SELECT id, record FROM vulns WHERE id IN ({marks})",
+                chunk,
+            ):
+                records[vuln_id] = json.loads(record)
+        return records
+
+
+def _in_interval(ecosystem: str, version: str, introduced: str | None, fixed: str | None, last: str | None) -> bool:
+    """True if *version* lies in [introduced, fixed) or [introduced, last_affected]."""
+    key = version_key(ecosystem, version)
+    if key is None:
+        return False
+    low = version_key(ecosystem, introduced or "0")
+    if low is None or key < low:
+        return False
+    if fixed is not None:
+        high = version_key(ecosystem, fixed)
+        return high is not None and key < high
+    if last is not None:
+        high = version_key(ecosystem, last)
+        return high is not None and key <= high
+    return True
+
+
+def update_database(
+    db_path: str | Path = OSV_DB_PATH,
+    ecosystems: Iterable[str] = DEFAULT_ECOSYSTEMS,
+    base_url: str = OSV_EXPORT_URL,
+) -> dict[str, int]:
+    """Download the OSV exports for *ecosystems* and import them.
+
+    This is the only network access of the CVE scanner.
+
+    Returns:
+        Ecosystem -> number of advisories imported.
+
+    Raises:
+        urllib.error.URLError, OSError: If an export cannot be downloaded.
+    """
+    counts: dict[str, int] = {}
+    with VulnerabilityDatabase(db_path) as db, tempfile.TemporaryDirectory(prefix="zerg-osv-") as tmp:
+        for ecosystem in ecosystems:
+            url = f"{base_url.rstrip('/')}/{urllib.parse.quote(ecosystem)}/all.zip"
+            target = Path(tmp) / f"{ecosystem}.zip"
+            logger.info("Downloading %s", url)
+            with urllib.request.urlopen(url, timeout=OSV_EXPORT_TIMEOUT_SECONDS) as resp, target.open("wb") as out:
+                shutil.copyfileobj(resp, out)
+            counts[ecosystem] = db.import_export(target, ecosystem)
+    return counts
@@ -7,6 +7,7 @@ Migrated from zerg/security_rules.py — complete copy of all functions,
 classes, and constants.
 """
 
+import functools
 import json
 import subprocess
 from dataclasses import dataclass, field
@@ -475,6 +476,48 @@ def filter_rules_for_files(
     return result
 
 
+def _summarize_rule_file(rule_path: Path) -> str:
+    """Return the summary section for one rule file, or "" if it has no rules.
+
+    Results are memoized per path, mtime and size, so repeated per-task
+    summaries only ``stat`` unchanged rule files.
+    """
+    try:
+        st = rule_path.stat()
+    except OSError:
+        return ""
+    return _summarize_rule_version(str(rule_path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=256)
+def _summarize_rule_version(path: str, mtime_ns: int, size: int) -> str:
+    """Build the summary section of one version of a rule file (memoized)."""
+    rule_path = Path(path)
+    content = rule_path.read_text()
+    in_code_block = False
+    file_parts: list[str] = []
+
+    for line in content.split("\n"):
+        # Track code blocks
+        if line.strip().startswith("```"):
+            in_code_block = not in_code_block
+            continue
+        if in_code_block:
+            continue
+
+        # Include rule headers and level indicators
+        if line.startswith("## Rule:") or line.startswith("### Rule:"):
+            file_parts.append(line)
+        elif line.startswith("**Level**:") or line.startswith("**Level**"):
+            file_parts.append(line)
+        elif line.startswith("**When**:") or line.startswith("**When**"):
+            file_parts.append(line)
+
+    if not file_parts:
+        return ""
+    return f"### {rule_path.parent.name}/{rule_path.name}\n" + "\n".join(file_parts)
+
+
 def summarize_rules(rule_paths: list[Path], max_tokens: int = 2000) -> str:
     """Read and summarize security rules within token budget.
 
@@ -486,34 +529,10 @@ def summarize_rules(rule_paths: list[Path], max_tokens: int = 2000) -> str:
     chars_used = 0
 
     for rule_path in rule_paths:
-        if not rule_path.exists():
-            continue
-
-        content = rule_path.read_text()
-        in_code_block = False
-        file_parts: list[str] = []
-
-        for line in content.split("\n"):
-            # Track code blocks
-            if line.strip().startswith("```"):
-                in_code_block = not in_code_block
-                continue
-            if in_code_block:
-                continue
-
-            # Include rule headers and level indicators
-            if line.startswith("## Rule:") or line.startswith("### Rule:"):
-                file_parts.append(line)
-            elif line.startswith("**Level**:") or line.startswith("**Level**"):
-                file_parts.append(line)
-            elif line.startswith("**When**:") or line.startswith("**When**"):
-                file_parts.append(line)
-
-        if file_parts:
-            section = f"### {rule_path.parent.name}/{rule_path.name}\n" + "\n".join(file_parts)
-            if chars_used + len(section) <= chars_budget:
-                parts.append(section)
-                chars_used += len(section)
+        section = _summarize_rule_file(rule_path)
+        if section and chars_used + len(section) <= chars_budget:
+            parts.append(section)
+            chars_used += len(section)
 
     return "\n\n".join(parts)
 
@@ -0,0 +1,234 @@
+"""Speculative incremental merging for ZERG levels.
+
+While a level is still running, :class:`SpeculativeMerger` merges each
+worker branch into a speculative branch as soon as one of its tasks
+completes (checkout-free, via ``git merge-tree``) and pre-runs the quality
+gates on that intermediate tree in a private worktree.  At the level
+barrier only the remaining delta is merged, and gate results are reused
+when the final tree hash matches a tree the gates already ran on.
+
+Enabled with ``rush.speculative_merge``.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+from zerg.config import QualityGate, ZergConfig
+from zerg.constants import MergeStatus
+from zerg.exceptions import GitError, MergeConflictError
+from zerg.gates import GateRunner
+from zerg.git_ops import GitOps
+from zerg.logging import get_logger
+from zerg.types import GateRunResult, MergeResult
+
+logger = get_logger("speculative_merge")
+
+
+class SpeculativeMerger:
+    """Merge worker branches and pre-run gates ahead of the level barrier.
+
+    Merges are serialized on one background thread and gate pre-runs on
+    another, so neither blocks the orchestrator loop.  Gate pre-runs are
+    coalesced: if several merges land while gates are running, only the
+    latest tree is verified next.
+    """
+
+    def __init__(
+        self,
+        feature: str,
+        git: GitOps,
+        base_branch: str = "main",
+        gates: list[QualityGate] | None = None,
+        config: ZergConfig | None = None,
+    ) -> None:
+        """Start speculation from the current tip of *base_branch*.
+
+        Args:
+            feature: Feature name (used for the speculative branch name)
+            git: GitOps for the repository
+            base_branch: Branch the level will be merged into
+            gates: Gates to pre-run on speculative trees (none disables pre-runs)
+            config: ZERG configuration for the gate runner
+        """
+        self.feature = feature
+        self.git = git
+        self.base_branch = base_branch
+        self.branch = f"zerg/{feature}/speculative"
+        self.base_commit = git.get_commit(base_branch)
+        self._gates = [g for g in gates or [] if g.required]
+        self._gate_runner = GateRunner(config) if self._gates else None
+
+        self._lock = threading.Lock()
+        self._broken = False
+        self._gates_stopped = False
+        self._merged: list[str] = []
+        self._merge_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="spec-merge")
+        self._pending: list[concurrent.futures.Future[None]] = []
+        self._gate_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="spec-gates")
+        self._gate_future: concurrent.futures.Future[None] | None = None
+        self._gate_results: dict[str, tuple[bool, list[GateRunResult]]] = {}
+        self._worktree: Path | None = None
+
+        if git.branch_exists(self.branch):
+            git.delete_branch(self.branch, force=True)
+        git.create_branch(self.branch, self.base_commit)
+
+    @property
+    def broken(self) -> bool:
+        """True once a speculative merge conflicted; the barrier then merges normally."""
+        return self._broken
+
+    # -- during the level --------------------------------------------------
+
+    def submit(self, branch: str) -> None:
+        """Queue a speculative merge of *branch* (called when one of its tasks completes)."""
+        if self._broken:
+            return
+        with self._lock:
+            self._pending.append(self._merge_pool.submit(self._merge, branch))
+
+    def _merge(self, branch: str) -> None:
+        if self._broken:
+            return
+        try:
+            self.git.merge_without_checkout([branch], self.branch)
+        except GitError as e:
+            logger.info(f"Speculative merge of {branch} failed ({e}); deferring to barrier merge")
+            self._broken = True
+            return
+        with self._lock:
+            if branch not in self._merged:
+                self._merged.append(branch)
+        self._schedule_gates()
+
+    def _schedule_gates(self) -> None:
+        """Start a gate pre-run unless one is already running (it re-checks the tip when done)."""
+        if self._gate_runner is None:
+            return
+        with self._lock:
+            if self._gate_future is None or self._gate_future.done():
+                self._gate_future = self._gate_pool.submit(self._run_gates_on_tip)
+
+    def _run_gates_on_tip(self) -> None:
+        while not (self._broken or self._gates_stopped):
+            tree = self._tree(self.branch)
+            with self._lock:
+                if tree in self._gate_results:
+                    return
+            try:
+                worktree = self._checkout_worktree(self.git.get_commit(self.branch))
+                assert self._gate_runner is not None
+                passed, results = self._gate_runner.run_all_gates(gates=self._gates, cwd=worktree, required_only=True)
+            except Exception as e:  # noqa: BLE001 — intentional: pre-runs are best-effort; barrier re-runs gates
+                logger.warning(f"Speculative gate pre-run failed: {e}")
+                return
+            with self._lock:
+                self._gate_results[tree] = (passed, results)
+            logger.info(f"Speculative gates on tree {tree[:8]}: {'passed' if passed else 'failed'}")
+
+    def _checkout_worktree(self, commit: str) -> Path:
+        """Move the private gate worktree to *commit*, creating it on first use."""
+        if self._worktree is None:
+            self._worktree = Path(tempfile.mkdtemp(prefix=f"zerg-{self.feature}-spec-"))
+            self.git._run("worktree", "add", "--detach", str(self._worktree), commit)
+        else:
+            self.git._run("-C", str(self._worktree), "checkout", "--detach", "--force", commit)
+        return self._worktree
+
+    def _tree(self, ref: str) -> str:
+        return self.git.get_commit(f"{ref}^{{tree}}")
+
+    # -- at the barrier ----------------------------------------------------
+
+    def finalize(self, branches: list[str], staging_branch: str) -> list[MergeResult] | None:
+        """Merge the remaining delta and point *staging_branch* at the result.
+
+        Args:
+            branches: All worker branches of the level, in merge order
+            staging_branch: Staging branch freshly created from the base branch
+
+        Returns:
+            Merge results, or ``None`` if speculation is unusable (a speculative
+            merge conflicted or the base moved) and the caller must merge normally.
+        """
+        self.wait()
+        if self._broken:
+            return None
+        staging_tip = self.git.get_commit(staging_branch)
+        if staging_tip != self.base_commit:
+            logger.info("Base branch moved since speculation started; merging normally")
+            return None
+        if self.git.current_branch() == staging_branch:
+            return None
+
+        with self._lock:
+            ahead = list(self._merged)
+        if any(b not in branches for b in ahead):
+            logger.info("Speculative branch contains branches outside this level; merging normally")
+            return None
+        order = ahead + [b for b in branches if b not in ahead]
+        try:
+            commits = self.git.merge_without_checkout(order, self.branch)
+        except MergeConflictError:
+            return None
+        delta = len(order) - len(ahead)
+        logger.info(f"Speculative merge: {len(ahead)} branches merged ahead, {delta} merged at barrier")
+
+        self.git.update_ref(f"refs/heads/{staging_branch}", self.git.get_commit(self.branch), staging_tip)
+        return [
+            MergeResult(
+                source_branch=branch,
+                target_branch=staging_branch,
+                status=MergeStatus.MERGED,
+                commit_sha=commit,
+            )
+            for branch, commit in zip(order, commits, strict=True)
+        ]
+
+    def gate_results(self, tree: str) -> tuple[bool, list[GateRunResult]] | None:
+        """Return pre-run gate results for *tree*, waiting if a pre-run will reach it.
+
+        A pre-run in flight always finishes on the speculative tip (the loop
+        re-checks it), so the caller waits only when *tree* is that tip.
+
+        Args:
+            tree: Tree SHA of the final staging commit
+
+        Returns:
+            ``(all_passed, results)`` or ``None`` if the gates never ran on *tree*
+        """
+        with self._lock:
+            cached = self._gate_results.get(tree)
+            future = self._gate_future if self._gate_future is not None and not self._gate_future.done() else None
+        if cached is None and future is not None and tree == self._tree(self.branch):
+            future.result()
+            with self._lock:
+                cached = self._gate_results.get(tree)
+        if cached is None:
+            # The barrier runs the gates itself; don't verify stale trees alongside it
+            self._gates_stopped = True
+        return cached
+
+    def wait(self) -> None:
+        """Block until every queued speculative merge has finished."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        concurrent.futures.wait(pending)
+
+    def close(self) -> None:
+        """Stop background work and remove the speculative branch and worktree."""
+        self._broken = True
+        self._gates_stopped = True
+        self._merge_pool.shutdown(wait=True)
+        self._gate_pool.shutdown(wait=True)
+        if self._worktree is not None:
+            self.git._run("worktree", "remove", "--force", str(self._worktree), check=False)
+            shutil.rmtree(self._worktree, ignore_errors=True)
+            self._worktree = None
+        if self.git.branch_exists(self.branch):
+            self.git.delete_branch(self.branch, force=True)
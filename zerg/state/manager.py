@@ -139,6 +139,17 @@ class StateManager:
         """
         return self._tasks.get_task_status(task_id)
 
+    def get_task_worker(self, task_id: str) -> int | None:
+        """Get the ID of the worker a task was last assigned to.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            Worker ID or None if the task was never assigned
+        """
+        return self._tasks.get_task_worker(task_id)
+
     def set_task_status(
         self,
         task_id: str,
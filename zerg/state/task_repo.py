@@ -47,6 +47,20 @@ class TaskStateRepo:
             task_state = self._persistence.state.get("tasks", {}).get(task_id)
             return task_state.get("status") if task_state else None
 
+    def get_task_worker(self, task_id: str) -> int | None:
+        """Get the ID of the worker a task was last assigned to.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            Worker ID or None if the task was never assigned
+        """
+        with self._persistence.lock:
+            task_state = self._persistence.state.get("tasks", {}).get(task_id)
+            worker_id = task_state.get("worker_id") if task_state else None
+            return worker_id if isinstance(worker_id, int) else None
+
     def set_task_status(
         self,
         task_id: str,
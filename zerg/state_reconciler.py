@@ -7,6 +7,7 @@ ensuring accurate level completion tracking and task state consistency.
 from __future__ import annotations
 
 import re
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
@@ -86,6 +87,20 @@ class ReconciliationResult:
         }
 
 
+def notify_task_complete(callbacks: list[Callable[[str], None]], task_id: str) -> None:
+    """Invoke task-complete callbacks for a completion synced from disk.
+
+    Args:
+        callbacks: Task-complete callbacks to invoke.
+        task_id: Task that completed.
+    """
+    for callback in callbacks:
+        try:
+            callback(task_id)
+        except Exception as e:  # noqa: BLE001 — intentional: a callback must not abort state sync
+            logger.warning(f"Task-complete callback failed for {task_id}: {e}")
+
+
 class StateReconciler:
     """Detect and fix state inconsistencies between workers and orchestrator.
 
@@ -106,6 +121,7 @@ class StateReconciler:
         state: StateManager,
         levels: LevelController,
         heartbeat_monitor: HeartbeatMonitor | None = None,
+        on_task_complete: list[Callable[[str], None]] | None = None,
     ) -> None:
         """Initialize StateReconciler.
 
@@ -113,10 +129,13 @@ class StateReconciler:
             state: Shared state manager for reading/writing disk state.
             levels: In-memory level controller to keep in sync.
             heartbeat_monitor: Optional heartbeat monitor for stale worker detection.
+            on_task_complete: Shared callbacks list, invoked for each task
+                whose completion is synced to the LevelController.
         """
         self._state = state
         self._levels = levels
         self._heartbeat_monitor = heartbeat_monitor
+        self._on_task_complete = on_task_complete if on_task_complete is not None else []
         self._last_reconcile_at: datetime | None = None
 
     def reconcile_periodic(self) -> ReconciliationResult:
@@ -254,6 +273,7 @@ class StateReconciler:
                 if disk_status == TaskStatus.COMPLETE.value:
                     if level_status != TaskStatus.COMPLETE.value:
                         self._levels.mark_task_complete(task_id)
+                        notify_task_complete(self._on_task_complete, task_id)
                         result.fixes_applied.append(
                             ReconciliationFix(
                                 fix_type="task_status_sync",
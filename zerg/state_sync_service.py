@@ -6,13 +6,14 @@ and reassigns tasks stranded on stopped/crashed workers.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 from zerg.constants import TaskStatus
 from zerg.levels import LevelController
 from zerg.logging import get_logger
 from zerg.state import StateManager
-from zerg.state_reconciler import ReconciliationResult, StateReconciler
+from zerg.state_reconciler import ReconciliationResult, StateReconciler, notify_task_complete
 
 if TYPE_CHECKING:
     from zerg.heartbeat import HeartbeatMonitor
@@ -32,6 +33,7 @@ class StateSyncService:
         state: StateManager,
         levels: LevelController,
         heartbeat_monitor: HeartbeatMonitor | None = None,
+        on_task_complete: list[Callable[[str], None]] | None = None,
     ) -> None:
         """Initialize StateSyncService.
 
@@ -39,10 +41,13 @@ class StateSyncService:
             state: Shared state manager for reading/writing disk state.
             levels: In-memory level controller to keep in sync.
             heartbeat_monitor: Optional heartbeat monitor for stale worker detection.
+            on_task_complete: Shared callbacks list, invoked for each task
+                completion synced from disk.
         """
         self.state = state
         self.levels = levels
-        self._reconciler = StateReconciler(state, levels, heartbeat_monitor)
+        self._on_task_complete = on_task_complete if on_task_complete is not None else []
+        self._reconciler = StateReconciler(state, levels, heartbeat_monitor, self._on_task_complete)
 
     def sync_from_disk(self) -> None:
         """Sync LevelController with task completions from disk state.
@@ -61,6 +66,7 @@ class StateSyncService:
             if disk_status == complete and level_status != complete:
                 self.levels.mark_task_complete(task_id)
                 logger.info(f"Synced task {task_id} completion to LevelController")
+                notify_task_complete(self._on_task_complete, task_id)
 
             # Task is failed on disk but not in LevelController
             elif disk_status == TaskStatus.FAILED.value and level_status != TaskStatus.FAILED.value:
@@ -8,6 +8,7 @@ modified modules.
 from __future__ import annotations
 
 import ast
+import functools
 import re
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -75,7 +76,8 @@ def get_modified_modules(task_graph: TaskGraph) -> list[str]:
 def _extract_imports_from_file(file_path: Path) -> set[str]:
     """Extract module names imported by a Python file.
 
-    Uses AST parsing to find import statements.
+    Uses AST parsing to find import statements. Results are memoized per
+    file and revalidated by mtime and size.
 
     Args:
         file_path: Path to Python file.
@@ -83,13 +85,25 @@ def _extract_imports_from_file(file_path: Path) -> set[str]:
     Returns:
         Set of imported module names (dotted paths).
     """
+    try:
+        st = file_path.stat()
+    except OSError:
+        return set()
+    return set(_parse_imports(str(file_path), st.st_mtime_ns, st.st_size))
+
+
+# Keyed by path, mtime and size so repeated scans (e.g. ``zerg test --watch``)
+# reparse only test files that changed.
+@functools.lru_cache(maxsize=4096)
+def _parse_imports(path: str, mtime_ns: int, size: int) -> frozenset[str]:
+    """Parse one version of *path* and return the module names it imports."""
     imports: set[str] = set()
 
     try:
-        content = file_path.read_text()
+        content = Path(path).read_text()
         tree = ast.parse(content)
     except (OSError, SyntaxError):
-        return imports
+        return frozenset()
 
     for node in ast.walk(tree):
         if isinstance(node, ast.Import):
@@ -102,7 +116,7 @@ def _extract_imports_from_file(file_path: Path) -> set[str]:
                 for alias in node.names:
                     imports.add(f"{node.module}.{alias.name}")
 
-    return imports
+    return frozenset(imports)
 
 
 def _module_path_to_dotted(file_path: str) -> str:
@@ -118,8 +132,14 @@ def _module_path_to_dotted(file_path: str) -> str:
     if file_path.endswith(".py"):
         file_path = file_path[:-3]
 
-    # Convert path separators to dots
-    return file_path.replace("/", ".").replace("\\", ".")
+    # Convert path separators to dots; a package's __init__ is the package itself
+    dotted = file_path.replace("/", ".").replace("\\", ".")
+    return dotted.removesuffix(".__init__")
+
+
+def _is_test_file(name: str) -> bool:
+    """Return True for pytest test modules (``test_*.py`` or ``*_test.py``)."""
+    return name.endswith(".py") and (name.startswith("test_") or name.endswith("_test.py"))
 
 
 def find_affected_tests(
@@ -128,7 +148,9 @@ def find_affected_tests(
 ) -> list[str]:
     """Find test files that import any of the modified modules.
 
-    Scans test files and checks if they import any of the given modules.
+    Scans ``test_*.py`` / ``*_test.py`` files and keeps those importing a
+    modified module or one of its submodules. Importing only a parent package
+    (e.g. ``zerg`` for ``zerg/test_scope.py``) does not count.
 
     Args:
         modified_modules: List of module file paths (e.g., ["zerg/test_scope.py"])
@@ -141,27 +163,21 @@ def find_affected_tests(
         return []
 
     # Convert file paths to dotted module names for matching
-    module_names: set[str] = set()
-    for mod_path in modified_modules:
-        dotted = _module_path_to_dotted(mod_path)
-        module_names.add(dotted)
-        # Also add partial matches (e.g., "zerg" matches "zerg.test_scope")
-        parts = dotted.split(".")
-        for i in range(len(parts)):
-            module_names.add(".".join(parts[: i + 1]))
+    module_names = {_module_path_to_dotted(mod_path) for mod_path in modified_modules}
+    prefixes = tuple(f"{m}." for m in module_names)
 
     affected_tests: list[str] = []
 
     py_files = collect_files(tests_dir, extensions={".py"}).get(".py", [])
     for test_file in py_files:
-        if test_file.name.startswith("_"):
+        if not _is_test_file(test_file.name):
             continue
 
         imports = _extract_imports_from_file(test_file)
 
-        # Check if any import matches our modified modules
+        # Check if any import is a modified module or one of its submodules
         for imp in imports:
-            if imp in module_names or any(imp.startswith(f"{m}.") for m in module_names):
+            if imp in module_names or imp.startswith(prefixes):
                 # Return relative path from project root
                 try:
                     rel_path = test_file.relative_to(tests_dir.parent)
@@ -1,5 +1,14 @@
-"""Token counting with caching and multiple counting modes."""
+"""Token counting with caching and multiple counting modes.
 
+The cache is persisted as a JSON snapshot (``token-cache.json``) plus an
+append-only JSON-lines log of entries stored since the last snapshot
+(``token-cache.log``). A cache miss appends one line to the log instead of
+rewriting the whole cache; the log is compacted into the snapshot once it
+holds more than ``MAX_CACHE_ENTRIES`` lines and when the counter is closed
+(also registered with :mod:`atexit`).
+"""
+
+import atexit
 import hashlib
 import json
 import logging
@@ -10,7 +19,7 @@ import time
 from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 from zerg.config import TokenMetricsConfig, ZergConfig
 from zerg.constants import STATE_DIR
@@ -32,7 +41,7 @@ class TokenCounter:
 
     _warned_no_anthropic: bool = False
 
-    def __init__(self, config: TokenMetricsConfig | None = None) -> None:
+    def __init__(self, config: TokenMetricsConfig | None = None, state_dir: str | Path | None = None) -> None:
         if config is not None:
             self._config = config
         else:
@@ -43,10 +52,12 @@ class TokenCounter:
                 logger.debug("Failed to load ZergConfig for token metrics; using defaults", exc_info=True)
                 self._config = TokenMetricsConfig()
 
-        self._cache_path = Path(STATE_DIR) / "token-cache.json"
+        self._cache_path = (Path(state_dir) if state_dir else Path(STATE_DIR)) / "token-cache.json"
         self._cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
         self._cache_lock = threading.Lock()
         self._cache_dirty = False
+        self._log_file: IO[str] | None = None
+        self._log_entries = 0  # lines in the log since the last compaction
 
         # Load existing cache file into memory
         self._load_cache_from_file()
@@ -85,6 +96,55 @@ class TokenCounter:
                 source="heuristic",
             )
 
+    def count_many(self, texts: list[str]) -> list[TokenResult]:
+        """Count tokens in several texts. Never raises exceptions.
+
+        Equivalent to ``[self.count(t) for t in texts]`` but looks up and
+        stores the whole batch under one lock acquisition each and appends
+        all misses to the cache log in a single write. Duplicate texts are
+        counted once.
+        """
+        try:
+            hashes = [hashlib.sha256(text.encode()).hexdigest() for text in texts]
+            results: dict[str, TokenResult] = {}
+            if self._config.cache_enabled:
+                with self._cache_lock:
+                    for text_hash in hashes:
+                        if text_hash not in results:
+                            cached = self._cache_get(text_hash)
+                            if cached is not None:
+                                results[text_hash] = cached
+
+            misses: dict[str, TokenResult] = {}
+            for text_hash, text in zip(hashes, texts, strict=True):
+                if text_hash not in results:
+                    if self._config.api_counting:
+                        result = self._try_api_count(text)
+                    else:
+                        result = TokenResult(count=self._count_heuristic(text), mode="estimated", source="heuristic")
+                    results[text_hash] = misses[text_hash] = result
+
+            if misses and self._config.cache_enabled:
+                self._cache_store_many(misses)
+
+            return [results[text_hash] for text_hash in hashes]
+        except Exception:  # noqa: BLE001 — intentional: count_many() must never raise, same contract as count()
+            logger.warning("Batch token counting failed, counting individually", exc_info=True)
+            return [self.count(text) for text in texts]
+
+    def close(self) -> None:
+        """Compact the cache log into the snapshot and close it."""
+        with self._cache_lock:
+            log_file, self._log_file = self._log_file, None
+        if log_file is None:
+            return
+        atexit.unregister(self.close)
+        try:
+            log_file.close()
+        except OSError as exc:
+            logger.debug("Failed to close token cache log: %s", exc)
+        self._persist_cache()
+
     def _try_api_count(self, text: str) -> TokenResult:
         """Attempt API-based counting, fall back to heuristic."""
         try:
@@ -122,8 +182,12 @@ class TokenCounter:
         """Estimate token count from character length."""
         return max(1, round(len(text) / self._config.fallback_chars_per_token))
 
+    @property
+    def _log_path(self) -> Path:
+        return self._cache_path.with_suffix(".log")
+
     def _load_cache_from_file(self) -> None:
-        """Load cache from disk into memory on init."""
+        """Load the snapshot and replay the log into memory on init."""
         try:
             if self._cache_path.exists():
                 with open(self._cache_path) as f:
@@ -140,56 +204,108 @@ class TokenCounter:
         except (OSError, json.JSONDecodeError, KeyError, TypeError) as exc:
             logger.debug("Failed to load token cache from file: %s", exc)
 
+        try:
+            with open(self._log_path) as f:
+                for line in f:
+                    self._log_entries += 1
+                    try:
+                        key, entry = json.loads(line)
+                    except (json.JSONDecodeError, TypeError, ValueError):
+                        continue  # Torn line from a writer that died mid-append
+                    self._cache[key] = entry
+                    self._cache.move_to_end(key)
+                    self._evict()
+            logger.debug("Replayed %d entries from token cache log", self._log_entries)
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            logger.debug("Failed to replay token cache log: %s", exc)
+
     def _cache_lookup(self, text_hash: str) -> TokenResult | None:
         """O(1) in-memory lookup."""
         with self._cache_lock:
-            entry = self._cache.get(text_hash)
-            if entry is None:
-                return None
+            return self._cache_get(text_hash)
 
-            age = time.time() - entry.get("timestamp", 0)
-            if age > self._config.cache_ttl_seconds:
-                return None
+    def _cache_get(self, text_hash: str) -> TokenResult | None:
+        """Look up *text_hash*; caller holds ``_cache_lock``."""
+        entry = self._cache.get(text_hash)
+        if entry is None:
+            return None
 
-            # Move to end for LRU
-            self._cache.move_to_end(text_hash)
-            logger.debug("Cache hit for token hash %s", text_hash[:12])
+        age = time.time() - entry.get("timestamp", 0)
+        if age > self._config.cache_ttl_seconds:
+            return None
 
-            return TokenResult(
-                count=entry["count"],
-                mode=entry["mode"],
-                source="cache",
-            )
+        # Move to end for LRU
+        self._cache.move_to_end(text_hash)
+        logger.debug("Cache hit for token hash %s", text_hash[:12])
+
+        return TokenResult(
+            count=entry["count"],
+            mode=entry["mode"],
+            source="cache",
+        )
 
     def _cache_store(self, text_hash: str, result: TokenResult) -> None:
-        """Store in memory with LRU eviction, persist periodically."""
-        with self._cache_lock:
-            self._cache[text_hash] = {
-                "count": result.count,
-                "mode": result.mode,
-                "timestamp": time.time(),
-            }
-            self._cache.move_to_end(text_hash)
-
-            # LRU eviction
-            while len(self._cache) > self.MAX_CACHE_ENTRIES:
-                oldest_key, _ = self._cache.popitem(last=False)
-                logger.debug("Evicting token cache entry %s", oldest_key[:12])
+        """Store in memory with LRU eviction and append to the cache log."""
+        self._cache_store_many({text_hash: result})
 
+    def _cache_store_many(self, results: dict[str, TokenResult]) -> None:
+        """Store *results* (keyed by text hash) and append them to the log in one write."""
+        now = time.time()
+        lines = []
+        with self._cache_lock:
+            for text_hash, result in results.items():
+                entry = {"count": result.count, "mode": result.mode, "timestamp": now}
+                self._cache[text_hash] = entry
+                self._cache.move_to_end(text_hash)
+                lines.append(json.dumps([text_hash, entry]) + "\n")
+                logger.debug("Cache miss for token hash %s, stored", text_hash[:12])
+            self._evict()
             self._cache_dirty = True
-            logger.debug("Cache miss for token hash %s, stored", text_hash[:12])
 
-        # Persist to file (atomic write)
-        self._persist_cache()
+            try:
+                self._append_log("".join(lines))
+            except OSError as exc:
+                logger.debug("Failed to append to token cache log: %s", exc)
+                return
+            self._log_entries += len(lines)
+            compact = self._log_entries > self.MAX_CACHE_ENTRIES
+
+        if compact:
+            self._persist_cache()
+
+    def _evict(self) -> None:
+        """LRU eviction down to ``MAX_CACHE_ENTRIES``; caller holds ``_cache_lock``."""
+        while len(self._cache) > self.MAX_CACHE_ENTRIES:
+            oldest_key, _ = self._cache.popitem(last=False)
+            logger.debug("Evicting token cache entry %s", oldest_key[:12])
+
+    def _append_log(self, data: str) -> None:
+        """Append *data* to the cache log, opening it on first use; caller holds ``_cache_lock``."""
+        if self._log_file is None:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._log_file = open(self._log_path, "a")  # noqa: SIM115
+            atexit.register(self.close)
+        # One write per batch: O_APPEND keeps lines from concurrent processes whole
+        self._log_file.write(data)
+        self._log_file.flush()
 
     def _persist_cache(self) -> None:
-        """Atomically persist cache to file."""
+        """Compact: atomically write the snapshot, then truncate the log.
+
+        Entries other processes appended to the log since this counter loaded
+        it are dropped by the truncation; they are simply recounted on their
+        next miss.
+        """
         with self._cache_lock:
             if not self._cache_dirty:
                 return
 
             self._cache_path.parent.mkdir(parents=True, exist_ok=True)
             data = json.dumps(dict(self._cache))
+            self._cache_dirty = False
+            self._log_entries = 0
 
         # Write outside lock to minimize contention
         try:
@@ -198,13 +314,17 @@ class TokenCounter:
                 with os.fdopen(fd, "w") as f:
                     f.write(data)
                 os.replace(tmp_path, str(self._cache_path))
-                with self._cache_lock:
-                    self._cache_dirty = False
             except OSError:
                 try:
                     os.unlink(tmp_path)
                 except OSError:
                     pass  # Best-effort file cleanup
                 raise
+            # Entries are in the snapshot now; an append-mode handle keeps writing at the new end
+            os.truncate(self._log_path, 0)
+        except FileNotFoundError:
+            pass  # No log yet
         except OSError as exc:
+            with self._cache_lock:
+                self._cache_dirty = True
             logger.debug("Failed to persist token cache to file: %s", exc)
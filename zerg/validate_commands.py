@@ -559,6 +559,8 @@ def validate_module_wiring(
             f"import {full_dotted}",
             f"from {parent_dotted} import {module_name}",
             f"from .{module_name} import",
+            # Lazy registries that resolve modules via importlib.import_module
+            f'"{full_dotted}"',
         ]
 
         found = False
@@ -309,10 +309,10 @@ class WorkerManager:
         # Stop via unified launcher interface
         self.launcher.terminate(worker_id, force=force)
 
-        # Delete worktree
+        # Return worktree to the pool (or delete it when pooling is off or full)
         try:
             wt_path = self.worktrees.get_worktree_path(self.feature, worker_id)
-            self.worktrees.delete(wt_path, force=True)
+            self.worktrees.release(wt_path)
         except Exception as e:  # noqa: BLE001 — intentional: worktree deletion spans git/OS errors; must not block termination
             logger.warning(f"Failed to delete worktree for worker {worker_id}: {e}")
 
@@ -364,6 +364,8 @@ class WorkerManager:
             task = self.parser.get_task(worker.current_task)
             if task:
                 verification = task.get("verification", {})
+                # Completion synced from disk already fired the callbacks
+                already_complete = self.levels.get_task_status(worker.current_task) == TaskStatus.COMPLETE.value
                 if verification.get("command"):
                     # Compute and record task duration before marking complete
                     # Guard: only record if worker didn't already record it
@@ -375,16 +377,16 @@ class WorkerManager:
                         if task_duration:
                             self.state.record_task_duration(task_id, task_duration)
 
-                    # Task should have been verified by worker
-                    self.levels.mark_task_complete(worker.current_task)
-                    self.state.set_task_status(worker.current_task, TaskStatus.COMPLETE)
-
                     # Record success in circuit breaker
                     if self._circuit_breaker is not None:
                         self._circuit_breaker.record_success(worker_id)
 
-                    for callback in self._on_task_complete:
-                        callback(worker.current_task)
+                    # Task should have been verified by worker
+                    if not already_complete:
+                        self.levels.mark_task_complete(worker.current_task)
+                        self.state.set_task_status(worker.current_task, TaskStatus.COMPLETE)
+                        for callback in self._on_task_complete:
+                            callback(worker.current_task)
 
         # Remove worker from tracking FIRST to prevent respawn loops
         old_worktree = worker.worktree_path
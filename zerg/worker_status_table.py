@@ -0,0 +1,363 @@
+"""Shared, fixed-slot worker status table for ZERG.
+
+Workers used to publish heartbeats and progress as one JSON file each, so
+every orchestrator tick or dashboard refresh globbed the state directory and
+opened and parsed a file per worker. WorkerStatusTable keeps those records in
+a single memory-mapped file (``.zerg/state/worker-status.bin``) instead:
+
+* every worker owns a fixed slot at ``worker_id * SLOT_SIZE`` holding one
+  record per kind (``heartbeat``, ``progress``) and rewrites it in place;
+* readers map the file once and read all workers without opening a file per
+  worker;
+* each record starts with a seqlock-style version counter. The writer makes it
+  odd before touching the payload and even again afterwards, and a reader
+  retries a record whose counter was odd or changed while it was copied.
+
+Records carry their write time, so readers can prefer a ``{kind}-{id}.json``
+file written after a worker's last table record (a crashed worker's slot is
+never cleared, and agent-driven workers only write the JSON file).
+
+Record layout (little endian)::
+
+    u64 sequence | u32 payload length | u32 reserved | f64 written at | payload (UTF-8 JSON)
+
+The table is POSIX-only, like the rest of the state layer (``fcntl`` guards
+growth of the file).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Any
+
+from zerg.constants import STATE_DIR
+from zerg.logging import get_logger
+
+logger = get_logger("worker_status_table")
+
+TABLE_FILENAME = "worker-status.bin"
+
+KINDS = ("heartbeat", "progress")
+RECORD_SIZE = 8192
+SLOT_SIZE = RECORD_SIZE * len(KINDS)
+
+_HEADER = struct.Struct("<QIId")
+_SEQ = struct.Struct("<Q")
+_LENGTH = struct.Struct("<I")
+_WRITTEN_AT = struct.Struct("<d")
+MAX_PAYLOAD = RECORD_SIZE - _HEADER.size
+
+# Attempts before a record that keeps changing under the reader is skipped
+_READ_RETRIES = 100
+
+# A JSON file must be this much newer than the table record to win, so the
+# export a worker writes right after its table record is not re-read
+_JSON_NEWER_MARGIN = 1.0
+
+
+class _MappedFile:
+    """Descriptor and mapping of the table file.
+
+    Held apart from WorkerStatusTable so its finalizer can release them
+    without keeping the table alive.
+    """
+
+    def __init__(self) -> None:
+        self.fd: int | None = None
+        self.map: mmap.mmap | None = None
+
+    def release(self) -> None:
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        if self.fd is not None:
+            with contextlib.suppress(OSError):
+                os.close(self.fd)
+            self.fd = None
+
+
+class WorkerStatusTable:
+    """Memory-mapped status records, one slot per worker.
+
+    A worker only writes its own slot, so writers never contend for a record;
+    the file lock is taken only when the file has to grow.
+    """
+
+    def __init__(self, state_dir: str | Path | None = None) -> None:
+        """Initialize the table. The file is opened lazily.
+
+        Args:
+            state_dir: Directory holding the table. Defaults to STATE_DIR.
+        """
+        self._state_dir = Path(state_dir) if state_dir else Path(STATE_DIR)
+        self._lock = threading.Lock()
+        self._file = _MappedFile()
+        # Tables that are never closed explicitly still release their descriptor
+        weakref.finalize(self, self._file.release)
+        self._writable = False
+        self._identity: tuple[int, int] | None = None  # (inode, size) of the mapped file
+
+    @property
+    def state_dir(self) -> Path:
+        return self._state_dir
+
+    @property
+    def path(self) -> Path:
+        return self._state_dir / TABLE_FILENAME
+
+    def exists(self) -> bool:
+        """Return True if any worker has created the table."""
+        return self.path.exists()
+
+    def write(self, worker_id: int, kind: str, record: dict[str, Any]) -> None:
+        """Publish a record into the worker's slot.
+
+        Args:
+            worker_id: Slot owner; only this worker may write the slot.
+            kind: One of KINDS.
+            record: JSON-serialisable record.
+
+        Raises:
+            ValueError: If the kind is unknown or the record does not fit.
+            OSError: If the table file cannot be created or mapped.
+        """
+        payload = json.dumps(record, separators=(",", ":")).encode()
+        if len(payload) > MAX_PAYLOAD:
+            raise ValueError(f"{kind} record for worker {worker_id} is {len(payload)} bytes (max {MAX_PAYLOAD})")
+        self._store(self._offset(worker_id, kind), payload)
+
+    def clear(self, worker_id: int, kind: str) -> None:
+        """Empty the worker's record of *kind* (e.g. on clean shutdown)."""
+        offset = self._offset(worker_id, kind)
+        try:
+            size = os.stat(self.path).st_size
+        except FileNotFoundError:
+            return
+        if offset + RECORD_SIZE <= size:
+            self._store(offset, b"")
+
+    def read(self, worker_id: int, kind: str) -> dict[str, Any] | None:
+        """Return one worker's record of *kind*, or None if it has none."""
+        entry = self.read_entry(worker_id, kind)
+        return entry[0] if entry is not None else None
+
+    def read_all(self, kind: str) -> dict[int, dict[str, Any]]:
+        """Return the records of *kind* for every worker that has one."""
+        return {wid: record for wid, (record, _) in self.read_all_entries(kind).items()}
+
+    def read_entry(self, worker_id: int, kind: str) -> tuple[dict[str, Any], float] | None:
+        """Return one worker's record of *kind* with its write time (epoch seconds)."""
+        offset = self._offset(worker_id, kind)
+        with self._lock:
+            mapped = self._mapping(writable=False)
+            if mapped is None or offset + RECORD_SIZE > len(mapped):
+                return None
+            return self._load(mapped, offset)
+
+    def read_all_entries(self, kind: str) -> dict[int, tuple[dict[str, Any], float]]:
+        """Return the records of *kind* with their write times for every worker that has one."""
+        index = self._kind_index(kind)
+        result: dict[int, tuple[dict[str, Any], float]] = {}
+        with self._lock:
+            mapped = self._mapping(writable=False)
+            if mapped is None:
+                return result
+            for worker_id in range(len(mapped) // SLOT_SIZE):
+                record = self._load(mapped, worker_id * SLOT_SIZE + index * RECORD_SIZE)
+                if record is not None:
+                    result[worker_id] = record
+        return result
+
+    def close(self) -> None:
+        """Unmap and close the table file."""
+        with self._lock:
+            self._unmap()
+
+    def _offset(self, worker_id: int, kind: str) -> int:
+        if worker_id < 0:
+            raise ValueError(f"Invalid worker id: {worker_id}")
+        return worker_id * SLOT_SIZE + self._kind_index(kind) * RECORD_SIZE
+
+    @staticmethod
+    def _kind_index(kind: str) -> int:
+        try:
+            return KINDS.index(kind)
+        except ValueError:
+            raise ValueError(f"Unknown worker status kind: {kind!r}") from None
+
+    def _store(self, offset: int, payload: bytes) -> None:
+        """Seqlock write: odd sequence, payload and length, even sequence."""
+        with self._lock:
+            # Grow by whole slots so readers can index slots by file size
+            slot_end = (offset // SLOT_SIZE + 1) * SLOT_SIZE
+            mapped = self._mapping(writable=True, min_size=slot_end)
+            assert mapped is not None
+            seq = _SEQ.unpack_from(mapped, offset)[0]
+            if seq % 2:
+                seq += 1  # previous writer died mid-update
+            _SEQ.pack_into(mapped, offset, seq + 1)
+            start = offset + _HEADER.size
+            mapped[start : start + len(payload)] = payload
+            _LENGTH.pack_into(mapped, offset + _SEQ.size, len(payload))
+            _WRITTEN_AT.pack_into(mapped, offset + _HEADER.size - _WRITTEN_AT.size, time.time())
+            _SEQ.pack_into(mapped, offset, seq + 2)
+
+    @staticmethod
+    def _load(mapped: mmap.mmap, offset: int) -> tuple[dict[str, Any], float] | None:
+        """Seqlock read of one record and its write time; None if empty, unreadable or torn."""
+        for _ in range(_READ_RETRIES):
+            seq, length, _reserved, written_at = _HEADER.unpack_from(mapped, offset)
+            if seq % 2:
+                continue  # write in progress
+            if length == 0 or length > MAX_PAYLOAD:
+                return None
+            start = offset + _HEADER.size
+            payload = mapped[start : start + length]
+            if _SEQ.unpack_from(mapped, offset)[0] != seq:
+                continue  # overwritten while copying
+            try:
+                record = json.loads(payload)
+            except ValueError:
+                return None
+            return (record, written_at) if isinstance(record, dict) else None
+        return None
+
+    def _mapping(self, writable: bool, min_size: int = 0) -> mmap.mmap | None:
+        """Return a mapping of the current table file (caller holds the lock).
+
+        Readers get None while no worker has created the table. The mapping
+        is refreshed when the file grows or is replaced.
+        """
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            if not writable:
+                self._unmap()
+                return None
+            st = None
+
+        current = self._file.map
+        if st is not None and current is not None and self._identity is not None:
+            same_file = self._identity[0] == st.st_ino
+            if writable and self._writable and same_file and len(current) >= min_size:
+                return current  # other workers growing the file do not matter
+            if not writable and same_file and self._identity[1] == st.st_size:
+                return current
+
+        self._unmap()
+        if writable:
+            self._state_dir.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                size = os.fstat(fd).st_size
+                if size < min_size:
+                    # Growth only; serialise with other workers so no one
+                    # truncates a slot another worker just added
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                    try:
+                        size = os.fstat(fd).st_size
+                        if size < min_size:
+                            os.ftruncate(fd, min_size)
+                            size = min_size
+                    finally:
+                        fcntl.flock(fd, fcntl.LOCK_UN)
+                mapped = mmap.mmap(fd, size, access=mmap.ACCESS_WRITE)
+            except BaseException:
+                os.close(fd)
+                raise
+        else:
+            fd = os.open(self.path, os.O_RDONLY)
+            try:
+                size = os.fstat(fd).st_size
+                if size == 0:
+                    os.close(fd)
+                    return None
+                mapped = mmap.mmap(fd, size, access=mmap.ACCESS_READ)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.close(fd)
+                raise
+        self._file.fd = fd
+        self._file.map = mapped
+        self._writable = writable
+        st = os.fstat(fd)
+        self._identity = (st.st_ino, st.st_size)
+        return mapped
+
+    def _unmap(self) -> None:
+        self._file.release()
+        self._identity = None
+        self._writable = False
+
+
+def _load_json_export(path: Path) -> dict[str, Any] | None:
+    try:
+        record = json.loads(path.read_text())
+    except (ValueError, OSError):
+        return None
+    return record if isinstance(record, dict) else None
+
+
+def _json_is_newer(path: Path, entry: tuple[dict[str, Any], float] | None) -> bool:
+    if entry is None:
+        return True
+    try:
+        return os.stat(path).st_mtime > entry[1] + _JSON_NEWER_MARGIN
+    except OSError:
+        return False
+
+
+def read_freshest(table: WorkerStatusTable, worker_id: int, kind: str) -> dict[str, Any] | None:
+    """Return a worker's newest record of *kind* from the table or its JSON file.
+
+    ``{kind}-{id}.json`` is only opened when it is newer than the worker's
+    table record (or the worker has none). A table that cannot be mapped is
+    logged and skipped.
+    """
+    try:
+        entry = table.read_entry(worker_id, kind)
+    except OSError:
+        logger.debug("Failed to read %s record for worker %d", kind, worker_id, exc_info=True)
+        entry = None
+    path = table.state_dir / f"{kind}-{worker_id}.json"
+    if path.exists() and _json_is_newer(path, entry):
+        record = _load_json_export(path)
+        if record is not None:
+            return record
+    return entry[0] if entry is not None else None
+
+
+def read_all_freshest(table: WorkerStatusTable, kind: str) -> dict[int, dict[str, Any]]:
+    """Return every worker's newest record of *kind* from the table or JSON files.
+
+    All table records come from one mapping of the table; a JSON file is
+    parsed only when it is newer than its worker's table record. A table
+    that cannot be mapped is logged and skipped.
+    """
+    try:
+        entries = table.read_all_entries(kind)
+    except OSError:
+        logger.debug("Failed to read worker status table", exc_info=True)
+        entries = {}
+    result = {wid: record for wid, (record, _) in entries.items()}
+    prefix, suffix = f"{kind}-", ".json"
+    for name in os.listdir(table.state_dir):
+        wid_text = name[len(prefix) : -len(suffix)]
+        if not (name.startswith(prefix) and name.endswith(suffix) and wid_text.isdigit()):
+            continue
+        path = table.state_dir / name
+        if not _json_is_newer(path, entries.get(int(wid_text))):
+            continue
+        record = _load_json_export(path)
+        if record is not None:
+            result[int(wid_text)] = record
+    return result
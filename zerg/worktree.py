@@ -28,15 +28,27 @@ class WorktreeInfo:
 
 
 class WorktreeManager:
-    """Manage git worktrees for ZERG workers."""
+    """Manage git worktrees for ZERG workers.
 
-    def __init__(self, repo_path: str | Path = ".") -> None:
+    With a non-zero ``pool_size`` worktrees are recycled instead of being
+    re-created: an existing worktree at a worker's path is reassigned in place
+    (``checkout --force -B`` plus ``clean``), and released worktrees are parked
+    detached under ``<WORKTREES_DIR>/_pool`` for later workers and runs. A
+    reassignment only rewrites the files that differ, where a fresh
+    ``worktree add`` checks out the whole tree.
+    """
+
+    POOL_DIR = "_pool"
+
+    def __init__(self, repo_path: str | Path = ".", pool_size: int = 0) -> None:
         """Initialize worktree manager.
 
         Args:
             repo_path: Path to the git repository
+            pool_size: Maximum number of idle worktrees kept for reuse (0 disables reuse)
         """
         self.repo_path = Path(repo_path).resolve()
+        self.pool_size = pool_size
         self._validate_repo()
 
     def _validate_repo(self) -> None:
@@ -187,6 +199,11 @@ class WorktreeManager:
         # Create parent directory
         path.parent.mkdir(parents=True, exist_ok=True)
 
+        if self.pool_size:
+            reused = self._reuse(path, branch, base_branch)
+            if reused is not None:
+                return reused
+
         # Remove if already exists (force to handle dirty worktrees)
         if self.exists(path):
             self.delete(path, force=True)
@@ -207,6 +224,159 @@ class WorktreeManager:
             commit=self._get_head_commit(path),
         )
 
+    @property
+    def pool_path(self) -> Path:
+        """Directory holding idle pooled worktrees."""
+        return self.repo_path / WORKTREES_DIR / self.POOL_DIR
+
+    def pooled(self) -> list[Path]:
+        """List idle worktrees in the pool.
+
+        Returns:
+            Paths of registered worktrees under the pool directory
+        """
+        return sorted(wt.path for wt in self.list_worktrees() if wt.path.parent == self.pool_path)
+
+    def is_healthy(self, path: str | Path) -> bool:
+        """Check that a worktree can be reused.
+
+        Args:
+            path: Path to worktree
+
+        Returns:
+            True if git recognises *path* as the top level of a work tree
+        """
+        path = Path(path).resolve()
+        if not (path / ".git").is_file():
+            return False
+        result = subprocess.run(
+            ["git", "-C", str(path), "rev-parse", "--show-toplevel"],
+            capture_output=True,
+            text=True,
+        )
+        return result.returncode == 0 and Path(result.stdout.strip()).resolve() == path
+
+    def warm_pool(self, base_branch: str = "main", count: int | None = None) -> int:
+        """Pre-create detached worktrees so later workers skip the full checkout.
+
+        Args:
+            base_branch: Commit-ish to check the pooled worktrees out at
+            count: Pool size to fill up to (default: ``pool_size``)
+
+        Returns:
+            Number of worktrees created
+        """
+        target = self.pool_size if count is None else count
+        pooled = self.pooled()
+        created = 0
+        while len(pooled) + created < target:
+            slot = self._free_pool_slot()
+            slot.parent.mkdir(parents=True, exist_ok=True)
+            self._run_git("worktree", "add", "--force", "--detach", str(slot), base_branch)
+            created += 1
+        if created:
+            logger.info(f"Warmed worktree pool with {created} worktree(s)")
+        return created
+
+    def release(self, path: str | Path) -> bool:
+        """Return a worker's worktree to the pool, or delete it if the pool is full.
+
+        Args:
+            path: Path to worktree
+
+        Returns:
+            True if the worktree was pooled, False if it was deleted
+        """
+        path = Path(path).resolve()
+        if self.pool_size and self.is_healthy(path) and len(self.pooled()) < self.pool_size:
+            try:
+                # Detach so the worker branch is free to be checked out elsewhere
+                self._run_git_in(path, "checkout", "--force", "--detach")
+                slot = self._free_pool_slot()
+                slot.parent.mkdir(parents=True, exist_ok=True)
+                self._run_git("worktree", "move", str(path), str(slot))
+                logger.info(f"Returned worktree {path} to pool as {slot.name}")
+                return True
+            except WorktreeError as e:
+                logger.warning(f"Could not pool worktree {path}, deleting: {e}")
+        if path.exists() or self.exists(path):
+            self.delete(path, force=True)
+        return False
+
+    def drain_pool(self) -> int:
+        """Delete every idle pooled worktree.
+
+        Returns:
+            Number of worktrees deleted
+        """
+        pooled = self.pooled()
+        for slot in pooled:
+            self.delete(slot, force=True)
+        if self.pool_path.exists() and not any(self.pool_path.iterdir()):
+            self.pool_path.rmdir()
+        return len(pooled)
+
+    def _free_pool_slot(self) -> Path:
+        """Return the first unused ``slot-N`` path in the pool directory."""
+        n = 0
+        while (self.pool_path / f"slot-{n}").exists():
+            n += 1
+        return self.pool_path / f"slot-{n}"
+
+    def _reuse(self, path: Path, branch: str, base_branch: str) -> WorktreeInfo | None:
+        """Reassign an existing or pooled worktree to *branch*.
+
+        Args:
+            path: Worker worktree path
+            branch: Worker branch
+            base_branch: Branch to start *branch* from if it does not exist
+
+        Returns:
+            WorktreeInfo, or None if no healthy worktree was available
+        """
+        registered = {wt.path for wt in self.list_worktrees()}
+        source: Path | None = None
+        if path in registered:
+            if self.is_healthy(path):
+                source = path
+            else:
+                self.delete(path, force=True)
+        if source is None and not path.exists():
+            source = next(
+                (slot for slot in sorted(registered) if slot.parent == self.pool_path and self.is_healthy(slot)),
+                None,
+            )
+        if source is None:
+            return None
+
+        try:
+            if source != path:
+                self._run_git("worktree", "move", str(source), str(path))
+            exists = self._run_git("rev-parse", "--verify", "--quiet", f"refs/heads/{branch}", check=False)
+            start = branch if exists.returncode == 0 else base_branch
+            self._run_git_in(path, "checkout", "--force", "-B", branch, start)
+            self._run_git_in(path, "clean", "-ffdq")
+        except WorktreeError as e:
+            logger.warning(f"Could not reuse worktree for {path}, recreating: {e}")
+            if path.exists() or self.exists(path):
+                self.delete(path, force=True)
+            return None
+
+        logger.info(f"Reused worktree at {path} on branch {branch}")
+        return WorktreeInfo(path=path, branch=branch, commit=self._get_head_commit(path))
+
+    def _run_git_in(self, worktree_path: Path, *args: str) -> subprocess.CompletedProcess[str]:
+        """Run a git command inside a worktree, raising WorktreeError on failure."""
+        cmd = ["git", "-C", str(worktree_path), *args]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise WorktreeError(
+                f"Git command failed: {result.stderr.strip()}",
+                worktree_path=str(worktree_path),
+                details={"command": " ".join(cmd), "exit_code": result.returncode},
+            )
+        return result
+
     def _get_head_commit(self, worktree_path: Path) -> str:
         """Get HEAD commit of a worktree.
 
@@ -308,21 +478,17 @@ class WorktreeManager:
     def sync_with_base(self, path: str | Path, base_branch: str = "main") -> None:
         """Rebase worktree on base branch.
 
+        Worker and base branches all live in this repository, so the local
+        ref is rebased onto directly; there is nothing to fetch.
+
         Args:
             path: Path to worktree
-            base_branch: Branch to rebase onto
+            base_branch: Local branch to rebase onto
         """
         path = Path(path).resolve()
 
         subprocess.run(
-            ["git", "-C", str(path), "fetch", "origin", base_branch],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        subprocess.run(
-            ["git", "-C", str(path), "rebase", f"origin/{base_branch}"],
+            ["git", "-C", str(path), "rebase", base_branch],
             capture_output=True,
             text=True,
             check=True,